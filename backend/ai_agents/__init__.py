@@ -1,2 +1,19 @@
-from .specialist_enhanced import SpecialistAgent
-from .director import DirectorAgent
+# Agent classes resolve on first access: importing any ai_agents.<module> must not
+# load the agents SDK through the package __init__ (PEP 562 module __getattr__).
+import importlib
+
+_EXPORTS = {
+    "SpecialistAgent": ".specialist_enhanced",
+    "DirectorAgent": ".director",
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = list(_EXPORTS)
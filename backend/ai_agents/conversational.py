@@ -14,6 +14,7 @@ from pydantic import BaseModel, Field
 from .specialist import SpecialistAgent
 from models import AgentSeniority, AgentStatus
 from database import get_supabase_client
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
 from utils.context_manager import get_workspace_context
 
 # Use the enhanced factory for quota tracking
@@ -281,6 +282,7 @@ class ConversationalAgent:
                 update_data["budget_changed_at"] = datetime.now(timezone.utc).isoformat()
             
             self.supabase.table("workspaces").update(update_data).eq("id", self.workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=self.workspace_id)
             
             return {
                 "success": True,
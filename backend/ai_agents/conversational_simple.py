@@ -10,8 +10,10 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 from pydantic import BaseModel
 
-from database import get_supabase_client
+from database import get_supabase_client, async_supabase
 from utils.context_manager import get_workspace_context
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED, WORKSPACE_CHANGED
+from services.workspace_context_snapshot import ContextSection, workspace_context_snapshots
 # CRITICAL FIX: Use quota-tracked OpenAI client factory
 from utils.openai_client_factory import get_openai_client
 from tools.openai_sdk_tools import openai_tools_manager
@@ -381,32 +383,18 @@ class SimpleConversationalAgent:
             self.context = {"workspace_id": self.workspace_id, "error": "context_unavailable"}
     
     async def _get_lightweight_context(self) -> Dict[str, Any]:
-        """Get minimal context to avoid OpenAI token limits"""
+        """
+        Get minimal context to avoid OpenAI token limits.
+        The three queries run concurrently through the workspace context snapshot
+        service and are cached until the workspace, its agents or tasks change.
+        """
         try:
-            supabase = get_supabase_client()
-            
-            # Get only essential workspace info including budget
-            workspace_result = supabase.table("workspaces")\
-                .select("id,name,description,status,budget")\
-                .eq("id", self.workspace_id)\
-                .execute()
-            
-            # Get basic team info  
-            agents_result = supabase.table("agents")\
-                .select("id,name,role,status")\
-                .eq("workspace_id", self.workspace_id)\
-                .limit(5)\
-                .execute()
-            
-            # Get recent tasks count only
-            tasks_result = supabase.table("tasks")\
-                .select("status")\
-                .eq("workspace_id", self.workspace_id)\
-                .limit(10)\
-                .execute()
+            context = await workspace_context_snapshots.get_snapshot(
+                self.workspace_id, self._lightweight_context_sections(), variant="lightweight"
+            )
             
             # Prepare workspace data with budget fallback
-            workspace_data = workspace_result.data[0] if workspace_result.data else {}
+            workspace_data = dict(context["workspace"])
             if 'budget' not in workspace_data or workspace_data['budget'] is None:
                 # Add fallback budget if not present in database
                 workspace_data['budget'] = 50000.00  # Default budget for testing
@@ -414,8 +402,8 @@ class SimpleConversationalAgent:
             return {
                 "workspace_id": self.workspace_id,
                 "workspace": workspace_data,
-                "agents": agents_result.data[:3],  # Limit to 3 agents
-                "task_count": len(tasks_result.data),
+                "agents": context["agents"][:3],  # Limit to 3 agents
+                "task_count": len(context["recent_tasks"]),
                 "context_type": "lightweight"
             }
             
@@ -423,6 +411,39 @@ class SimpleConversationalAgent:
             logger.error(f"Failed to load lightweight context: {e}")
             return {"workspace_id": self.workspace_id, "error": "lightweight_context_unavailable"}
     
+    def _lightweight_context_sections(self) -> List[ContextSection]:
+        async def workspace():
+            # Get only essential workspace info including budget
+            result = await async_supabase.table("workspaces")\
+                .select("id,name,description,status,budget")\
+                .eq("id", self.workspace_id)\
+                .execute()
+            return result.data[0] if result.data else {}
+        
+        async def agents():
+            # Get basic team info
+            result = await async_supabase.table("agents")\
+                .select("id,name,role,status")\
+                .eq("workspace_id", self.workspace_id)\
+                .limit(5)\
+                .execute()
+            return result.data or []
+        
+        async def recent_tasks():
+            # Get recent tasks count only
+            result = await async_supabase.table("tasks")\
+                .select("status")\
+                .eq("workspace_id", self.workspace_id)\
+                .limit(10)\
+                .execute()
+            return result.data or []
+        
+        return [
+            ContextSection("workspace", workspace),
+            ContextSection("agents", agents, list),
+            ContextSection("recent_tasks", recent_tasks, list),
+        ]
+    
     async def _generate_intelligent_response(self, user_message: str, query_type: str = "GENERAL_INQUIRY") -> str:
         """
         Generate AI-driven response based on context and user message.
@@ -1313,6 +1334,7 @@ Use tools to gather additional data for deeper analysis when needed.
                         supabase.table("agents").update({"status": "paused"}).eq(
                             "workspace_id", self.workspace_id
                         ).execute()
+                        task_event_bus.publish(AGENT_CHANGED, workspace_id=self.workspace_id)
                     
                     return {
                         "success": True,
@@ -1883,6 +1905,7 @@ Use tools to gather additional data for deeper analysis when needed.
                     .eq("workspace_id", self.workspace_id)\
                     .in_("status", ["error", "paused", "terminated"])\
                     .execute()
+                task_event_bus.publish(AGENT_CHANGED, workspace_id=self.workspace_id)
                 
                 affected_count = len(result.data) if result.data else 0
                 return {
@@ -1896,6 +1919,7 @@ Use tools to gather additional data for deeper analysis when needed.
                     .update({"status": "active"})\
                     .eq("id", self.workspace_id)\
                     .execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=self.workspace_id)
                 
                 return {
                     "success": True,
@@ -2004,6 +2028,7 @@ Use tools to gather additional data for deeper analysis when needed.
                 .update({"status": "active"})\
                 .eq("id", self.workspace_id)\
                 .execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=self.workspace_id)
             actions_taken.append("Activated workspace")
             
             # 2. Reset agents to available
@@ -2012,6 +2037,7 @@ Use tools to gather additional data for deeper analysis when needed.
                 .eq("workspace_id", self.workspace_id)\
                 .in_("status", ["error", "paused", "terminated"])\
                 .execute()
+            task_event_bus.publish(AGENT_CHANGED, workspace_id=self.workspace_id)
             
             reset_agents = len(agent_result.data) if agent_result.data else 0
             if reset_agents > 0:
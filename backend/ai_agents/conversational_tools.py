@@ -11,6 +11,7 @@ from uuid import uuid4
 
 from ..database import get_supabase_client
 from ..models import AgentModelPydantic, AgentSeniority, TaskStatus
+from ..utils.task_event_bus import task_event_bus, AGENT_CHANGED, DELIVERABLE_CHANGED
 
 # Import SDK with fallback
 try:
@@ -69,6 +70,9 @@ class ConversationalToolRegistry:
             }
             
             result = self.supabase.table("deliverables").insert(new_deliverable).execute()
+            if not result.data:
+                return {"success": False, "error": f"Deliverable '{title}' was not created"}
+            task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=self.workspace_id, deliverable_id=new_deliverable["id"])
             
             return {
                 "success": True,
@@ -134,7 +138,10 @@ class ConversationalToolRegistry:
                 updates["updated_at"] = datetime.now(timezone.utc).isoformat()
             
             # Update agent
-            self.supabase.table("agents").update(updates).eq("id", agent["id"]).execute()
+            result = self.supabase.table("agents").update(updates).eq("id", agent["id"]).execute()
+            if not result.data:
+                return {"success": False, "error": f"Agent '{agent_name}' was not updated"}
+            task_event_bus.publish(AGENT_CHANGED, workspace_id=self.workspace_id, agent_id=agent["id"])
             
             return {
                 "success": True,
@@ -5,6 +5,7 @@ Provides AI-driven quality validation, human review coordination, and automated
 
 import os
 import json
+import time
 import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
@@ -16,10 +17,13 @@ from models import (
     EnhancedWorkspaceGoal, WorkspaceGoal
 )
 from .quality_db_fallbacks import (
-    get_quality_rules_for_asset_type, log_quality_validation,
-    update_artifact_status, get_artifacts_for_requirement,
-    update_goal_progress
+    get_quality_rules_for_asset_type, get_quality_rules_for_asset_types,
+    get_asset_artifacts_by_ids, log_quality_validations,
+    update_artifact_status, bulk_update_artifact_statuses,
+    get_artifacts_for_requirement, update_goal_progress
 )
+from utils.latency_histogram import LatencyHistogram
+from utils.telemetry_counters import telemetry_counters
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +40,32 @@ class AIQualityGateEngine:
         self.quality_gate_timeout = int(os.getenv("QUALITY_GATE_TIMEOUT_SECONDS", "30"))
         self.min_quality_score = float(os.getenv("MIN_QUALITY_SCORE_FOR_APPROVAL", "0.5"))
         
+        # Gate execution: all rules of an artifact in one structured call when possible,
+        # otherwise one call per rule under a concurrency bound
+        self.multi_rule_evaluation = os.getenv("QUALITY_GATE_MULTI_RULE", "true").lower() == "true"
+        self.max_rules_per_call = max(1, int(os.getenv("QUALITY_GATE_MAX_RULES_PER_CALL", "10")))
+        self.rule_concurrency = max(1, int(os.getenv("QUALITY_GATE_RULE_CONCURRENCY", "4")))
+        self.hard_rule_severities = {
+            severity.strip().lower()
+            for severity in os.getenv("QUALITY_GATE_HARD_SEVERITIES", "critical").split(",")
+            if severity.strip()
+        }
+        self.gate_stats = {
+            "artifacts_validated": 0,
+            "rules_evaluated": 0,
+            "rules_skipped": 0,
+            "llm_calls": 0,
+            "multi_rule_calls": 0,
+            "single_rule_calls": 0,
+            "multi_rule_fallbacks": 0,
+            "hard_failures": 0,
+        }
+        self.gate_latency = LatencyHistogram()
+        
+        # Batch re-validation (batch_validate_artifacts)
+        self.batch_concurrency = max(1, int(os.getenv("CONCURRENT_ARTIFACT_PROCESSING", "3")))
+        self.batch_artifact_timeout = float(os.getenv("QUALITY_BATCH_ARTIFACT_TIMEOUT_SECONDS", "90"))
+        
         # Pillar 7: Autonomous Quality Pipeline configuration
         self.eliminate_human_intervention = os.getenv("ELIMINATE_HUMAN_INTERVENTION", "true").lower() == "true"
         self.autonomous_error_recovery = os.getenv("AUTONOMOUS_ERROR_RECOVERY", "true").lower() == "true"
@@ -64,30 +94,11 @@ class AIQualityGateEngine:
                 logger.warning(f"No quality rules found for asset type: {artifact.artifact_type}")
                 return await self._fallback_quality_assessment(artifact)
             
-            # Run validation against each rule
-            validation_results = []
-            for rule in quality_rules:
-                try:
-                    result = await self._execute_quality_rule(artifact, rule)
-                    validation_results.append(result)
-                    
-                    # Log validation result
-                    await log_quality_validation(result)
-                    
-                except Exception as e:
-                    logger.error(f"Quality rule {rule.id} failed: {e}")
-                    continue
-            
-            # Aggregate results and make decision
-            quality_decision = await self._make_quality_decision(artifact, validation_results)
+            quality_decision = await self._evaluate_artifact(artifact, quality_rules)
             
             # Update artifact status based on decision
             await self._apply_quality_decision(artifact, quality_decision)
             
-            # Auto-learning: Update quality rules based on results (Pillar 4: Auto-apprendente)
-            if self.auto_learning_enabled:
-                await self._update_quality_rules_from_feedback(validation_results)
-            
             logger.info(f"✅ Quality validation completed - Decision: {quality_decision['status']}")
             return quality_decision
             
@@ -95,6 +106,131 @@ class AIQualityGateEngine:
             logger.error(f"Quality validation failed for artifact {artifact.id}: {e}")
             return {"status": "error", "error": str(e), "requires_human_review": True}
     
+    async def _evaluate_artifact(self, artifact: AssetArtifact, quality_rules: List[QualityRule]) -> Dict[str, Any]:
+        """Run the gates, log the validations and return the decision (without applying it)"""
+        
+        # Run every applicable rule (single pass where possible), then log them in one insert
+        started = time.perf_counter()
+        validation_results, hard_failures = await self._run_quality_gates(artifact, quality_rules)
+        self.gate_latency.observe(time.perf_counter() - started)
+        self.gate_stats["artifacts_validated"] += 1
+        
+        if validation_results:
+            await log_quality_validations(validation_results)
+        
+        # Aggregate results and make decision
+        quality_decision = await self._make_quality_decision(artifact, validation_results, hard_failures)
+        telemetry_counters.record_outcome("quality_gate_approval", quality_decision.get("status") == "approved")
+        
+        # Auto-learning: Update quality rules based on results (Pillar 4: Auto-apprendente)
+        if self.auto_learning_enabled:
+            await self._update_quality_rules_from_feedback(validation_results)
+        
+        return quality_decision
+    
+    async def _run_quality_gates(
+        self, artifact: AssetArtifact, quality_rules: List[QualityRule]
+    ) -> Tuple[List[QualityValidation], List[QualityRule]]:
+        """
+        Evaluate the artifact against its rules and return (validations, failed hard rules).
+        
+        When every rule fits in one multi-rule call they are judged together. Otherwise
+        hard rules (severity in QUALITY_GATE_HARD_SEVERITIES) run first, and a hard
+        failure short-circuits the remaining rules.
+        """
+        hard_rules = [rule for rule in quality_rules if self._is_hard_rule(rule)]
+        soft_rules = [rule for rule in quality_rules if not self._is_hard_rule(rule)]
+        
+        if self.multi_rule_evaluation and 1 < len(quality_rules) <= self.max_rules_per_call:
+            stages = [quality_rules]
+        else:
+            stages = [stage for stage in (hard_rules, soft_rules) if stage]
+        
+        validation_results: List[QualityValidation] = []
+        hard_failures: List[QualityRule] = []
+        for index, stage in enumerate(stages):
+            stage_results = await self._evaluate_rules(artifact, stage)
+            validation_results.extend(stage_results)
+            hard_failures.extend(
+                rule for rule, result in zip(stage, stage_results)
+                if self._is_hard_rule(rule) and not result.passed
+            )
+            if hard_failures:
+                skipped = sum(len(remaining) for remaining in stages[index + 1:])
+                if skipped:
+                    logger.info(f"⛔ Hard quality gate failed for {artifact.artifact_name}, skipping {skipped} rules")
+                self.gate_stats["rules_skipped"] += skipped
+                self.gate_stats["hard_failures"] += 1
+                break
+        
+        self.gate_stats["rules_evaluated"] += len(validation_results)
+        return validation_results, hard_failures
+    
+    def _is_hard_rule(self, rule: QualityRule) -> bool:
+        return (getattr(rule, 'severity', None) or "").lower() in self.hard_rule_severities
+    
+    async def _evaluate_rules(self, artifact: AssetArtifact, rules: List[QualityRule]) -> List[QualityValidation]:
+        """Validations for ``rules`` in the same order, using multi-rule calls when enabled"""
+        if self.multi_rule_evaluation and len(rules) > 1:
+            chunks = [rules[i:i + self.max_rules_per_call] for i in range(0, len(rules), self.max_rules_per_call)]
+            chunk_results = await asyncio.gather(*[
+                self._execute_quality_rules_single_pass(artifact, chunk) for chunk in chunks
+            ])
+            return [validation for chunk in chunk_results for validation in chunk]
+        return await self._execute_quality_rules_concurrently(artifact, rules)
+    
+    async def _execute_quality_rules_concurrently(
+        self, artifact: AssetArtifact, rules: List[QualityRule]
+    ) -> List[QualityValidation]:
+        """One call per rule, at most QUALITY_GATE_RULE_CONCURRENCY in flight"""
+        semaphore = asyncio.Semaphore(self.rule_concurrency)
+        
+        async def run(rule: QualityRule) -> QualityValidation:
+            async with semaphore:
+                return await self._execute_quality_rule(artifact, rule)
+        
+        return list(await asyncio.gather(*[run(rule) for rule in rules]))
+    
+    async def _execute_quality_rules_single_pass(
+        self, artifact: AssetArtifact, rules: List[QualityRule]
+    ) -> List[QualityValidation]:
+        """Judge several rules in one structured-output call; rules it misses fall back to per-rule calls"""
+        
+        verdicts: Dict[str, Dict[str, Any]] = {}
+        try:
+            response = await self.openai_client.chat.completions.create(
+                model=self.quality_validation_model,
+                messages=[{"role": "user", "content": self._build_multi_rule_validation_prompt(artifact, rules)}],
+                response_format={"type": "json_object"},
+                temperature=0.1,
+                timeout=self.quality_gate_timeout
+            )
+            self.gate_stats["llm_calls"] += 1
+            self.gate_stats["multi_rule_calls"] += 1
+            response_data = json.loads(response.choices[0].message.content)
+            for item in response_data.get("rule_results", []):
+                if isinstance(item, dict) and item.get("rule_key"):
+                    verdicts[str(item["rule_key"]).strip().upper()] = item
+        except Exception as e:
+            logger.warning(f"Multi-rule validation failed for {artifact.artifact_name}, evaluating rules individually: {e}")
+        
+        results: List[Optional[QualityValidation]] = []
+        for index, rule in enumerate(rules):
+            verdict = verdicts.get(f"R{index + 1}")
+            try:
+                results.append(self._build_validation(artifact, rule, verdict) if verdict else None)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Malformed verdict for rule {rule.rule_name}: {e}")
+                results.append(None)
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            self.gate_stats["multi_rule_fallbacks"] += 1
+            retried = await self._execute_quality_rules_concurrently(artifact, [rules[i] for i in missing])
+            for index, validation in zip(missing, retried):
+                results[index] = validation
+        return results
+    
     async def _execute_quality_rule(self, artifact: AssetArtifact, rule: QualityRule) -> QualityValidation:
         """Execute a single quality rule against an artifact"""
         
@@ -111,71 +247,92 @@ class AIQualityGateEngine:
                 timeout=self.quality_gate_timeout
             )
             
+            self.gate_stats["llm_calls"] += 1
+            self.gate_stats["single_rule_calls"] += 1
             validation_data = json.loads(response.choices[0].message.content)
-            
-            # Get workspace_id from artifact if available
-            workspace_id = getattr(artifact, 'workspace_id', None)
-            
-            # Create validation record
-            validation = QualityValidation(
-                id=uuid4(),
-                artifact_id=artifact.id,
-                rule_id=rule.id,
-                workspace_id=workspace_id,
-                
-                # Core validation results
-                score=float(validation_data.get("quality_score", 0.0)),
-                passed=validation_data.get("validation_passed", False),
-                feedback=validation_data.get("detailed_feedback", ""),
-                
-                # AI insights and suggestions
-                ai_assessment=validation_data.get("ai_assessment", ""),
-                improvement_suggestions=validation_data.get("improvement_suggestions", []),
-                
-                # Business impact analysis  
-                business_impact=validation_data.get("business_impact_analysis", ""),
-                actionability_assessment=validation_data.get("actionability_score", 0.0),
-                
-                # Quality dimensions
-                quality_dimensions={
-                    "completeness": validation_data.get("completeness_score", 0.0),
-                    "accuracy": validation_data.get("accuracy_score", 0.0),
-                    "relevance": validation_data.get("relevance_score", 0.0),
-                    "usability": validation_data.get("usability_score", 0.0),
-                    "professional_standard": validation_data.get("professional_standard_score", 0.0)
-                },
-                
-                # Metadata
-                validation_model=self.quality_validation_model,
-                validated_at=datetime.utcnow(),
-                processing_time_ms=validation_data.get("processing_time_ms", 0),
-                
-                # Pillar compliance
-                ai_driven=True,
-                pillar_compliance_check=validation_data.get("pillar_compliance", {})
-            )
-            
-            return validation
+            return self._build_validation(artifact, rule, validation_data)
             
         except Exception as e:
             logger.error(f"Quality rule execution failed for rule {rule.id}: {e}")
-            # Get workspace_id from artifact if available
-            workspace_id = getattr(artifact, 'workspace_id', None)
-            
-            # Return failed validation
-            return QualityValidation(
-                id=uuid4(),
-                artifact_id=artifact.id,
-                rule_id=rule.id,
-                workspace_id=workspace_id,
-                score=0.0,
-                passed=False,
-                feedback=f"Validation failed due to system error: {str(e)}",
-                ai_assessment="System error during validation",
-                validation_model=self.quality_validation_model,
-                validated_at=datetime.utcnow(),
-                ai_driven=True
-            )
+            return self._failed_validation(artifact, rule, e)
+    
+    def _build_validation(self, artifact: AssetArtifact, rule: QualityRule, validation_data: Dict[str, Any]) -> QualityValidation:
+        """Turn one rule's JSON verdict (single- or multi-rule response) into a validation record"""
+        
+        # Get workspace_id from artifact if available
+        workspace_id = getattr(artifact, 'workspace_id', None)
+        
+        # Dimension scores may be flat or nested under "quality_dimensions"
+        dimensions = validation_data.get("quality_dimensions")
+        if isinstance(dimensions, dict):
+            validation_data = {**dimensions, **validation_data}
+        
+        # Create validation record
+        return QualityValidation(
+            id=uuid4(),
+            artifact_id=artifact.id,
+            rule_id=rule.id,
+            workspace_id=workspace_id,
+            
+            # Core validation results
+            score=float(validation_data.get("quality_score", 0.0)),
+            passed=validation_data.get("validation_passed", False),
+            feedback=validation_data.get("detailed_feedback", ""),
+            
+            # AI insights and suggestions
+            ai_assessment=validation_data.get("ai_assessment", ""),
+            improvement_suggestions=validation_data.get("improvement_suggestions", []),
+            
+            # Business impact analysis  
+            business_impact=validation_data.get("business_impact_analysis", ""),
+            actionability_assessment=validation_data.get("actionability_score", 0.0),
+            
+            # Quality dimensions
+            quality_dimensions={
+                "completeness": validation_data.get("completeness_score", 0.0),
+                "accuracy": validation_data.get("accuracy_score", 0.0),
+                "relevance": validation_data.get("relevance_score", 0.0),
+                "usability": validation_data.get("usability_score", 0.0),
+                "professional_standard": validation_data.get("professional_standard_score", 0.0)
+            },
+            
+            # Metadata
+            validation_model=self.quality_validation_model,
+            validated_at=datetime.utcnow(),
+            processing_time_ms=validation_data.get("processing_time_ms", 0),
+            
+            # Pillar compliance
+            ai_driven=True,
+            pillar_compliance_check=validation_data.get("pillar_compliance", {})
+        )
+    
+    def _failed_validation(self, artifact: AssetArtifact, rule: QualityRule, error: Exception) -> QualityValidation:
+        """Validation record for a rule that could not be evaluated"""
+        return QualityValidation(
+            id=uuid4(),
+            artifact_id=artifact.id,
+            rule_id=rule.id,
+            workspace_id=getattr(artifact, 'workspace_id', None),
+            score=0.0,
+            passed=False,
+            feedback=f"Validation failed due to system error: {str(error)}",
+            ai_assessment="System error during validation",
+            validation_model=self.quality_validation_model,
+            validated_at=datetime.utcnow(),
+            ai_driven=True
+        )
+    
+    def _content_text(self, artifact: AssetArtifact) -> str:
+        """Artifact content as text; stored content is usually a JSON object"""
+        content = getattr(artifact, 'content', None)
+        if isinstance(content, str):
+            return content
+        if content:
+            return json.dumps(content, default=str, ensure_ascii=False)
+        return getattr(artifact, 'display_content', None) or ""
+    
+    def _content_excerpt(self, artifact: AssetArtifact, limit: int, empty: str = "No content available") -> str:
+        return self._content_text(artifact)[:limit] or empty
     
     def _build_quality_validation_prompt(self, artifact: AssetArtifact, rule: QualityRule) -> str:
         """Build comprehensive quality validation prompt (Pillar 2: AI-Driven)"""
@@ -188,12 +345,12 @@ class AIQualityGateEngine:
         Name: {artifact.artifact_name}
         Type: {artifact.artifact_type}
         Format: {artifact.content_format}
-        Content Length: {len(artifact.content or '') if artifact.content else 0} characters
+        Content Length: {len(self._content_text(artifact))} characters
         Current Quality Score: {artifact.quality_score}
-        Business Value Score: {artifact.business_value_score}
+        Business Value Score: {getattr(artifact, 'business_value_score', None)}
         
         ARTIFACT CONTENT:
-        {artifact.content[:4000] if artifact.content else "No content available"}...
+        {self._content_excerpt(artifact, 4000)}...
         
         QUALITY RULE TO APPLY:
         Rule Name: {rule.rule_name}
@@ -307,10 +464,80 @@ class AIQualityGateEngine:
         
         return prompt
     
+    def _build_multi_rule_validation_prompt(self, artifact: AssetArtifact, rules: List[QualityRule]) -> str:
+        """Prompt judging every rule of an artifact in one response (Pillar 2: AI-Driven)"""
+        
+        rule_lines = "\n".join(
+            f"""        R{index + 1}: {rule.rule_name}
+            Validation Criteria: {rule.ai_validation_prompt}
+            Required Threshold: {rule.threshold_score}
+            Severity: {rule.severity or "medium"}"""
+            for index, rule in enumerate(rules)
+        )
+        
+        prompt = f"""
+        You are a world-class quality assurance expert with deep expertise in {artifact.artifact_type} assets.
+        Your task is to validate this business deliverable against EACH of the quality rules below.
+        
+        ARTIFACT TO VALIDATE:
+        Name: {artifact.artifact_name}
+        Type: {artifact.artifact_type}
+        Format: {artifact.content_format}
+        Content Length: {len(self._content_text(artifact))} characters
+        Current Quality Score: {artifact.quality_score}
+        Business Value Score: {getattr(artifact, 'business_value_score', None)}
+        
+        ARTIFACT CONTENT:
+        {self._content_excerpt(artifact, 4000)}...
+        
+        QUALITY RULES TO APPLY:
+{rule_lines}
+        
+        For each rule, score the artifact (0.0-1.0) on COMPLETENESS, ACCURACY, RELEVANCE,
+        USABILITY and PROFESSIONAL STANDARD as they apply to that rule's criteria, and pass
+        it only if its quality score meets the rule's threshold. Judge every rule
+        independently: a weakness relevant to one rule must not lower unrelated rules.
+        
+        RESPONSE FORMAT (JSON), one entry per rule key, in order:
+        {{
+            "rule_results": [
+                {{
+                    "rule_key": "R1",
+                    "validation_passed": true,
+                    "quality_score": 0.87,
+                    "detailed_feedback": "Assessment of the artifact against this rule",
+                    "ai_assessment": "Strengths and opportunities for this rule",
+                    "quality_dimensions": {{
+                        "completeness_score": 0.90,
+                        "accuracy_score": 0.85,
+                        "relevance_score": 0.88,
+                        "usability_score": 0.82,
+                        "professional_standard_score": 0.89
+                    }},
+                    "business_impact_analysis": "Business value relevant to this rule",
+                    "actionability_score": 0.85,
+                    "improvement_suggestions": ["Specific, actionable suggestion"]
+                }}
+            ]
+        }}
+        
+        CRITICAL QUALITY STANDARDS:
+        - CONCRETE over abstract: Must be immediately usable
+        - ACTIONABLE over informational: Must enable decisions/actions  
+        - COMPLETE over partial: Must fully address requirements
+        - PROFESSIONAL over amateur: Must meet business standards
+        - VALUABLE over generic: Must provide clear business benefit
+        
+        Be rigorous but fair. This artifact will be used in a real business context.
+        """
+        
+        return prompt
+    
     async def _make_quality_decision(
         self, 
         artifact: AssetArtifact, 
-        validation_results: List[QualityValidation]
+        validation_results: List[QualityValidation],
+        hard_failures: Optional[List[QualityRule]] = None
     ) -> Dict[str, Any]:
         """Make comprehensive quality decision based on validation results"""
         
@@ -384,6 +611,16 @@ class AIQualityGateEngine:
                     "reason": f"Low quality score ({overall_score:.2f}) needs enhancement"
                 })
             
+            # A failed hard gate cannot be outweighed by the other rules
+            if hard_failures:
+                failed_rules = [rule.rule_name for rule in hard_failures]
+                decision.update({
+                    "status": "needs_improvement",
+                    "requires_human_review": False,
+                    "hard_failures": failed_rules,
+                    "reason": f"Hard quality gate failed: {', '.join(failed_rules)} (score {overall_score:.2f})"
+                })
+            
             # Add improvement suggestions
             all_suggestions = []
             for validation in validation_results:
@@ -414,11 +651,18 @@ class AIQualityGateEngine:
         """Apply the quality decision to the artifact"""
         
         try:
-            status = decision["status"]
-            quality_score = decision.get("overall_score", 0.0)
-            
             # Update artifact status and quality score
-            await update_artifact_status(artifact.id, status, quality_score)
+            await update_artifact_status(artifact.id, decision["status"], decision.get("overall_score", 0.0))
+            await self._run_decision_followups(artifact, decision)
+            
+        except Exception as e:
+            logger.error(f"Failed to apply quality decision for artifact {artifact.id}: {e}")
+    
+    async def _run_decision_followups(self, artifact: AssetArtifact, decision: Dict[str, Any]):
+        """Goal progress, enhancement or review follow-ups of an already persisted decision"""
+        
+        try:
+            status = decision["status"]
             
             # If approved, trigger goal progress update
             if status == "approved":
@@ -433,7 +677,7 @@ class AIQualityGateEngine:
                 await self._create_human_review_task(artifact, decision)
             
         except Exception as e:
-            logger.error(f"Failed to apply quality decision for artifact {artifact.id}: {e}")
+            logger.error(f"Quality decision follow-up failed for artifact {artifact.id}: {e}")
     
     async def _trigger_goal_progress_update(self, artifact: AssetArtifact):
         """Trigger goal progress recalculation when artifact is approved"""
@@ -486,7 +730,7 @@ class AIQualityGateEngine:
         CURRENT ARTIFACT:
         Name: {artifact.artifact_name}
         Type: {artifact.artifact_type}
-        Content: {artifact.content[:2000] if artifact.content else "No content"}...
+        Content: {self._content_excerpt(artifact, 2000, "No content")}...
         
         IMPROVEMENT SUGGESTIONS:
         {chr(10).join(f"- {suggestion}" for suggestion in suggestions)}
@@ -546,7 +790,7 @@ class AIQualityGateEngine:
             ARTIFACT:
             Name: {artifact.artifact_name}
             Type: {artifact.artifact_type}
-            Content: {artifact.content[:2000] if artifact.content else "No content"}...
+            Content: {self._content_excerpt(artifact, 2000, "No content")}...
             
             Rate the quality from 0.0 to 1.0 based on:
             - Completeness and thoroughness
@@ -607,8 +851,20 @@ class AIQualityGateEngine:
         except Exception as e:
             logger.error(f"Failed to update quality rules from feedback: {e}")
     
-    async def batch_validate_artifacts(self, artifact_ids: List[UUID]) -> Dict[str, Any]:
-        """Batch validate multiple artifacts efficiently"""
+    async def batch_validate_artifacts(
+        self,
+        artifact_ids: List[UUID],
+        workspace_id: Optional[UUID] = None,
+        run_followups: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Re-validate a backlog of artifacts efficiently.
+        
+        Artifacts and the rules of every artifact type involved are loaded with two
+        queries, artifacts are validated with bounded concurrency and a per-artifact
+        timeout, progress is streamed over the quality WebSocket channel, and the
+        resulting statuses are written in bulk before any follow-ups run.
+        """
         
         results = {
             "processed": 0,
@@ -616,32 +872,89 @@ class AIQualityGateEngine:
             "needs_improvement": 0,
             "requires_human_review": 0,
             "errors": 0,
+            "timeouts": 0,
+            "status_updates": 0,
             "details": []
         }
         
         try:
+            started = time.perf_counter()
             logger.info(f"🛡️ Batch validating {len(artifact_ids)} artifacts")
             
-            # Process artifacts concurrently (up to configured limit)
-            concurrent_limit = int(os.getenv("CONCURRENT_ARTIFACT_PROCESSING", "3"))
-            semaphore = asyncio.Semaphore(concurrent_limit)
+            # Two queries: the artifacts, then the active rules of all their types
+            artifacts = await get_asset_artifacts_by_ids(artifact_ids)
+            loaded_ids = {str(artifact.id) for artifact in artifacts}
+            for artifact_id in artifact_ids:
+                if str(artifact_id) not in loaded_ids:
+                    results["errors"] += 1
+                    results["details"].append({"artifact_id": str(artifact_id), "status": "error", "error": "Artifact not found"})
+            
+            artifacts_by_type: Dict[str, List[AssetArtifact]] = {}
+            for artifact in artifacts:
+                artifacts_by_type.setdefault(artifact.artifact_type, []).append(artifact)
+            rules_by_type = await get_quality_rules_for_asset_types(list(artifacts_by_type))
             
-            async def validate_single(artifact_id: UUID):
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+            decisions: List[Tuple[AssetArtifact, Dict[str, Any]]] = []
+            total = len(artifacts)
+            
+            async def validate_single(artifact: AssetArtifact):
                 async with semaphore:
+                    quality_rules = rules_by_type.get(artifact.artifact_type) or []
                     try:
-                        # This would require getting artifact from database
-                        # Implementation depends on database methods
-                        results["processed"] += 1
-                        # Update counters based on validation result
-                        
+                        evaluation = (
+                            self._evaluate_artifact(artifact, quality_rules) if quality_rules
+                            else self._fallback_quality_assessment(artifact)
+                        )
+                        decision = await asyncio.wait_for(evaluation, timeout=self.batch_artifact_timeout)
+                    except asyncio.TimeoutError:
+                        results["timeouts"] += 1
+                        decision = {"status": "error", "error": f"Validation timed out after {self.batch_artifact_timeout:g}s",
+                                    "requires_human_review": True, "overall_score": 0.0}
                     except Exception as e:
-                        results["errors"] += 1
-                        logger.error(f"Failed to validate artifact {artifact_id}: {e}")
-            
-            # Execute batch validation
-            await asyncio.gather(*[validate_single(aid) for aid in artifact_ids])
-            
-            logger.info(f"✅ Batch validation completed: {results}")
+                        logger.error(f"Failed to validate artifact {artifact.id}: {e}")
+                        decision = {"status": "error", "error": str(e), "requires_human_review": True, "overall_score": 0.0}
+                
+                decisions.append((artifact, decision))
+                self._record_batch_decision(results, artifact, decision)
+                await self._broadcast_validation_progress(
+                    workspace_id or getattr(artifact, 'workspace_id', None), artifact, decision,
+                    {"processed": results["processed"], "total": total}
+                )
+            
+            # Artifacts of the same type run next to each other and share their rule list
+            await asyncio.gather(*[
+                validate_single(artifact)
+                for type_artifacts in artifacts_by_type.values()
+                for artifact in type_artifacts
+            ])
+            
+            # Bulk status write (fallback assessments are advisory, as in validate_artifact_quality)
+            status_updates = [
+                (artifact.id, decision["status"], decision.get("overall_score", 0.0))
+                for artifact, decision in decisions
+                if decision.get("status") != "error" and not decision.get("fallback_assessment")
+            ]
+            if status_updates:
+                results["status_updates"] = await bulk_update_artifact_statuses(status_updates)
+            
+            if run_followups:
+                async def followup(artifact: AssetArtifact, decision: Dict[str, Any]):
+                    async with semaphore:
+                        await self._run_decision_followups(artifact, decision)
+                
+                await asyncio.gather(*[
+                    followup(artifact, decision) for artifact, decision in decisions
+                    if decision.get("status") != "error" and not decision.get("fallback_assessment")
+                ])
+            
+            elapsed = time.perf_counter() - started
+            results["elapsed_seconds"] = round(elapsed, 3)
+            results["artifacts_per_minute"] = round(results["processed"] / elapsed * 60, 1) if elapsed > 0 else 0.0
+            
+            logger.info(f"✅ Batch validation completed: {results['processed']} artifacts, "
+                        f"{results['approved']} approved, {results['errors']} errors "
+                        f"({results['artifacts_per_minute']}/min)")
             return results
             
         except Exception as e:
@@ -649,6 +962,51 @@ class AIQualityGateEngine:
             results["errors"] = len(artifact_ids)
             return results
     
+    def _record_batch_decision(self, results: Dict[str, Any], artifact: AssetArtifact, decision: Dict[str, Any]):
+        status = decision.get("status", "error")
+        results["processed"] += 1
+        if status in ("approved", "needs_improvement", "requires_human_review"):
+            results[status] += 1
+        else:
+            results["errors"] += 1
+        results["details"].append({
+            "artifact_id": str(artifact.id),
+            "status": status,
+            "overall_score": decision.get("overall_score", 0.0),
+            "reason": decision.get("reason") or decision.get("error")
+        })
+    
+    async def _broadcast_validation_progress(
+        self, workspace_id: Optional[UUID], artifact: AssetArtifact,
+        decision: Dict[str, Any], progress: Dict[str, Any]
+    ):
+        """Stream one artifact's outcome to the workspace's quality WebSocket subscribers"""
+        if not workspace_id:
+            return
+        try:
+            from routes.websocket_assets import broadcast_quality_validation_complete
+            
+            summary = QualityValidation(
+                id=uuid4(),
+                artifact_id=artifact.id,
+                passed=decision.get("status") == "approved",
+                score=float(decision.get("overall_score") or 0.0)
+            )
+            await broadcast_quality_validation_complete(
+                str(workspace_id), summary, progress={**progress, "status": decision.get("status")}
+            )
+        except Exception as e:
+            logger.debug(f"Quality progress broadcast skipped: {e}")
+    
+    def get_gate_stats(self) -> Dict[str, Any]:
+        """Gate execution counters and per-artifact validation latency"""
+        artifacts = self.gate_stats["artifacts_validated"]
+        return {
+            **self.gate_stats,
+            "llm_calls_per_artifact": round(self.gate_stats["llm_calls"] / artifacts, 2) if artifacts else 0.0,
+            "latency": self.gate_latency.to_dict()
+        }
+    
     async def get_quality_metrics_dashboard(self, workspace_id: UUID) -> Dict[str, Any]:
         """Get comprehensive quality metrics for dashboard display"""
         
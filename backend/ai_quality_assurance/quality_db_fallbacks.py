@@ -31,6 +31,22 @@ except ImportError:
 # Import real functions that exist
 from database import log_quality_validation as _real_log_quality_validation
 
+try:
+    from database import log_quality_validations as _real_log_quality_validations
+except ImportError:
+    _real_log_quality_validations = None
+
+try:
+    from database import (
+        get_quality_rules_for_asset_types as _real_get_quality_rules_for_types,
+        get_asset_artifacts_by_ids as _real_get_asset_artifacts_by_ids,
+        bulk_update_artifact_statuses as _real_bulk_update_artifact_statuses
+    )
+except ImportError:
+    _real_get_quality_rules_for_types = None
+    _real_get_asset_artifacts_by_ids = None
+    _real_bulk_update_artifact_statuses = None
+
 
 async def get_quality_rules_for_asset_type(asset_type: str) -> List[Dict[str, Any]]:
     """Get quality rules for a specific asset type with fallback"""
@@ -81,6 +97,23 @@ async def get_quality_rules_for_asset_type(asset_type: str) -> List[Dict[str, An
     return rules
 
 
+async def get_quality_rules_for_asset_types(asset_types: List[str]) -> Dict[str, List[Any]]:
+    """Get quality rules for several asset types (one query when available), grouped by type"""
+    if _real_get_quality_rules_for_types:
+        return await _real_get_quality_rules_for_types(asset_types)
+    
+    return {asset_type: await get_quality_rules_for_asset_type(asset_type) for asset_type in asset_types}
+
+
+async def get_asset_artifacts_by_ids(artifact_ids: List[UUID]) -> List[Any]:
+    """Load many asset artifacts with fallback"""
+    if _real_get_asset_artifacts_by_ids:
+        return await _real_get_asset_artifacts_by_ids(artifact_ids)
+    
+    logger.info(f"Artifacts not loaded (fallback): {len(artifact_ids)} ids")
+    return []
+
+
 async def log_quality_validation(validation_result: Any) -> bool:
     """Log quality validation result with fallback"""
     if _real_log_quality_validation:
@@ -91,6 +124,14 @@ async def log_quality_validation(validation_result: Any) -> bool:
     return True
 
 
+async def log_quality_validations(validation_results: List[Any]) -> List[Any]:
+    """Log a batch of quality validation results (one insert when available)"""
+    if _real_log_quality_validations:
+        return await _real_log_quality_validations(validation_results)
+    
+    return [await log_quality_validation(result) for result in validation_results]
+
+
 async def update_artifact_status(artifact_id: UUID, status: str, metadata: Dict[str, Any] = None) -> bool:
     """Update artifact status with fallback"""
     if _real_update_artifact_status:
@@ -101,6 +142,18 @@ async def update_artifact_status(artifact_id: UUID, status: str, metadata: Dict[
     return True
 
 
+async def bulk_update_artifact_statuses(updates: List[Any]) -> int:
+    """Write many (artifact_id, status, quality_score) updates with fallback"""
+    if _real_bulk_update_artifact_statuses:
+        return await _real_bulk_update_artifact_statuses(updates)
+    
+    written = 0
+    for artifact_id, status, quality_score in updates:
+        if await update_artifact_status(artifact_id, status, quality_score):
+            written += 1
+    return written
+
+
 async def get_artifacts_for_requirement(requirement_id: UUID) -> List[Dict[str, Any]]:
     """Get artifacts for a requirement with fallback"""
     if _real_get_artifacts_for_requirement:
@@ -21,6 +21,7 @@ from uuid import UUID, uuid4
 from datetime import datetime
 
 from database import supabase
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED
 from models import GoalStatus
 
 logger = logging.getLogger(__name__)
@@ -188,6 +189,7 @@ class AutoAgentProvisioner:
                 result = supabase.table("agents").insert(agent_data).execute()
                 if result.data:
                     created_agents.append(result.data[0])
+                    task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=agent_data["id"])
                     logger.info(f"✅ Created agent: {agent_spec['name']} ({agent_spec['role']}) for workspace {workspace_id}")
             
             return created_agents
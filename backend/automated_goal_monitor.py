@@ -4,12 +4,17 @@ import asyncio
 import logging
 import time
 import os
+from collections import Counter, defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from models import WorkspaceGoal, GoalStatus
-from database import supabase
+from database import async_supabase
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED, GOAL_CHANGED, AGENT_CHANGED
+from utils.consistent_hash import ring_from_env
+from utils.latency_histogram import LatencyHistogram
+from services.llm_rate_limiter import PRIORITY_BACKGROUND, llm_priority
 from ai_quality_assurance.unified_quality_engine import goal_validator
 from goal_driven_task_planner import goal_driven_task_planner
 
@@ -76,6 +81,23 @@ class AutomatedGoalMonitor:
         self.global_corrective_cooldown = {}  # workspace_id + goal_type -> last_created_time
         self.corrective_cooldown_seconds = int(os.getenv("CORRECTIVE_TASK_COOLDOWN_SECONDS", "300"))  # 5 minutes
         
+        # 🚀 Concurrent validation pipeline: fan-out bound, per-workspace deadline, batched lookups
+        self.validation_concurrency = int(os.getenv("GOAL_MONITOR_VALIDATION_CONCURRENCY", "8"))
+        self.validation_timeout_seconds = float(os.getenv("GOAL_MONITOR_WORKSPACE_TIMEOUT_SECONDS", "300"))
+        self.batch_query_size = int(os.getenv("GOAL_MONITOR_BATCH_QUERY_SIZE", "100"))
+        self.cycle_histogram = LatencyHistogram()
+        self.workspace_validation_histograms: Dict[str, LatencyHistogram] = {}
+        self.workspace_validation_outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self.last_cycle_metrics: Dict[str, Any] = {}
+        
+        # 🧭 Optional sharding: with GOAL_MONITOR_REPLICAS="a,b,c" and GOAL_MONITOR_REPLICA_ID
+        # (or HOSTNAME) each replica validates only the workspaces it owns on the hash ring
+        try:
+            self.shard_ring, self.shard_node_id = ring_from_env("GOAL_MONITOR_REPLICAS", "GOAL_MONITOR_REPLICA_ID")
+        except ValueError as e:
+            logger.warning(f"⚠️ Goal monitor sharding disabled, validating every workspace: {e}")
+            self.shard_ring, self.shard_node_id = None, None
+        
     async def start_monitoring(self):
         """Start the automated monitoring loop"""
         if self.is_running:
@@ -87,7 +109,9 @@ class AutomatedGoalMonitor:
         
         while self.is_running:
             try:
-                await self._run_monitoring_cycle()
+                # Monitor LLM calls yield to chat and task execution in the shared rate limiter
+                with llm_priority(PRIORITY_BACKGROUND):
+                    await self._run_monitoring_cycle()
                 
                 # Wait for next cycle
                 await asyncio.sleep(self.monitor_interval_minutes * 60)
@@ -153,8 +177,15 @@ class AutomatedGoalMonitor:
             }
     
     async def _run_monitoring_cycle(self):
-        """Execute one complete monitoring cycle"""
+        """
+        Execute one complete monitoring cycle
+
+        Workspaces are validated concurrently (bounded by a semaphore), each with its
+        own deadline and error isolation, so a cycle lasts about as long as its
+        slowest workspaces instead of the sum of all of them.
+        """
         cycle_start = datetime.now()
+        cycle_timer = time.perf_counter()
         logger.info(f"🔄 Starting goal monitoring cycle at {cycle_start}")
         
         try:
@@ -193,13 +224,13 @@ class AutomatedGoalMonitor:
                 status_filter=GoalStatus.ACTIVE.value
             )
             
-            # 2. Process each workspace with pre-loaded goals
-            total_corrective_tasks = 0
-            for workspace_id in workspaces_to_validate:
-                # Pass pre-loaded goals to avoid individual database queries
-                workspace_goals = all_workspace_goals.get(workspace_id, [])
-                corrective_tasks = await self._process_workspace_validation(workspace_id, preloaded_goals=workspace_goals)
-                total_corrective_tasks += len(corrective_tasks)
+            # 2. Process workspaces concurrently with pre-loaded goals
+            semaphore = asyncio.Semaphore(self.validation_concurrency)
+            corrective_counts = await asyncio.gather(*(
+                self._validate_workspace_isolated(workspace_id, all_workspace_goals.get(workspace_id, []), semaphore)
+                for workspace_id in workspaces_to_validate
+            ))
+            total_corrective_tasks = sum(corrective_counts)
             
             # 2.5. Check for completed goals without deliverables
             # await self._check_and_create_missing_deliverables()
@@ -221,6 +252,60 @@ class AutomatedGoalMonitor:
             
         except Exception as e:
             logger.error(f"Error in monitoring cycle: {e}")
+        finally:
+            cycle_seconds = time.perf_counter() - cycle_timer
+            self.cycle_histogram.observe(cycle_seconds)
+            self.last_cycle_metrics = {
+                "started_at": cycle_start.isoformat(),
+                "duration_seconds": round(cycle_seconds, 3),
+                "interval_seconds": self.monitor_interval_minutes * 60,
+                "overran_interval": cycle_seconds > self.monitor_interval_minutes * 60,
+            }
+    
+    async def _validate_workspace_isolated(
+        self, workspace_id: str, workspace_goals: List[Dict], semaphore: asyncio.Semaphore
+    ) -> int:
+        """Validate one workspace under the fan-out bound with its own deadline; never raises."""
+        async with semaphore:
+            started = time.perf_counter()
+            outcome = "ok"
+            corrective_count = 0
+            try:
+                corrective_tasks = await asyncio.wait_for(
+                    self._process_workspace_validation(workspace_id, preloaded_goals=workspace_goals),
+                    timeout=self.validation_timeout_seconds
+                )
+                corrective_count = len(corrective_tasks)
+            except asyncio.TimeoutError:
+                outcome = "timeouts"
+                logger.error(f"⏰ Goal validation for workspace {workspace_id} exceeded {self.validation_timeout_seconds}s")
+            except Exception as e:
+                outcome = "errors"
+                logger.error(f"Error validating workspace {workspace_id}: {e}", exc_info=True)
+            finally:
+                elapsed = time.perf_counter() - started
+                if workspace_id not in self.workspace_validation_histograms:
+                    self.workspace_validation_histograms[workspace_id] = LatencyHistogram()
+                self.workspace_validation_histograms[workspace_id].observe(elapsed)
+                self.workspace_validation_outcomes[workspace_id][outcome] += 1
+            return corrective_count
+    
+    def _owned_workspaces(self, workspace_ids: List[str]) -> List[str]:
+        """The slice of ``workspace_ids`` this replica validates (all of them when not sharded)."""
+        if self.shard_ring is None:
+            return workspace_ids
+        owned = self.shard_ring.slice_for(self.shard_node_id, workspace_ids)
+        logger.info(f"🧭 Replica {self.shard_node_id} owns {len(owned)}/{len(workspace_ids)} workspaces this cycle")
+        return owned
+    
+    async def _batch_load_rows(self, table: str, column: str, values: List[str], columns: str = "*") -> List[Dict]:
+        """Load rows whose ``column`` is in ``values`` with one in_() query per batch."""
+        batches = [values[i:i + self.batch_query_size] for i in range(0, len(values), self.batch_query_size)]
+        responses = await asyncio.gather(*(
+            async_supabase.table(table).select(columns).in_(column, batch).execute()
+            for batch in batches
+        ))
+        return [row for response in responses for row in (response.data or [])]
     
     async def _get_workspaces_needing_validation(self) -> List[str]:
         """Get workspaces with active goals needing validation"""
@@ -228,7 +313,7 @@ class AutomatedGoalMonitor:
             # Query workspace_goals for active goals that need validation
             cutoff_time = datetime.now() - timedelta(minutes=self.monitor_interval_minutes)
             
-            response = supabase.table("workspace_goals").select(
+            response = await async_supabase.table("workspace_goals").select(
                 "workspace_id"
             ).eq(
                 "status", GoalStatus.ACTIVE.value
@@ -236,20 +321,42 @@ class AutomatedGoalMonitor:
                 f"last_validation_at.is.null,last_validation_at.lt.{cutoff_time.isoformat()}"
             ).execute()
             
-            # Get unique workspace IDs
-            workspace_ids = list(set(row["workspace_id"] for row in response.data))
+            # Get unique workspace IDs (only this replica's slice when sharded)
+            workspace_ids = self._owned_workspaces(list(set(row["workspace_id"] for row in response.data)))
+            if not workspace_ids:
+                return []
             
-            # 🚨 HEALTH CHECK: Filter out orphaned/incomplete workspaces
-            healthy_workspace_ids = []
+            # 🚀 Batched existence + health data: one in_() query per batch instead of N lookups
+            workspace_rows = {
+                row["id"]: row for row in await self._batch_load_rows("workspaces", "id", workspace_ids)
+            }
+            agents_by_workspace: Dict[str, List[Dict]] = defaultdict(list)
+            for agent in await self._batch_load_rows(
+                "agents", "workspace_id", list(workspace_rows), columns="id, workspace_id, name, role, status"
+            ):
+                agents_by_workspace[agent["workspace_id"]].append(agent)
+            
+            # First drop goals of workspaces that no longer exist (prevent orphaned goals issue)
             for workspace_id in workspace_ids:
-                # First check if workspace still exists (prevent orphaned goals issue)
-                workspace_exists = await self._verify_workspace_exists(workspace_id)
-                if not workspace_exists:
+                if workspace_id not in workspace_rows:
                     logger.warning(f"🗑️ Orphaned goals detected - workspace {workspace_id} doesn't exist, cleaning up goals")
                     await self._cleanup_orphaned_goals(workspace_id)
-                    continue
-                    
-                is_healthy = await self._check_workspace_health(workspace_id)
+            
+            # 🚨 HEALTH CHECK: Filter out incomplete/unhealthy workspaces, concurrently
+            existing_ids = [workspace_id for workspace_id in workspace_ids if workspace_id in workspace_rows]
+            semaphore = asyncio.Semaphore(self.validation_concurrency)
+            
+            async def check_health(workspace_id: str) -> bool:
+                async with semaphore:
+                    return await self._check_workspace_health(
+                        workspace_id,
+                        workspace_row=workspace_rows[workspace_id],
+                        agents=agents_by_workspace.get(workspace_id, [])
+                    )
+            
+            health_results = await asyncio.gather(*(check_health(workspace_id) for workspace_id in existing_ids))
+            healthy_workspace_ids = []
+            for workspace_id, is_healthy in zip(existing_ids, health_results):
                 if is_healthy:
                     healthy_workspace_ids.append(workspace_id)
                 else:
@@ -265,7 +372,7 @@ class AutomatedGoalMonitor:
     async def _verify_workspace_exists(self, workspace_id: str) -> bool:
         """Verify that a workspace still exists in the database"""
         try:
-            response = supabase.table("workspaces").select("id").eq("id", workspace_id).execute()
+            response = await async_supabase.table("workspaces").select("id").eq("id", workspace_id).execute()
             return len(response.data) > 0
         except Exception as e:
             logger.error(f"Error checking workspace existence for {workspace_id}: {e}")
@@ -275,13 +382,13 @@ class AutomatedGoalMonitor:
         """Clean up goals for non-existent workspaces"""
         try:
             # Delete orphaned goals
-            result = supabase.table("workspace_goals").delete().eq("workspace_id", workspace_id).execute()
+            result = await async_supabase.table("workspace_goals").delete().eq("workspace_id", workspace_id).execute()
             deleted_count = len(result.data) if result.data else 0
             
             logger.warning(f"🗑️ Cleaned up {deleted_count} orphaned goals for deleted workspace {workspace_id}")
             
             # Log cleanup action
-            supabase.table("logs").insert({
+            await async_supabase.table("logs").insert({
                 "workspace_id": None,  # No workspace reference since it's deleted
                 "type": "system",
                 "message": f"Cleaned up orphaned goals for deleted workspace {workspace_id}",
@@ -306,7 +413,7 @@ class AutomatedGoalMonitor:
             # Skip validation if no team has been approved to prevent premature workspace activation
             try:
                 # First check if there's an approved team proposal for this workspace
-                proposal_response = supabase.table("team_proposals").select("*").eq(
+                proposal_response = await async_supabase.table("team_proposals").select("*").eq(
                     "workspace_id", workspace_id
                 ).eq("status", "approved").execute()
                 
@@ -318,7 +425,7 @@ class AutomatedGoalMonitor:
                     return []
                 
                 # Then check if agents are available (they should be created after approval)
-                agents_response = supabase.table("agents").select("*").eq(
+                agents_response = await async_supabase.table("agents").select("*").eq(
                     "workspace_id", workspace_id
                 ).eq("status", "available").execute()
                 
@@ -483,7 +590,7 @@ class AutomatedGoalMonitor:
     async def _get_completed_tasks(self, workspace_id: str) -> List[Dict]:
         """Get completed tasks for workspace validation"""
         try:
-            response = supabase.table("tasks").select("*").eq(
+            response = await async_supabase.table("tasks").select("*").eq(
                 "workspace_id", workspace_id
             ).eq(
                 "status", "completed"
@@ -498,7 +605,7 @@ class AutomatedGoalMonitor:
     async def _get_workspace_goal_text(self, workspace_id: str) -> str:
         """Get workspace goal text for validation"""
         try:
-            response = supabase.table("workspaces").select("goal").eq(
+            response = await async_supabase.table("workspaces").select("goal").eq(
                 "id", workspace_id
             ).single().execute()
             
@@ -530,13 +637,14 @@ class AutomatedGoalMonitor:
     async def _update_validation_timestamps(self, workspace_id: str):
         """Update last_validation_at for all active goals in workspace"""
         try:
-            supabase.table("workspace_goals").update({
+            await async_supabase.table("workspace_goals").update({
                 "last_validation_at": datetime.now().isoformat()
             }).eq(
                 "workspace_id", workspace_id
             ).eq(
                 "status", GoalStatus.ACTIVE.value
             ).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id)
             
         except Exception as e:
             logger.error(f"Error updating validation timestamps: {e}")
@@ -566,7 +674,7 @@ class AutomatedGoalMonitor:
                     continue
 
                 # 🚨 IDEMPOTENCY FIX: Check if a corrective task for this goal already exists
-                existing_task_response = supabase.table("tasks").select("id").eq("goal_id", goal_id).eq("is_corrective", True).in_("status", ["pending", "in_progress"]).execute()
+                existing_task_response = await async_supabase.table("tasks").select("id").eq("goal_id", goal_id).eq("is_corrective", True).in_("status", ["pending", "in_progress"]).execute()
                 
                 if existing_task_response.data:
                     logger.warning(f"Skipping corrective task for goal {goal_id}: an active corrective task already exists.")
@@ -639,7 +747,7 @@ class AutomatedGoalMonitor:
                 }
                 
                 # Insert task
-                response = supabase.table("tasks").insert(db_task).execute()
+                response = await async_supabase.table("tasks").insert(db_task).execute()
                 
                 if response.data:
                     created_task = response.data[0]
@@ -751,12 +859,18 @@ class AutomatedGoalMonitor:
         except Exception as e:
             logger.error(f"Error scheduling priority recheck: {e}")
     
-    async def _check_workspace_health(self, workspace_id: str) -> bool:
+    async def _check_workspace_health(
+        self,
+        workspace_id: str,
+        workspace_row: Optional[Dict] = None,
+        agents: Optional[List[Dict]] = None
+    ) -> bool:
         """
         🏥 ENHANCED WORKSPACE HEALTH CHECK with Auto-Recovery
         
         Returns False for workspaces that shouldn't be processed by goal monitoring
-        Uses WorkspaceHealthManager for intelligent health assessment and recovery
+        Uses WorkspaceHealthManager for intelligent health assessment and recovery.
+        ``workspace_row`` / ``agents`` are batch-preloaded rows; when omitted they are queried.
         """
         try:
             # 🏥 ENHANCED: Try to use WorkspaceHealthManager first
@@ -765,7 +879,7 @@ class AutomatedGoalMonitor:
                 
                 # Get comprehensive health report with auto-recovery
                 health_report = await workspace_health_manager.check_workspace_health_with_recovery(
-                    workspace_id, attempt_auto_recovery=True
+                    workspace_id, attempt_auto_recovery=True, workspace_data=workspace_row, agents=agents
                 )
                 
                 # CRITICAL FIX: Ensure health_report.issues is always a list of dicts
@@ -819,15 +933,17 @@ class AutomatedGoalMonitor:
                 
                 # FALLBACK: Original basic health check logic
                 # 1. Check workspace status
-                workspace_response = supabase.table("workspaces").select("*").eq(
-                    "id", workspace_id
-                ).single().execute()
+                if workspace_row is None:
+                    workspace_response = await async_supabase.table("workspaces").select("*").eq(
+                        "id", workspace_id
+                    ).single().execute()
+                    workspace_row = workspace_response.data
                 
-                if not workspace_response.data:
+                if not workspace_row:
                     await self._alert_workspace_issue(workspace_id, "WORKSPACE_NOT_FOUND", "Workspace does not exist in database")
                     return False
                 
-                workspace = workspace_response.data
+                workspace = workspace_row
                 workspace_status = workspace.get("status")
                 workspace_name = workspace.get("name", "Unknown")
                 
@@ -846,9 +962,10 @@ class AutomatedGoalMonitor:
                     
                     try:
                         # Reset status to active
-                        supabase.table("workspaces").update({
+                        await async_supabase.table("workspaces").update({
                             "status": "active"
                         }).eq("id", workspace_id).execute()
+                        task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                         
                         logger.info(f"✅ Auto-recovered workspace {workspace_id} from needs_intervention to active")
                         return True  # Continue processing after recovery
@@ -857,6 +974,13 @@ class AutomatedGoalMonitor:
                         logger.error(f"❌ Failed to auto-recover workspace {workspace_id}: {recovery_err}")
                         return False
                 
+                # Agent rows (batch-preloaded by the monitoring cycle when available)
+                if agents is None:
+                    agents_response = await async_supabase.table("agents").select("id, status").eq(
+                        "workspace_id", workspace_id
+                    ).execute()
+                    agents = agents_response.data or []
+                
                 # 3. 🎯 UNIFIED AGENT STATUS CHECK: Use AgentStatusManager if available
                 if AGENT_STATUS_MANAGER_AVAILABLE and agent_status_manager:
                     try:
@@ -870,31 +994,15 @@ class AutomatedGoalMonitor:
                             for agent in available_agents_info
                         ]
                         
-                        # Get all agents count for health reporting
-                        agents_response = supabase.table("agents").select("id, status").eq(
-                            "workspace_id", workspace_id
-                        ).execute()
-                        agents = agents_response.data or []
-                        
                         logger.debug(f"🎯 UNIFIED AGENT STATUS: {len(available_agents)} available agents from AgentStatusManager")
                         
                     except Exception as asm_error:
                         logger.warning(f"⚠️ AgentStatusManager error in health check, falling back: {asm_error}")
                         # Fallback to legacy logic
-                        agents_response = supabase.table("agents").select("id, status").eq(
-                            "workspace_id", workspace_id
-                        ).execute()
-                        
-                        agents = agents_response.data or []
                         # CRITICAL FIX: Accept both "available" and "active" agents (matching executor.py logic)
                         available_agents = [a for a in agents if a.get("status") in ["available", "active"]]
                 else:
                     # FALLBACK: Legacy agent status checking
-                    agents_response = supabase.table("agents").select("id, status").eq(
-                        "workspace_id", workspace_id
-                    ).execute()
-                    
-                    agents = agents_response.data or []
                     # CRITICAL FIX: Accept both "available" and "active" agents (matching executor.py logic)
                     available_agents = [a for a in agents if a.get("status") in ["available", "active"]]
                 
@@ -947,17 +1055,18 @@ class AutomatedGoalMonitor:
                 "created_at": datetime.now().isoformat()
             }
             
-            supabase.table("logs").insert(alert_data).execute()
+            await async_supabase.table("logs").insert(alert_data).execute()
             
             # Also log to console for immediate visibility
             logger.error(f"🚨 WORKSPACE ALERT [{issue_type}]: {description} (Workspace: {workspace_id})")
             
             # Update workspace status if it's orphaned
             if issue_type == "ORPHANED_WORKSPACE":
-                supabase.table("workspaces").update({
+                await async_supabase.table("workspaces").update({
                     "status": "needs_intervention",
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", workspace_id).execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                 
                 logger.info(f"📝 Updated workspace {workspace_id} status to 'needs_intervention'")
             
@@ -974,7 +1083,7 @@ class AutomatedGoalMonitor:
             logger.info(f"🤖 Auto-provisioning agents for workspace {workspace_id} (Pillar 4 & 7 compliance)")
             
             # Get workspace details for context
-            workspace_response = supabase.table("workspaces").select("*").eq(
+            workspace_response = await async_supabase.table("workspaces").select("*").eq(
                 "id", workspace_id
             ).single().execute()
             
@@ -1044,9 +1153,10 @@ Always focus on actionable deliverables.""",
             provisioned_count = 0
             for agent_data in essential_agents:
                 try:
-                    response = supabase.table("agents").insert(agent_data).execute()
+                    response = await async_supabase.table("agents").insert(agent_data).execute()
                     if response.data:
                         provisioned_count += 1
+                        task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=response.data[0].get("id"))
                         agent_name = agent_data["name"]
                         agent_role = agent_data["role"]
                         logger.info(f"✅ Auto-provisioned agent: {agent_name} ({agent_role})")
@@ -1058,7 +1168,7 @@ Always focus on actionable deliverables.""",
                 logger.info(f"🎉 Successfully auto-provisioned {provisioned_count} agents for workspace {workspace_id}")
                 
                 # Log this action for audit trail
-                supabase.table("logs").insert({
+                await async_supabase.table("logs").insert({
                     "workspace_id": workspace_id,
                     "type": "system",
                     "message": f"Auto-provisioned {provisioned_count} essential agents (Pillar 4 & 7 compliance)",
@@ -1086,7 +1196,7 @@ Always focus on actionable deliverables.""",
         """
         try:
             # Get newly provisioned agents
-            response = supabase.table("agents").select("*").eq(
+            response = await async_supabase.table("agents").select("*").eq(
                 "workspace_id", workspace_id
             ).eq(
                 "status", "active"
@@ -1162,7 +1272,7 @@ Always focus on actionable deliverables.""",
         
         try:
             # 🛡️ ENHANCED DUPLICATE PREVENTION: Use workspace status as a lock
-            workspace_response = supabase.table("workspaces").select("status").eq(
+            workspace_response = await async_supabase.table("workspaces").select("status").eq(
                 "id", workspace_id
             ).single().execute()
             
@@ -1183,15 +1293,16 @@ Always focus on actionable deliverables.""",
                 }
             
             # Set workspace status to processing to prevent concurrent task creation
-            supabase.table("workspaces").update({
+            await async_supabase.table("workspaces").update({
                 "status": "processing_tasks",
                 "updated_at": datetime.now().isoformat()
             }).eq("id", workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             logger.info(f"🔒 Locked workspace {workspace_id} for task generation")
             
             # 🛡️ DUPLICATE PREVENTION: Check if tasks already exist for this workspace
-            existing_tasks_response = supabase.table("tasks").select("id").eq(
+            existing_tasks_response = await async_supabase.table("tasks").select("id").eq(
                 "workspace_id", workspace_id
             ).neq(
                 "status", "completed"
@@ -1202,10 +1313,11 @@ Always focus on actionable deliverables.""",
                 logger.info(f"🔄 Workspace {workspace_id} already has {len(existing_tasks)} active tasks - skipping immediate goal analysis")
                 
                 # Reset workspace status
-                supabase.table("workspaces").update({
+                await async_supabase.table("workspaces").update({
                     "status": "active",
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", workspace_id).execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                 
                 return {
                     "success": True,
@@ -1216,7 +1328,7 @@ Always focus on actionable deliverables.""",
                 }
             
             # 1. Get newly created goals from the workspace
-            response = supabase.table("workspace_goals").select("*").eq(
+            response = await async_supabase.table("workspace_goals").select("*").eq(
                 "workspace_id", workspace_id
             ).eq(
                 "status", GoalStatus.ACTIVE.value
@@ -1239,7 +1351,7 @@ Always focus on actionable deliverables.""",
                             logger.info(f"✅ Created {len(created_goals)} workspace goals from goal text")
                             
                             # Re-fetch the newly created goals
-                            response = supabase.table("workspace_goals").select("*").eq(
+                            response = await async_supabase.table("workspace_goals").select("*").eq(
                                 "workspace_id", workspace_id
                             ).eq(
                                 "status", GoalStatus.ACTIVE.value
@@ -1253,10 +1365,11 @@ Always focus on actionable deliverables.""",
                 # If still no goals, return failure
                 if not workspace_goals:
                     # Reset workspace status
-                    supabase.table("workspaces").update({
+                    await async_supabase.table("workspaces").update({
                         "status": "active",
                         "updated_at": datetime.now().isoformat()
                     }).eq("id", workspace_id).execute()
+                    task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                     
                     return {"success": False, "reason": "no_active_goals_and_failed_to_create"}
             
@@ -1293,10 +1406,11 @@ Always focus on actionable deliverables.""",
                     initial_tasks.extend(goal_tasks)
             
             # 3. Reset workspace status to active after task creation
-            supabase.table("workspaces").update({
+            await async_supabase.table("workspaces").update({
                 "status": "active",
                 "updated_at": datetime.now().isoformat()
             }).eq("id", workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             logger.info(f"🔓 Unlocked workspace {workspace_id} after task generation")
             
@@ -1317,10 +1431,11 @@ Always focus on actionable deliverables.""",
             
             # Always reset workspace status on error
             try:
-                supabase.table("workspaces").update({
+                await async_supabase.table("workspaces").update({
                     "status": "active",
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", workspace_id).execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                 logger.info(f"🔓 Reset workspace {workspace_id} status after error")
             except:
                 pass
@@ -1336,7 +1451,7 @@ Always focus on actionable deliverables.""",
         """Get current monitoring status and statistics"""
         try:
             # Get active workspaces count
-            response = supabase.table("workspace_goals").select(
+            response = await async_supabase.table("workspace_goals").select(
                 "workspace_id"
             ).eq(
                 "status", GoalStatus.ACTIVE.value
@@ -1346,7 +1461,7 @@ Always focus on actionable deliverables.""",
             
             # Get corrective tasks created today
             today = datetime.now().date()
-            response = supabase.table("tasks").select("id").eq(
+            response = await async_supabase.table("tasks").select("id").eq(
                 "is_corrective", True
             ).gte(
                 "created_at", today.isoformat()
@@ -1360,7 +1475,8 @@ Always focus on actionable deliverables.""",
                 "active_workspaces": unique_workspaces,
                 "corrective_tasks_today": corrective_tasks_today,
                 "last_cycle": self.last_validation_cache.get("last_cycle"),
-                "next_cycle_in_minutes": self.monitor_interval_minutes if self.is_running else None
+                "next_cycle_in_minutes": self.monitor_interval_minutes if self.is_running else None,
+                "validation_metrics": self.get_validation_metrics()
             }
             
         except Exception as e:
@@ -1406,16 +1522,17 @@ Always focus on actionable deliverables.""",
                         total_generated += requirements_count
                         
                         # Update goal with asset requirements count
-                        supabase.table("workspace_goals").update({
+                        await async_supabase.table("workspace_goals").update({
                             "asset_requirements_count": requirements_count,
                             "ai_validation_enabled": True,
                             "updated_at": datetime.now().isoformat()
                         }).eq("id", goal_id).execute()
+                        task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=goal_id)
                         
                         logger.info(f"✅ Generated {requirements_count} asset requirements for goal '{metric_type}'")
                         
                         # Log the generation
-                        supabase.table("logs").insert({
+                        await async_supabase.table("logs").insert({
                             "workspace_id": workspace_id,
                             "type": "asset_generation",
                             "message": f"Auto-generated {requirements_count} asset requirements for goal: {metric_type}",
@@ -1523,6 +1640,12 @@ Always focus on actionable deliverables.""",
             for ws_id, _ in sorted_entries[:excess_count]:
                 del self.last_validation_cache[ws_id]
         
+        # Reset per-workspace validation metrics of workspaces no longer validated
+        if len(self.workspace_validation_histograms) > self.max_cache_entries * 5:
+            self.workspace_validation_histograms = {}
+            self.workspace_validation_outcomes = defaultdict(Counter)
+            logger.debug("Reset workspace validation metrics")
+        
         if expired_workspaces or expired_validations:
             logger.info(f"🧹 Cache cleanup: removed {len(expired_workspaces)} workspace entries, {len(expired_validations)} validation entries")
     
@@ -1536,6 +1659,27 @@ Always focus on actionable deliverables.""",
             "background_tasks_count": len(self._background_tasks)
         }
     
+    def get_validation_metrics(self) -> Dict[str, Any]:
+        """Cycle duration and per-workspace validation latency/outcomes"""
+        return {
+            "concurrency": self.validation_concurrency,
+            "workspace_timeout_seconds": self.validation_timeout_seconds,
+            "sharding": {
+                "enabled": self.shard_ring is not None,
+                "replica_id": self.shard_node_id,
+                "replicas": list(self.shard_ring.nodes) if self.shard_ring else [],
+            },
+            "last_cycle": self.last_cycle_metrics,
+            "cycle_seconds": self.cycle_histogram.to_dict(),
+            "workspaces": {
+                ws_id: {
+                    **histogram.to_dict(),
+                    "outcomes": dict(self.workspace_validation_outcomes.get(ws_id, {})),
+                }
+                for ws_id, histogram in self.workspace_validation_histograms.items()
+            },
+        }
+    
     async def _check_and_create_missing_deliverables(self):
         """Check for completed goals without deliverables and create them"""
         try:
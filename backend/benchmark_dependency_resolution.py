@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Dependency Resolution Benchmark - sequential get_task() vs batched dependency graph
+Builds a workspace of interdependent pending tasks and measures how long one
+ready-set computation takes with a simulated PostgREST round-trip, plus the cost of
+incrementally propagating a single status change through the graph.
+
+Usage:
+    python benchmark_dependency_resolution.py [--tasks 100 300 1000] [--fanin 3] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List
+
+from services.task_dependency_graph import TaskDependencyGraph, MISSING_DEPENDENCY
+
+
+def _build_workspace(n_tasks: int, fanin: int, completed_ratio: float, seed: int = 42):
+    """Random DAG: each task depends on up to ``fanin`` earlier tasks."""
+    rng = random.Random(seed)
+    statuses: Dict[str, str] = {}
+    tasks: List[Dict] = []
+    for i in range(n_tasks):
+        task_id = f"task-{i}"
+        deps = [f"task-{j}" for j in rng.sample(range(i), min(i, rng.randint(0, fanin)))] if i else []
+        status = "completed" if rng.random() < completed_ratio else "pending"
+        statuses[task_id] = status
+        tasks.append({"id": task_id, "status": status, "depends_on_task_ids": deps})
+    pending = [t for t in tasks if t["status"] == "pending"]
+    return pending, statuses
+
+
+async def _legacy(pending: List[Dict], statuses: Dict[str, str], latency_s: float) -> int:
+    round_trips = 1
+    await asyncio.sleep(latency_s)  # list_tasks(status="pending")
+    ready = 0
+    for task in pending:
+        all_complete = True
+        for dep_id in task["depends_on_task_ids"]:
+            round_trips += 1
+            await asyncio.sleep(latency_s)  # get_task(dep_id)
+            if statuses.get(dep_id) != "completed":
+                all_complete = False
+                break
+        ready += all_complete
+    return round_trips
+
+
+async def _batched(pending: List[Dict], statuses: Dict[str, str], latency_s: float, batch_size: int = 200) -> int:
+    round_trips = 1
+    await asyncio.sleep(latency_s)  # list_tasks(status="pending")
+    graph = TaskDependencyGraph("bench")
+    graph.sync_pending(pending)
+    unresolved = list(graph.unresolved_dependencies())
+    for start in range(0, len(unresolved), batch_size):
+        round_trips += 1
+        await asyncio.sleep(latency_s)  # in_("id", batch)
+    for dep_id in unresolved:
+        graph.set_status(dep_id, statuses.get(dep_id) or MISSING_DEPENDENCY)
+    graph.ready_task_ids()
+    return round_trips
+
+
+def _incremental_update_us(pending: List[Dict], statuses: Dict[str, str]) -> float:
+    graph = TaskDependencyGraph("bench")
+    graph.sync_pending(pending)
+    for dep_id in graph.unresolved_dependencies():
+        graph.set_status(dep_id, statuses.get(dep_id) or MISSING_DEPENDENCY)
+
+    candidates = [t["id"] for t in pending]
+    start = time.perf_counter()
+    for task_id in candidates:
+        graph.set_status(task_id, "completed")
+    return (time.perf_counter() - start) / max(1, len(candidates)) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ready-task dependency resolution")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 300, 1000], help="Tasks per workspace")
+    parser.add_argument("--fanin", type=int, default=3, help="Max dependencies per task")
+    parser.add_argument("--completed-ratio", type=float, default=0.5, help="Share of already completed tasks")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Simulated PostgREST round-trip")
+    args = parser.parse_args()
+    latency_s = args.latency_ms / 1000
+
+    print(f"🔬 fan-in {args.fanin}, {args.completed_ratio:.0%} completed, {args.latency_ms}ms per round-trip\n")
+    print(f"{'tasks':>6} {'legacy rt':>10} {'legacy(s)':>10} {'graph rt':>9} {'graph(s)':>9} {'update(us)':>11}")
+    for n_tasks in args.tasks:
+        pending, statuses = _build_workspace(n_tasks, args.fanin, args.completed_ratio)
+
+        start = time.perf_counter()
+        legacy_rt = asyncio.run(_legacy(pending, statuses, latency_s))
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        graph_rt = asyncio.run(_batched(pending, statuses, latency_s))
+        graph_s = time.perf_counter() - start
+
+        update_us = _incremental_update_us(pending, statuses)
+        print(f"{n_tasks:>6} {legacy_rt:>10} {legacy_s:>10.2f} {graph_rt:>9} {graph_s:>9.3f} {update_us:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Event Loop Lag Benchmark - synchronous vs non-blocking Supabase access
+Simulates concurrent task execution issuing PostgREST queries and measures how
+late a 10ms heartbeat coroutine (standing in for websockets / goal monitor) fires.
+
+Usage:
+    python benchmark_event_loop_lag.py [--workers 20] [--queries 10] [--latency-ms 40]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from utils.async_supabase import AsyncSupabaseClient
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+class _FakeBuilder:
+    """Mimics a supabase-py request builder whose execute() blocks on network I/O."""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, *args, **kwargs):
+        return self
+
+    def execute(self):
+        time.sleep(self.latency_s)
+        return _FakeResponse([{"id": "task", "status": "pending"}])
+
+
+class _FakeSyncClient:
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+
+    def table(self, name: str):
+        return _FakeBuilder(self.latency_s)
+
+
+async def _heartbeat(stop: asyncio.Event, samples: List[float], interval: float = 0.01):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def _run(mode: str, workers: int, queries: int, latency_s: float) -> Dict[str, float]:
+    sync_client = _FakeSyncClient(latency_s)
+    async_client = AsyncSupabaseClient(sync_client, backend="threadpool", max_concurrency=workers)
+
+    async def task_worker():
+        for _ in range(queries):
+            if mode == "blocking":
+                sync_client.table("tasks").select("*").eq("status", "pending").execute()
+                await asyncio.sleep(0)
+            else:
+                await async_client.table("tasks").select("*").eq("status", "pending").execute()
+
+    stop = asyncio.Event()
+    lag_samples: List[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lag_samples))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(task_worker() for _ in range(workers)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await heartbeat
+
+    lag_samples.sort()
+    p95_index = max(0, int(len(lag_samples) * 0.95) - 1)
+    return {
+        "elapsed_s": elapsed,
+        "queries_per_s": (workers * queries) / elapsed,
+        "lag_p50_ms": statistics.median(lag_samples) if lag_samples else 0.0,
+        "lag_p95_ms": lag_samples[p95_index] if lag_samples else 0.0,
+        "lag_max_ms": lag_samples[-1] if lag_samples else 0.0,
+        "heartbeats": len(lag_samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure event loop lag under concurrent DB access")
+    parser.add_argument("--workers", type=int, default=20, help="Concurrent task executors")
+    parser.add_argument("--queries", type=int, default=10, help="Queries per executor")
+    parser.add_argument("--latency-ms", type=float, default=40.0, help="Simulated PostgREST round-trip")
+    args = parser.parse_args()
+
+    print(f"🔬 {args.workers} workers x {args.queries} queries, {args.latency_ms}ms per round-trip\n")
+    print(f"{'mode':<10} {'elapsed(s)':>10} {'q/s':>8} {'lag p50':>9} {'lag p95':>9} {'lag max':>9}")
+    for mode in ("blocking", "async"):
+        r = asyncio.run(_run(mode, args.workers, args.queries, args.latency_ms / 1000))
+        print(
+            f"{mode:<10} {r['elapsed_s']:>10.2f} {r['queries_per_s']:>8.1f} "
+            f"{r['lag_p50_ms']:>7.1f}ms {r['lag_p95_ms']:>7.1f}ms {r['lag_max_ms']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Quality Batch Validation Benchmark - per-artifact serial gates vs batch_validate_artifacts
+Re-validates a synthetic backlog of artifacts against a stub model with fixed latency
+and reports throughput (artifacts per minute) and model calls for:
+
+  serial  - validate_artifact_quality one artifact at a time, one call per rule
+  batch   - batch_validate_artifacts (bulk loads, multi-rule calls, bounded concurrency)
+
+Database access is stubbed in-process with a fixed per-query latency.
+
+Usage:
+    python benchmark_quality_batch_validation.py [--artifacts 60] [--types 3] [--rules 6]
+        [--model-ms 400] [--db-ms 20] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+from ai_quality_assurance import ai_quality_gate_engine as gate_module
+from ai_quality_assurance.ai_quality_gate_engine import AIQualityGateEngine
+from models import AssetArtifact, QualityRule
+
+
+class StubCompletions:
+    """Stub model: fixed latency, passes every rule with a 0.8 score"""
+
+    def __init__(self, latency_s: float):
+        self.latency_s = latency_s
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency_s)
+        prompt = kwargs["messages"][0]["content"]
+        verdict = {"validation_passed": True, "quality_score": 0.8}
+        if "rule_results" in prompt:
+            keys = [line.strip().split(":", 1)[0] for line in prompt.splitlines()
+                    if line.strip()[:1] == "R" and line.strip().split(":", 1)[0][1:].isdigit()]
+            payload = {"rule_results": [{"rule_key": key, **verdict} for key in keys]}
+        else:
+            payload = verdict
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+
+def _install_stub_db(artifacts, rules_by_type, db_s: float, counters):
+    by_id = {str(artifact.id): artifact for artifact in artifacts}
+
+    async def query(result):
+        counters["queries"] += 1
+        await asyncio.sleep(db_s)
+        return result
+
+    gate_module.get_quality_rules_for_asset_type = lambda asset_type: query(rules_by_type.get(asset_type, []))
+    gate_module.get_quality_rules_for_asset_types = lambda types: query({t: rules_by_type.get(t, []) for t in types})
+    gate_module.get_asset_artifacts_by_ids = lambda ids: query([by_id[str(i)] for i in ids if str(i) in by_id])
+    gate_module.log_quality_validations = lambda validations: query([])
+    gate_module.update_artifact_status = lambda artifact_id, status, score: query(True)
+    gate_module.bulk_update_artifact_statuses = lambda updates: query(len(updates))
+
+
+def _backlog(count: int, types: int, rules: int):
+    asset_types = [f"type_{i}" for i in range(types)]
+    artifacts = [
+        AssetArtifact(requirement_id=uuid4(), artifact_name=f"Artifact {i}", artifact_type=asset_types[i % types],
+                      content={"body": "Quarterly plan " * 50})
+        for i in range(count)
+    ]
+    rules_by_type = {
+        asset_type: [QualityRule(id=uuid4(), rule_name=f"{asset_type} rule {r}", asset_type=asset_type,
+                                 ai_validation_prompt=f"Check criterion {r}") for r in range(rules)]
+        for asset_type in asset_types
+    }
+    return artifacts, rules_by_type
+
+
+def _engine(completions, concurrency: int, multi_rule: bool) -> AIQualityGateEngine:
+    engine = AIQualityGateEngine(openai_client=SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    engine.auto_enhancement_enabled = False
+    engine.auto_learning_enabled = False
+    engine.multi_rule_evaluation = multi_rule
+    engine.rule_concurrency = 1 if not multi_rule else engine.rule_concurrency
+    engine.batch_concurrency = concurrency
+    return engine
+
+
+async def _run(mode: str, artifacts, rules_by_type, args):
+    counters = {"queries": 0}
+    _install_stub_db(artifacts, rules_by_type, args.db_ms / 1000, counters)
+    completions = StubCompletions(args.model_ms / 1000)
+    started = time.perf_counter()
+    if mode == "serial":
+        engine = _engine(completions, 1, multi_rule=False)
+        for artifact in artifacts:
+            await engine.validate_artifact_quality(artifact)
+    else:
+        engine = _engine(completions, args.concurrency, multi_rule=True)
+        await engine.batch_validate_artifacts([artifact.id for artifact in artifacts], run_followups=False)
+    elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "per_minute": len(artifacts) / elapsed * 60,
+            "model_calls": completions.calls, "queries": counters["queries"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quality batch validation throughput")
+    parser.add_argument("--artifacts", type=int, default=60)
+    parser.add_argument("--types", type=int, default=3, help="Distinct asset types in the backlog")
+    parser.add_argument("--rules", type=int, default=6, help="Quality rules per asset type")
+    parser.add_argument("--model-ms", type=float, default=400.0, help="Stub model latency per call")
+    parser.add_argument("--db-ms", type=float, default=20.0, help="Stub database latency per query")
+    parser.add_argument("--concurrency", type=int, default=8, help="Artifacts validated at once in batch mode")
+    args = parser.parse_args()
+
+    artifacts, rules_by_type = _backlog(args.artifacts, args.types, args.rules)
+    print(f"🔬 {args.artifacts} artifacts, {args.types} types x {args.rules} rules, model {args.model_ms:g}ms, "
+          f"db {args.db_ms:g}ms, batch concurrency {args.concurrency}\n")
+    print(f"{'mode':>7} {'wall (s)':>9} {'artifacts/min':>14} {'model calls':>12} {'db queries':>11}")
+    for mode in ("serial", "batch"):
+        result = asyncio.run(_run(mode, artifacts, rules_by_type, args))
+        print(f"{mode:>7} {result['elapsed']:>9.2f} {result['per_minute']:>14.1f} "
+              f"{result['model_calls']:>12} {result['queries']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Startup Import Benchmark - eager vs deferred router mounting
+Imports ``main`` in a fresh interpreter per run and reports wall time and peak RSS
+with LAZY_ROUTERS_ENABLED=false (every router mounted at import) and =true
+(rarely used groups mounted on first request). One extra run under
+``python -X importtime`` lists the modules with the largest cumulative import
+time, which is where the next candidates for lazy loading are.
+
+Usage:
+    python benchmark_startup_imports.py [--runs 3] [--top 25] [--module main]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).parent
+
+_PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print("__STARTUP__" + json.dumps({{"seconds": elapsed, "rss_mb": rss_kb / 1024, "modules": len(sys.modules)}}))
+"""
+
+
+def _env(lazy: bool) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["LAZY_ROUTERS_ENABLED"] = "true" if lazy else "false"
+    return env
+
+
+def _probe(module: str, lazy: bool) -> Dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=BACKEND_DIR, env=_env(lazy), capture_output=True, text=True,
+    )
+    for line in result.stdout.splitlines():
+        if line.startswith("__STARTUP__"):
+            return json.loads(line[len("__STARTUP__"):])
+    raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+
+
+def _importtime(module: str, lazy: bool) -> List[Tuple[int, int, str]]:
+    """(cumulative_us, self_us, module) rows parsed from ``-X importtime`` output"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=_env(lazy), capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|", 2))
+        rows.append((int(cumulative_us), int(self_us), name))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark backend startup imports")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per mode")
+    parser.add_argument("--top", type=int, default=25, help="Rows of the import-time report")
+    parser.add_argument("--module", default="main", help="Module whose import is measured")
+    args = parser.parse_args()
+
+    print(f"🔬 import {args.module}: {args.runs} runs per mode\n")
+    print(f"{'mode':>6} {'p50 (s)':>9} {'min (s)':>9} {'rss (MB)':>9} {'modules':>8}")
+    results = {}
+    for lazy in (False, True):
+        runs = [_probe(args.module, lazy) for _ in range(args.runs)]
+        mode = "lazy" if lazy else "eager"
+        results[mode] = runs
+        print(f"{mode:>6} {median(r['seconds'] for r in runs):>9.2f} {min(r['seconds'] for r in runs):>9.2f} "
+              f"{median(r['rss_mb'] for r in runs):>9.1f} {runs[0]['modules']:>8}")
+
+    eager_s = median(r["seconds"] for r in results["eager"])
+    lazy_s = median(r["seconds"] for r in results["lazy"])
+    eager_rss = median(r["rss_mb"] for r in results["eager"])
+    lazy_rss = median(r["rss_mb"] for r in results["lazy"])
+    print(f"\n⏱️  startup {eager_s - lazy_s:+.2f}s saved ({(1 - lazy_s / eager_s):.0%}), "
+          f"RSS {eager_rss - lazy_rss:+.1f}MB saved ({(1 - lazy_rss / eager_rss):.0%})")
+
+    rows = _importtime(args.module, lazy=True)
+    print(f"\n📋 Top {args.top} imports by cumulative time (lazy mode, python -X importtime)")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    for cumulative_us, self_us, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:>16.1f} {self_us / 1000:>10.1f}  {name}")
+
+
+if __name__ == "__main__":
+    main()
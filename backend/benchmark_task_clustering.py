@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Task Clustering Benchmark - pairwise difflib loop vs vectorized all-pairs similarity
+Generates a workspace of task descriptions (families of paraphrased near-duplicates
+plus unrelated tasks) and measures how long finding every similar pair takes with
+the legacy O(n²) SequenceMatcher loop and with each task_similarity_clustering
+backend, along with the pairs found.
+
+Usage:
+    python benchmark_task_clustering.py [--tasks 100 1000 10000] [--threshold 0.7] [--legacy-max 300]
+"""
+
+import argparse
+import difflib
+import random
+import time
+from typing import List
+
+from services.task_similarity_clustering import HAS_NUMPY, HAS_SCIPY, find_similar_pairs
+
+_VERBS = ["create", "write", "analyze", "research", "design", "publish", "review", "draft", "plan", "optimize"]
+_NOUNS = ["linkedin post", "email sequence", "landing page", "competitor list", "budget report",
+          "newsletter", "case study", "webinar outline", "seo audit", "press release"]
+
+
+def _build_texts(n_tasks: int, duplicate_ratio: float = 0.3, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    vocabulary = [f"term{i}" for i in range(5000)]
+    texts: List[str] = []
+    while len(texts) < n_tasks:
+        base = (f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)} about "
+                + " ".join(rng.sample(vocabulary, 12)))
+        texts.append(base)
+        if rng.random() < duplicate_ratio and len(texts) < n_tasks:
+            # Paraphrase: drop one word and append another
+            words = base.split()
+            words.pop(rng.randrange(2, len(words)))
+            texts.append(" ".join(words + [rng.choice(vocabulary)]))
+    return texts
+
+
+def _legacy(texts: List[str], threshold: float) -> int:
+    pairs = 0
+    for i, text1 in enumerate(texts):
+        for text2 in texts[i + 1:]:
+            if difflib.SequenceMatcher(None, text1, text2).ratio() >= threshold:
+                pairs += 1
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark all-pairs task similarity")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--threshold", type=float, default=0.7, help="Similarity threshold")
+    parser.add_argument("--legacy-max", type=int, default=300, help="Largest workspace run with difflib")
+    args = parser.parse_args()
+
+    methods = ["inverted", "lsh"]
+    if HAS_NUMPY:
+        methods.insert(1, "dense")
+    if HAS_SCIPY:
+        methods.insert(1, "sparse")
+
+    print(f"🔬 threshold {args.threshold}, numpy={HAS_NUMPY}, scipy={HAS_SCIPY}\n")
+    print(f"{'tasks':>7} {'method':>9} {'time(ms)':>10} {'pairs':>7}")
+    for n_tasks in args.tasks:
+        texts = _build_texts(n_tasks)
+        if n_tasks <= args.legacy_max:
+            start = time.perf_counter()
+            pairs = _legacy(texts, args.threshold)
+            print(f"{n_tasks:>7} {'difflib':>9} {(time.perf_counter() - start) * 1000:>10.1f} {pairs:>7}")
+        for method in methods:
+            start = time.perf_counter()
+            pairs = find_similar_pairs(texts, args.threshold, method)
+            print(f"{n_tasks:>7} {method:>9} {(time.perf_counter() - start) * 1000:>10.1f} {len(pairs):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Thinking Step Benchmark - inline insert + broadcast vs write-behind buffer
+Emits thinking steps at a fixed rate and measures the latency the producer sees per
+add_thinking_step call, with a simulated PostgREST insert and WebSocket fan-out.
+
+Usage:
+    python benchmark_thinking_steps.py [--rates 10 100 1000] [--duration 2] [--insert-ms 15] [--broadcast-ms 2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Dict, List
+
+from services.thinking_step_writer import ThinkingEventDispatcher, ThinkingStepWriter
+
+
+class SimulatedBackend:
+    def __init__(self, insert_s: float, broadcast_s: float):
+        self.insert_s = insert_s
+        self.broadcast_s = broadcast_s
+        self.round_trips = 0
+        self.rows = 0
+
+    async def insert(self, rows: List[Dict]):
+        self.round_trips += 1
+        self.rows += len(rows)
+        await asyncio.sleep(self.insert_s)
+
+    async def broadcast(self, event_type: str, data: Dict):
+        await asyncio.sleep(self.broadcast_s)
+
+
+async def _produce(rate: float, duration: float, add_step) -> List[float]:
+    latencies = []
+    interval = 1.0 / rate
+    start = time.perf_counter()
+    for i in range(int(rate * duration)):
+        # Fixed-rate schedule: a slow call delays the following ones, as in an agent loop
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        t0 = time.perf_counter()
+        await add_step({"step_id": f"s{i}", "content": "..."})
+        latencies.append(time.perf_counter() - t0)
+    return latencies
+
+
+async def _inline(rate: float, duration: float, backend: SimulatedBackend) -> List[float]:
+    async def add_step(row):
+        await backend.insert([row])
+        await backend.broadcast("step_added", row)
+
+    return await _produce(rate, duration, add_step)
+
+
+async def _write_behind(rate: float, duration: float, backend: SimulatedBackend, batch_size: int, flush_interval: float):
+    writer = ThinkingStepWriter(backend.insert, batch_size=batch_size, flush_interval=flush_interval)
+    dispatcher = ThinkingEventDispatcher(backend.broadcast)
+
+    async def add_step(row):
+        await writer.enqueue(row)
+        dispatcher.dispatch("step_added", row)
+
+    latencies = await _produce(rate, duration, add_step)
+    drain_start = time.perf_counter()
+    await writer.close()
+    await dispatcher.close(timeout=30)
+    return latencies, time.perf_counter() - drain_start
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-step thinking latency")
+    parser.add_argument("--rates", type=float, nargs="+", default=[10, 100, 1000], help="Steps per second")
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds of load per rate")
+    parser.add_argument("--insert-ms", type=float, default=15.0, help="Simulated insert round-trip")
+    parser.add_argument("--broadcast-ms", type=float, default=2.0, help="Simulated WebSocket fan-out")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--flush-interval", type=float, default=0.25)
+    args = parser.parse_args()
+
+    print(f"🔬 insert {args.insert_ms}ms, broadcast {args.broadcast_ms}ms, batch {args.batch_size}, "
+          f"flush every {args.flush_interval}s\n")
+    print(f"{'rate/s':>7} {'mode':>12} {'steps':>6} {'p50(ms)':>8} {'p99(ms)':>8} {'mean(ms)':>9} "
+          f"{'inserts':>8} {'wall(s)':>8}")
+    for rate in args.rates:
+        for mode in ("inline", "write-behind"):
+            backend = SimulatedBackend(args.insert_ms / 1000, args.broadcast_ms / 1000)
+            start = time.perf_counter()
+            if mode == "inline":
+                latencies = asyncio.run(_inline(rate, args.duration, backend))
+            else:
+                latencies, _ = asyncio.run(
+                    _write_behind(rate, args.duration, backend, args.batch_size, args.flush_interval)
+                )
+            wall = time.perf_counter() - start
+            print(
+                f"{rate:>7g} {mode:>12} {len(latencies):>6} "
+                f"{_percentile(latencies, 0.5) * 1000:>8.3f} {_percentile(latencies, 0.99) * 1000:>8.3f} "
+                f"{statistics.mean(latencies) * 1000:>9.3f} {backend.round_trips:>8} {wall:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
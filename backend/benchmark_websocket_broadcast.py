@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+WebSocket Broadcast Benchmark - sequential send loop vs queued fan-out
+Simulates hundreds of clients per workspace (a fraction of them slow) receiving a
+stream of broadcasts, and reports delivery latency percentiles (broadcast call to
+message received) for fast and slow clients, plus the time the producer spends
+inside each broadcast call.
+
+Usage:
+    python benchmark_websocket_broadcast.py [--clients 100 500] [--messages 50] [--rate 100]
+        [--send-ms 0.2] [--slow-fraction 0.02] [--slow-ms 200] [--queue-size 64]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Dict, List
+
+from utils.websocket_broadcast import WebSocketBroadcaster
+
+
+class SimulatedClient:
+    """Fake socket: each send takes ``send_s`` and records when the frame arrived."""
+
+    def __init__(self, send_s: float, slow: bool):
+        self.send_s = send_s
+        self.slow = slow
+        self.latencies: List[float] = []
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(self.send_s)
+        sent_at = json.loads(text)["sent_at"]
+        self.latencies.append(time.perf_counter() - sent_at)
+
+
+def _make_clients(count: int, send_s: float, slow_fraction: float, slow_s: float) -> List[SimulatedClient]:
+    slow_every = int(1 / slow_fraction) if slow_fraction > 0 else 0
+    return [
+        SimulatedClient(slow_s if slow_every and i % slow_every == 0 else send_s, bool(slow_every and i % slow_every == 0))
+        for i in range(count)
+    ]
+
+
+async def _run(mode: str, clients: List[SimulatedClient], messages: int, rate: float, queue_size: int) -> Dict:
+    broadcaster = WebSocketBroadcaster(queue_size=queue_size, send_timeout=30)
+    call_latencies = []
+    interval = 1.0 / rate
+    start = time.perf_counter()
+
+    for i in range(messages):
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        message = {"type": "thinking_step", "seq": i, "data": {"content": "x" * 200}, "sent_at": time.perf_counter()}
+        t0 = time.perf_counter()
+        if mode == "sequential":
+            # Previous behaviour: await every client in turn, serializing per socket
+            for client in clients:
+                await client.send_text(json.dumps(message))
+        else:
+            broadcaster.broadcast(clients, message)
+        call_latencies.append(time.perf_counter() - t0)
+
+    # Let queued frames drain (bounded)
+    deadline = time.perf_counter() + 30
+    while broadcaster.get_stats()["queued"] and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    for client in clients:
+        broadcaster.discard(client)
+
+    return {"calls": call_latencies, "stats": broadcaster.get_stats()}
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WebSocket broadcast fan-out")
+    parser.add_argument("--clients", type=int, nargs="+", default=[100, 500], help="Clients per workspace")
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=100.0, help="Broadcasts per second")
+    parser.add_argument("--send-ms", type=float, default=0.2, help="Per-send time of a healthy client")
+    parser.add_argument("--slow-fraction", type=float, default=0.02, help="Share of slow clients")
+    parser.add_argument("--slow-ms", type=float, default=200.0, help="Per-send time of a slow client")
+    parser.add_argument("--queue-size", type=int, default=64)
+    args = parser.parse_args()
+
+    print(f"🔬 {args.messages} messages at {args.rate:g}/s, send {args.send_ms}ms, "
+          f"{args.slow_fraction:.0%} slow clients at {args.slow_ms}ms, queue {args.queue_size}\n")
+    print(f"{'clients':>7} {'mode':>10} {'fast p50':>9} {'fast p95':>9} {'fast p99':>9} {'slow p99':>9} "
+          f"{'call p99':>9} {'dropped':>8} {'wall(s)':>8}")
+    for count in args.clients:
+        for mode in ("sequential", "queued"):
+            clients = _make_clients(count, args.send_ms / 1000, args.slow_fraction, args.slow_ms / 1000)
+            start = time.perf_counter()
+            result = asyncio.run(_run(mode, clients, args.messages, args.rate, args.queue_size))
+            wall = time.perf_counter() - start
+            fast = [latency for client in clients if not client.slow for latency in client.latencies]
+            slow = [latency for client in clients if client.slow for latency in client.latencies]
+            print(
+                f"{count:>7} {mode:>10} "
+                f"{_percentile(fast, 0.5) * 1000:>8.1f}m {_percentile(fast, 0.95) * 1000:>8.1f}m "
+                f"{_percentile(fast, 0.99) * 1000:>8.1f}m {_percentile(slow, 0.99) * 1000:>8.1f}m "
+                f"{_percentile(result['calls'], 0.99) * 1000:>8.2f}m {result['stats']['dropped']:>8} {wall:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
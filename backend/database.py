@@ -4,7 +4,7 @@ import asyncio
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import logging
-from typing import Optional, Dict, Any, List, Union, Callable
+from typing import Optional, Dict, Any, List, Tuple, Union, Callable, Set
 from uuid import UUID
 import uuid
 from datetime import datetime, timedelta
@@ -46,6 +46,31 @@ except ImportError as e:
     CONSTRAINT_PREVENTION_AVAILABLE = False
     constraint_violation_preventer = None
 
+from utils.async_supabase import AsyncSupabaseClient
+from utils.task_event_bus import (
+    task_event_bus, TASK_CREATED, TASK_STATUS_CHANGED, GOAL_CHANGED, DELIVERABLE_CHANGED,
+    WORKSPACE_CHANGED, AGENT_CHANGED
+)
+from utils.performance_cache import cached, invalidate_workspace_cache, invalidate_agent_cache
+
+# Short TTL for hot read helpers; writes in this module invalidate by tag, direct
+# writers elsewhere publish WORKSPACE_CHANGED / AGENT_CHANGED on the task event bus
+READ_CACHE_TTL_SECONDS = int(os.getenv("DB_READ_CACHE_TTL_SECONDS", "30"))
+
+
+def _invalidate_cached_reads(event):
+    """Task event bus listener: drop cached workspace/agent reads touched by a write outside this module"""
+    if event.event_type == WORKSPACE_CHANGED and event.workspace_id:
+        invalidate_workspace_cache(event.workspace_id)
+    elif event.event_type == AGENT_CHANGED:
+        if event.data.get("agent_id"):
+            invalidate_agent_cache(event.data["agent_id"])
+        if event.workspace_id:
+            invalidate_workspace_cache(event.workspace_id)
+
+
+task_event_bus.add_listener(_invalidate_cached_reads)
+
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_KEY")
 
@@ -96,6 +121,28 @@ def get_supabase_service_client() -> Client:
     """Get the privileged Supabase service client instance (admin-level, bypasses RLS)."""
     return supabase_service
 
+# Async facades: query execution never blocks the event loop shared by the executor,
+# websockets and the goal monitor. The clients are resolved lazily through the getters
+# so tests patching `database.supabase` are honoured.
+async_supabase = AsyncSupabaseClient(
+    lambda: get_supabase_client(),
+    rest_url=f"{supabase_url.rstrip('/')}/rest/v1",
+    api_key=supabase_key
+)
+async_supabase_service = AsyncSupabaseClient(
+    lambda: get_supabase_service_client(),
+    rest_url=f"{supabase_url.rstrip('/')}/rest/v1",
+    api_key=supabase_service_key or supabase_key
+)
+
+def get_async_supabase_client() -> AsyncSupabaseClient:
+    """Get the non-blocking facade over the standard Supabase client."""
+    return async_supabase
+
+def get_async_supabase_service_client() -> AsyncSupabaseClient:
+    """Get the non-blocking facade over the privileged Supabase service client."""
+    return async_supabase_service
+
 # 🤖 AI-DRIVEN ROOT CAUSE FIX: Constraint-safe database operations
 async def safe_database_operation(
     operation_type: str,
@@ -123,19 +170,19 @@ async def safe_database_operation(
             # Fallback to direct operation if preventer not available
             logger.warning(f"⚠️ Constraint prevention not available, performing direct {operation_type} on {table_name}")
             if operation_type.upper() == "INSERT":
-                return supabase.table(table_name).insert(data).execute()
+                return await async_supabase.table(table_name).insert(data).execute()
             elif operation_type.upper() == "UPDATE":
                 # For UPDATE, we need an ID or condition - this is simplified
-                return supabase.table(table_name).update(data).execute()
+                return await async_supabase.table(table_name).update(data).execute()
             elif operation_type.upper() == "DELETE":
                 # For DELETE, use the ID from data
                 record_id = data.get("id")
                 if record_id:
-                    return supabase.table(table_name).delete().eq("id", record_id).execute()
+                    return await async_supabase.table(table_name).delete().eq("id", record_id).execute()
                 else:
                     raise ValueError("DELETE operation requires 'id' in data")
             else:
-                return supabase.table(table_name).upsert(data).execute()
+                return await async_supabase.table(table_name).upsert(data).execute()
         
         # Use constraint violation preventer
         logger.info(f"🔍 Validating {operation_type} operation on {table_name} with constraint prevention")
@@ -167,24 +214,24 @@ async def safe_database_operation(
         
         # Perform the actual database operation with validated data
         if operation_type.upper() == "INSERT":
-            result = supabase.table(table_name).insert(corrected_data).execute()
+            result = await async_supabase.table(table_name).insert(corrected_data).execute()
         elif operation_type.upper() == "UPDATE":
             # For UPDATE operations, extract ID from data for condition
             record_id = corrected_data.get("id")
             if record_id:
                 update_data = {k: v for k, v in corrected_data.items() if k != "id"}
-                result = supabase.table(table_name).update(update_data).eq("id", record_id).execute()
+                result = await async_supabase.table(table_name).update(update_data).eq("id", record_id).execute()
             else:
-                result = supabase.table(table_name).update(corrected_data).execute()
+                result = await async_supabase.table(table_name).update(corrected_data).execute()
         elif operation_type.upper() == "DELETE":
             # For DELETE operations, extract ID from data for condition
             record_id = corrected_data.get("id")
             if record_id:
-                result = supabase.table(table_name).delete().eq("id", record_id).execute()
+                result = await async_supabase.table(table_name).delete().eq("id", record_id).execute()
             else:
                 raise ValueError("DELETE operation requires 'id' in data")
         else:  # UPSERT
-            result = supabase.table(table_name).upsert(corrected_data).execute()
+            result = await async_supabase.table(table_name).upsert(corrected_data).execute()
         
         logger.info(f"✅ Constraint-safe {operation_type} completed successfully on {table_name}")
         return result
@@ -387,7 +434,7 @@ async def _auto_create_workspace_goals(workspace_id: str, goal_text: str):
         for goal_data in workspace_goals_data:
             try:
                 # FIXED: Check if goal with same metric_type already exists
-                existing_goal = supabase.table("workspace_goals").select("id").eq(
+                existing_goal = await async_supabase.table("workspace_goals").select("id").eq(
                     "workspace_id", workspace_id
                 ).eq(
                     "metric_type", goal_data["metric_type"]
@@ -405,7 +452,7 @@ async def _auto_create_workspace_goals(workspace_id: str, goal_text: str):
                     "updated_at": datetime.now().isoformat()
                 })
                 
-                result = supabase.table("workspace_goals").insert(goal_data).execute()
+                result = await async_supabase.table("workspace_goals").insert(goal_data).execute()
                 if result.data:
                     created_goals.append(result.data[0])
                     logger.info(f"✅ Created AI goal: {goal_data['metric_type']} = {goal_data['target_value']} {goal_data['unit']}")
@@ -588,6 +635,7 @@ async def create_deliverable(workspace_id: str, deliverable_data: dict) -> dict:
                 if result.data:
                     deliverable = result.data[0]
                     logger.info(f"✅ Created AI-driven deliverable with ID: {deliverable['id']}")
+                    task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=workspace_id, deliverable_id=deliverable['id'])
                     logger.info(f"🤖 Quality: {pipeline_result.content_quality_score:.1f}, Specificity: {pipeline_result.business_readiness_score:.1f}, Usability: {pipeline_result.tool_usage_score:.1f}")
                     
                     # 🔗 BRIDGE: Create corresponding asset_artifact for frontend consumption
@@ -640,11 +688,12 @@ async def create_deliverable(workspace_id: str, deliverable_data: dict) -> dict:
         if 'business_specificity_score' in create_data and 'business_value_score' not in create_data:
             create_data['business_value_score'] = create_data['business_specificity_score']
         
-        result = supabase.table('deliverables').insert(create_data).execute()
+        result = await async_supabase.table('deliverables').insert(create_data).execute()
         
         if result.data:
             deliverable = result.data[0]
             logger.info(f"✅ Created standard deliverable with ID: {deliverable['id']}")
+            task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=workspace_id, deliverable_id=deliverable['id'])
             
             # 🔗 BRIDGE: Create corresponding asset_artifact for frontend consumption
             try:
@@ -686,7 +735,7 @@ async def create_deliverable(workspace_id: str, deliverable_data: dict) -> dict:
 async def get_deliverables(workspace_id: str, limit: Optional[int] = None, goal_id: Optional[str] = None, **kwargs) -> List[dict]:
     """Get deliverables for a workspace with optional limit and goal filter - consolidated compatibility function"""
     try:
-        query = supabase.table('deliverables').select('*').eq('workspace_id', workspace_id)
+        query = async_supabase.table('deliverables').select('*').eq('workspace_id', workspace_id)
         
         # Apply goal filter if provided
         if goal_id:
@@ -698,7 +747,7 @@ async def get_deliverables(workspace_id: str, limit: Optional[int] = None, goal_
         if limit:
             query = query.limit(limit)
             
-        result = query.execute()
+        result = await query.execute()
         deliverables = result.data or []
         
         filter_desc = f" (limit: {limit or 'none'}" + (f", goal: {goal_id}" if goal_id else "") + ")"
@@ -712,7 +761,7 @@ async def get_deliverables(workspace_id: str, limit: Optional[int] = None, goal_
 async def get_deliverable_by_id(deliverable_id: str) -> Optional[dict]:
     """Get a specific deliverable by ID"""
     try:
-        result = supabase.table('deliverables').select('*').eq('id', deliverable_id).execute()
+        result = await async_supabase.table('deliverables').select('*').eq('id', deliverable_id).execute()
         
         if result.data:
             deliverable = result.data[0]
@@ -738,6 +787,7 @@ async def update_deliverable(deliverable_id: str, update_data: dict) -> dict:
         if result.data:
             deliverable = result.data[0]
             logger.info(f"✅ Updated deliverable {deliverable_id}")
+            task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=deliverable.get('workspace_id'), deliverable_id=deliverable_id)
             
             # 🎯 AUTO-UPDATE GOAL PROGRESS: Update goal progress when deliverable status changes
             if 'status' in update_data and deliverable.get('goal_id'):
@@ -760,6 +810,7 @@ async def delete_deliverable(deliverable_id: str) -> bool:
         
         if result.data:
             logger.info(f"✅ Deleted deliverable {deliverable_id}")
+            task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=result.data[0].get('workspace_id'), deliverable_id=deliverable_id)
             return True
         else:
             logger.warning(f"❌ Deliverable {deliverable_id} not found for deletion")
@@ -897,7 +948,7 @@ async def convert_deliverable_to_asset_artifact(deliverable: dict) -> Optional[d
         
         # Insert directly into database avoiding model validation issues
         try:
-            result = supabase.table('asset_artifacts').insert(artifact_dict).execute()
+            result = await async_supabase.table('asset_artifacts').insert(artifact_dict).execute()
             
             if result.data:
                 created_artifact_data = result.data[0]
@@ -936,10 +987,10 @@ async def batch_convert_existing_deliverables_to_assets(workspace_id: str = None
             deliverables = await get_deliverables(workspace_id, limit=limit)
         else:
             # Get deliverables from all workspaces
-            query = supabase.table('deliverables').select('*').order('created_at', desc=True)
+            query = async_supabase.table('deliverables').select('*').order('created_at', desc=True)
             if limit:
                 query = query.limit(limit)
-            result = query.execute()
+            result = await query.execute()
             deliverables = result.data or []
         
         logger.info(f"🔄 Found {len(deliverables)} deliverables to process")
@@ -947,7 +998,7 @@ async def batch_convert_existing_deliverables_to_assets(workspace_id: str = None
         # Get existing asset_artifacts to avoid duplicates
         existing_artifacts = []
         try:
-            artifact_result = supabase.table('asset_artifacts').select('metadata').execute()
+            artifact_result = await async_supabase.table('asset_artifacts').select('metadata').execute()
             for artifact in (artifact_result.data or []):
                 metadata = artifact.get('metadata', {})
                 if isinstance(metadata, dict) and metadata.get('original_deliverable_id'):
@@ -1049,7 +1100,7 @@ async def _auto_create_workspace_goals_fallback(workspace_id: str, goal_text: st
                 metric_type = _map_requirement_to_metric_type(req.get('type', 'general'))
                 
                 # FIXED: Check if goal with same metric_type already exists (fallback method)
-                existing_goal = supabase.table("workspace_goals").select("id").eq(
+                existing_goal = await async_supabase.table("workspace_goals").select("id").eq(
                     "workspace_id", workspace_id
                 ).eq(
                     "metric_type", metric_type.value
@@ -1072,7 +1123,7 @@ async def _auto_create_workspace_goals_fallback(workspace_id: str, goal_text: st
                     "description": f"Auto-created from workspace goal: {req.get('context', '')}"
                 }
                 
-                result = supabase.table("workspace_goals").insert(goal_data).execute()
+                result = await async_supabase.table("workspace_goals").insert(goal_data).execute()
                 if result.data:
                     created_goals.append(result.data[0])
                     logger.info(f"📊 FALLBACK: Created goal: {metric_type.value} = {req['target_value']} {req.get('unit', '')}")
@@ -1150,9 +1201,10 @@ async def create_workspace(name: str, description: Optional[str], user_id: str,
         raise
 
 @supabase_retry(max_attempts=3, backoff_factor=2.0)
+@cached(ttl=READ_CACHE_TTL_SECONDS)
 async def get_workspace(workspace_id: str):
     try:
-        result = supabase.table("workspaces").select("*").eq("id", workspace_id).execute() # Rimossa await
+        result = await async_supabase.table("workspaces").select("*").eq("id", workspace_id).execute()
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error retrieving workspace: {e}")
@@ -1161,7 +1213,7 @@ async def get_workspace(workspace_id: str):
 async def list_workspaces(user_id: str):
     try:
         logger.debug(f"Querying workspaces for user_id: {user_id}")
-        result = supabase.table("workspaces").select("*").eq("user_id", user_id).execute()
+        result = await async_supabase.table("workspaces").select("*").eq("user_id", user_id).execute()
         logger.debug(f"Database query completed. Found {len(result.data) if result.data else 0} workspaces")
         return result.data or []
     except Exception as e:
@@ -1174,6 +1226,7 @@ async def update_workspace(workspace_id: str, data: Dict[str, Any]):
     try:
         update_data = {k: v for k, v in data.items() if k not in ['id', 'user_id', 'created_at', 'updated_at']}
         result = await safe_database_operation("UPDATE", "workspaces", update_data, operation_context={"workspace_id": workspace_id})
+        invalidate_workspace_cache(workspace_id)
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error updating workspace: {e}")
@@ -1227,14 +1280,16 @@ async def create_agent(
         if background_story: data["background_story"] = background_story
 
         result = await safe_database_operation("INSERT", "agents", data)
+        invalidate_workspace_cache(workspace_id)
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error creating agent: {e}", exc_info=True)
         raise
 
+@cached(ttl=READ_CACHE_TTL_SECONDS)
 async def list_agents(workspace_id: str):
     try:
-        result = supabase.table("agents").select("*").eq("workspace_id", workspace_id).execute()
+        result = await async_supabase.table("agents").select("*").eq("workspace_id", workspace_id).execute()
         # Deserializza ogni agente
         agents_data = [_deserialize_agent_json_fields(agent) for agent in result.data]
         return agents_data
@@ -1246,6 +1301,7 @@ async def update_agent(agent_id: str, data: Dict[str, Any]):
     try:
         update_data = {k: v for k, v in data.items() if k not in ['id', 'workspace_id', 'created_at', 'updated_at']}
         result = await safe_database_operation("UPDATE", "agents", update_data, operation_context={"agent_id": agent_id})
+        _invalidate_agent_reads(agent_id, result)
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error updating agent: {e}")
@@ -1263,11 +1319,19 @@ async def update_agent_status(agent_id: str, status: Optional[str], health: Opti
 
         # Use safe_database_operation for update
         result = await safe_database_operation("UPDATE", "agents", {"id": agent_id, **data_to_update}, operation_context={"agent_id": agent_id, "status_update": True})
+        _invalidate_agent_reads(agent_id, result)
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error updating agent status: {e}")
         raise
         
+def _invalidate_agent_reads(agent_id: str, result: Any):
+    """Drop cached get_agent/list_agents results affected by an agent write."""
+    invalidate_agent_cache(agent_id)
+    for row in getattr(result, "data", None) or []:
+        if isinstance(row, dict) and row.get("workspace_id"):
+            invalidate_workspace_cache(row["workspace_id"])
+
 def _sanitize_uuid_string(uuid_value: Optional[Union[str, UUID]], field_name: str) -> Optional[str]:
     if uuid_value is None:
         return None
@@ -1360,6 +1424,7 @@ async def create_task(
             # 🚫 ENHANCED DUPLICATE DETECTION using AI Resilient Similarity Engine
             try:
                 from services.ai_resilient_similarity_engine import ai_resilient_similarity_engine
+                from services.task_duplicate_index import task_duplicate_indexes
                 
                 # Prepare task data for similarity check
                 new_task_data = {
@@ -1370,37 +1435,39 @@ async def create_task(
                     "workspace_id": workspace_id
                 }
                 
-                # Fetch all existing tasks in the workspace for comparison
-                existing_tasks_in_workspace = await list_tasks(workspace_id)
+                # Shortlist near-duplicates through the per-workspace MinHash/LSH index; the
+                # workspace is only listed when its index is cold or due for a refresh
+                duplicate_index = task_duplicate_indexes.get(workspace_id)
+                if task_duplicate_indexes.needs_load(workspace_id):
+                    duplicate_index.load(await list_tasks(workspace_id, fields="dedup"))
                 
                 is_duplicate = False
                 existing_task_id = None
                 
-                for existing_task in existing_tasks_in_workspace:
-                    # Only compare with active or pending tasks
-                    if existing_task.get("status") in [TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value, TaskStatus.COMPLETED.value]:
-                        similarity_result = await ai_resilient_similarity_engine.compute_semantic_similarity(
-                            task1=new_task_data,
-                            task2=existing_task,
-                            context={"workspace_id": workspace_id}
+                # Only the candidates (pending, in progress or completed) reach the AI tier
+                for existing_task, _ in duplicate_index.candidates(new_task_data):
+                    similarity_result = await ai_resilient_similarity_engine.compute_semantic_similarity(
+                        task1=new_task_data,
+                        task2=existing_task,
+                        context={"workspace_id": workspace_id}
+                    )
+                    
+                    # 🔧 FIX CRITICO 3: Threshold meno aggressivo per permettere task legittimi
+                    # Cambiato da 0.95 a 0.98 per ridurre falsi positivi di duplicazione
+                    if similarity_result.similarity_score > 0.98 and similarity_result.confidence > 0.90:
+                        is_duplicate = True
+                        existing_task_id = existing_task.get("id")
+                        logger.warning(
+                            f"🚫 DUPLICATE TASK BLOCKED: '{clean_name}' in workspace {workspace_id}. "
+                            f"Reason: High semantic similarity ({similarity_result.similarity_score:.2f}) with existing task {existing_task_id}. "
+                            f"(Method: {similarity_result.method_used}, Confidence: {similarity_result.confidence:.2f})"
                         )
-                        
-                        # 🔧 FIX CRITICO 3: Threshold meno aggressivo per permettere task legittimi
-                        # Cambiato da 0.95 a 0.98 per ridurre falsi positivi di duplicazione
-                        if similarity_result.similarity_score > 0.98 and similarity_result.confidence > 0.90:
-                            is_duplicate = True
-                            existing_task_id = existing_task.get("id")
-                            logger.warning(
-                                f"🚫 DUPLICATE TASK BLOCKED: '{clean_name}' in workspace {workspace_id}. "
-                                f"Reason: High semantic similarity ({similarity_result.similarity_score:.2f}) with existing task {existing_task_id}. "
-                                f"(Method: {similarity_result.method_used}, Confidence: {similarity_result.confidence:.2f})"
-                            )
-                            break
+                        break
                 
                 if is_duplicate:
                     if existing_task_id:
                         try:
-                            existing_task_response = supabase.table("tasks").select("*").eq(
+                            existing_task_response = await async_supabase.table("tasks").select("*").eq(
                                 "id", existing_task_id
                             ).execute()
                             if existing_task_response.data:
@@ -1525,8 +1592,20 @@ async def create_task(
         if db_result.data and len(db_result.data) > 0:
             created_task = db_result.data[0]
             logger.info(f"Task '{clean_name}' (ID: {created_task['id']}) created successfully")
-            
-            
+
+            try:
+                from services.task_duplicate_index import task_duplicate_indexes
+                task_duplicate_indexes.on_task_created(created_task)
+            except Exception as index_error:
+                logger.debug(f"Duplicate index update skipped for task {created_task['id']}: {index_error}")
+
+            # Wake the executor immediately instead of waiting for its next polling cycle
+            task_event_bus.publish(
+                TASK_CREATED,
+                workspace_id=created_task.get("workspace_id"),
+                task_id=created_task["id"],
+                status=created_task.get("status", status),
+            )
             
             return created_task
         else:
@@ -1651,7 +1730,24 @@ async def update_task_status(task_id: str, status: str, result_payload: Optional
         data_to_update["status"] = status
         
         # Execute the database update
-        result = supabase.table("tasks").update(data_to_update).eq("id", task_id).execute()
+        result = await async_supabase.table("tasks").update(data_to_update).eq("id", task_id).execute()
+
+        # Keep in-memory dependency graphs in sync so dependents unblock without re-polling
+        try:
+            from services.task_dependency_graph import task_dependency_graphs
+            from services.task_duplicate_index import task_duplicate_indexes
+            task_dependency_graphs.on_status_change(task_id, status)
+            task_duplicate_indexes.on_status_change(task_id, status)
+        except Exception as graph_error:
+            logger.debug(f"Dependency graph update skipped for task {task_id}: {graph_error}")
+
+        updated_row = result.data[0] if result.data else {}
+        task_event_bus.publish(
+            TASK_STATUS_CHANGED,
+            workspace_id=updated_row.get("workspace_id"),
+            task_id=task_id,
+            status=status,
+        )
         
         # 🎯 STEP 2: UPDATE GOAL PROGRESS IF TASK COMPLETED SUCCESSFULLY
         if status == "completed" and result.data:
@@ -1750,7 +1846,7 @@ async def create_custom_tool(name: str, description: Optional[str], code: str, w
 
 async def get_custom_tool(tool_id: str):
     try:
-        result = supabase.table("custom_tools").select("*").eq("id", tool_id).execute() # Rimossa await
+        result = await async_supabase.table("custom_tools").select("*").eq("id", tool_id).execute()
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error retrieving custom tool: {e}")
@@ -1758,7 +1854,7 @@ async def get_custom_tool(tool_id: str):
 
 async def get_custom_tools_by_workspace(workspace_id: str):
     try:
-        result = supabase.table("custom_tools").select("*").eq("workspace_id", workspace_id).execute() # Rimossa await
+        result = await async_supabase.table("custom_tools").select("*").eq("workspace_id", workspace_id).execute()
         return result.data
     except Exception as e:
         logger.error(f"Error listing custom tools: {e}")
@@ -1772,6 +1868,36 @@ async def delete_custom_tool(tool_id: str):
         logger.error(f"Error deleting custom tool: {e}")
         raise
         
+# Named column projections for task listings. Callers should pick the narrowest set
+# they actually read: the large JSON blobs (result, context_data, description) are only
+# transferred and decoded for "full".
+TASK_FIELD_SETS: Dict[str, str] = {
+    "id": "id",
+    "stats": "id, status, created_at, updated_at",
+    "summary": "id, workspace_id, goal_id, agent_id, name, status, priority, assigned_to_role, created_at, updated_at",
+    "dedup": "id, workspace_id, goal_id, name, description, status, priority, assigned_to_role, created_at",
+    "scheduling": (
+        "id, workspace_id, goal_id, agent_id, name, status, priority, assigned_to_role, "
+        "depends_on_task_ids, parent_task_id, delegation_depth, creation_type, created_at, updated_at"
+    ),
+    "full": "*",
+}
+
+TASK_STATUS_VALUES = [status.value for status in TaskStatus]
+
+
+def _resolve_task_fields(fields: Union[str, List[str], None]) -> str:
+    """Resolve a named field set (or an explicit column list) to a PostgREST select string."""
+    if fields is None:
+        return TASK_FIELD_SETS["full"]
+    if isinstance(fields, (list, tuple)):
+        return ", ".join(fields)
+    if fields in TASK_FIELD_SETS:
+        return TASK_FIELD_SETS[fields]
+    # Allow raw select strings such as "id, status, execution_time:result->execution_time"
+    return fields
+
+
 @supabase_retry(max_attempts=3, backoff_factor=2.0)
 async def list_tasks(
     workspace_id: str,
@@ -1781,10 +1907,19 @@ async def list_tasks(
     asset_only: bool = False,
     limit: Optional[int] = None,
     offset: int = 0,
+    fields: Union[str, List[str]] = "full",
+    created_after: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """List tasks for a workspace with optional filtering and pagination."""
+    """
+    List tasks for a workspace with optional filtering and pagination.
+
+    Args:
+        fields: Named projection from TASK_FIELD_SETS ("id", "stats", "summary",
+            "scheduling", "full") or an explicit list of columns.
+        created_after: Optional ISO timestamp; only tasks created at or after it are returned.
+    """
     try:
-        query = supabase.table("tasks").select("*").eq("workspace_id", workspace_id)
+        query = async_supabase.table("tasks").select(_resolve_task_fields(fields)).eq("workspace_id", workspace_id)
 
         if status:
             query = query.eq("status", status)
@@ -1792,13 +1927,15 @@ async def list_tasks(
             query = query.eq("agent_id", agent_id)
         if goal_id:
             query = query.eq("goal_id", goal_id)
+        if created_after:
+            query = query.gte("created_at", created_after)
 
         query = query.order("created_at", desc=True)
 
         if limit is not None:
             query = query.range(offset, offset + limit - 1)
 
-        result = query.execute()
+        result = await query.execute()
         tasks = result.data if result.data else []
 
         if asset_only:
@@ -1811,19 +1948,97 @@ async def list_tasks(
         )
         raise
 
+async def list_tasks_page(
+    workspace_id: str,
+    fields: Union[str, List[str]] = "summary",
+    page_size: int = 100,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    goal_id: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Keyset-paginated task listing ordered by (created_at DESC, id DESC).
+
+    Unlike offset pagination the cost of a page does not grow with its position.
+    Pass the returned ``next_cursor`` back to fetch the following page; it is None
+    once the listing is exhausted.
+    """
+    try:
+        select_fields = _resolve_task_fields(fields)
+        if select_fields != "*":
+            # The cursor is built from these columns, so they must always be selected
+            columns = [c.strip() for c in select_fields.split(",")]
+            for required in ("id", "created_at"):
+                if required not in columns:
+                    columns.append(required)
+            select_fields = ", ".join(columns)
+
+        query = async_supabase.table("tasks").select(select_fields).eq("workspace_id", workspace_id)
+        if status:
+            query = query.eq("status", status)
+        if goal_id:
+            query = query.eq("goal_id", goal_id)
+        if cursor:
+            cursor_created_at, cursor_id = cursor.rsplit("|", 1)
+            query = query.or_(
+                f'created_at.lt."{cursor_created_at}",'
+                f'and(created_at.eq."{cursor_created_at}",id.lt.{cursor_id})'
+            )
+
+        result = await query.order("created_at", desc=True).order("id", desc=True).limit(page_size).execute()
+        tasks = result.data or []
+
+        next_cursor = None
+        if len(tasks) == page_size:
+            last = tasks[-1]
+            next_cursor = f"{last['created_at']}|{last['id']}"
+
+        return {"tasks": tasks, "next_cursor": next_cursor}
+    except Exception as e:
+        logger.error(f"Error paginating tasks for workspace {workspace_id}: {e}", exc_info=True)
+        raise
+
+async def count_tasks(
+    workspace_id: Optional[str] = None,
+    status: Optional[str] = None,
+    goal_id: Optional[str] = None,
+) -> int:
+    """Count tasks server-side (HEAD request with exact count, no rows transferred)."""
+    try:
+        query = async_supabase.table("tasks").select("id", count="exact", head=True)
+        if workspace_id:
+            query = query.eq("workspace_id", workspace_id)
+        if status:
+            query = query.eq("status", status)
+        if goal_id:
+            query = query.eq("goal_id", goal_id)
+        result = await query.execute()
+        return result.count if result.count else 0
+    except Exception as e:
+        logger.error(f"Error counting tasks for workspace {workspace_id}: {e}")
+        raise
+
+async def count_tasks_by_status(workspace_id: str) -> Dict[str, int]:
+    """Per-status task counts for a workspace, computed server-side in parallel."""
+    counts = await asyncio.gather(
+        *(count_tasks(workspace_id, status=s) for s in TASK_STATUS_VALUES)
+    )
+    status_counts = dict(zip(TASK_STATUS_VALUES, counts))
+    status_counts["total"] = sum(counts)
+    return status_counts
+
 async def get_pending_tasks_count() -> int:
     """Get total count of pending tasks across all workspaces for load assessment."""
     try:
-        query = supabase.table("tasks").select("*", count="exact").eq("status", "pending")
-        result = query.execute()
-        return result.count if result.count else 0
+        return await count_tasks(status="pending")
     except Exception as e:
         logger.error(f"Error counting pending tasks: {e}")
         return 0
-        
+
+@cached(ttl=READ_CACHE_TTL_SECONDS)
 async def get_agent(agent_id: str):
     try:
-        result = supabase.table("agents").select("*").eq("id", agent_id).execute()
+        result = await async_supabase.table("agents").select("*").eq("id", agent_id).execute()
         if result.data and len(result.data) > 0:
             return _deserialize_agent_json_fields(result.data[0])
         return None
@@ -1834,6 +2049,7 @@ async def get_agent(agent_id: str):
 async def delete_workspace(workspace_id: str):
     try:
         result = await safe_database_operation("DELETE", "workspaces", {"id": workspace_id}, operation_context={"workspace_id": workspace_id})
+        invalidate_workspace_cache(workspace_id)
         return {"success": True, "message": f"Workspace {workspace_id} marked for deletion."} # Adattato
     except Exception as e:
         logger.error(f"Error deleting workspace: {e}")
@@ -1842,9 +2058,10 @@ async def delete_workspace(workspace_id: str):
 async def update_workspace_status(workspace_id: str, status: str):
     """Update workspace status"""
     try:
-        result = supabase.table("workspaces").update({
+        result = await async_supabase.table("workspaces").update({
             "status": status
         }).eq("id", workspace_id).execute()
+        invalidate_workspace_cache(workspace_id)
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error updating workspace status: {e}")
@@ -1853,7 +2070,7 @@ async def update_workspace_status(workspace_id: str, status: str):
 async def get_active_workspaces():
     """Get all active workspaces"""
     try:
-        result = supabase.table("workspaces").select("id").eq("status", "active").execute()
+        result = await async_supabase.table("workspaces").select("id").eq("status", "active").execute()
         return [workspace["id"] for workspace in result.data] if result.data else []
     except Exception as e:
         logger.error(f"Error getting active workspaces: {e}")
@@ -1873,7 +2090,7 @@ async def get_workspaces_with_pending_tasks():
             logger.warning("Workspace pause manager not available, using fallback logic")
         
         # Fallback: Original logic with enhanced logging
-        result = supabase.table("tasks").select("workspace_id, workspaces!inner(id, status)").eq("status", "pending").execute()
+        result = await async_supabase.table("tasks").select("workspace_id, workspaces!inner(id, status)").eq("status", "pending").execute()
         
         if not result.data:
             return []
@@ -1911,7 +2128,7 @@ async def save_team_proposal(workspace_id: str, proposal_data: Dict[str, Any]):
 
 async def get_team_proposal(proposal_id: str):
     try:
-        result = supabase.table("team_proposals").select("*").eq("id", proposal_id).execute() # Rimossa await
+        result = await async_supabase.table("team_proposals").select("*").eq("id", proposal_id).execute()
         return result.data[0] if result.data and len(result.data) > 0 else None
     except Exception as e:
         logger.error(f"Error retrieving team proposal: {e}")
@@ -1957,7 +2174,7 @@ async def create_handoff(source_agent_id: UUID, target_agent_id: UUID, descripti
 
 async def list_handoffs(workspace_id: str):
     try:
-        agents_in_workspace_res = supabase.table("agents").select("id").eq("workspace_id", workspace_id).execute() # Rimossa await
+        agents_in_workspace_res = await async_supabase.table("agents").select("id").eq("workspace_id", workspace_id).execute()
         if not agents_in_workspace_res.data:
             return []
         
@@ -1966,8 +2183,8 @@ async def list_handoffs(workspace_id: str):
         if not agent_ids_in_workspace:
             return []
 
-        source_handoffs_res = supabase.table("agent_handoffs").select("*").in_("source_agent_id", agent_ids_in_workspace).execute() # Rimossa await
-        target_handoffs_res = supabase.table("agent_handoffs").select("*").in_("target_agent_id", agent_ids_in_workspace).execute() # Rimossa await
+        source_handoffs_res = await async_supabase.table("agent_handoffs").select("*").in_("source_agent_id", agent_ids_in_workspace).execute()
+        target_handoffs_res = await async_supabase.table("agent_handoffs").select("*").in_("target_agent_id", agent_ids_in_workspace).execute()
 
         all_handoffs_map = {}
         if source_handoffs_res.data:
@@ -2032,7 +2249,7 @@ async def get_human_feedback_requests(
 ) -> List[Dict]:
     """Get human feedback requests with optional filters"""
     try:
-        query = supabase.table("human_feedback_requests").select("*")
+        query = async_supabase.table("human_feedback_requests").select("*")
         
         if workspace_id:
             query = query.eq("workspace_id", workspace_id)
@@ -2040,7 +2257,7 @@ async def get_human_feedback_requests(
             query = query.eq("status", status)
             
         query = query.order("created_at", desc=True)
-        result = query.execute()  # Rimuovi await se Supabase è sincrono
+        result = await query.execute()
         return result.data
     except Exception as e:
         logger.error(f"Error getting human feedback requests: {e}")
@@ -2107,7 +2324,7 @@ async def update_human_feedback_request(
                             update_data["result"] = stored_result
                         
                         # Direct database update to avoid re-triggering verification
-                        db_result = supabase.table("tasks").update(update_data).eq("id", task_id).execute()
+                        db_result = await async_supabase.table("tasks").update(update_data).eq("id", task_id).execute()
                         
                         if db_result.data:
                             logger.info(f"📝 Task {task_id} status updated to completed via direct database update")
@@ -2142,7 +2359,7 @@ async def update_human_feedback_request(
 async def delete_human_feedback_requests_by_workspace(workspace_id: str) -> bool:
     """Delete all human feedback requests for a workspace"""
     try:
-        supabase.table("human_feedback_requests").delete().eq("workspace_id", workspace_id).execute()
+        await async_supabase.table("human_feedback_requests").delete().eq("workspace_id", workspace_id).execute()
         return True
     except Exception as e:
         logger.error(f"Error deleting human feedback requests: {e}")
@@ -2151,7 +2368,7 @@ async def delete_human_feedback_requests_by_workspace(workspace_id: str) -> bool
 async def cleanup_expired_feedback_requests() -> int:
     """Clean up expired feedback requests"""
     try:
-        result = supabase.table("human_feedback_requests").update({
+        result = await async_supabase.table("human_feedback_requests").update({
             "status": "expired"
         }).lt("expires_at", datetime.now().isoformat()).eq("status", "pending").execute()
         
@@ -2290,7 +2507,7 @@ async def get_task(task_id: str) -> Optional[Dict[str, Any]]:
         # Se il task non esiste, PostgREST potrebbe sollevare un errore o restituire data vuota
         # a seconda della configurazione del client Supabase.
         # È buona norma gestire il caso in cui il task non venga trovato.
-        result = supabase.table("tasks").select("*").eq("id", task_id).maybe_single().execute()
+        result = await async_supabase.table("tasks").select("*").eq("id", task_id).maybe_single().execute()
         # maybe_single() restituisce None se non trovato, senza sollevare eccezioni HTTP immediate
         
         if result.data:
@@ -2309,7 +2526,7 @@ async def update_team_proposal_status(proposal_id: str, status: str) -> Optional
     """Update the status of a team proposal."""
     try:
         result = (
-            supabase.table("team_proposals")
+            await async_supabase.table("team_proposals")
             .update({"status": status})
             .eq("id", proposal_id)
             .execute()
@@ -2354,7 +2571,10 @@ async def create_workspace_goal(goal_data: Dict[str, Any]) -> Optional[Dict[str,
         # Sanitize input data
         clean_data = sanitize_unicode_for_postgres(goal_data)
         result = await safe_database_operation("INSERT", "workspace_goals", clean_data)
-        return result.data[0] if result.data and len(result.data) > 0 else None
+        goal = result.data[0] if result.data and len(result.data) > 0 else None
+        if goal:
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=goal.get("workspace_id"), goal_id=goal.get("id"))
+        return goal
     except Exception as e:
         logger.error(f"Error creating workspace goal: {e}")
         raise
@@ -2362,13 +2582,13 @@ async def create_workspace_goal(goal_data: Dict[str, Any]) -> Optional[Dict[str,
 async def get_workspace_goals(workspace_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get workspace goals with optional status filter"""
     try:
-        query = supabase.table("workspace_goals").select("*").eq("workspace_id", workspace_id)
+        query = async_supabase.table("workspace_goals").select("*").eq("workspace_id", workspace_id)
         
         if status:
             query = query.eq("status", status)
         
         query = query.order("priority").order("created_at", desc=True)
-        result = query.execute()
+        result = await query.execute()
         
         # 🔧 HOLISTIC FIX: Add goal_name field for frontend compatibility
         goals = result.data if result.data else []
@@ -2398,7 +2618,7 @@ async def update_goal_progress(goal_id: str, increment: float, task_id: Optional
     """
     try:
         # Get current goal value
-        goal_result = supabase.table("workspace_goals").select("current_value, target_value").eq("id", goal_id).single().execute()
+        goal_result = await async_supabase.table("workspace_goals").select("current_value, target_value").eq("id", goal_id).single().execute()
         if not goal_result.data:
             raise ValueError(f"Goal {goal_id} not found")
             
@@ -2412,7 +2632,9 @@ async def update_goal_progress(goal_id: str, increment: float, task_id: Optional
         if new_value >= target_value:
             update_payload["status"] = "completed"
             
-        result = supabase.table("workspace_goals").update(update_payload).eq("id", goal_id).execute()
+        result = await async_supabase.table("workspace_goals").update(update_payload).eq("id", goal_id).execute()
+        if result.data:
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=result.data[0].get("workspace_id"), goal_id=goal_id)
         
         # Log the progress using direct insert with correct schema
         try:
@@ -2423,7 +2645,7 @@ async def update_goal_progress(goal_id: str, increment: float, task_id: Optional
             should_log_progress = True
             if task_id:
                 # Verify task exists before logging
-                task_check = supabase.table("tasks").select("id").eq("id", task_id).execute()
+                task_check = await async_supabase.table("tasks").select("id").eq("id", task_id).execute()
                 if not task_check.data:
                     logger.warning(f"Task {task_id} not found in database, logging progress without task reference")
                     task_id = None  # Set to None to avoid foreign key constraint
@@ -2446,7 +2668,7 @@ async def update_goal_progress(goal_id: str, increment: float, task_id: Optional
             }
             
             # Insert directly to avoid any Pydantic conversion issues
-            supabase.table("goal_progress_logs").insert(progress_log_data).execute()
+            await async_supabase.table("goal_progress_logs").insert(progress_log_data).execute()
             logger.info(f"✅ Logged progress for goal {goal_id}: {current_value} -> {new_value}")
             
         except Exception as log_exc:
@@ -2467,7 +2689,7 @@ async def update_goal_progress_from_deliverable(goal_id: str) -> None:
     """
     try:
         # Count completed deliverables for this goal
-        deliverables = supabase.table('deliverables').select('status').eq('goal_id', goal_id).execute()
+        deliverables = await async_supabase.table('deliverables').select('status').eq('goal_id', goal_id).execute()
         
         if not deliverables.data:
             logger.info(f"📊 No deliverables found for goal {goal_id}")
@@ -2477,7 +2699,7 @@ async def update_goal_progress_from_deliverable(goal_id: str) -> None:
         total_count = len(deliverables.data)
         
         # Get goal target
-        goal = supabase.table('workspace_goals').select('target_value, current_value, status').eq('id', goal_id).single().execute()
+        goal = await async_supabase.table('workspace_goals').select('target_value, current_value, status').eq('id', goal_id).single().execute()
         
         if goal.data:
             target_value = goal.data.get('target_value', 1)
@@ -2503,7 +2725,7 @@ async def update_goal_progress_from_deliverable(goal_id: str) -> None:
                     update_data['completed_at'] = datetime.now().isoformat()
                     logger.info(f"🎯 Goal {goal_id} COMPLETED! Progress: {progress_pct:.1f}%")
                 
-                result = supabase.table('workspace_goals').update(update_data).eq('id', goal_id).execute()
+                result = await async_supabase.table('workspace_goals').update(update_data).eq('id', goal_id).execute()
                 
                 if result.data:
                     logger.info(f"✅ Updated goal {goal_id} progress: {old_value}/{target_value} → {new_value}/{target_value} ({progress_pct:.1f}%)")
@@ -2520,7 +2742,7 @@ async def update_goal_progress_from_deliverable(goal_id: str) -> None:
 async def get_unmet_goals(workspace_id: str, completion_threshold: float = 80.0) -> List[Dict[str, Any]]:
     """Get goals that haven't met their targets (used by goal-driven task planner)"""
     try:
-        result = supabase.table("workspace_goals").select("*").eq(
+        result = await async_supabase.table("workspace_goals").select("*").eq(
             "workspace_id", workspace_id
         ).eq("status", "active").execute()
         
@@ -2551,16 +2773,17 @@ async def delete_workspace_goal(goal_id: str, workspace_id: str) -> bool:
     """Delete a workspace goal (with safety checks)"""
     try:
         # Check for active tasks linked to this goal
-        tasks_result = supabase.table("tasks").select("id").eq("goal_id", goal_id).eq("status", "pending").execute()
+        tasks_result = await async_supabase.table("tasks").select("id").eq("goal_id", goal_id).eq("status", "pending").execute()
         
         if tasks_result.data:
             logger.warning(f"Cannot delete goal {goal_id}: has {len(tasks_result.data)} active tasks")
             return False
         
         # Delete goal
-        result = supabase.table("workspace_goals").delete().eq("id", goal_id).eq("workspace_id", workspace_id).execute()
+        result = await async_supabase.table("workspace_goals").delete().eq("id", goal_id).eq("workspace_id", workspace_id).execute()
         
         if result.data:
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=goal_id)
             await _log_goal_event(workspace_id, goal_id, "goal_deleted", {})
             return True
         
@@ -2574,7 +2797,7 @@ async def get_goal_task_performance(workspace_id: str) -> List[Dict[str, Any]]:
     """Get performance metrics for goal-driven tasks"""
     try:
         # This would use the view created in SQL
-        result = supabase.table("goal_task_performance").select("*").eq("workspace_id", workspace_id).execute()
+        result = await async_supabase.table("goal_task_performance").select("*").eq("workspace_id", workspace_id).execute()
         return result.data if result.data else []
         
     except Exception as e:
@@ -2599,7 +2822,7 @@ async def _log_goal_progress(goal_id: str, workspace_id: str, old_value: float,
             }
         }
         
-        supabase.table("logs").insert(log_data).execute()
+        await async_supabase.table("logs").insert(log_data).execute()
         
     except Exception as e:
         logger.warning(f"Failed to log goal progress: {e}")
@@ -2618,7 +2841,7 @@ async def _log_goal_event(workspace_id: str, goal_id: str, event_type: str, meta
             }
         }
         
-        supabase.table("logs").insert(log_data).execute()
+        await async_supabase.table("logs").insert(log_data).execute()
         
     except Exception as e:
         logger.warning(f"Failed to log goal event: {e}")
@@ -3502,6 +3725,7 @@ class AssetDrivenDatabaseManager:
     
     def __init__(self, supabase_client: Client = None):
         self.supabase = supabase_client or supabase
+        self.async_supabase = AsyncSupabaseClient(lambda: self.supabase)
     
     # ========================================================================
     # ASSET ARTIFACTS MANAGEMENT (Pillar 12: Concrete Deliverables)
@@ -3525,7 +3749,7 @@ class AssetDrivenDatabaseManager:
             artifact_data['updated_at'] = datetime.now().isoformat()
             
             # Insert into database
-            result = self.supabase.table("asset_artifacts").insert(artifact_data).execute()
+            result = await self.async_supabase.table("asset_artifacts").insert(artifact_data).execute()
             
             if result.data:
                 logger.info(f"✅ Asset artifact created: {result.data[0]['id']}")
@@ -3541,7 +3765,7 @@ class AssetDrivenDatabaseManager:
     async def get_artifacts_for_requirement(self, requirement_id: UUID) -> List[AssetArtifact]:
         """Get all artifacts for a specific asset requirement"""
         try:
-            result = self.supabase.table("asset_artifacts")\
+            result = await self.async_supabase.table("asset_artifacts")\
                 .select("*")\
                 .eq("requirement_id", str(requirement_id))\
                 .order("created_at", desc=True)\
@@ -3571,7 +3795,7 @@ class AssetDrivenDatabaseManager:
             if status == "approved":
                 update_data["approved_at"] = datetime.now().isoformat()
             
-            result = self.supabase.table("asset_artifacts")\
+            result = await self.async_supabase.table("asset_artifacts")\
                 .update(update_data)\
                 .eq("id", str(artifact_id))\
                 .execute()
@@ -3590,7 +3814,7 @@ class AssetDrivenDatabaseManager:
     async def get_asset_artifact(self, artifact_id: UUID) -> Optional[AssetArtifact]:
         """Get specific asset artifact by ID"""
         try:
-            result = self.supabase.table("asset_artifacts")\
+            result = await self.async_supabase.table("asset_artifacts")\
                 .select("*")\
                 .eq("id", str(artifact_id))\
                 .single()\
@@ -3612,7 +3836,7 @@ class AssetDrivenDatabaseManager:
     async def get_quality_rules_for_asset_type(self, asset_type: str) -> List[QualityRule]:
         """Get active quality rules for specific asset type"""
         try:
-            result = self.supabase.table("quality_rules")\
+            result = await self.async_supabase.table("quality_rules")\
                 .select("*")\
                 .eq("asset_type", asset_type)\
                 .eq("is_active", True)\
@@ -3627,6 +3851,72 @@ class AssetDrivenDatabaseManager:
             logger.error(f"Failed to get quality rules for {asset_type}: {e}")
             return []
     
+    @supabase_retry(max_attempts=3)
+    async def get_asset_artifacts_by_ids(self, artifact_ids: List[UUID]) -> List[AssetArtifact]:
+        """Load many asset artifacts with one query per 200 ids"""
+        ids = list(dict.fromkeys(str(artifact_id) for artifact_id in artifact_ids))
+        artifacts = []
+        for start in range(0, len(ids), 200):
+            result = await self.async_supabase.table("asset_artifacts")\
+                .select("*")\
+                .in_("id", ids[start:start + 200])\
+                .execute()
+            for row in result.data or []:
+                try:
+                    artifacts.append(AssetArtifact(**row))
+                except Exception as e:
+                    logger.warning(f"Skipping malformed asset artifact {row.get('id')}: {e}")
+        return artifacts
+    
+    async def get_quality_rules_for_asset_types(self, asset_types: List[str]) -> Dict[str, List[QualityRule]]:
+        """Active quality rules of several asset types in one query, grouped by type"""
+        rules_by_type: Dict[str, List[QualityRule]] = {asset_type: [] for asset_type in asset_types}
+        if not asset_types:
+            return rules_by_type
+        try:
+            result = await self.async_supabase.table("quality_rules")\
+                .select("*")\
+                .in_("asset_type", list(asset_types))\
+                .eq("is_active", True)\
+                .order("rule_order")\
+                .execute()
+            for rule in result.data or []:
+                rules_by_type.setdefault(rule.get("asset_type"), []).append(QualityRule(**rule))
+        except Exception as e:
+            logger.error(f"Failed to get quality rules for {asset_types}: {e}")
+        return rules_by_type
+    
+    async def bulk_update_artifact_statuses(self, updates: List[Tuple[UUID, str, Optional[float]]]) -> int:
+        """
+        Write (artifact_id, status, quality_score) updates with one UPDATE per distinct
+        (status, score) pair; scores are stored to two decimals so batches collapse
+        into a handful of statements. Returns the number of artifacts updated.
+        """
+        groups: Dict[Tuple[str, Optional[float]], List[str]] = {}
+        for artifact_id, status, quality_score in updates:
+            score = round(float(quality_score), 2) if quality_score is not None else None
+            groups.setdefault((status, score), []).append(str(artifact_id))
+        
+        async def write(status: str, quality_score: Optional[float], ids: List[str]) -> int:
+            update_data = {"status": status, "updated_at": datetime.now().isoformat()}
+            if quality_score is not None:
+                update_data["quality_score"] = quality_score
+            if status == "approved":
+                update_data["approved_at"] = datetime.now().isoformat()
+            try:
+                result = await self.async_supabase.table("asset_artifacts")\
+                    .update(update_data)\
+                    .in_("id", ids)\
+                    .execute()
+                return len(result.data or [])
+            except Exception as e:
+                logger.error(f"Failed to update status of {len(ids)} artifacts to {status}: {e}")
+                return 0
+        
+        written = await asyncio.gather(*[write(status, score, ids) for (status, score), ids in groups.items()])
+        logger.info(f"✅ {sum(written)} artifact statuses updated in {len(groups)} statements")
+        return sum(written)
+    
     def _ensure_json_serializable(self, obj):
         """Ensure object is JSON serializable by converting UUID objects to strings"""
         import json
@@ -3673,7 +3963,7 @@ class AssetDrivenDatabaseManager:
             else:
                 # Fallback to original method if schema verification not available
                 logger.warning("⚠️ Schema verification not available, using direct insert")
-                result = self.supabase.table("quality_validations").insert(validation_data).execute()
+                result = await self.async_supabase.table("quality_validations").insert(validation_data).execute()
                 
                 if result.data:
                     validation_id = result.data[0]['id']
@@ -3702,7 +3992,7 @@ class AssetDrivenDatabaseManager:
                         if field in validation_data and validation_data[field] is not None:
                             basic_validation_data[field] = validation_data[field]
                     
-                    result = self.supabase.table("quality_validations")\
+                    result = await self.async_supabase.table("quality_validations")\
                         .insert(basic_validation_data)\
                         .execute()
                     
@@ -3726,6 +4016,28 @@ class AssetDrivenDatabaseManager:
             from uuid import uuid4
             return uuid4()
     
+    async def log_quality_validations(self, validations: List[QualityValidation]) -> List[UUID]:
+        """Log a batch of quality validations with one insert; falls back to per-row logging"""
+        if not validations:
+            return []
+        try:
+            rows = []
+            for validation in validations:
+                row = validation.model_dump(exclude={'id'}) if hasattr(validation, 'model_dump') else validation.dict(exclude={'id'})
+                row['validated_at'] = datetime.now().isoformat()
+                rows.append(self._ensure_json_serializable(row))
+            
+            result = await self.async_supabase.table("quality_validations").insert(rows).execute()
+            if result.data and len(result.data) == len(rows):
+                logger.info(f"✅ {len(rows)} quality validations logged in one insert")
+                return [UUID(str(row['id'])) for row in result.data]
+            raise Exception("Bulk insert returned no data")
+            
+        except Exception as e:
+            # Schema drift and partial failures are handled row by row by the single-row path
+            logger.warning(f"⚠️ Bulk quality validation insert failed, logging individually: {e}")
+            return list(await asyncio.gather(*[self.log_quality_validation(v) for v in validations]))
+    
     # ========================================================================
     # ASSET REQUIREMENTS MANAGEMENT (Enhanced from goal_asset_requirements)
     # ========================================================================
@@ -3734,7 +4046,7 @@ class AssetDrivenDatabaseManager:
     async def get_asset_requirements_for_goal(self, goal_id: UUID) -> List[AssetRequirement]:
         """Get asset requirements for specific goal"""
         try:
-            result = self.supabase.table("goal_asset_requirements")\
+            result = await self.async_supabase.table("goal_asset_requirements")\
                 .select("*")\
                 .eq("goal_id", str(goal_id))\
                 .order("priority", desc=True)\
@@ -3752,7 +4064,7 @@ class AssetDrivenDatabaseManager:
     async def get_asset_requirements_for_workspace(self, workspace_id: UUID) -> List[AssetRequirement]:
         """Get all asset requirements for workspace"""
         try:
-            result = self.supabase.table("goal_asset_requirements")\
+            result = await self.async_supabase.table("goal_asset_requirements")\
                 .select("*")\
                 .eq("workspace_id", str(workspace_id))\
                 .order("created_at", desc=True)\
@@ -3775,7 +4087,7 @@ class AssetDrivenDatabaseManager:
             requirement_data['created_at'] = datetime.now().isoformat()
             requirement_data['updated_at'] = datetime.now().isoformat()
             
-            result = self.supabase.table("goal_asset_requirements")\
+            result = await self.async_supabase.table("goal_asset_requirements")\
                 .insert(requirement_data)\
                 .execute()
             
@@ -3797,7 +4109,7 @@ class AssetDrivenDatabaseManager:
     async def get_real_time_goal_completion(self, workspace_id: UUID) -> List[Dict[str, Any]]:
         """Get real-time goal completion using database view"""
         try:
-            result = self.supabase.table("real_time_goal_completion")\
+            result = await self.async_supabase.table("real_time_goal_completion")\
                 .select("*")\
                 .eq("workspace_id", str(workspace_id))\
                 .execute()
@@ -3814,7 +4126,7 @@ class AssetDrivenDatabaseManager:
         try:
             log_data['changed_at'] = datetime.now().isoformat()
             
-            result = self.supabase.table("goal_progress_log")\
+            result = await self.async_supabase.table("goal_progress_log")\
                 .insert(log_data)\
                 .execute()
             
@@ -3833,7 +4145,7 @@ class AssetDrivenDatabaseManager:
     async def get_goal_progress_log(self, goal_id: UUID, limit: int = 10) -> List[GoalProgressLog]:
         """Get recent goal progress log entries"""
         try:
-            result = self.supabase.table("goal_progress_logs")\
+            result = await self.async_supabase.table("goal_progress_logs")\
                 .select("*")\
                 .eq("goal_id", str(goal_id))\
                 .order("created_at", desc=True)\
@@ -3857,7 +4169,7 @@ class AssetDrivenDatabaseManager:
         """Get AI quality performance metrics for workspace"""
         try:
             # Use the ai_quality_performance view created in database schema
-            result = self.supabase.table("ai_quality_performance")\
+            result = await self.async_supabase.table("ai_quality_performance")\
                 .select("*")\
                 .execute()
             
@@ -3897,7 +4209,7 @@ class AssetDrivenDatabaseManager:
     async def get_pillar_compliance_status(self) -> List[Dict[str, Any]]:
         """Get pillar compliance status using database view"""
         try:
-            result = self.supabase.table("pillar_compliance_status")\
+            result = await self.async_supabase.table("pillar_compliance_status")\
                 .select("*")\
                 .order("pillar_number")\
                 .execute()
@@ -3925,7 +4237,7 @@ class AssetDrivenDatabaseManager:
                 "updated_at": datetime.now().isoformat()
             }
             
-            result = self.supabase.table("workspace_goals")\
+            result = await self.async_supabase.table("workspace_goals")\
                 .update(update_data)\
                 .eq("id", str(goal_id))\
                 .execute()
@@ -3947,14 +4259,14 @@ class AssetDrivenDatabaseManager:
     async def execute_view_query(self, view_name: str, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Execute query on database view with optional filters"""
         try:
-            query = self.supabase.table(view_name).select("*")
+            query = self.async_supabase.table(view_name).select("*")
             
             # Apply filters if provided
             if filters:
                 for key, value in filters.items():
                     query = query.eq(key, value)
             
-            result = query.execute()
+            result = await query.execute()
             return result.data if result.data else []
             
         except Exception as e:
@@ -3984,10 +4296,26 @@ async def get_quality_rules_for_asset_type(asset_type: str) -> List[QualityRule]
     """Convenience function for getting quality rules"""
     return await asset_db.get_quality_rules_for_asset_type(asset_type)
 
+async def get_quality_rules_for_asset_types(asset_types: List[str]) -> Dict[str, List[QualityRule]]:
+    """Convenience function for getting the quality rules of several asset types"""
+    return await asset_db.get_quality_rules_for_asset_types(asset_types)
+
+async def get_asset_artifacts_by_ids(artifact_ids: List[UUID]) -> List[AssetArtifact]:
+    """Convenience function for loading many asset artifacts"""
+    return await asset_db.get_asset_artifacts_by_ids(artifact_ids)
+
+async def bulk_update_artifact_statuses(updates: List[Tuple[UUID, str, Optional[float]]]) -> int:
+    """Convenience function for writing many artifact status updates"""
+    return await asset_db.bulk_update_artifact_statuses(updates)
+
 async def log_quality_validation(validation: QualityValidation) -> UUID:
     """Convenience function for logging quality validation"""
     return await asset_db.log_quality_validation(validation)
 
+async def log_quality_validations(validations: List[QualityValidation]) -> List[UUID]:
+    """Convenience function for logging a batch of quality validations"""
+    return await asset_db.log_quality_validations(validations)
+
 async def get_asset_requirements_for_goal(goal_id: UUID) -> List[AssetRequirement]:
     """Convenience function for getting asset requirements"""
     return await asset_db.get_asset_requirements_for_goal(goal_id)
@@ -4190,29 +4518,39 @@ IMPORTANT DISTINCTIONS:
 RESPONSE FORMAT:
 Return ONLY "SUBSTANTIVE" or "FAKE" - no explanation needed."""
 
-        try:
-            response = await client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                temperature=0.1
-            )
-            
-            # Record successful request with token usage
-            tokens_used = response.usage.total_tokens if hasattr(response, 'usage') and response.usage else 0
-            quota_tracker.record_request(success=True, tokens_used=tokens_used)
-            logger.info(f"✅ QUOTA TRACKED: Fake detection AI call - {tokens_used} tokens used")
-            
-            result = response.choices[0].message.content.strip().upper()
+        async def _classify() -> Optional[str]:
+            try:
+                response = await client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=10,
+                    temperature=0.1
+                )
+                
+                # Record successful request with token usage
+                tokens_used = response.usage.total_tokens if hasattr(response, 'usage') and response.usage else 0
+                quota_tracker.record_request(success=True, tokens_used=tokens_used)
+                logger.info(f"✅ QUOTA TRACKED: Fake detection AI call - {tokens_used} tokens used")
+                
+                return response.choices[0].message.content.strip().upper()
+            except Exception as ai_error:
+                # Record failed request for quota tracking
+                quota_tracker.record_openai_error(str(type(ai_error).__name__), str(ai_error))
+                logger.error(f"❌ QUOTA TRACKED: Fake detection AI error: {ai_error}")
+                return None
+        
+        # Same content -> same verdict: cached per prompt (failures are not cached)
+        from utils.ai_result_store import ai_result_store
+        result = await ai_result_store.get_or_compute(
+            "llm:substantive_content", "gpt-4o-mini:t0.1:v1", (prompt,), _classify
+        )
+        if result is not None:
             is_substantive = result == "SUBSTANTIVE"
-            
             logger.info(f"🧠 AI FAKE DETECTION: Content classified as '{result}' -> substantive={is_substantive}")
             return is_substantive
-        except Exception as ai_error:
-            # Record failed request for quota tracking
-            quota_tracker.record_openai_error(str(type(ai_error).__name__), str(ai_error))
-            logger.error(f"❌ QUOTA TRACKED: Fake detection AI error: {ai_error}")
-            # Continue to fallback instead of re-raising
+        
+        # Continue to fallback instead of re-raising
+        return len(content.strip()) > 1000
         
     except Exception as e:
         logger.warning(f"⚠️ AI fake detection failed: {e}")
@@ -4299,36 +4637,75 @@ async def add_memory_insight(workspace_id: str, insight_type: str, content: str,
         logger.error(f"Error adding memory insight: {e}")
         return False
 
+async def add_memory_insights(workspace_id: str, insights: List[Dict[str, Any]]) -> Optional[int]:
+    """Store a batch of memory insights with one insert - returns how many were stored, None on failure
+
+    Items take the add_memory_insight arguments (content, insight_type, confidence_score,
+    relevance_tags) plus an optional content_hash used for deduplication.
+    """
+    try:
+        from services.unified_memory_engine import unified_memory_engine
+        return await unified_memory_engine.store_insights(workspace_id, insights)
+    except ImportError:
+        logger.warning("Unified memory engine not available")
+        return None
+    except Exception as e:
+        logger.error(f"Error adding memory insights: {e}")
+        return None
+
+async def get_existing_insight_hashes(workspace_id: str, content_hashes: List[str]) -> Set[str]:
+    """Content hashes from ``content_hashes`` already stored as insights for the workspace"""
+    try:
+        from services.unified_memory_engine import unified_memory_engine
+        return await unified_memory_engine.get_existing_semantic_hashes(workspace_id, content_hashes)
+    except ImportError:
+        logger.warning("Unified memory engine not available")
+        return set()
+    except Exception as e:
+        logger.error(f"Error checking existing insight hashes: {e}")
+        return set()
+
 # ============================================================================
 # ADDITIONAL COMPATIBILITY FUNCTIONS
 # ============================================================================
 
+# Max ids per in_() filter, keeps the PostgREST URL well below proxy limits
+DEPENDENCY_STATUS_BATCH_SIZE = 200
+
+async def get_task_statuses(task_ids: List[str]) -> Dict[str, str]:
+    """Fetch the status of many tasks with one in_() query per batch of ids."""
+    statuses: Dict[str, str] = {}
+    task_ids = list(task_ids)
+    for start in range(0, len(task_ids), DEPENDENCY_STATUS_BATCH_SIZE):
+        batch = task_ids[start:start + DEPENDENCY_STATUS_BATCH_SIZE]
+        result = await async_supabase.table("tasks").select("id, status").in_("id", batch).execute()
+        for row in result.data or []:
+            statuses[str(row["id"])] = row.get("status")
+    return statuses
+
 async def get_ready_tasks_python(workspace_id: str) -> List[Dict[str, Any]]:
-    """Get tasks ready for execution - compatibility function"""
+    """
+    Get tasks ready for execution - compatibility function
+
+    Dependencies are resolved through the workspace's in-memory dependency graph:
+    one query for the pending tasks plus one batched in_() query for the statuses
+    of dependencies not yet known to be satisfied.
+    """
     try:
-        # Get pending tasks that are ready (no dependencies or dependencies completed)
+        from services.task_dependency_graph import task_dependency_graphs, MISSING_DEPENDENCY
+
         tasks = await list_tasks(workspace_id, status="pending")
-        ready_tasks = []
-        
-        for task in tasks:
-            # Check if task has dependencies
-            depends_on = task.get('depends_on', [])
-            if not depends_on:
-                # No dependencies, task is ready
-                ready_tasks.append(task)
-            else:
-                # Check if all dependencies are completed
-                all_deps_complete = True
-                for dep_id in depends_on:
-                    dep_task = await get_task(dep_id)
-                    if dep_task and dep_task.get('status') != 'completed':
-                        all_deps_complete = False
-                        break
-                
-                if all_deps_complete:
-                    ready_tasks.append(task)
-        
-        return ready_tasks
+        graph = task_dependency_graphs.get(workspace_id)
+        graph.sync_pending(tasks)
+
+        unresolved = graph.unresolved_dependencies()
+        if unresolved:
+            statuses = await get_task_statuses(list(unresolved))
+            for dep_id in unresolved:
+                graph.set_status(dep_id, statuses.get(dep_id) or MISSING_DEPENDENCY)
+
+        ready_ids = graph.ready_task_ids()
+        return [task for task in tasks if str(task.get("id")) in ready_ids]
     except Exception as e:
         logger.error(f"Error getting ready tasks: {e}")
         return []
@@ -4338,24 +4715,24 @@ async def get_task_execution_stats_python(workspace_id: str, days: int = 7) -> D
     try:
         from datetime import datetime, timedelta
         
-        # Get all tasks from the workspace
-        all_tasks = await list_tasks(workspace_id)
-        
         # Calculate date threshold
         threshold = datetime.now() - timedelta(days=days)
         
-        # Filter and calculate stats
-        recent_tasks = [t for t in all_tasks if t.get('created_at', '') > threshold.isoformat()]
+        # Only the recent window, and only the execution_time key of the result blob
+        recent_tasks = await list_tasks(
+            workspace_id,
+            fields="id, status, created_at, execution_time:result->execution_time",
+            created_after=threshold.isoformat()
+        )
         completed_tasks = [t for t in recent_tasks if t.get('status') == 'completed']
         failed_tasks = [t for t in recent_tasks if t.get('status') == 'failed']
         
         # Calculate execution times for completed tasks
         execution_times = []
         for task in completed_tasks:
-            if 'result' in task and isinstance(task['result'], dict):
-                exec_time = task['result'].get('execution_time', 0)
-                if exec_time > 0:
-                    execution_times.append(exec_time)
+            exec_time = task.get('execution_time')
+            if isinstance(exec_time, (int, float)) and exec_time > 0:
+                execution_times.append(exec_time)
         
         avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0
         
@@ -4385,21 +4762,27 @@ async def get_workspace_execution_stats(workspace_id: str) -> Dict[str, Any]:
         task_stats = await get_task_execution_stats_python(workspace_id)
         
         # Get additional workspace metrics
-        all_tasks = await list_tasks(workspace_id)
         agents = await list_agents(workspace_id)
         
-        # Count tasks by status
-        status_counts = {}
-        for task in all_tasks:
-            status = task.get('status', 'unknown')
-            status_counts[status] = status_counts.get(status, 0) + 1
+        # Count tasks by status server-side instead of downloading every row
+        status_counts = {
+            status: count
+            for status, count in (await count_tasks_by_status(workspace_id)).items()
+            if status != "total" and count
+        }
         
-        # Calculate agent utilization
+        # Calculate agent utilization from id/agent_id pages only
         agent_task_counts = {}
-        for task in all_tasks:
-            agent_id = task.get('agent_id')
-            if agent_id:
-                agent_task_counts[agent_id] = agent_task_counts.get(agent_id, 0) + 1
+        cursor = None
+        while True:
+            page = await list_tasks_page(workspace_id, fields=["id", "agent_id"], page_size=500, cursor=cursor)
+            for task in page["tasks"]:
+                agent_id = task.get('agent_id')
+                if agent_id:
+                    agent_task_counts[agent_id] = agent_task_counts.get(agent_id, 0) + 1
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
         
         avg_tasks_per_agent = sum(agent_task_counts.values()) / len(agents) if agents else 0
         
@@ -4445,7 +4828,7 @@ async def create_task_execution(task_id: str, agent_id: str, status: str = "runn
             context_data = task.get('context_data', {})
             context_data['execution'] = execution_data
             
-            result = supabase.table("tasks").update({
+            result = await async_supabase.table("tasks").update({
                 "context_data": context_data,
                 "status": "in_progress"
             }).eq("id", task_id).execute()
@@ -4499,7 +4882,7 @@ async def update_task_execution(
                 if value is not None:
                     execution_data[key] = value
                 
-            result = supabase.table("tasks").update({
+            result = await async_supabase.table("tasks").update({
                 "context_data": context_data
             }).eq("id", task_id).execute()
             
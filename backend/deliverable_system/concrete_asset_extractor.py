@@ -3,6 +3,7 @@ Concrete Asset Extractor - AI-Powered Real Asset Extraction
 Extracts concrete assets (code, JSON, documents) from task outputs
 """
 
+import os
 import re
 import json
 import logging
@@ -11,9 +12,29 @@ from datetime import datetime
 import asyncio
 
 from services.ai_provider_abstraction import ai_provider_manager
+from utils.ai_result_store import ai_result_store
 
 logger = logging.getLogger(__name__)
 
+# Extraction ledger: assets extracted per task result content, persisted in the AI result
+# store so re-running deliverable generation only extracts new or changed task results.
+# Bump the version when the extraction prompt or enrichment changes. Entries whose AI
+# analysis failed (pattern-only assets) are returned but never ledgered.
+ASSET_EXTRACTION_LEDGER_NAMESPACE = "asset_extraction"
+ASSET_EXTRACTION_LEDGER_VERSION = os.getenv("ASSET_EXTRACTION_LEDGER_VERSION", "asset-extraction-v2")
+ASSET_EXTRACTION_LEDGER_TTL_SECONDS = float(os.getenv("ASSET_EXTRACTION_LEDGER_TTL_SECONDS", str(7 * 86400)))
+ASSET_EXTRACTION_CONCURRENCY = max(1, int(os.getenv("ASSET_EXTRACTION_CONCURRENCY", "4")))
+ASSET_EXTRACTION_BATCH_TIMEOUT_SECONDS = float(os.getenv("ASSET_EXTRACTION_BATCH_TIMEOUT_SECONDS", "120"))
+# Per-asset placeholder/quality checks: assets judged per model call, and calls in flight
+ASSET_CHECK_BATCH_SIZE = max(1, int(os.getenv("ASSET_CHECK_BATCH_SIZE", "8")))
+ASSET_CHECK_CONCURRENCY = max(1, int(os.getenv("ASSET_CHECK_CONCURRENCY", "4")))
+
+
+def _is_ledgerable_extraction(entry: Any) -> bool:
+    """Pattern-only results from a failed AI analysis are used once, then retried."""
+    return isinstance(entry, dict) and not entry.get("ai_degraded")
+
+
 class ConcreteAssetExtractor:
     """
     Extracts real, concrete assets from task execution outputs.
@@ -47,6 +68,28 @@ class ConcreteAssetExtractor:
                 'email': r'[\w._%+-]+@[\w.-]+\.[A-Z|a-z]{2,}'
             }
         }
+        self.extraction_stats = {
+            "tasks": 0,
+            "extracted": 0,
+            "reused": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "ai_degraded": 0,
+            "asset_check_calls": 0,
+            "asset_check_fallbacks": 0,
+        }
+    
+    def _content_to_text(self, content: Any) -> str:
+        """Task output as text: dicts and mixed lists as JSON, string lists joined by lines"""
+        if isinstance(content, str):
+            return content
+        if isinstance(content, dict):
+            return json.dumps(content, indent=2, default=str)
+        if isinstance(content, list):
+            if all(isinstance(item, str) for item in content):
+                return '\n'.join(content)
+            return json.dumps(content, indent=2, default=str)
+        return str(content)
     
     async def extract_assets(self, content: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -60,41 +103,48 @@ class ConcreteAssetExtractor:
             List of extracted assets with metadata
         """
         try:
-            # FIXED: Ensure content is always a string
-            if not isinstance(content, str):
-                if isinstance(content, dict):
-                    content = json.dumps(content, indent=2, default=str)
-                elif isinstance(content, list):
-                    if all(isinstance(item, str) for item in content):
-                        content = '\n'.join(content)
-                    else:
-                        content = json.dumps(content, indent=2, default=str)
-                else:
-                    content = str(content)
-            
-            logger.info("🔍 Starting asset extraction from content")
-            
-            # Step 1: AI-powered content analysis
-            ai_extracted = await self._ai_analyze_content(content, context)
-            
-            # Step 2: Pattern-based extraction
-            pattern_extracted = await self._pattern_based_extraction(content)
-            
-            # Step 3: Merge and deduplicate
-            all_assets = self._merge_assets(ai_extracted, pattern_extracted)
-            
-            # Step 4: Validate and enrich assets
-            validated_assets = await self._validate_and_enrich_assets(all_assets, content)
-            
-            logger.info(f"✅ Extracted {len(validated_assets)} concrete assets")
-            return validated_assets
-            
+            return (await self._extract_assets(content, context))["assets"]
         except Exception as e:
             logger.error(f"Asset extraction failed: {e}")
             return []
     
-    async def _ai_analyze_content(self, content: str, context: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Use AI to intelligently identify and extract assets from content"""
+    async def _extract_assets(self, content: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        extract_assets without the error guard, so callers can tell failures from empty results.
+        
+        Returns {"assets": [...], "ai_degraded": bool}; ai_degraded means the AI analysis failed
+        and the assets come from pattern matching only.
+        """
+        content = self._content_to_text(content)
+        
+        logger.info("🔍 Starting asset extraction from content")
+        
+        # Step 1: AI-powered content analysis (None when the model call failed)
+        ai_extracted = await self._ai_analyze_content(content, context)
+        ai_degraded = ai_extracted is None
+        if ai_degraded:
+            self.extraction_stats["ai_degraded"] += 1
+        
+        # Step 2: Pattern-based extraction
+        pattern_extracted = await self._pattern_based_extraction(content)
+        
+        # Step 3: Merge and deduplicate
+        all_assets = self._merge_assets(ai_extracted or [], pattern_extracted)
+        
+        # Step 4: Validate and enrich assets
+        validated_assets = await self._validate_and_enrich_assets(all_assets, content)
+        
+        logger.info(f"✅ Extracted {len(validated_assets)} concrete assets"
+                    f"{' (pattern fallback only)' if ai_degraded else ''}")
+        return {"assets": validated_assets, "ai_degraded": ai_degraded}
+    
+    async def _ai_analyze_content(self, content: str, context: Optional[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Use AI to intelligently identify and extract assets from content.
+        
+        Returns None when the analysis failed (timeout, error, fallback provider or an
+        unparseable reply), as opposed to [] when the model found no assets.
+        """
         try:
             # Domain-agnostic AI analysis - removed hard-coded business bias
             domain_context = context.get('domain', 'unknown') if context else 'unknown'
@@ -154,25 +204,26 @@ Return as JSON object with "assets" array. Focus on CONCRETE, SPECIFIC content -
                 )
             except asyncio.TimeoutError:
                 logger.warning("AI asset analysis timed out after 30s - using pattern fallback")
-                return []
-            
-            if response:
-                # Handle both list and dict responses from AI
-                if isinstance(response, list):
-                    assets_data = response
-                elif isinstance(response, dict):
-                    assets_data = response.get('assets', [])
-                else:
-                    assets_data = []
-
-                if isinstance(assets_data, list):
-                    return [self._format_ai_asset(asset) for asset in assets_data]
+                return None
+            
+            # Handle both list and dict responses from AI; anything else (the fallback
+            # provider's error dict, unparsed {"content": ...}) is a failed analysis
+            if isinstance(response, list):
+                assets_data = response
+            elif isinstance(response, dict):
+                assets_data = response.get('assets')
+            else:
+                assets_data = None
             
-            return []
+            if isinstance(assets_data, list):
+                return [self._format_ai_asset(asset) for asset in assets_data]
+            
+            logger.warning("AI asset analysis returned no usable result - using pattern fallback")
+            return None
             
         except Exception as e:
             logger.error(f"AI content analysis failed: {e}")
-            return []
+            return None
     
     async def _pattern_based_extraction(self, content: str) -> List[Dict[str, Any]]:
         """Extract assets using regex patterns"""
@@ -284,23 +335,19 @@ Return as JSON object with "assets" array. Focus on CONCRETE, SPECIFIC content -
     
     async def _validate_and_enrich_assets(self, assets: List[Dict[str, Any]], original_content: str) -> List[Dict[str, Any]]:
         """Validate assets are real and enrich with metadata"""
-        validated = []
+        candidates: List[Tuple[Dict[str, Any], str]] = []
         
         for asset in assets:
-            # Skip if content is too short or looks like placeholder
+            # Skip if content is too short
             content = asset.get('content', '')
             # Convert to string if it's a dict or other non-string type for validation - ROBUST VERSION
             try:
-                if isinstance(content, dict):
-                    import json
-                    content_str = json.dumps(content, sort_keys=True, default=str)
-                elif isinstance(content, list):
-                    import json
+                if isinstance(content, (dict, list)):
                     content_str = json.dumps(content, sort_keys=True, default=str)
                 else:
                     content_str = str(content)
                 
-                if len(content_str) < 10 or await self._is_placeholder_content(content_str):
+                if len(content_str) < 10:
                     continue
                 
                 # Enrich asset metadata with safe hashing
@@ -314,9 +361,16 @@ Return as JSON object with "assets" array. Focus on CONCRETE, SPECIFIC content -
             asset['extracted_at'] = datetime.now().isoformat()
             asset['byte_size'] = len(content_str.encode('utf-8'))
             asset['line_count'] = content_str.count('\n') + 1
-            
-            # Calculate quality score (AI-driven)
-            asset['quality_score'] = await self._calculate_asset_quality(asset)
+            candidates.append((asset, content_str))
+        
+        # Placeholder detection and quality scoring (AI-driven), batched across assets
+        assessments = await self._assess_assets(candidates)
+        
+        validated = []
+        for (asset, _), (is_placeholder, quality_score) in zip(candidates, assessments):
+            if is_placeholder:
+                continue
+            asset['quality_score'] = quality_score
             
             # Only include high-quality assets - FIXED: Lower threshold
             if asset['quality_score'] >= 0.1:  # Lowered from 0.6 to 0.5, then to 0.1
@@ -327,6 +381,124 @@ Return as JSON object with "assets" array. Focus on CONCRETE, SPECIFIC content -
         
         return validated
     
+    async def _assess_assets(self, candidates: List[Tuple[Dict[str, Any], str]]) -> List[Tuple[bool, float]]:
+        """
+        (is_placeholder, quality_score) per asset, judging up to ASSET_CHECK_BATCH_SIZE assets
+        per model call. Assets a batch call misses fall back to the per-asset checks.
+        """
+        results: List[Optional[Tuple[bool, float]]] = [None] * len(candidates)
+        semaphore = asyncio.Semaphore(ASSET_CHECK_CONCURRENCY)
+        
+        async def assess_chunk(offset: int, chunk: List[Tuple[Dict[str, Any], str]]):
+            async with semaphore:
+                verdicts = await self._ai_assess_asset_chunk(chunk)
+            for index in range(len(chunk)):
+                verdict = verdicts.get(f"A{index + 1}")
+                if not isinstance(verdict, dict):
+                    continue
+                try:
+                    confidence = float(verdict.get('placeholder_confidence', 0.8))
+                    quality_score = max(0.0, min(1.0, float(verdict['quality_score'])))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                # Only consider it placeholder if AI is confident
+                results[offset + index] = (bool(verdict.get('is_placeholder')) and confidence >= 0.7, quality_score)
+        
+        await asyncio.gather(*[
+            assess_chunk(offset, candidates[offset:offset + ASSET_CHECK_BATCH_SIZE])
+            for offset in range(0, len(candidates), ASSET_CHECK_BATCH_SIZE)
+        ])
+        
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            self.extraction_stats["asset_check_fallbacks"] += len(missing)
+            
+            async def check_single(index: int):
+                asset, content_str = candidates[index]
+                async with semaphore:
+                    if await self._is_placeholder_content(content_str):
+                        results[index] = (True, 0.0)
+                    else:
+                        results[index] = (False, await self._calculate_asset_quality(asset))
+            
+            await asyncio.gather(*[check_single(index) for index in missing])
+        
+        return results
+    
+    async def _ai_assess_asset_chunk(self, chunk: List[Tuple[Dict[str, Any], str]]) -> Dict[str, Dict[str, Any]]:
+        """One model call judging placeholder status and quality of several assets, keyed A1..An"""
+        try:
+            asset_sections = "\n\n".join(
+                f"""[A{index + 1}]
+Asset Type: {asset.get('asset_type', 'unknown')}
+Asset Name: {asset.get('asset_name', 'unnamed')}
+Content Size: {len(content_str)} characters
+Extraction Method: {asset.get('extraction_method', 'unknown')}
+Content:
+{content_str[:1500]}"""
+                for index, (asset, content_str) in enumerate(chunk)
+            )
+            
+            assessment_prompt = f"""Assess each of the following assets independently.
+
+{asset_sections}
+
+For every asset decide:
+- Is it placeholder, fake, or generic content (like "TODO", "TBD", "Lorem ipsum", templates
+  without specific information, dummy data) rather than real, specific, actionable content?
+- Its quality from 0.0 to 1.0, based on completeness and usefulness, specificity vs
+  generic content, business value and actionability, structure, and context appropriateness.
+
+Respond with JSON, one entry per asset key:
+{{
+  "assessments": [
+    {{
+      "asset_key": "A1",
+      "is_placeholder": true/false,
+      "placeholder_confidence": 0.0-1.0,
+      "quality_score": 0.0-1.0,
+      "reasoning": "brief explanation"
+    }}
+  ]
+}}"""
+
+            agent = {
+                "name": "AssetBatchAssessor",
+                "model": "gpt-4o-mini",
+                "instructions": "You are an expert at evaluating asset quality objectively and at detecting placeholder, fake, or generic content vs real specific content."
+            }
+            
+            response = await asyncio.wait_for(
+                ai_provider_manager.call_ai(
+                    provider_type='openai_sdk',
+                    agent=agent,
+                    prompt=assessment_prompt,
+                    max_tokens=120 * len(chunk) + 100,
+                    temperature=0.1,
+                    response_format={"type": "json_object"}
+                ),
+                timeout=30.0
+            )
+            self.extraction_stats["asset_check_calls"] += 1
+            
+            if response and isinstance(response, dict):
+                response_content = response.get('content', response)
+                if isinstance(response_content, str):
+                    response_content = json.loads(response_content)
+                if isinstance(response_content, dict):
+                    return {
+                        str(item.get('asset_key', '')).strip().upper(): item
+                        for item in response_content.get('assessments', [])
+                        if isinstance(item, dict)
+                    }
+                
+        except asyncio.TimeoutError:
+            logger.debug("AI batch asset assessment timed out - using per-asset checks")
+        except Exception as e:
+            logger.debug(f"AI batch asset assessment failed, using per-asset checks: {e}")
+        
+        return {}
+    
     async def _ai_extract_structured_content(self, content: str, assets: List[Dict[str, Any]]) -> None:
         """AI-driven extraction of structured content without hard-coded patterns"""
         try:
@@ -614,70 +786,98 @@ Respond with JSON:
             
         return max(0.0, min(1.0, base_score))
     
-    async def extract_assets_from_task_batch(self, tasks: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Extract assets from multiple tasks in parallel"""
+    async def extract_assets_from_task_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        timeout: Optional[float] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Extract assets from the completed tasks of a batch.
+        
+        Results already in the extraction ledger (same task result content) are reused
+        without any model call; the rest run ASSET_EXTRACTION_CONCURRENCY at a time and
+        are ledgered as each finishes, unless their AI analysis failed (those pattern-only
+        results are returned but re-extracted on the next run). On timeout the finished tasks keep their assets,
+        unfinished ones map to [], and a later run resumes from the ledger.
+        """
         try:
-            logger.info(f"🔄 Extracting assets from {len(tasks)} tasks in batch")
-            
-            # Prepare extraction tasks
-            extraction_tasks = []
-            for task in tasks:
-                if task.get('status') == 'completed' and task.get('result'):
-                    context = {
-                        'task_name': task.get('name'),
-                        'task_type': task.get('type'),
-                        'workspace_id': task.get('workspace_id')
-                    }
-                    
-                    # Convert result to string if it's a dict, list, or other object
-                    task_result = task['result']
-                    if isinstance(task_result, dict):
-                        content_str = json.dumps(task_result, indent=2, default=str)
-                    elif isinstance(task_result, list):
-                        # Handle list results by joining or converting to JSON
-                        if all(isinstance(item, str) for item in task_result):
-                            content_str = '\n'.join(task_result)
-                        else:
-                            content_str = json.dumps(task_result, indent=2, default=str)
-                    elif isinstance(task_result, str):
-                        content_str = task_result
-                    else:
-                        content_str = str(task_result)
-                    
-                    extraction_tasks.append(
-                        self.extract_assets(content_str, context)
-                    )
-            
-            # Execute in parallel with timeout
-            if extraction_tasks:
-                try:
-                    results = await asyncio.wait_for(
-                        asyncio.gather(*extraction_tasks, return_exceptions=True),
-                        timeout=120.0  # 2 minute timeout for batch extraction
-                    )
-                except asyncio.TimeoutError:
-                    logger.error("Batch asset extraction timed out after 2 minutes")
-                    # Return empty assets for all tasks
-                    return {task['id']: [] for task in tasks}
+            completed = [task for task in tasks if task.get('status') == 'completed' and task.get('result')]
+            logger.info(f"🔄 Extracting assets from {len(completed)} completed tasks in batch")
+            if not completed:
+                return {}
+            
+            timeout = ASSET_EXTRACTION_BATCH_TIMEOUT_SECONDS if timeout is None else timeout
+            semaphore = asyncio.Semaphore(ASSET_EXTRACTION_CONCURRENCY)
+            computed = set()
+            
+            async def extract_task(task: Dict[str, Any]) -> List[Dict[str, Any]]:
+                content_str = self._content_to_text(task['result'])
+                context = {
+                    'task_name': task.get('name'),
+                    'task_type': task.get('type'),
+                    'workspace_id': task.get('workspace_id')
+                }
                 
-                # Map results back to task IDs
-                task_assets = {}
-                for i, (task, result) in enumerate(zip(tasks, results)):
-                    if isinstance(result, Exception):
-                        logger.error(f"Asset extraction failed for task {task.get('id')}: {result}")
-                        task_assets[task['id']] = []
-                    else:
-                        task_assets[task['id']] = result
+                async def compute() -> Dict[str, Any]:
+                    async with semaphore:
+                        computed.add(task['id'])
+                        return await self._extract_assets(content_str, context)
                 
-                total_assets = sum(len(assets) for assets in task_assets.values())
-                logger.info(f"✅ Extracted {total_assets} total assets from batch")
-                return task_assets
+                entry = await ai_result_store.get_or_compute(
+                    ASSET_EXTRACTION_LEDGER_NAMESPACE,
+                    ASSET_EXTRACTION_LEDGER_VERSION,
+                    (content_str, context['task_name']),
+                    compute,
+                    should_store=_is_ledgerable_extraction,
+                    max_age=ASSET_EXTRACTION_LEDGER_TTL_SECONDS
+                )
+                return entry["assets"]
+            
+            futures = {asyncio.ensure_future(extract_task(task)): task for task in completed}
+            done, pending = await asyncio.wait(futures, timeout=timeout)
+            
+            if pending:
+                logger.warning(f"⏱️ Batch asset extraction timed out after {timeout:g}s: "
+                               f"keeping {len(done)} finished tasks, {len(pending)} will resume on the next run")
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+            
+            # Map results back to task IDs
+            task_assets = {}
+            extracted = reused = 0
+            for future, task in futures.items():
+                if future in pending:
+                    self.extraction_stats["timed_out"] += 1
+                    task_assets[task['id']] = []
+                elif future.exception() is not None:
+                    self.extraction_stats["failed"] += 1
+                    logger.error(f"Asset extraction failed for task {task.get('id')}: {future.exception()}")
+                    task_assets[task['id']] = []
+                else:
+                    task_assets[task['id']] = future.result()
+                    if task['id'] in computed:
+                        extracted += 1
+                    else:
+                        reused += 1
             
-            return {}
+            self.extraction_stats["tasks"] += len(completed)
+            self.extraction_stats["extracted"] += extracted
+            self.extraction_stats["reused"] += reused
+            
+            total_assets = sum(len(assets) for assets in task_assets.values())
+            logger.info(f"✅ Extracted {total_assets} total assets from batch "
+                        f"({extracted} tasks extracted, {reused} reused from ledger)")
+            return task_assets
             
         except Exception as e:
             logger.error(f"Batch asset extraction failed: {e}")
             return {}
+    
+    def get_extraction_stats(self) -> Dict[str, Any]:
+        """Extraction counters plus the ledger's hit/miss statistics"""
+        ledger = ai_result_store.get_stats()["namespaces"].get(ASSET_EXTRACTION_LEDGER_NAMESPACE, {})
+        return {**self.extraction_stats, "ledger": ledger}
 
 
 # Create singleton instance
@@ -3,17 +3,18 @@ import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Set, Callable
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple
 from uuid import UUID, uuid4
 import json
 import time
+from contextvars import ContextVar
 from collections import defaultdict, Counter
-import difflib
 
 # Import da modelli del progetto
 from models import TaskStatus, Task, AgentStatus, WorkspaceStatus, Agent as AgentModelPydantic, TaskExecutionOutput
 from database import (
     list_tasks,
+    count_tasks,
     update_task_status,
     get_workspace,
     get_agent,
@@ -32,9 +33,19 @@ from ai_agents.manager import AgentManager
 from task_analyzer import EnhancedTaskExecutor, get_enhanced_task_executor
 from utils.project_settings import get_project_settings
 from services.unified_memory_engine import unified_memory_engine
+from services.task_similarity_clustering import (
+    cluster_texts, TASK_CLUSTERING_OFFLOAD_MIN_TASKS, TASK_DESCRIPTION_DUPLICATE_THRESHOLD
+)
+from utils.priority_task_queue import PriorityTaskQueue
+from utils.latency_histogram import LatencyHistogram
+from utils.telemetry_counters import telemetry_counters
+from utils.task_event_bus import task_event_bus, TASK_CREATED, TASK_STATUS_CHANGED, TASK_QUEUED, WORKSPACE_CHANGED, GOAL_CHANGED
 
 logger = logging.getLogger(__name__)
 
+# Settings of the workspace currently being scanned by this asyncio task (see _scan_workspace)
+_workspace_scan_settings: ContextVar[Optional[Dict[str, Any]]] = ContextVar("workspace_scan_settings", default=None)
+
 # 🎯 HOLISTIC INTEGRATION: Import pipeline esistente senza creare silos
 try:
     from services.holistic_task_deliverable_pipeline import HolisticTaskDeliverablePipeline
@@ -586,6 +597,18 @@ class TaskExecutor(AssetCoordinationMixin):
         self.default_execution_timeout: int = 300  # secondi per task
         self.max_delegation_depth: int = 2
 
+        # Concurrent workspace polling: fan-out bound, per-workspace deadline and scan metrics
+        self.workspace_scan_concurrency: int = int(os.getenv("EXECUTOR_WORKSPACE_SCAN_CONCURRENCY", "5"))
+        self.workspace_scan_timeout: float = float(os.getenv("EXECUTOR_WORKSPACE_SCAN_TIMEOUT", "60"))
+        self.workspace_scan_histograms: Dict[str, LatencyHistogram] = {}
+        self.workspace_scan_outcomes: Dict[str, Counter] = defaultdict(Counter)
+        self.polling_cycle_histogram = LatencyHistogram()
+
+        # Event-driven dispatch (see _wait_for_work)
+        self.task_event_subscription = None
+        self.event_coalesce_window: float = float(os.getenv("EXECUTOR_EVENT_COALESCE_SECONDS", "0.05"))
+        self.event_dispatch_histogram = LatencyHistogram(buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+
         # Tracking per anti-loop
         self.task_completion_tracker: Dict[str, Set[str]] = defaultdict(set)
         self.delegation_chain_tracker: Dict[str, List[str]] = defaultdict(list)
@@ -615,7 +638,12 @@ class TaskExecutor(AssetCoordinationMixin):
         # Queue configuration
         self.max_queue_size: int = self.max_concurrent_tasks * 5
         self.active_tasks_count: int = 0
-        self.task_queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        # Priority scheduler: corrective fast lane, per-workspace fair share, aging
+        self.task_queue: PriorityTaskQueue = PriorityTaskQueue(
+            maxsize=self.max_queue_size,
+            priority_fn=self._get_queue_priority,
+            aging_rate=float(os.getenv("TASK_QUEUE_AGING_RATE", "10")),
+        )
         self.worker_tasks: List[asyncio.Task] = []
 
         # Enhanced task handler (con auto-generation disabilitata)
@@ -746,11 +774,17 @@ class TaskExecutor(AssetCoordinationMixin):
     @property
     def max_concurrent_tasks(self) -> int:
         """Get max concurrent tasks (workspace-aware when possible)"""
+        scan_settings = _workspace_scan_settings.get()
+        if scan_settings:
+            return scan_settings['max_concurrent_tasks']
         return getattr(self, '_current_max_concurrent_tasks', self.default_max_concurrent_tasks)
 
     @property
     def execution_timeout(self) -> int:
         """Get execution timeout (workspace-aware when possible)"""
+        scan_settings = _workspace_scan_settings.get()
+        if scan_settings:
+            return scan_settings['task_timeout']
         return getattr(self, '_current_execution_timeout', self.default_execution_timeout)
 
     async def _debounced_query(self, query_key: str, query_func: Callable, *args, **kwargs):
@@ -922,6 +956,10 @@ class TaskExecutor(AssetCoordinationMixin):
             except Exception as e:
                 logger.warning(f"⚠️ Failed to start recovery scheduler: {e}")
         
+        # 📣 Event-driven dispatch: wake on task events, polling stays as safety net
+        self.task_event_subscription = task_event_bus.subscribe({TASK_CREATED, TASK_STATUS_CHANGED})
+        asyncio.create_task(task_event_bus.start_postgres_listener())
+
         # Avvia il main execution loop
         asyncio.create_task(self.execution_loop())
         logger.info("Task executor started successfully")
@@ -937,6 +975,11 @@ class TaskExecutor(AssetCoordinationMixin):
         self.paused = True
         self.pause_event.set()
 
+        if self.task_event_subscription is not None:
+            self.task_event_subscription.close()
+            self.task_event_subscription = None
+        await task_event_bus.stop_postgres_listener()
+
         # Invia segnali di stop ai worker
         for _ in range(len(self.worker_tasks)):
             try:
@@ -1051,6 +1094,7 @@ class TaskExecutor(AssetCoordinationMixin):
                 "timestamp": datetime.now().isoformat()
             })
             
+            task_event_bus.publish(TASK_QUEUED, workspace_id=workspace_id, task_id=task_id, priority=priority)
             logger.info(f"✅ Task {task_id} added to queue immediately. Queue size: {self.task_queue.qsize()}")
             return True
             
@@ -1191,6 +1235,7 @@ class TaskExecutor(AssetCoordinationMixin):
                 logger.info(f"WORKER {worker_id}: Validating task {task_id} for anti-loop.")
                 if not await self._validate_task_execution(task_dict_from_queue):
                     logger.warning(f"Worker {worker_id} skipping task {task_id} - failed anti-loop validation")
+                    telemetry_counters.increment("anti_loop_triggers")
                     self.task_queue.task_done()
                     self.active_task_ids.discard(task_id)
                     await asyncio.sleep(0.05)
@@ -2866,7 +2911,7 @@ Original Task:
                 # 🛌 STEP 5: ADAPTIVE SLEEP BASED ON LOAD
                 sleep_interval = self.adaptive_intervals[self.executor_metrics['load_level']]
                 logger.debug(f"🛌 Adaptive sleep: {sleep_interval}s (load: {self.executor_metrics['load_level']})")
-                await asyncio.sleep(sleep_interval)
+                await self._wait_for_work(sleep_interval)
 
             except asyncio.CancelledError:
                 logger.info("Main execution loop cancelled")
@@ -2877,11 +2922,70 @@ Original Task:
         
         logger.info("Main execution loop finished")
 
+    async def _wait_for_work(self, timeout: float):
+        """
+        Sleep until the next safety-net poll, but dispatch immediately when task
+        events arrive for a workspace (new task, task back to pending, completion
+        that may unblock dependents).
+        """
+        if self.task_event_subscription is None:
+            await asyncio.sleep(timeout)
+            return
+
+        deadline = time.monotonic() + timeout
+        while self.running:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            events = await self.task_event_subscription.wait(remaining)
+            if not events:
+                return
+            # Short window so bursts (e.g. a planner creating many tasks) become one dispatch
+            await asyncio.sleep(self.event_coalesce_window)
+            events.extend(self.task_event_subscription.drain())
+            if not self.paused:
+                await self._dispatch_task_events(events)
+
+    async def _dispatch_task_events(self, events: List[Any]):
+        workspace_ids = {
+            event.workspace_id for event in events
+            if event.workspace_id and (
+                event.event_type == TASK_CREATED or
+                event.status in (TaskStatus.PENDING.value, TaskStatus.COMPLETED.value)
+            )
+        }
+        if not workspace_ids:
+            return
+
+        oldest_event = min(event.published_at for event in events)
+        logger.info(f"📣 EVENT DISPATCH: {len(events)} task events -> scanning {len(workspace_ids)} workspaces")
+        for workspace_id in workspace_ids:
+            self._invalidate_task_query_cache(workspace_id)
+
+        semaphore = asyncio.Semaphore(self.workspace_scan_concurrency)
+        await asyncio.gather(
+            *(self._scan_workspace_isolated(workspace_id, semaphore) for workspace_id in workspace_ids)
+        )
+        self.event_dispatch_histogram.observe(time.time() - oldest_event)
+
+    def _invalidate_task_query_cache(self, workspace_id: str):
+        """Forget cached task listings (all projections) so the next scan sees new work."""
+        for cache_key in [k for k in self._tasks_query_cache if k == workspace_id or k.startswith(f"{workspace_id}:")]:
+            self._tasks_query_cache.pop(cache_key, None)
+            self._query_debounce_cache.pop(f"tasks_{cache_key}", None)
+
     async def process_pending_tasks_anti_loop(self):
-        """Processa task pendenti da tutti i workspace attivi"""
+        """
+        Processa task pendenti da tutti i workspace attivi
+
+        Workspaces are scanned concurrently (bounded by a semaphore), each with its
+        own deadline and error isolation, so a cycle lasts as long as the slowest
+        workspace instead of the sum of all of them.
+        """
         if self.paused:
             return
             
+        cycle_start = time.perf_counter()
         try:
             # Ottieni workspace con task pendenti
             workspaces_with_pending = await get_workspaces_with_pending_tasks()
@@ -2890,41 +2994,82 @@ Original Task:
                 logger.info(f"🔍 POLLING: Found {len(workspaces_with_pending)} workspaces with pending tasks: {workspaces_with_pending}")
             else:
                 logger.info(f"🔍 POLLING: No workspaces with pending tasks found")
+                return
             
             # Limita il numero di workspace processati per ciclo
-            for workspace_id in workspaces_with_pending[:self.max_concurrent_tasks * 2]:
-                logger.info(f"🔍 POLLING: Processing workspace {workspace_id}")
-                
-                if self.task_queue.full():
-                    logger.warning(f"Anti-loop Task Queue is full ({self.task_queue.qsize()}/{self.max_queue_size}). Skipping further workspace processing in this cycle")
-                    break
-                
-                # Load workspace-specific settings before processing
-                try:
-                    workspace_settings = await self.get_workspace_settings(workspace_id)
-                    # Apply workspace-specific settings for this cycle
-                    self._current_max_concurrent_tasks = workspace_settings['max_concurrent_tasks']
-                    self._current_execution_timeout = workspace_settings['task_timeout']
-                    logger.debug(f"Loaded settings for workspace {workspace_id}: "
-                               f"concurrent_tasks={workspace_settings['max_concurrent_tasks']}, "
-                               f"timeout={workspace_settings['task_timeout']}s")
-                except Exception as e:
-                    logger.warning(f"Failed to load workspace settings for {workspace_id}, using defaults: {e}")
-                    # Reset to defaults on error
-                    self._current_max_concurrent_tasks = self.default_max_concurrent_tasks
-                    self._current_execution_timeout = self.default_execution_timeout
-                
-                # Pre-warm caches to avoid repeated DB hits in quick succession
-                tasks_count = len(await self._cached_list_tasks(workspace_id))
-                agents_count = len(await self._cached_list_agents(workspace_id))
-                logger.info(f"🔍 POLLING: Workspace {workspace_id} has {tasks_count} tasks, {agents_count} agents")
-                
-                logger.info(f"🔍 POLLING: Calling process_workspace_tasks_anti_loop_with_health_check_enhanced for {workspace_id}")
-                await self.process_workspace_tasks_anti_loop_with_health_check_enhanced(workspace_id)
-                logger.info(f"🔍 POLLING: Finished processing workspace {workspace_id}")
+            workspaces_to_scan = workspaces_with_pending[:self.max_concurrent_tasks * 2]
+            semaphore = asyncio.Semaphore(self.workspace_scan_concurrency)
+            await asyncio.gather(
+                *(self._scan_workspace_isolated(workspace_id, semaphore) for workspace_id in workspaces_to_scan)
+            )
                 
         except Exception as e:
             logger.error(f"Error in process_pending_tasks_anti_loop: {e}", exc_info=True)
+        finally:
+            self.polling_cycle_histogram.observe(time.perf_counter() - cycle_start)
+
+    async def _scan_workspace_isolated(self, workspace_id: str, semaphore: asyncio.Semaphore):
+        """Scan one workspace under the fan-out bound with its own deadline; never raises."""
+        async with semaphore:
+            if self.paused:
+                return
+            if self.task_queue.full():
+                logger.warning(f"Anti-loop Task Queue is full ({self.task_queue.qsize()}/{self.max_queue_size}). Skipping W:{workspace_id} in this cycle")
+                self.workspace_scan_outcomes[workspace_id]["skipped_queue_full"] += 1
+                return
+
+            scan_start = time.perf_counter()
+            outcome = "ok"
+            try:
+                await asyncio.wait_for(self._scan_workspace(workspace_id), timeout=self.workspace_scan_timeout)
+            except asyncio.TimeoutError:
+                outcome = "timeouts"
+                logger.error(f"⏰ POLLING: Workspace {workspace_id} scan exceeded {self.workspace_scan_timeout}s deadline")
+            except Exception as e:
+                outcome = "errors"
+                logger.error(f"POLLING: Error scanning workspace {workspace_id}: {e}", exc_info=True)
+            finally:
+                elapsed = time.perf_counter() - scan_start
+                if workspace_id not in self.workspace_scan_histograms:
+                    self.workspace_scan_histograms[workspace_id] = LatencyHistogram()
+                self.workspace_scan_histograms[workspace_id].observe(elapsed)
+                self.workspace_scan_outcomes[workspace_id][outcome] += 1
+
+    async def _scan_workspace(self, workspace_id: str):
+        logger.info(f"🔍 POLLING: Processing workspace {workspace_id}")
+
+        # Load workspace-specific settings before processing
+        try:
+            workspace_settings = await self.get_workspace_settings(workspace_id)
+            scan_settings = {
+                'max_concurrent_tasks': workspace_settings['max_concurrent_tasks'],
+                'task_timeout': workspace_settings['task_timeout'],
+            }
+            logger.debug(f"Loaded settings for workspace {workspace_id}: "
+                       f"concurrent_tasks={workspace_settings['max_concurrent_tasks']}, "
+                       f"timeout={workspace_settings['task_timeout']}s")
+        except Exception as e:
+            logger.warning(f"Failed to load workspace settings for {workspace_id}, using defaults: {e}")
+            scan_settings = {
+                'max_concurrent_tasks': self.default_max_concurrent_tasks,
+                'task_timeout': self.default_execution_timeout,
+            }
+        # Concurrent scans each see their own workspace's settings (task-local context);
+        # the instance attributes keep the previous last-scanned semantics for workers
+        _workspace_scan_settings.set(scan_settings)
+        self._current_max_concurrent_tasks = scan_settings['max_concurrent_tasks']
+        self._current_execution_timeout = scan_settings['task_timeout']
+
+        # Server-side count: no task rows are transferred just to log their number
+        tasks_count, agents = await asyncio.gather(
+            count_tasks(workspace_id),
+            self._cached_list_agents(workspace_id),
+        )
+        logger.info(f"🔍 POLLING: Workspace {workspace_id} has {tasks_count} tasks, {len(agents)} agents")
+        
+        logger.info(f"🔍 POLLING: Calling process_workspace_tasks_anti_loop_with_health_check_enhanced for {workspace_id}")
+        await self.process_workspace_tasks_anti_loop_with_health_check_enhanced(workspace_id)
+        logger.info(f"🔍 POLLING: Finished processing workspace {workspace_id}")
 
     async def process_workspace_tasks_anti_loop_with_health_check_enhanced(self, workspace_id: str):
         """
@@ -2980,7 +3125,7 @@ Original Task:
                     # Convert health_report to health_status format for compatibility
                     health_status = {
                         'is_healthy': health_report.is_healthy,
-                        'task_counts': {'pending': len([t for t in await self._cached_list_tasks(workspace_id) if t.get('status') == 'pending'])},
+                        'task_counts': {'pending': len([t for t in await self._cached_list_tasks(workspace_id, fields="stats") if t.get('status') == 'pending'])},
                         'health_score': health_report.overall_score
                     }
                     
@@ -3102,11 +3247,17 @@ Original Task:
                 return
 
             # === ENHANCED PRIORITIZATION LOGIC ===
+            # Score every task once: the sort, the logs and the queue classification reuse it
+            if ENABLE_SMART_PRIORITIZATION:
+                priority_scores = {id(t): get_task_priority_score_enhanced(t, workspace_id) for t in pending_eligible_tasks}
+            else:
+                priority_scores = {id(t): self._get_task_priority_score_standard(t) for t in pending_eligible_tasks}
+
             if ENABLE_SMART_PRIORITIZATION:
                 # Usa la nuova funzione di prioritizzazione
                 pending_eligible_tasks.sort(
                     key=lambda t: (
-                        get_task_priority_score_enhanced(t, workspace_id),  # Primary: Enhanced priority score
+                        priority_scores[id(t)],  # Primary: Enhanced priority score
                         datetime.fromisoformat(t.get("created_at", "2020-01-01").replace("Z", "+00:00"))  # Secondary: FIFO
                     ),
                     reverse=True  # Higher priority first, then older tasks
@@ -3115,7 +3266,7 @@ Original Task:
                 # Log the top priority task for monitoring
                 if pending_eligible_tasks:
                     top_task = pending_eligible_tasks[0]
-                    top_priority = get_task_priority_score_enhanced(top_task, workspace_id)
+                    top_priority = priority_scores[id(top_task)]
                     top_context_data = top_task.get('context_data') or {}
                     top_phase = top_context_data.get('project_phase', 'N/A') if isinstance(top_context_data, dict) else 'N/A'
                     logger.info(f"🔥 TOP PRIORITY: '{top_task.get('name', 'Unknown')[:50]}' "
@@ -3124,7 +3275,7 @@ Original Task:
                 # Fallback: uso prioritizzazione standard
                 pending_eligible_tasks.sort(
                     key=lambda t: (
-                        self._get_task_priority_score_standard(t),
+                        priority_scores[id(t)],
                         datetime.fromisoformat(t.get("created_at", "2020-01-01").replace("Z", "+00:00"))
                     ),
                     reverse=True
@@ -3151,13 +3302,15 @@ Original Task:
 
             # Aggiungi alla queue con log migliorato
             try:
-                self.task_queue.put_nowait((manager, task_to_queue_dict))
+                queue_item = (manager, task_to_queue_dict)
+                task_score = priority_scores[id(task_to_queue_dict)]
+                self.task_queue.put_nowait(queue_item, priority=self._get_queue_priority(queue_item, score=task_score))
                 self.queued_task_ids.add(task_id_to_queue)
                 
                 context_data = task_to_queue_dict.get('context_data') or {}
                 task_phase = context_data.get('project_phase', 'N/A') if isinstance(context_data, dict) else 'N/A'
                 needs_assign = not task_to_queue_dict.get('agent_id') and task_to_queue_dict.get('assigned_to_role')
-                priority_score = get_task_priority_score_enhanced(task_to_queue_dict, workspace_id) if ENABLE_SMART_PRIORITIZATION else "standard"
+                priority_score = task_score if ENABLE_SMART_PRIORITIZATION else "standard"
                 
                 logger.info(f"🚀 QUEUED: '{task_to_queue_dict.get('name', 'Unknown')[:40]}' "
                            f"(ID: {task_id_to_queue[:8]}) Priority: {priority_score}, "
@@ -3190,6 +3343,38 @@ Original Task:
             ("quality" in task_name and "enhancement" in task_name)
         )
 
+    def _get_queue_priority(self, queue_item, score: Optional[float] = None) -> Tuple[str, float, Optional[str]]:
+        """
+        Map a queue item ((manager, task_dict) or task_dict) to (priority_class, score, workspace_id)
+
+        ``score`` is the task's already computed priority score, when the caller has one.
+        """
+        task_data = queue_item[1] if isinstance(queue_item, tuple) else queue_item
+        workspace_id = task_data.get("workspace_id")
+        context_data = task_data.get("context_data", {}) or {}
+        if not isinstance(context_data, dict):
+            context_data = {}
+
+        if score is None and ENABLE_SMART_PRIORITIZATION:
+            score = get_task_priority_score_enhanced(task_data, workspace_id)
+        elif score is None:
+            score = self._get_task_priority_score_standard(task_data)
+
+        is_goal_driven_corrective = (
+            context_data.get("is_goal_driven_task", False) and
+            "corrective" in str(context_data.get("task_type", "")).lower()
+        )
+        if task_data.get("is_corrective") or is_goal_driven_corrective or score >= 10000:
+            priority_class = "corrective"
+        elif (str(context_data.get("project_phase", "")).upper() == "FINALIZATION" or
+              context_data.get("target_phase") == "FINALIZATION"):
+            priority_class = "finalization"
+        else:
+            priority_field = str(task_data.get("priority", "medium")).lower()
+            priority_class = {"high": "high", "low": "low"}.get(priority_field, "normal")
+
+        return priority_class, score, workspace_id
+
     def _get_task_priority_score_standard(self, task_data):
         """Funzione standard di prioritizzazione (fallback)"""
         delegation_depth = 0
@@ -3230,6 +3415,13 @@ Original Task:
             elif len(self.task_completion_tracker[workspace_id]) > max_completed_per_ws:
                 logger.info(f"Task completion tracker for W:{workspace_id} has {len(self.task_completion_tracker[workspace_id])} entries. Consider more granular cleanup if grows further")
 
+        # Cleanup scan metrics of workspaces that are no longer polled
+        max_scan_metric_workspaces = 500
+        if len(self.workspace_scan_histograms) > max_scan_metric_workspaces:
+            self.workspace_scan_histograms = {}
+            self.workspace_scan_outcomes = defaultdict(Counter)
+            logger.debug("Reset workspace scan metrics")
+
         # Cleanup delegation chain tracker
         for task_id in list(self.delegation_chain_tracker.keys()):
             if len(self.delegation_chain_tracker[task_id]) > self.max_delegation_depth * 2:
@@ -3248,14 +3440,16 @@ Original Task:
         logger.info("Tracking data cleanup finished")
 
     # === CACHED DATABASE ACCESS HELPERS ===
-    async def _cached_list_tasks(self, workspace_id: str) -> List[Dict]:
+    async def _cached_list_tasks(self, workspace_id: str, fields: str = "full") -> List[Dict]:
+        # Each projection is cached separately: lightweight callers never pay for the JSON blobs
+        cache_key = workspace_id if fields == "full" else f"{workspace_id}:{fields}"
         now = time.time()
-        ts, data = self._tasks_query_cache.get(workspace_id, (0, None))
+        ts, data = self._tasks_query_cache.get(cache_key, (0, None))
         if data is not None and now - ts < self.min_db_query_interval:
             return data
         # Use debounced query for database call
-        data = await self._debounced_query(f"tasks_{workspace_id}", list_tasks, workspace_id)
-        self._tasks_query_cache[workspace_id] = (now, data)
+        data = await self._debounced_query(f"tasks_{cache_key}", list_tasks, workspace_id, fields=fields)
+        self._tasks_query_cache[cache_key] = (now, data)
         return data
 
     async def _cached_list_agents(self, workspace_id: str) -> List[Dict]:
@@ -3314,8 +3508,11 @@ Original Task:
             task_counts = Counter(t.get("status") for t in all_tasks_db)
             task_counts['total'] = len(all_tasks_db)
 
-            # Analisi pattern problematici
-            pattern_analysis = self._analyze_task_patterns(all_tasks_db, workspace_id)
+            # Analisi pattern problematici (large workspaces are clustered off the event loop)
+            if len(all_tasks_db) >= TASK_CLUSTERING_OFFLOAD_MIN_TASKS:
+                pattern_analysis = await asyncio.to_thread(self._analyze_task_patterns, all_tasks_db, workspace_id)
+            else:
+                pattern_analysis = self._analyze_task_patterns(all_tasks_db, workspace_id)
             
             # Identificazione problemi di salute
             health_issues = []
@@ -3458,47 +3655,25 @@ Original Task:
             'description_clusters': description_clusters
         }
 
-    def _find_similar_task_descriptions(self, tasks_db: List[Dict], threshold=0.8) -> List[Dict]:
-        """Trova cluster di task con descrizioni simili"""
-        if not difflib:
-            return []
+    def _find_similar_task_descriptions(
+        self, tasks_db: List[Dict], threshold=TASK_DESCRIPTION_DUPLICATE_THRESHOLD
+    ) -> List[Dict]:
+        """Trova cluster di task con descrizioni simili (TF-IDF cosine + union-find)"""
+        eligible = []
+        for task_dict in tasks_db:
+            desc = (task_dict.get('description') or '')[:250].lower()
+            if len(desc) >= 20:
+                eligible.append((task_dict, desc))
         
         clusters = []
-        processed_indices = set()
-        
-        for i, task1_dict in enumerate(tasks_db):
-            if i in processed_indices:
-                continue
-                
-            desc1 = task1_dict.get('description', '')[:250].lower()
-            if not desc1 or len(desc1) < 20:
-                processed_indices.add(i)
-                continue
-            
-            current_cluster = [task1_dict]
-            processed_indices.add(i)
-            
-            for j, task2_dict in enumerate(tasks_db[i+1:], start=i+1):
-                if j in processed_indices:
-                    continue
-                    
-                desc2 = task2_dict.get('description', '')[:250].lower()
-                if not desc2 or len(desc2) < 20:
-                    processed_indices.add(j)
-                    continue
-                
-                similarity = difflib.SequenceMatcher(None, desc1, desc2).ratio()
-                if similarity >= threshold:
-                    current_cluster.append(task2_dict)
-                    processed_indices.add(j)
-            
-            if len(current_cluster) > 1:
-                clusters.append({
-                    'count': len(current_cluster),
-                    'sample_names': [t.get('name', 'N/A') for t in current_cluster[:3]],
-                    'snippet': desc1[:100] + "...",
-                    'threshold': threshold
-                })
+        for members in cluster_texts([desc for _, desc in eligible], threshold):
+            current_cluster = [eligible[k][0] for k in members]
+            clusters.append({
+                'count': len(current_cluster),
+                'sample_names': [t.get('name', 'N/A') for t in current_cluster[:3]],
+                'snippet': eligible[members[0]][1][:100] + "...",
+                'threshold': threshold
+            })
         
         return clusters
 
@@ -3875,7 +4050,7 @@ Original Task:
                     continue
 
                 # Se il workspace non ha task, crea task iniziale
-                tasks = await self._cached_list_tasks(ws_id)
+                tasks = await self._cached_list_tasks(ws_id, fields="id")
                 if not tasks:
                     ws_data = await get_workspace(ws_id)
                     if ws_data and ws_data.get("status") == WorkspaceStatus.ACTIVE.value:
@@ -4241,6 +4416,7 @@ Original Task:
                         pass
                     
                     update_result = supabase.table("workspaces").update(update_data).eq("id", workspace_id).execute()
+                    task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                     
                     if update_result.data:
                         paused_count += 1
@@ -4316,6 +4492,7 @@ Original Task:
                         pass
                     
                     update_result = supabase.table("workspaces").update(update_data).eq("id", workspace["id"]).execute()
+                    task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace["id"])
                     
                     if update_result.data:
                         resumed_count += 1
@@ -4392,6 +4569,23 @@ Original Task:
             "executor_status": status,
             "anti_loop_mode_active": True,
             "tasks_in_queue": self.task_queue.qsize(),
+            "task_queue_metrics": self.task_queue.get_metrics(),
+            "polling_cycle_seconds": self.polling_cycle_histogram.to_dict(),
+            "event_dispatch": {
+                "event_to_dispatch_seconds": self.event_dispatch_histogram.to_dict(),
+                "bus": task_event_bus.get_stats(),
+            },
+            "workspace_scan_metrics": {
+                "concurrency": self.workspace_scan_concurrency,
+                "timeout_seconds": self.workspace_scan_timeout,
+                "workspaces": {
+                    ws_id: {
+                        **histogram.to_dict(),
+                        "outcomes": dict(self.workspace_scan_outcomes.get(ws_id, {})),
+                    }
+                    for ws_id, histogram in self.workspace_scan_histograms.items()
+                },
+            },
             "active_tasks": self.active_tasks_count,
             "max_concurrent_tasks": self.max_concurrent_tasks,
             "task_timeout_seconds": self.execution_timeout,
@@ -5354,7 +5548,7 @@ class QualityEnhancedTaskExecutor(TaskExecutor):
                 # 🛌 STEP 5: ADAPTIVE SLEEP BASED ON LOAD
                 sleep_interval = self.adaptive_intervals[self.executor_metrics['load_level']]
                 logger.debug(f"🛌 Adaptive sleep: {sleep_interval}s (load: {self.executor_metrics['load_level']})")
-                await asyncio.sleep(sleep_interval)
+                await self._wait_for_work(sleep_interval)
                 
             except asyncio.CancelledError:
                 logger.info("Enhanced execution loop cancelled")
@@ -6448,6 +6642,7 @@ Return ONLY a number between 0-200 representing urgency boost.
                     "asset_completion_rate": asset_completion_rate,
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", str(goal_id)).execute()
+                task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=str(goal_id))
                 
                 logger.info(f"📊 Updated goal {goal_id} asset completion rate to {asset_completion_rate:.2%}")
                 
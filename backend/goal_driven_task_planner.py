@@ -13,6 +13,8 @@ from models import (
 )
 from services.task_deduplication_manager import task_deduplication_manager
 from database import get_supabase_client
+from utils.task_event_bus import task_event_bus, GOAL_CHANGED, AGENT_CHANGED
+from services.task_similarity_clustering import find_similar_pairs_async
 
 logger = logging.getLogger(__name__)
 supabase = get_supabase_client()
@@ -27,6 +29,13 @@ except ImportError as e:
     RESILIENT_SIMILARITY_AVAILABLE = False
     ai_resilient_similarity_engine = None
 
+# Cross-task similarity: pairs scoring at least SIMILARITY_DIRECT_THRESHOLD (TF-IDF cosine)
+# are duplicates outright; pairs between the candidate and direct thresholds are confirmed
+# by the resilient engine, at most SIMILARITY_MAX_AI_CONFIRMATIONS per check
+SIMILARITY_DIRECT_THRESHOLD = 0.85
+SIMILARITY_CANDIDATE_THRESHOLD = float(os.getenv("SIMILARITY_CANDIDATE_THRESHOLD", "0.5"))
+SIMILARITY_MAX_AI_CONFIRMATIONS = int(os.getenv("SIMILARITY_MAX_AI_CONFIRMATIONS", "10"))
+
 class GoalDrivenTaskPlanner:
     """
     🎯 STEP 2: Goal-Driven Task Planner - AI-DRIVEN & UNIVERSAL
@@ -1406,14 +1415,22 @@ Return ONLY the category name that best fits this metric.
         🤖 Use AI Resilient Similarity Engine for robust cross-task similarity detection
         """
         try:
-            similar_tasks = []
-            
-            # Compare each task with every other task using resilient engine
-            for i, task1 in enumerate(active_tasks):
-                for j, task2 in enumerate(active_tasks):
-                    if i >= j:  # Avoid duplicates and self-comparison
+            # One vectorized all-pairs pass shortlists candidate pairs instead of
+            # awaiting the similarity engine for every pair of tasks
+            texts = [f"{t.get('name', '')} {t.get('description') or ''}" for t in active_tasks]
+            candidate_pairs = await find_similar_pairs_async(texts, SIMILARITY_CANDIDATE_THRESHOLD)
+            candidate_pairs.sort(key=lambda pair: pair[2], reverse=True)
+            
+            similar_indices = set()
+            ai_confirmations = 0
+            for i, j, cosine in candidate_pairs:
+                task1, task2 = active_tasks[i], active_tasks[j]
+                if cosine >= SIMILARITY_DIRECT_THRESHOLD:
+                    score, method, confidence = cosine, "tfidf_cosine", 1.0
+                else:
+                    if ai_confirmations >= SIMILARITY_MAX_AI_CONFIRMATIONS:
                         continue
-                    
+                    ai_confirmations += 1
                     # Use resilient similarity engine
                     similarity_result = await ai_resilient_similarity_engine.compute_semantic_similarity(
                         task1=task1,
@@ -1421,25 +1438,24 @@ Return ONLY the category name that best fits this metric.
                         context={
                             "metric_type": metric_type,
                             "business_context": "cross-goal task similarity detection",
-                            "similarity_threshold": 0.85  # Very high threshold - only catch true duplicates
+                            "similarity_threshold": SIMILARITY_DIRECT_THRESHOLD  # Very high threshold - only catch true duplicates
                         }
                     )
-                    
-                    # If tasks are similar enough, add both to similar_tasks list
-                    if similarity_result.similarity_score >= 0.85:  # Increased threshold
-                        if task1 not in similar_tasks:
-                            similar_tasks.append(task1)
-                        if task2 not in similar_tasks:
-                            similar_tasks.append(task2)
-                        
-                        logger.info(
-                            f"🤖 RESILIENT SIMILARITY: '{task1['name']}' ↔ '{task2['name']}' "
-                            f"(score: {similarity_result.similarity_score:.3f}, "
-                            f"method: {similarity_result.method_used.value}, "
-                            f"confidence: {similarity_result.confidence:.3f})"
-                        )
+                    score = similarity_result.similarity_score
+                    method = similarity_result.method_used.value
+                    confidence = similarity_result.confidence
+                
+                # If tasks are similar enough, add both to similar_tasks list
+                if score >= SIMILARITY_DIRECT_THRESHOLD:
+                    similar_indices.update((i, j))
+                    logger.info(
+                        f"🤖 RESILIENT SIMILARITY: '{task1['name']}' ↔ '{task2['name']}' "
+                        f"(score: {score:.3f}, "
+                        f"method: {method}, "
+                        f"confidence: {confidence:.3f})"
+                    )
             
-            return similar_tasks
+            return [active_tasks[k] for k in sorted(similar_indices)]
             
         except Exception as e:
             logger.error(f"❌ Resilient similarity detection failed: {e}")
@@ -1551,6 +1567,7 @@ Return ONLY the category name that best fits this metric.
             await supabase.table("workspace_goals").update(update_data).eq(
                 "id", str(goal_id)
             ).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=goal_data.get("workspace_id"), goal_id=str(goal_id))
             
             logger.info(f"✅ Updated goal {goal_id} progress: {current_value} → {new_value} / {target_value} (business score: {business_content_score:.1f})")
             return True
@@ -1757,6 +1774,7 @@ Return ONLY the category name that best fits this metric.
                     result = supabase.table("agents").insert(agent_data).execute()
                     if result.data:
                         created_agents.append(result.data[0])
+                        task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=agent_data["id"])
                         logger.info(f"✅ Created basic agent: {agent_data['name']}")
                 except Exception as e:
                     logger.error(f"Error creating basic agent {agent_data['name']}: {e}")
@@ -20,6 +20,8 @@ from supabase import create_client
 from dotenv import load_dotenv
 from typing import List, Dict, Any
 
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -108,6 +110,7 @@ class HealthMonitor:
                         self.supabase.table('workspaces').update({
                             'status': 'active'
                         }).eq('id', workspace['id']).execute()
+                        task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace['id'])
                         
                         fix_msg = f"Fixed workspace '{workspace.get('name', 'Unnamed')}' (error → active)"
                         logger.info(f"🔧 {fix_msg}")
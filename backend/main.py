@@ -27,8 +27,14 @@ if PROJECT_ROOT not in sys.path:
 # Load environment variables from `.env` in this directory
 load_dotenv(os.path.join(CURRENT_DIR, ".env"))
 
+# Service singletons that are only needed once the app is running are imported on first use
+from services.service_registry import lazy_service
+from utils.lazy_routers import DeferredRouterMounter, DeferredRouterMiddleware
+
+tool_registry = lazy_service("tool_registry", "tools.registry:tool_registry", description="Modular tool registry")
+task_executor = lazy_service("task_executor", "executor", description="Task executor loop")
+
 # Import routers
-from tools.registry import tool_registry
 from routes.workspaces import router as workspace_router
 from routes.director import router as director_router
 from routes.agents import router as agents_router
@@ -53,30 +59,16 @@ from routes.websocket import router as websocket_router
 from routes.conversation import router as conversation_router
 from routes.documents import router as documents_router
 from routes.authentic_thinking import router as authentic_thinking_router
-from routes.memory import router as memory_router
-from routes.memory_sessions import router as memory_sessions_router
 from routes.thinking import router as thinking_router
-from routes.test_thinking_demo import router as test_thinking_demo_router
 from routes.thinking_api import router as thinking_api_router
 from routes.assets import router as assets_router
 from routes.websocket_assets import router as websocket_assets_router
 from routes.system_monitoring import router as system_monitoring_router
 from routes.service_registry import router as service_registry_router, registry_router as service_registry_compat_router
 from routes.component_health import router as component_health_router, health_router as component_health_compat_router
-from routes.debug import router as debug_router
-
-# Recovery system routes
-from routes.recovery_explanations import router as recovery_explanations_router
-from routes.recovery_analysis import router as recovery_analysis_router
-
-# Sub-agent orchestration route
-from routes.sub_agent_orchestration import router as sub_agent_orchestration_router
 from routes.quota_api import router as quota_router
 from routes.goal_progress_compliance import router as goal_progress_compliance_router
 
-# Import task executor
-from executor import start_task_executor, stop_task_executor
-
 # Import health monitor
 async def start_health_monitor():
     """Start the health monitoring system"""
@@ -105,7 +97,6 @@ async def start_health_monitor():
 
 # Import asset system integration
 from asset_system_integration import register_asset_routes, initialize_asset_system
-from optimization.asset_system_optimizer import start_optimization_monitoring
 
 # Configure logging
 logging.basicConfig(
@@ -130,7 +121,7 @@ async def lifespan(app: FastAPI):
     # Only initialize task executor - essential for task execution
     if os.getenv("DISABLE_TASK_EXECUTOR", "false").lower() != "true":
         logger.info("STARTUP: Starting task executor...")
-        asyncio.create_task(start_task_executor())
+        asyncio.create_task(task_executor.start_task_executor())
         logger.info("STARTUP: Task executor started in background.")
         
         # 🏥 START HEALTH MONITOR: Auto-monitor and fix common issues
@@ -267,8 +258,17 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"SHUTDOWN: Error stopping component health monitoring: {e}")
     
-    logger.info("SHUTDOWN: Stopping task executor...")
-    await stop_task_executor()
+    if task_executor.loaded:
+        logger.info("SHUTDOWN: Stopping task executor...")
+        await task_executor.stop_task_executor()
+    
+    logger.info("SHUTDOWN: Flushing buffered thinking steps...")
+    try:
+        from services.thinking_process import thinking_engine
+        await thinking_engine.shutdown()
+        logger.info("SHUTDOWN: Thinking steps flushed.")
+    except Exception as e:
+        logger.error(f"SHUTDOWN: Error flushing thinking steps: {e}")
     
     logger.info("SHUTDOWN: Application shutdown complete.")
 
@@ -306,6 +306,11 @@ logger.info("✅ X-Trace-ID middleware and trace-aware logging installed")
 # Register asset system routes
 register_asset_routes(app)
 
+# Rarely used API groups are imported and mounted on their first request
+deferred_routers = DeferredRouterMounter(app)
+app.state.deferred_routers = deferred_routers
+app.add_middleware(DeferredRouterMiddleware, mounter=deferred_routers)
+
 # Include all routers
 # ==========================================
 
@@ -332,9 +337,9 @@ app.include_router(assets_router, prefix="/api")
 app.include_router(deliverables_router, prefix="/api")
 app.include_router(enhanced_deliverables_router, prefix="/api")
 
-# Auto-completion system for missing deliverables
-from routes.auto_completion import router as auto_completion_router
-app.include_router(auto_completion_router, prefix="/api")
+# Auto-completion system for missing deliverables (imports the executor)
+deferred_routers.defer("auto_completion", "/api/auto-completion",
+                       ("routes.auto_completion:router", {"prefix": "/api"}))
 
 # Communication and feedback - standardized to /api prefix
 app.include_router(websocket_router)  # WebSocket endpoints don't need /api prefix
@@ -346,18 +351,19 @@ app.include_router(human_feedback_router, prefix="/api")
 app.include_router(ai_content_router, prefix="/api")
 app.include_router(authentic_thinking_router, prefix="/api/thinking", tags=["thinking"])
 app.include_router(thinking_router, prefix="/api")
-app.include_router(test_thinking_demo_router, prefix="/api")
+deferred_routers.defer("test_thinking_demo", "/api/test-thinking",
+                       ("routes.test_thinking_demo:router", {"prefix": "/api"}))
 app.include_router(thinking_api_router)  # Production thinking API
-app.include_router(memory_router, prefix="/api")
-app.include_router(memory_sessions_router, prefix="/api")
+# Memory routes (unified memory engine, agents SDK session adapter)
+deferred_routers.defer("memory", "/api/memory",
+                       ("routes.memory:router", {"prefix": "/api"}),
+                       ("routes.memory_sessions:router", {"prefix": "/api"}))
 
 # Content-aware learning extraction
-from routes.content_learning import router as content_learning_router
-app.include_router(content_learning_router)  # Already has /api/content-learning prefix
+deferred_routers.defer("content_learning", "/api/content-learning", "routes.content_learning:router")
 
 # Learning-Quality Feedback Loop for performance boost
-from routes.learning_feedback_routes import router as learning_feedback_router
-app.include_router(learning_feedback_router)  # Already has /api/learning-feedback prefix
+deferred_routers.defer("learning_feedback", "/api/learning-feedback", "routes.learning_feedback_routes:router")
 
 # Legacy Insights Adapters - Backward compatibility during migration (MUST BE FIRST)
 from routes.insights_adapter import register_legacy_adapters
@@ -400,11 +406,17 @@ app.include_router(documents_router, prefix="/api")
 app.include_router(utils_router, prefix="/api")
 
 # Recovery system routes
-app.include_router(recovery_explanations_router)  # Already includes /api/recovery-explanations prefix
-app.include_router(recovery_analysis_router)  # Already includes /api/recovery-analysis prefix
+deferred_routers.defer(
+    "recovery",
+    ("/api/recovery-explanations", "/api/recovery-analysis"),
+    "routes.recovery_explanations:router",
+    "routes.recovery_analysis:router",
+)
 
 # Sub-agent orchestration routes
-app.include_router(sub_agent_orchestration_router)  # Already includes /api/sub-agent-orchestration prefix
+deferred_routers.defer(
+    "sub_agent_orchestration", "/api/sub-agent-orchestration", "routes.sub_agent_orchestration:router"
+)
 
 # Quota monitoring routes
 app.include_router(quota_router)
@@ -415,12 +427,11 @@ app.include_router(goal_progress_compliance_router)  # Already includes /api/quo
 # app.include_router(usage_analytics_router, prefix="/api")
 
 # Real OpenAI Usage API routes
-from routes.usage import router as usage_router
-app.include_router(usage_router)
+deferred_routers.defer("usage", "/api/usage", "routes.usage:router")
 
 
 # All routers now use consistent /api prefix - compatibility layer removed
-app.include_router(debug_router)
+deferred_routers.defer("debug", "/api/debug", "routes.debug:router")
 
 # Health check endpoint
 # Root endpoint
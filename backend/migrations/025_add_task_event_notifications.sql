@@ -0,0 +1,26 @@
+-- Migration 025: Task event notifications (optional, non-breaking)
+-- Emits a NOTIFY on the task_events channel whenever a task is created or its status
+-- changes, so executors in other processes/replicas wake up immediately
+-- (see utils/task_event_bus.py, enabled with TASK_EVENTS_PG_DSN).
+
+CREATE OR REPLACE FUNCTION notify_task_event() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.status IS DISTINCT FROM OLD.status THEN
+        PERFORM pg_notify(
+            'task_events',
+            json_build_object(
+                'event_type', CASE WHEN TG_OP = 'INSERT' THEN 'task_created' ELSE 'task_status_changed' END,
+                'workspace_id', NEW.workspace_id,
+                'task_id', NEW.id,
+                'status', NEW.status
+            )::text
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_notify_task_event ON tasks;
+CREATE TRIGGER trg_notify_task_event
+AFTER INSERT OR UPDATE OF status ON tasks
+FOR EACH ROW EXECUTE FUNCTION notify_task_event();
@@ -0,0 +1,3 @@
+-- Rollback Migration 025: Task event notifications
+DROP TRIGGER IF EXISTS trg_notify_task_event ON tasks;
+DROP FUNCTION IF EXISTS notify_task_event();
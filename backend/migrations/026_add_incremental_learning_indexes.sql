@@ -0,0 +1,26 @@
+-- Migration 026: Indexes for incremental content learning (optional, non-breaking)
+-- The learning engines fetch only deliverables changed since their per-workspace
+-- watermark and deduplicate insights with one semantic_hash IN (...) lookup
+-- (see services/learning_watermarks.py).
+
+CREATE INDEX IF NOT EXISTS idx_deliverables_workspace_updated_at
+    ON deliverables (workspace_id, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_memory_context_entries_workspace_semantic
+    ON memory_context_entries (workspace_id, semantic_hash);
+
+-- The watermark relies on deliverables.updated_at moving on every change, but most
+-- writers update deliverables without setting it: stamp it in the database
+CREATE OR REPLACE FUNCTION update_deliverables_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS update_deliverables_updated_at_trigger ON deliverables;
+CREATE TRIGGER update_deliverables_updated_at_trigger
+    BEFORE UPDATE ON deliverables
+    FOR EACH ROW
+    EXECUTE FUNCTION update_deliverables_updated_at();
@@ -0,0 +1,5 @@
+-- Rollback Migration 026: Incremental content learning indexes
+DROP TRIGGER IF EXISTS update_deliverables_updated_at_trigger ON deliverables;
+DROP FUNCTION IF EXISTS update_deliverables_updated_at();
+DROP INDEX IF EXISTS idx_deliverables_workspace_updated_at;
+DROP INDEX IF EXISTS idx_memory_context_entries_workspace_semantic;
@@ -0,0 +1,31 @@
+-- Migration 027: Aggregate functions for system telemetry (optional, non-breaking)
+-- SystemTelemetryMonitor calls these through RPC instead of downloading every
+-- pending task and every workspace to count them in Python
+-- (see services/system_telemetry_monitor.py). Without them it falls back to
+-- count queries.
+
+CREATE OR REPLACE FUNCTION telemetry_task_summary(p_completed_since TIMESTAMPTZ)
+RETURNS TABLE (
+    pending_count BIGINT,
+    critical_count BIGINT,
+    avg_wait_minutes DOUBLE PRECISION,
+    completed_since_count BIGINT
+) AS $$
+    SELECT
+        COUNT(*) FILTER (WHERE status = 'pending'),
+        COUNT(*) FILTER (WHERE status = 'pending' AND name ~* '(urgent|critical|emergency)'),
+        COALESCE(EXTRACT(EPOCH FROM AVG(NOW() - created_at) FILTER (WHERE status = 'pending')) / 60.0, 0),
+        COUNT(*) FILTER (WHERE status = 'completed' AND updated_at >= p_completed_since)
+    FROM tasks
+    WHERE status = 'pending'
+       OR (status = 'completed' AND updated_at >= p_completed_since);
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION telemetry_workspace_status_counts()
+RETURNS TABLE (status TEXT, workspace_count BIGINT) AS $$
+    SELECT status::TEXT, COUNT(*) FROM workspaces GROUP BY status;
+$$ LANGUAGE sql STABLE;
+
+-- Keep both task filters index-driven as the table grows
+CREATE INDEX IF NOT EXISTS idx_tasks_status_created_at ON tasks (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_updated_at ON tasks (status, updated_at);
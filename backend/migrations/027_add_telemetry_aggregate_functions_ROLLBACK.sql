@@ -0,0 +1,5 @@
+-- Rollback Migration 027: Telemetry aggregate functions
+DROP FUNCTION IF EXISTS telemetry_task_summary(TIMESTAMPTZ);
+DROP FUNCTION IF EXISTS telemetry_workspace_status_counts();
+DROP INDEX IF EXISTS idx_tasks_status_created_at;
+DROP INDEX IF EXISTS idx_tasks_status_updated_at;
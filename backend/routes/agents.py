@@ -24,7 +24,6 @@ from database import (
     update_task_status,
     list_handoffs as db_list_handoffs
 )
-from ai_agents.manager import AgentManager
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/agents", tags=["agents"])
@@ -238,6 +237,7 @@ async def verify_agents(workspace_id: UUID, request: Request):
     
     """Verify all agents in a workspace have required capabilities"""
     try:
+        from ai_agents.manager import AgentManager  # loads the agents SDK; keep it off startup
         manager = AgentManager(workspace_id)
         await manager.initialize()
         results = await manager.verify_all_agents()
@@ -304,6 +304,7 @@ async def execute_task(workspace_id: UUID, task_id: UUID, request: Request):
     
     """Execute a specific task"""
     try:
+        from ai_agents.manager import AgentManager  # loads the agents SDK; keep it off startup
         manager = AgentManager(workspace_id)
         await manager.initialize()
         result = await manager.execute_task(task_id)
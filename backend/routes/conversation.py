@@ -14,9 +14,11 @@ from middleware.trace_middleware import get_trace_id, create_traced_logger, Trac
 from pydantic import BaseModel, Field
 
 from database import get_supabase_client
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED
 from models import Workspace
 from services.ai_knowledge_categorization import get_categorization_service
 from config.knowledge_insights_config import get_config
+from services.llm_rate_limiter import PRIORITY_INTERACTIVE, llm_priority
 
 logger = logging.getLogger(__name__)
 
@@ -138,11 +140,12 @@ async def send_chat_message(
             # Fallback if factory not available
             agent = ConversationalAgent(workspace_id, request.chat_id)
         
-        # Process the message
-        response = await agent.process_message(
-            user_message=request.message,
-            message_id=request.message_id
-        )
+        # Process the message (user-facing: served ahead of task and background LLM calls)
+        with llm_priority(PRIORITY_INTERACTIVE):
+            response = await agent.process_message(
+                user_message=request.message,
+                message_id=request.message_id
+            )
         
         # Calculate processing time
         processing_time = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -188,11 +191,12 @@ async def send_chat_message_with_thinking(
             })
         
         # Process message with thinking
-        response = await agent.process_message_with_thinking(
-            user_message=request.message,
-            message_id=request.message_id,
-            thinking_callback=thinking_callback
-        )
+        with llm_priority(PRIORITY_INTERACTIVE):
+            response = await agent.process_message_with_thinking(
+                user_message=request.message,
+                message_id=request.message_id,
+                thinking_callback=thinking_callback
+            )
         
         # Add thinking steps to response metadata
         response.artifacts = response.artifacts or []
@@ -680,11 +684,12 @@ async def websocket_chat(websocket: WebSocket, workspace_id: str, chat_id: str =
                     })
                 
                 # Process message with thinking steps
-                response = await agent.process_message_with_thinking(
-                    message, 
-                    message_id, 
-                    thinking_callback=thinking_callback
-                )
+                with llm_priority(PRIORITY_INTERACTIVE):
+                    response = await agent.process_message_with_thinking(
+                        message, 
+                        message_id, 
+                        thinking_callback=thinking_callback
+                    )
                 
                 # Send final response
                 await websocket.send_json({
@@ -899,6 +904,7 @@ async def _execute_confirmed_action(confirmation: Dict[str, Any]) -> Dict[str, A
                 .delete()\
                 .eq("id", parameters["agent_id"])\
                 .execute()
+            task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=parameters["agent_id"])
             return {"success": True, "deleted_agent": parameters.get("agent_name", "Unknown")}
             
         elif action_type == "modify_budget":
@@ -12,7 +12,10 @@ from database import (
     list_agents,
     list_tasks
 )
-from executor import task_executor
+from services.service_registry import lazy_service
+
+# The executor pulls in the agents SDK; resolve the singleton on first request
+task_executor = lazy_service("task_executor_instance", "executor:task_executor", description="Task executor singleton")
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/delegation", tags=["delegation-monitor"])
@@ -21,8 +21,6 @@ from models import (
     AgentCreate, 
     HandoffProposalCreate 
 )
-from ai_agents.director import DirectorAgent
-from ai_agents.director_enhanced import EnhancedDirectorAgent
 from database import supabase
 
 logger = logging.getLogger(__name__)
@@ -91,11 +89,14 @@ async def create_team_proposal(proposal_request: DirectorTeamProposal, request:
             elif strategic_goals:
                 logger.info(f"📊 Using {len(strategic_goals.get('strategic_deliverables', []))} strategic goals from database")
             
+            # Imported on first use: the director pulls in the agents SDK (~1s of startup)
+            from ai_agents.director_enhanced import EnhancedDirectorAgent
             director = EnhancedDirectorAgent()
             proposal = await director.create_proposal_with_goals(proposal_request, goals_to_use)
         else:
             reason = "enhanced director disabled" if not use_enhanced_director else "no strategic goals available"
             logger.info(f"Using standard director for workspace {proposal_request.workspace_id} ({reason})")
+            from ai_agents.director import DirectorAgent
             director = DirectorAgent()
             proposal = await director.create_team_proposal(proposal_request)
         
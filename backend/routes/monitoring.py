@@ -7,8 +7,10 @@ from collections import Counter
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
-# Import task_executor
-from executor import task_executor
+from services.service_registry import lazy_service
+
+# The executor pulls in the agents SDK; resolve the singleton on first request
+task_executor = lazy_service("task_executor_instance", "executor:task_executor", description="Task executor singleton")
 
 # Import database functions
 from database import (
@@ -20,6 +22,7 @@ from database import (
 
 # Import models for task status
 from models import TaskStatus
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
 
 logger = logging.getLogger(__name__)
 # Tag separati per organizzazione logica
@@ -1451,6 +1454,7 @@ async def unblock_workspace(workspace_id: UUID, request: Request):
                 "status": "active",
                 "updated_at": datetime.now().isoformat()
             }).eq("id", workspace_id_str).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id_str)
             
             actions_taken.append(f"Reset workspace status from '{current_status}' to 'active'")
         
@@ -1545,6 +1549,7 @@ async def resume_workspace_auto_generation(workspace_id: UUID, request: Request)
                     "status": "active",
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", workspace_id_str).execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id_str)
                 actions_taken.append(f"Updated workspace status to 'active'")
         except Exception as e:
             logger.warning(f"Failed to update workspace status: {e}")
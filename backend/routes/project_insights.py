@@ -16,7 +16,6 @@ from models import (
     Task,
     TaskStatus,
 )
-from ai_agents.director import DirectorAgent
 
 from database import (
     get_workspace,
@@ -24,7 +23,10 @@ from database import (
     list_tasks,
     create_task,
 )
-from executor import task_executor
+from services.service_registry import lazy_service
+
+# The executor pulls in the agents SDK; resolve the singleton on first request
+task_executor = lazy_service("task_executor_instance", "executor:task_executor", description="Task executor singleton")
 from deliverable_system.unified_deliverable_engine import unified_deliverable_engine
 from deliverable_system.unified_deliverable_engine import unified_deliverable_engine
 
@@ -64,7 +66,8 @@ async def get_project_insights(workspace_id: UUID, request: Request):
         
         # Get agents and tasks
         agents = await list_agents(str(workspace_id))
-        tasks = await list_tasks(str(workspace_id))
+        # Insights only read names, statuses and timestamps
+        tasks = await list_tasks(str(workspace_id), fields="summary")
         
         # Get execution history from task executor
         recent_activity = task_executor.get_recent_activity(str(workspace_id), 100)
@@ -1327,6 +1330,7 @@ def _classify_output_type(task_name: str, output: str) -> str:
 async def _generate_project_summary(workspace: Dict, outputs: List[ProjectOutput]) -> str:
     """Generate AI summary of project deliverables"""
     try:
+        from ai_agents.director import DirectorAgent
         director = DirectorAgent()
         
         # Create a simplified agent for summarization
@@ -12,6 +12,8 @@ import asyncio
 import json
 
 from services.openai_quota_tracker import quota_tracker, quota_manager, QuotaStatus
+from services.llm_rate_limiter import llm_rate_limiter
+from services.ai_provider_abstraction import ai_provider_manager
 from utils.performance_cache import rate_limited
 
 logger = logging.getLogger(__name__)
@@ -116,6 +118,36 @@ async def check_quota_availability() -> Dict[str, Any]:
         logger.error(f"❌ Error checking quota availability: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to check quota availability: {str(e)}")
 
+@router.get("/rate-limiter")
+@rate_limited(max_requests=30, window_seconds=60)  # Max 30 requests per minute
+async def get_llm_rate_limiter_stats() -> Dict[str, Any]:
+    """
+    Per-model request/token budgets, AIMD factor, queue depth and spend of the LLM rate limiter
+    """
+    try:
+        return {
+            "success": True,
+            "data": llm_rate_limiter.get_stats()
+        }
+    except Exception as e:
+        logger.error(f"❌ Error getting LLM rate limiter stats: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get rate limiter stats: {str(e)}")
+
+@router.get("/response-cache")
+@rate_limited(max_requests=30, window_seconds=60)  # Max 30 requests per minute
+async def get_llm_response_cache_stats() -> Dict[str, Any]:
+    """
+    Per-caller hit rates of the opt-in LLM response cache
+    """
+    try:
+        return {
+            "success": True,
+            "data": ai_provider_manager.get_cache_stats()
+        }
+    except Exception as e:
+        logger.error(f"❌ Error getting LLM response cache stats: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get response cache stats: {str(e)}")
+
 @router.post("/reset")
 async def reset_quota_stats(admin_key: Optional[str] = None) -> Dict[str, Any]:
     """
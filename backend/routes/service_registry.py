@@ -80,6 +80,25 @@ async def service_health_check(request: Request):
         logger.error(f"Error running health check: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/lazy")
+async def get_lazy_loading_stats(request: Request):
+    # Get trace ID and create traced logger
+    trace_id = get_trace_id(request)
+    logger = create_traced_logger(request, __name__)
+    logger.info(f"Route get_lazy_loading_stats called", endpoint="get_lazy_loading_stats", trace_id=trace_id)
+
+    """Which lazily loaded services and deferred router groups have been loaded, and what they cost"""
+    try:
+        from services.service_registry import service_registry
+        deferred_routers = getattr(request.app.state, "deferred_routers", None)
+        return {
+            "services": service_registry.get_lazy_service_stats(),
+            "routers": deferred_routers.get_stats() if deferred_routers else None
+        }
+    except Exception as e:
+        logger.error(f"Error getting lazy loading stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/service/{service_name}")
 async def get_service_info(service_name: str, request: Request):
     # Get trace ID and create traced logger
@@ -13,6 +13,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/monitoring", tags=["system-monitoring"])
 
+
+def _wait_time_trend(latest: Optional[float], earliest: Optional[float]) -> Dict[str, Any]:
+    """Wait times are None when collected without the telemetry aggregate RPC"""
+    if latest is None or earliest is None:
+        return {"current": latest, "change": None, "trend": "unknown"}
+    return {
+        "current": latest,
+        "change": latest - earliest,
+        "trend": "improving" if latest < earliest else "degrading"
+    }
+
+
 @router.get("/status")
 async def get_system_status(request: Request):
     # Get trace ID and create traced logger
@@ -231,11 +243,7 @@ async def get_performance_trends(
                 "change": latest.system_health_score - earliest.system_health_score,
                 "trend": "improving" if latest.system_health_score > earliest.system_health_score else "degrading"
             },
-            "task_wait_time": {
-                "current": latest.average_task_wait_time,
-                "change": latest.average_task_wait_time - earliest.average_task_wait_time,
-                "trend": "improving" if latest.average_task_wait_time < earliest.average_task_wait_time else "degrading"
-            },
+            "task_wait_time": _wait_time_trend(latest.average_task_wait_time, earliest.average_task_wait_time),
             "completion_rate": {
                 "current": latest.task_completion_rate,
                 "change": latest.task_completion_rate - earliest.task_completion_rate,
@@ -5,7 +5,10 @@ from uuid import UUID
 import logging
 import json
 
-from tools.registry import tool_registry
+from services.service_registry import lazy_service
+
+# Same proxy main.py registers; the registry imports the agents SDK tools on first use
+tool_registry = lazy_service("tool_registry", "tools.registry:tool_registry", description="Modular tool registry")
 from database import (
     create_custom_tool,
     get_custom_tool,
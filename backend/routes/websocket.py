@@ -6,13 +6,16 @@ WebSocket endpoint per aggiornamenti real-time dello stato dei task
 from fastapi import Request
 from middleware.trace_middleware import get_trace_id, create_traced_logger, TracedDatabaseOperation
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, Set
+from typing import Dict, List, Set
 import json
 import logging
 import asyncio
 from datetime import datetime
 from websockets.exceptions import ConnectionClosedError
 
+from utils.websocket_broadcast import websocket_broadcaster
+from utils.websocket_entity_stream import entity_stream_hub
+
 logger = logging.getLogger(__name__)
 
 class ConnectionManager:
@@ -78,8 +81,54 @@ class ConnectionManager:
             if not subscribers:
                 del self.task_subscribers[task_id]
         
+        websocket_broadcaster.discard(websocket)
+        entity_stream_hub.forget(websocket)
         logger.info(f"WebSocket disconnected from workspace {workspace_id}")
     
+    def _drop_dead_connection(self, websocket: WebSocket, error: Exception):
+        """A background send failed: stop targeting this websocket"""
+        if isinstance(error, ConnectionClosedError):
+            logger.debug(f"WebSocket connection closed during broadcast: {error}")
+        else:
+            logger.error(f"Error sending message to websocket: {error!r}")
+        for connections in list(self.active_connections.values()):
+            connections.discard(websocket)
+        for subscribers in list(self.task_subscribers.values()):
+            subscribers.discard(websocket)
+    
+    def _broadcast(self, websockets: Set[WebSocket], message: dict) -> int:
+        """Serialize once and queue on each live websocket's bounded send queue"""
+        return websocket_broadcaster.broadcast(self._live_targets(websockets), message)
+    
+    def _live_targets(self, websockets: Set[WebSocket]) -> List[WebSocket]:
+        """Connected websockets of a set, with this manager's failure callback attached"""
+        targets = []
+        for websocket in list(websockets):
+            # 🔧 FIX: Check WebSocket state before sending
+            try:
+                if websocket.client_state.name in ['DISCONNECTED', 'CLOSED']:
+                    websockets.discard(websocket)
+                    continue
+            except AttributeError:
+                pass  # Some WebSocket implementations don't have client_state
+            
+            websocket_broadcaster.sender_for(websocket).add_callbacks(
+                "connection_manager",
+                on_failure=lambda error, websocket=websocket: self._drop_dead_connection(websocket, error),
+            )
+            targets.append(websocket)
+        
+        return targets
+    
+    def workspace_websockets(self, workspace_id: str) -> List[WebSocket]:
+        """Recipients of a workspace broadcast: healthy sockets, else the legacy set"""
+        from utils.websocket_health_manager import websocket_health_manager
+        
+        targets = websocket_health_manager.healthy_websockets(workspace_id)
+        if targets:
+            return targets
+        return self._live_targets(self.active_connections.get(workspace_id, set()))
+    
     async def subscribe_to_task(self, websocket: WebSocket, task_id: str):
         """Subscribe websocket to specific task updates"""
         if task_id not in self.task_subscribers:
@@ -106,28 +155,7 @@ class ConnectionManager:
         if workspace_id not in self.active_connections:
             return
         
-        dead_connections = set()
-        for websocket in self.active_connections[workspace_id]:
-            try:
-                # 🔧 FIX: Check WebSocket state before sending
-                try:
-                    if websocket.client_state.name in ['DISCONNECTED', 'CLOSED']:
-                        dead_connections.add(websocket)
-                        continue
-                except AttributeError:
-                    pass  # Some WebSocket implementations don't have client_state
-                
-                await websocket.send_text(json.dumps(message))
-            except ConnectionClosedError as e:
-                logger.debug(f"WebSocket connection closed during broadcast: {e}")
-                dead_connections.add(websocket)
-            except Exception as e:
-                logger.error(f"Error sending message to websocket: {e}")
-                dead_connections.add(websocket)
-        
-        # Clean up dead connections
-        for dead_ws in dead_connections:
-            self.active_connections[workspace_id].discard(dead_ws)
+        self._broadcast(self.active_connections[workspace_id], message)
     
     async def broadcast_thinking_step(self, workspace_id: str, thinking_step: dict):
         """🧠 Broadcast real-time thinking step like Claude/o3"""
@@ -170,7 +198,12 @@ class ConnectionManager:
         logger.info(f"✅ Broadcasted goal decomposition complete for workspace {workspace_id}")
     
     async def broadcast_task_update(self, task_id: str, task_data: dict):
-        """Broadcast task update to all subscribers"""
+        """
+        Broadcast task update to all subscribers
+        
+        Updates go through the entity stream: bursts within the frame window are
+        coalesced, and clients in delta mode receive patches (utils.websocket_entity_stream)
+        """
         if task_id not in self.task_subscribers:
             return
         
@@ -181,28 +214,11 @@ class ConnectionManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        dead_connections = set()
-        for websocket in self.task_subscribers[task_id]:
-            try:
-                # 🔧 FIX: Check WebSocket state before sending task update
-                try:
-                    if websocket.client_state.name in ['DISCONNECTED', 'CLOSED']:
-                        dead_connections.add(websocket)
-                        continue
-                except AttributeError:
-                    pass  # Some WebSocket implementations don't have client_state
-                
-                await websocket.send_text(json.dumps(message))
-            except ConnectionClosedError as e:
-                logger.debug(f"WebSocket connection closed during task update: {e}")
-                dead_connections.add(websocket)
-            except Exception as e:
-                logger.error(f"Error sending task update to websocket: {e}")
-                dead_connections.add(websocket)
-        
-        # Clean up dead connections
-        for dead_ws in dead_connections:
-            self.task_subscribers[task_id].discard(dead_ws)
+        entity_stream_hub.publish(
+            f"task:{task_id}",
+            message,
+            lambda: self._live_targets(self.task_subscribers.get(task_id, set())),
+        )
 
 # Global connection manager
 manager = ConnectionManager()
@@ -250,6 +266,10 @@ async def websocket_endpoint(websocket: WebSocket, workspace_id: str):
                     logger.debug(f"💓 Heartbeat response from {client_id}")
                     continue
                 
+                # Entity stream protocol: delta opt-in / resume-from-seq and acks
+                elif entity_stream_hub.handle_client_message(websocket, message):
+                    continue
+                
                 # Handle task subscription
                 elif message.get("type") == "subscribe_task":
                     task_id = message.get("task_id")
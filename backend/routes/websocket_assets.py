@@ -15,6 +15,8 @@ from fastapi.websockets import WebSocketState
 
 from models import AssetArtifact, QualityValidation, WorkspaceGoal
 from database import get_supabase_client
+from utils.websocket_broadcast import websocket_broadcaster
+from utils.websocket_entity_stream import entity_stream_hub
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +104,8 @@ class AssetWebSocketManager:
                 connections.discard(websocket)
             
             self.system_connections.discard(websocket)
+            websocket_broadcaster.discard(websocket)
+            entity_stream_hub.forget(websocket)
             
             if websocket.client_state != WebSocketState.DISCONNECTED:
                 await websocket.close()
@@ -172,6 +176,29 @@ class AssetWebSocketManager:
         for websocket in disconnected:
             self.asset_connections[artifact_id].discard(websocket)
 
+    def stream_targets(self, *groups: Optional[Set[WebSocket]]) -> List[WebSocket]:
+        """Connected sockets of the given connection sets, for entity stream fan-out"""
+        targets = []
+        for connections in groups:
+            for websocket in list(connections or ()):
+                if websocket.client_state != WebSocketState.CONNECTED:
+                    continue
+                websocket_broadcaster.sender_for(websocket).add_callbacks(
+                    "asset_manager",
+                    on_failure=lambda error, websocket=websocket: self._drop_connection(websocket, error),
+                )
+                targets.append(websocket)
+        return targets
+
+    def _drop_connection(self, websocket: WebSocket, error: Exception):
+        """A queued send failed: stop targeting this websocket"""
+        logger.error(f"Failed to send asset WebSocket update: {error!r}")
+        for registry in (self.workspace_connections, self.asset_connections, self.quality_connections):
+            for connections in registry.values():
+                connections.discard(websocket)
+        self.system_connections.discard(websocket)
+        entity_stream_hub.forget(websocket)
+
     async def send_current_asset_status(self, websocket: WebSocket, artifact_id: str):
         """Send current status of a specific asset"""
         try:
@@ -236,8 +263,12 @@ async def websocket_asset_progress(websocket: WebSocket, workspace_id: str):
                 data = await websocket.receive_text()
                 message = json.loads(data)
                 
+                # Entity stream protocol: delta opt-in / resume-from-seq and acks
+                if entity_stream_hub.handle_client_message(websocket, message):
+                    continue
+                
                 # Handle ping/pong for connection health
-                if message.get("type") == "ping":
+                elif message.get("type") == "ping":
                     await websocket_manager.send_to_websocket(websocket, {
                         "type": "pong",
                         "timestamp": datetime.utcnow().isoformat()
@@ -272,7 +303,10 @@ async def websocket_quality_monitoring(websocket: WebSocket, workspace_id: str):
                 data = await websocket.receive_text()
                 message = json.loads(data)
                 
-                if message.get("type") == "ping":
+                if entity_stream_hub.handle_client_message(websocket, message):
+                    continue
+                
+                elif message.get("type") == "ping":
                     await websocket_manager.send_to_websocket(websocket, {
                         "type": "pong",
                         "timestamp": datetime.utcnow().isoformat()
@@ -305,7 +339,10 @@ async def websocket_specific_asset(websocket: WebSocket, artifact_id: str):
                 data = await websocket.receive_text()
                 message = json.loads(data)
                 
-                if message.get("type") == "ping":
+                if entity_stream_hub.handle_client_message(websocket, message):
+                    continue
+                
+                elif message.get("type") == "ping":
                     await websocket_manager.send_to_websocket(websocket, {
                         "type": "pong",
                         "timestamp": datetime.utcnow().isoformat()
@@ -334,7 +371,12 @@ async def broadcast_goal_progress_update(
     asset_completion_rate: float,
     quality_score: float
 ):
-    """Broadcast goal progress update to all workspace connections"""
+    """
+    Broadcast goal progress update to all workspace connections
+    
+    Published on the goal's entity stream: updates within the frame window are
+    coalesced and delta-mode clients get patches (utils.websocket_entity_stream)
+    """
     try:
         update_data = {
             "type": "goal_progress_update",
@@ -346,18 +388,21 @@ async def broadcast_goal_progress_update(
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        # Broadcast to asset WebSocket connections
-        await websocket_manager.broadcast_to_workspace(workspace_id, update_data)
+        def recipients():
+            # Asset WebSocket connections
+            targets = websocket_manager.stream_targets(websocket_manager.workspace_connections.get(workspace_id))
+            
+            # 🔥 CRITICAL FIX: Also broadcast to main workspace WebSocket connections
+            try:
+                from routes.websocket import manager as main_websocket_manager
+                targets.extend(main_websocket_manager.workspace_websockets(workspace_id))
+            except Exception as main_ws_error:
+                logger.error(f"Failed to broadcast to main WebSocket: {main_ws_error}")
+            return targets
         
-        # 🔥 CRITICAL FIX: Also broadcast to main workspace WebSocket connections
-        try:
-            from routes.websocket import manager as main_websocket_manager
-            await main_websocket_manager.broadcast_to_workspace(workspace_id, update_data)
-            logger.info(f"📡 Broadcasted goal progress to MAIN WebSocket: {goal_id}")
-        except Exception as main_ws_error:
-            logger.error(f"Failed to broadcast to main WebSocket: {main_ws_error}")
+        entity_stream_hub.publish(f"goal:{goal_id}", update_data, recipients)
         
-        logger.info(f"📡 Broadcasted goal progress update: {goal_id}")
+        logger.info(f"📡 Published goal progress update: {goal_id}")
         
     except Exception as e:
         logger.error(f"Failed to broadcast goal progress update: {e}")
@@ -369,7 +414,7 @@ async def broadcast_artifact_quality_update(
     status: str,
     validation_feedback: Optional[str] = None
 ):
-    """Broadcast artifact quality update"""
+    """Broadcast artifact quality update (coalesced per artifact on its entity stream)"""
     try:
         update_data = {
             "type": "artifact_quality_update",
@@ -381,12 +426,18 @@ async def broadcast_artifact_quality_update(
             "timestamp": datetime.utcnow().isoformat()
         }
         
-        # Broadcast to both workspace and quality connections
-        await websocket_manager.broadcast_to_workspace(workspace_id, update_data)
-        await websocket_manager.broadcast_quality_update(workspace_id, update_data)
-        await websocket_manager.broadcast_asset_update(artifact_id, update_data)
+        # Broadcast to workspace, quality and asset connections (each socket once)
+        entity_stream_hub.publish(
+            f"artifact_quality:{artifact_id}",
+            update_data,
+            lambda: websocket_manager.stream_targets(
+                websocket_manager.workspace_connections.get(workspace_id),
+                websocket_manager.quality_connections.get(workspace_id),
+                websocket_manager.asset_connections.get(artifact_id),
+            ),
+        )
         
-        logger.info(f"📡 Broadcasted artifact quality update: {artifact_id}")
+        logger.info(f"📡 Published artifact quality update: {artifact_id}")
         
     except Exception as e:
         logger.error(f"Failed to broadcast artifact quality update: {e}")
@@ -419,23 +470,27 @@ async def broadcast_new_artifact_created(
 
 async def broadcast_quality_validation_complete(
     workspace_id: str,
-    validation: QualityValidation
+    validation: QualityValidation,
+    progress: Optional[Dict[str, Any]] = None
 ):
-    """Broadcast quality validation completion"""
+    """Broadcast quality validation completion (with batch progress when part of a batch run)"""
     try:
+        validated_at = getattr(validation, "validated_at", None)
         update_data = {
             "type": "quality_validation_complete",
             "workspace_id": workspace_id,
             "validation": {
-                "id": validation.id,
-                "artifact_id": validation.artifact_id,
+                "id": str(validation.id) if validation.id else None,
+                "artifact_id": str(validation.artifact_id),
                 "score": validation.score,
                 "passed": validation.passed,
-                "feedback": validation.feedback,
-                "validated_at": validation.validated_at.isoformat() if validation.validated_at else None
+                "feedback": getattr(validation, "feedback", None),
+                "validated_at": validated_at.isoformat() if validated_at else None
             },
             "timestamp": datetime.utcnow().isoformat()
         }
+        if progress:
+            update_data["progress"] = progress
         
         await websocket_manager.broadcast_quality_update(workspace_id, update_data)
         logger.info(f"📡 Broadcasted quality validation complete: {validation.id}")
@@ -599,7 +654,8 @@ async def get_websocket_stats(request: Request):
         return {
             "status": "active",
             "timestamp": datetime.utcnow().isoformat(),
-            "connections": stats
+            "connections": stats,
+            "streams": entity_stream_hub.get_stats()
         }
     except Exception as e:
         logger.error(f"Failed to get WebSocket stats: {e}")
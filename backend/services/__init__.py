@@ -2,109 +2,109 @@
 """
 Services Module - Enhanced with Unified Memory Engine and Deliverable Aliases
 Contains all service layer components including unified memory system and deliverable system aliases.
+
+Nothing is imported when the package itself is imported: importing any
+``services.<module>`` would otherwise load the unified memory engine (the
+heaviest module of the backend) first. The names below resolve on first access
+through the module-level ``__getattr__`` (PEP 562).
 """
 
+import importlib
 import logging
 
 logger = logging.getLogger(__name__)
 
-try:
-    # Import unified memory engine
-    from .unified_memory_engine import (
-        unified_memory_engine,
-        UnifiedMemoryEngine,
-        get_universal_memory_architecture,
-        # Data classes
-        ContextEntry,
-        MemoryPattern,
-        AssetGenerationResult,
-        ContentQuality,
-        # Backward compatibility aliases
-        MemorySystem,
-        UniversalMemoryArchitecture,
-        MemoryEnhancedAIAssetGenerator
-    )
-    
-    # Primary exports (unified engine)
-    memory_system = unified_memory_engine
-    universal_memory_architecture = unified_memory_engine
-    memory_enhanced_ai_asset_generator = unified_memory_engine
-    
-    # --- LAZY LOADING FOR DELIVERABLE SYSTEM ---
-    # Break circular import by loading deliverable engine on-demand
-    _deliverable_engine = None
-    
-    def _get_deliverable_engine():
-        """Lazy load deliverable engine to break circular imports"""
-        global _deliverable_engine
-        if _deliverable_engine is None:
-            try:
-                import sys
-                from pathlib import Path
-                # Add project root to Python path for consistent imports
-                project_root = Path(__file__).parent.parent.parent
-                if str(project_root) not in sys.path:
-                    sys.path.insert(0, str(project_root))
-                
-                from backend.deliverable_system.unified_deliverable_engine import unified_deliverable_engine
-                _deliverable_engine = unified_deliverable_engine
-                logger.info("✅ Deliverable engine loaded on-demand")
-            except ImportError as e:
-                logger.warning(f"Failed to load deliverable engine: {e}")
-                _deliverable_engine = None
-        return _deliverable_engine
-    
-    # Create lazy-loading property classes for backward compatibility
-    class LazyDeliverableAlias:
-        """Lazy loading wrapper for deliverable system aliases"""
-        def __getattr__(self, name):
-            engine = _get_deliverable_engine()
-            if engine is None:
-                raise ImportError("Deliverable engine not available")
-            return getattr(engine, name)
-    
-    # --- DELIVERABLE SYSTEM ALIASES ---
-    # This ensures that old imports like `from services.asset_artifact_processor import ...` still work
-    AssetArtifactProcessor = LazyDeliverableAlias()
-    AssetRequirementsGenerator = LazyDeliverableAlias() 
-    AssetFirstDeliverableSystem = LazyDeliverableAlias()
-    
-    __all__ = [
-        # Unified memory engine
-        'unified_memory_engine',
-        'UnifiedMemoryEngine',
-        'get_universal_memory_architecture',
-        
-        # Data classes
-        'ContextEntry',
-        'MemoryPattern', 
-        'AssetGenerationResult',
-        'ContentQuality',
-        
-        # Backward compatibility classes
-        'MemorySystem',
-        'UniversalMemoryArchitecture',
-        'MemoryEnhancedAIAssetGenerator',
-        
-        # Singleton instances for compatibility
-        'memory_system',
-        'universal_memory_architecture',
-        'memory_enhanced_ai_asset_generator',
-        
-        # Deliverable System Aliases
-        'AssetArtifactProcessor',
-        'AssetRequirementsGenerator',
-        'AssetFirstDeliverableSystem'
-    ]
-    
-    MEMORY_SYSTEM_AVAILABLE = True
-    
-    logger.info("🧠 Unified Memory System loaded successfully")
-    logger.info("   ├─ Consolidated 3 files into unified_memory_engine.py")
-    logger.info("   ├─ Backward compatibility maintained for all imports")
-    logger.info("   └─ Memory patterns, context storage, and AI generation unified")
-    
-except ImportError as e:
-    logger.warning(f"Memory or Deliverable System not fully available: {e}")
-    MEMORY_SYSTEM_AVAILABLE = False
-    __all__ = []
\ No newline at end of file
+# Exported name -> attribute of services.unified_memory_engine
+_MEMORY_EXPORTS = {
+    # Unified memory engine
+    'unified_memory_engine': 'unified_memory_engine',
+    'UnifiedMemoryEngine': 'UnifiedMemoryEngine',
+    'get_universal_memory_architecture': 'get_universal_memory_architecture',
+    # Data classes
+    'ContextEntry': 'ContextEntry',
+    'MemoryPattern': 'MemoryPattern',
+    'AssetGenerationResult': 'AssetGenerationResult',
+    'ContentQuality': 'ContentQuality',
+    # Backward compatibility classes
+    'MemorySystem': 'MemorySystem',
+    'UniversalMemoryArchitecture': 'UniversalMemoryArchitecture',
+    'MemoryEnhancedAIAssetGenerator': 'MemoryEnhancedAIAssetGenerator',
+    # Singleton instances for compatibility (all the unified engine)
+    'memory_system': 'unified_memory_engine',
+    'universal_memory_architecture': 'unified_memory_engine',
+    'memory_enhanced_ai_asset_generator': 'unified_memory_engine',
+}
+
+# --- LAZY LOADING FOR DELIVERABLE SYSTEM ---
+# Break circular import by loading deliverable engine on-demand
+_deliverable_engine = None
+
+
+def _get_deliverable_engine():
+    """Lazy load deliverable engine to break circular imports"""
+    global _deliverable_engine
+    if _deliverable_engine is None:
+        try:
+            import sys
+            from pathlib import Path
+            # Add project root to Python path for consistent imports
+            project_root = Path(__file__).parent.parent.parent
+            if str(project_root) not in sys.path:
+                sys.path.insert(0, str(project_root))
+
+            from backend.deliverable_system.unified_deliverable_engine import unified_deliverable_engine
+            _deliverable_engine = unified_deliverable_engine
+            logger.info("✅ Deliverable engine loaded on-demand")
+        except ImportError as e:
+            logger.warning(f"Failed to load deliverable engine: {e}")
+            _deliverable_engine = None
+    return _deliverable_engine
+
+
+# Create lazy-loading property classes for backward compatibility
+class LazyDeliverableAlias:
+    """Lazy loading wrapper for deliverable system aliases"""
+    def __getattr__(self, name):
+        engine = _get_deliverable_engine()
+        if engine is None:
+            raise ImportError("Deliverable engine not available")
+        return getattr(engine, name)
+
+
+# --- DELIVERABLE SYSTEM ALIASES ---
+# This ensures that old imports like `from services.asset_artifact_processor import ...` still work
+AssetArtifactProcessor = LazyDeliverableAlias()
+AssetRequirementsGenerator = LazyDeliverableAlias()
+AssetFirstDeliverableSystem = LazyDeliverableAlias()
+
+
+def _memory_system_available() -> bool:
+    try:
+        importlib.import_module(f"{__name__}.unified_memory_engine")
+        return True
+    except ImportError as e:
+        logger.warning(f"Memory or Deliverable System not fully available: {e}")
+        return False
+
+
+def __getattr__(name):
+    if name in _MEMORY_EXPORTS:
+        module = importlib.import_module(f"{__name__}.unified_memory_engine")
+        value = getattr(module, _MEMORY_EXPORTS[name])
+        globals()[name] = value
+        return value
+    if name == 'MEMORY_SYSTEM_AVAILABLE':
+        value = _memory_system_available()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    *_MEMORY_EXPORTS,
+
+    # Deliverable System Aliases
+    'AssetArtifactProcessor',
+    'AssetRequirementsGenerator',
+    'AssetFirstDeliverableSystem'
+]
@@ -25,6 +25,7 @@ from dataclasses import dataclass
 from enum import Enum
 
 from database import supabase
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED
 from models import AgentStatus
 
 logger = logging.getLogger(__name__)
@@ -333,6 +334,7 @@ class AgentStatusManager:
                 workspace_id = agent_data.get("workspace_id")
                 if workspace_id and workspace_id in self.agent_cache:
                     del self.agent_cache[workspace_id]
+                task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=agent_id)
                 
                 return True
             else:
@@ -7,9 +7,16 @@ underlying provider (e.g., OpenAI SDK, direct OpenAI client, fallbacks).
 This is a key component of the Foundation Layer for the OpenAI SDK migration.
 """
 
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, Optional
+import re
+import unicodedata
+from typing import Any, Dict, Optional, Tuple, Union
+
+from services.llm_rate_limiter import estimate_tokens, llm_priority, llm_rate_limiter
+from utils.ai_result_store import ai_result_store
 
 # Placeholder for the real Agent SDK
 # from agents import Agent, Runner, AgentOutputSchema
@@ -17,6 +24,67 @@ from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Opt-in response cache for callers whose output is a pure function of the prompt
+LLM_RESPONSE_CACHE_ENABLED = os.getenv("LLM_RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+LLM_RESPONSE_CACHE_TTL_SECONDS = int(os.getenv("LLM_RESPONSE_CACHE_TTL_SECONDS", "86400"))
+# Bump when result parsing below changes, so entries of the old shape are never served
+LLM_RESPONSE_CACHE_VERSION = "call_ai-v1"
+LLM_RESPONSE_CACHE_PREFIX = "llm:"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _prompt_digest(prompt: Any) -> str:
+    """Hash of the prompt with Unicode and whitespace normalised (case is kept)."""
+    text = prompt if isinstance(prompt, str) else json.dumps(prompt, sort_keys=True, default=str)
+    text = _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _agent_fingerprint(agent: Any) -> Tuple[Optional[str], Any, str]:
+    """(model, temperature, canonical config) of a dict or SDK agent."""
+    if isinstance(agent, dict):
+        model_settings = agent.get('model_settings')
+        model = agent.get('model')
+        temperature = agent.get('temperature', getattr(model_settings, 'temperature', None))
+        config = agent
+    else:
+        model_settings = getattr(agent, 'model_settings', None)
+        model = getattr(agent, 'model', None)
+        temperature = getattr(model_settings, 'temperature', None)
+        config = {
+            "name": getattr(agent, 'name', None),
+            "instructions": getattr(agent, 'instructions', None),
+            "model_settings": model_settings,
+            "output_type": getattr(agent, 'output_type', None),
+            "tools": [getattr(tool, 'name', str(tool)) for tool in getattr(agent, 'tools', None) or []],
+        }
+    return str(model) if model is not None else None, temperature, json.dumps(config, sort_keys=True, default=str)
+
+
+def _response_cache_parts(provider_type: str, kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+    model, temperature, agent_config = _agent_fingerprint(kwargs.get('agent'))
+    temperature = kwargs.get('temperature', temperature)
+    extra = {k: v for k, v in kwargs.items() if k not in ('agent', 'prompt')}
+    return (
+        provider_type,
+        model,
+        temperature,
+        hashlib.sha256(agent_config.encode("utf-8")).hexdigest(),
+        json.dumps(extra, sort_keys=True, default=str),
+        _prompt_digest(kwargs.get('prompt')),
+    )
+
+
+def _is_cacheable_result(result: Any) -> bool:
+    """Only parsed JSON objects are cached; fallback, error and unparsed results are returned but never cached."""
+    if not isinstance(result, dict) or not result:
+        return False
+    if result.get("provider") == "fallback" or "error" in result:
+        return False
+    # {"content": "..."} is what the SDK provider returns for replies it could not parse
+    return set(result) != {"content"}
+
 class BaseProvider:
     """Base class for all AI providers."""
     async def call_ai(self, **kwargs: Any) -> Dict[str, Any]:
@@ -70,8 +138,13 @@ class OpenAISDKProvider(BaseProvider):
             else:
                 sdk_agent = agent
             
-            # Use Runner.run as static method (not context manager)
-            result = await Runner.run(sdk_agent, prompt)
+            # Use Runner.run as static method (not context manager), admitted by the
+            # shared LLM rate limiter (request + token budget of the agent's model)
+            model = getattr(sdk_agent, 'model', None)
+            estimated_tokens = estimate_tokens(getattr(sdk_agent, 'instructions', None), prompt)
+            async with llm_rate_limiter.limit(model if isinstance(model, str) else None, estimated_tokens) as permit:
+                result = await Runner.run(sdk_agent, prompt)
+                permit.record_usage(getattr(getattr(result, 'context_wrapper', None), 'usage', None))
             
             # Process the result - handle multiple possible formats
             logger.info(f"🔍 DEBUG: SDK result type: {type(result)}")
@@ -221,6 +294,9 @@ class AIProviderManager:
     async def call_ai(
         self,
         provider_type: str = 'openai_sdk',
+        priority: Optional[str] = None,
+        cache: Union[bool, str] = False,
+        cache_ttl: Optional[int] = None,
         **kwargs: Any
     ) -> Dict[str, Any]:
         """
@@ -228,16 +304,46 @@ class AIProviderManager:
 
         Args:
             provider_type: 'openai_sdk', 'openai_direct', or 'fallback'.
+            priority: LLM rate limiter class ('interactive', 'task', 'background');
+                defaults to the caller's llm_priority context.
+            cache: Opt-in response cache for callers whose output depends only on
+                the prompt. Pass the caller name (used for hit-rate metrics) or True
+                to use the agent name. Entries are keyed by provider, model,
+                temperature, agent config, extra kwargs and normalised prompt hash;
+                identical concurrent calls share one request.
+            cache_ttl: Max age in seconds of a cached response
+                (default LLM_RESPONSE_CACHE_TTL_SECONDS).
             **kwargs: Arguments to pass to the provider's call_ai method.
 
         Returns:
             The result from the AI provider.
         """
+        if priority is not None:
+            with llm_priority(priority):
+                return await self.call_ai(provider_type, cache=cache, cache_ttl=cache_ttl, **kwargs)
+        
         provider = self.providers.get(provider_type)
         if not provider:
             logger.error(f"Invalid provider type: {provider_type}. Using fallback.")
             provider = self.providers['fallback']
         
+        if cache and LLM_RESPONSE_CACHE_ENABLED and provider_type != 'fallback':
+            agent = kwargs.get('agent')
+            caller = cache if isinstance(cache, str) else (
+                agent.get('name') if isinstance(agent, dict) else getattr(agent, 'name', None)
+            ) or "default"
+            return await ai_result_store.get_or_compute(
+                f"{LLM_RESPONSE_CACHE_PREFIX}{caller}",
+                LLM_RESPONSE_CACHE_VERSION,
+                _response_cache_parts(provider_type, kwargs),
+                lambda: self._call_provider(provider_type, provider, kwargs),
+                should_store=_is_cacheable_result,
+                max_age=cache_ttl if cache_ttl is not None else LLM_RESPONSE_CACHE_TTL_SECONDS,
+            )
+        
+        return await self._call_provider(provider_type, provider, kwargs)
+
+    async def _call_provider(self, provider_type: str, provider: BaseProvider, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         try:
             return await provider.call_ai(**kwargs)
         except Exception as e:
@@ -246,5 +352,18 @@ class AIProviderManager:
             fallback_provider = self.providers['fallback']
             return await fallback_provider.call_ai(**kwargs)
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Per-caller hit/miss/coalesced counters of the response cache."""
+        namespaces = ai_result_store.get_stats()["namespaces"]
+        return {
+            "enabled": LLM_RESPONSE_CACHE_ENABLED,
+            "ttl_seconds": LLM_RESPONSE_CACHE_TTL_SECONDS,
+            "callers": {
+                namespace[len(LLM_RESPONSE_CACHE_PREFIX):]: counters
+                for namespace, counters in namespaces.items()
+                if namespace.startswith(LLM_RESPONSE_CACHE_PREFIX)
+            },
+        }
+
 # Singleton instance
 ai_provider_manager = AIProviderManager()
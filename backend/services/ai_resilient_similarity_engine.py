@@ -30,8 +30,14 @@ import traceback
 from collections import defaultdict
 import hashlib
 
+from utils.ai_result_store import ai_result_store
+
 logger = logging.getLogger(__name__)
 
+# Model + prompt revision of _ai_semantic_analysis: bump when either changes so
+# persisted similarity results are not reused across revisions
+SIMILARITY_RESULT_VERSION = "gpt-4o-mini/similarity-v1"
+
 # 🤖 AI Client for semantic analysis
 try:
     from openai import AsyncOpenAI
@@ -117,11 +123,12 @@ class AIResilientSimilarityEngine:
             # Tier 1: AI Semantic Analysis (Primary)
             if AI_AVAILABLE:
                 try:
-                    result = await self._ai_semantic_analysis(task1, task2, context)
+                    result, computed = await self._stored_ai_semantic_analysis(task1, task2, context)
                     if result.confidence >= 0.7:  # High confidence threshold
                         self.performance_metrics["ai_successes"] += 1
                         self._cache_result(cache_key, result)
-                        await self._learn_from_successful_detection(task1, task2, result)
+                        if computed:
+                            await self._learn_from_successful_detection(task1, task2, result)
                         return result
                     else:
                         logger.info(f"⚠️ AI analysis confidence too low ({result.confidence:.3f}), trying fallback")
@@ -173,6 +180,53 @@ class AIResilientSimilarityEngine:
                 fallback_used=True
             )
 
+    async def _stored_ai_semantic_analysis(
+        self,
+        task1: Dict[str, Any],
+        task2: Dict[str, Any],
+        context: Optional[Dict[str, Any]]
+    ) -> Tuple[SimilarityResult, bool]:
+        """
+        AI analysis through the persistent result store, keyed by the content of
+        both tasks (order-insensitive) and the context. Returns (result, computed).
+        """
+        computed = False
+
+        async def analyse():
+            nonlocal computed
+            computed = True
+            result = await self._ai_semantic_analysis(task1, task2, context)
+            if result.fallback_used:
+                return None  # Unparseable response: retry next time
+            return {
+                "similarity_score": result.similarity_score,
+                "confidence": result.confidence,
+                "reasoning": result.reasoning,
+            }
+
+        parts = tuple(sorted([self._content_signature(task1), self._content_signature(task2)])) + (context,)
+        stored = await ai_result_store.get_or_compute("similarity", SIMILARITY_RESULT_VERSION, parts, analyse)
+        if stored is None:
+            return SimilarityResult(
+                similarity_score=0.0,
+                confidence=0.0,
+                method_used=SimilarityMethod.AI_SEMANTIC,
+                reasoning="JSON parsing failed, triggering fallback",
+                similar_tasks=[],
+                execution_time_ms=0.0,
+                fallback_used=True
+            ), computed
+
+        return SimilarityResult(
+            similarity_score=stored["similarity_score"],
+            confidence=stored["confidence"],
+            method_used=SimilarityMethod.AI_SEMANTIC,
+            reasoning=stored["reasoning"],
+            similar_tasks=[task2] if stored["similarity_score"] > 0.7 else [],
+            execution_time_ms=0.0,
+            fallback_used=False
+        ), computed
+
     async def _ai_semantic_analysis(
         self, 
         task1: Dict[str, Any], 
@@ -605,6 +659,14 @@ Respond with JSON:
         except:
             return 0.0
 
+    def _content_signature(self, task: Dict[str, Any]) -> str:
+        """The task content the AI analysis depends on (no ids, status or timestamps)"""
+        return json.dumps(
+            [task.get("name", ""), task.get("description", ""), task.get("priority", "medium"),
+             task.get("assigned_to_role", ""), task.get("context_data", {}), bool(task.get("goal_id"))],
+            sort_keys=True, default=str
+        )
+
     def _generate_cache_key(self, task1: Dict[str, Any], task2: Dict[str, Any]) -> str:
         """Generate cache key for similarity results"""
         key_data = {
@@ -718,6 +780,7 @@ Respond with JSON:
             "fallback_rate": fallback_rate,
             "learned_patterns": len(self.learned_patterns),
             "cache_size": len(self.similarity_cache),
+            "result_store": ai_result_store.get_stats()["namespaces"].get("similarity", {}),
             "keyword_weights": len(self.keyword_weights)
         }
 
@@ -137,6 +137,7 @@ Return as JSON:
                 provider_type='openai_sdk',
                 agent=TASK_CLASSIFIER_AGENT_CONFIG,
                 prompt=classification_prompt,
+                cache="ai_task_classifier",
             )
             
             # Parse AI response
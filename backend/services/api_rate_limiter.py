@@ -71,21 +71,15 @@ class TokenBucket:
                 self.tokens -= tokens
                 return 0.0  # Nessuna attesa necessaria
             
-            # Calcola quanto tempo aspettare per avere abbastanza token
+            # Prenota i token (il bucket va in debito) e calcola l'attesa: chi arriva
+            # dopo trova il debito e aspetta il proprio turno, senza tenere il lock
             tokens_needed = tokens - self.tokens
-            wait_time = tokens_needed / self.rate
-            
-            # Aspetta il tempo necessario
-            await asyncio.sleep(wait_time)
-            
-            # Aggiorna di nuovo dopo l'attesa
-            now = time.time()
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
             self.tokens -= tokens
-            
-            return wait_time
+            wait_time = tokens_needed / self.rate
+        
+        # Aspetta fuori dal lock, così gli altri waiter non vengono serializzati
+        await asyncio.sleep(wait_time)
+        return wait_time
 
 class APIRateLimiter:
     """
@@ -23,6 +23,7 @@ from database import (
 from models import Task, TaskStatus, WorkspaceStatus
 from services.enhanced_goal_driven_planner import EnhancedGoalDrivenPlanner
 from services.api_rate_limiter import api_rate_limiter
+from utils.telemetry_counters import telemetry_counters
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +79,8 @@ class AutonomousTaskRecovery:
                 try:
                     recovery_result = await self._recover_single_task(task)
                     recovery_results.append(recovery_result)
+                    telemetry_counters.increment("recovery_actions")
+                    telemetry_counters.record_outcome("recovery", bool(recovery_result.get('success')))
                     
                     if recovery_result.get('success'):
                         successful_recoveries += 1
@@ -87,6 +90,7 @@ class AutonomousTaskRecovery:
                         
                 except Exception as task_error:
                     logger.error(f"❌ AUTONOMOUS RECOVERY: Error processing task {task_id}: {task_error}")
+                    telemetry_counters.record_outcome("recovery", False)
                     recovery_results.append({
                         'task_id': task_id,
                         'success': False,
@@ -16,15 +16,27 @@ from enum import Enum
 
 from database import (
     get_memory_insights, 
-    add_memory_insight, 
+    add_memory_insights,
+    get_existing_insight_hashes,
     get_supabase_client,
     get_deliverables
 )
 from services.ai_provider_abstraction import ai_provider_manager
+from services.learning_watermarks import (
+    LearningWatermark,
+    deliverable_timestamp,
+    fetch_changed_deliverables,
+    learning_watermarks,
+)
 from config.quality_system_config import QualitySystemConfig
+from utils.ai_result_store import ai_result_store
 
 logger = logging.getLogger(__name__)
 
+# Domain classification per deliverable, keyed by (id, updated_at); bump the version when the keywords change
+DELIVERABLE_DOMAIN_NAMESPACE = "deliverable_domain"
+DELIVERABLE_DOMAIN_VERSION = "keywords-v1"
+
 class DomainType(str, Enum):
     """Business domains for specialized learning extraction"""
     INSTAGRAM_MARKETING = "instagram_marketing"
@@ -68,13 +80,26 @@ class ContentAwareLearningEngine:
     """
     Analyzes deliverable content to extract business-valuable insights.
     Replaces generic statistics with domain-specific, actionable learnings.
+    Runs are incremental: only deliverables changed since the workspace watermark are analysed.
     """
     
+    WATERMARK_NAME = "content_aware_learning"
+    
     def __init__(self):
         self.analysis_window_days = 30  # Look back 30 days for patterns
         self.minimum_deliverables_for_pattern = 2  # Need at least 2 similar deliverables
         self.quality_threshold = 0.7  # Only learn from high-quality content
         
+        self.learning_stats = {
+            "runs": 0,
+            "deliverables_analyzed": 0,
+            "domain_lookups": 0,
+            "domains_classified": 0,
+            "insights_stored": 0,
+            "duplicates_skipped": 0,
+            "failed_runs": 0,
+        }
+        
         # Domain-specific extractors
         self.domain_extractors = {
             DomainType.INSTAGRAM_MARKETING: self._extract_instagram_insights,
@@ -146,35 +171,55 @@ class ContentAwareLearningEngine:
         }
     
     async def analyze_workspace_content(self, workspace_id: str) -> Dict[str, Any]:
-        """Comprehensive content analysis for business insights extraction"""
+        """Content analysis of the deliverables changed since the last run, for business insights extraction"""
         try:
             logger.info(f"🔍 Analyzing workspace {workspace_id} deliverable content for business insights")
+            self.learning_stats["runs"] += 1
             
-            # Get deliverables from the workspace
-            deliverables = await self._get_quality_deliverables(workspace_id)
+            # Get deliverables changed since the watermark (plus those carried over from earlier runs)
+            mark = await learning_watermarks.get(self.WATERMARK_NAME, workspace_id)
+            deliverables = await self._get_quality_deliverables(workspace_id, mark)
             
             if not deliverables or len(deliverables) < self.minimum_deliverables_for_pattern:
-                logger.info("Not enough quality deliverables for meaningful content analysis")
-                return {"status": "insufficient_data", "insights_generated": 0}
+                # Keep them for the next run, when related deliverables may have arrived
+                mark.carry_over(d['id'] for d in deliverables)
+                await learning_watermarks.save(self.WATERMARK_NAME, workspace_id, mark)
+                logger.info("Not enough new quality deliverables for meaningful content analysis")
+                return {"status": "insufficient_data", "insights_generated": 0,
+                        "deliverables_pending": len(mark.pending_ids)}
+            
+            self.learning_stats["deliverables_analyzed"] += len(deliverables)
             
             # Detect domain and group deliverables
             domain_groups = await self._group_deliverables_by_domain(deliverables)
             
             # Extract insights for each domain
             all_insights = []
+            carried_over = []
+            extraction_failed = False
             for domain, domain_deliverables in domain_groups.items():
                 if len(domain_deliverables) >= self.minimum_deliverables_for_pattern:
                     domain_insights = await self._extract_domain_insights(domain, domain_deliverables)
-                    all_insights.extend(domain_insights)
-            
-            # Store valuable insights
-            insights_stored = await self._store_business_insights(workspace_id, all_insights)
+                    extraction_failed = extraction_failed or domain_insights is None
+                    all_insights.extend(domain_insights or [])
+                else:
+                    carried_over.extend(d['id'] for d in domain_deliverables)
             
-            # Generate comparative insights across domains
+            # Generate comparative insights across domains, then store everything in one batch
             comparative_insights = await self._generate_comparative_insights(all_insights)
-            for insight in comparative_insights:
-                await self._store_insight(workspace_id, insight)
-                insights_stored += 1
+            insights_stored = await self._store_business_insights(workspace_id, all_insights + comparative_insights)
+            
+            if extraction_failed or insights_stored is None:
+                # Leave the watermark where it was: the next run re-analyses these deliverables
+                # (insights stored this time are skipped as duplicates)
+                self.learning_stats["failed_runs"] += 1
+                logger.warning(f"Content learning for workspace {workspace_id} failed, "
+                               f"{len(deliverables)} deliverables will be re-analysed on the next run")
+                return {"status": "error", "error": "insight extraction or storage failed",
+                        "insights_generated": insights_stored or 0, "deliverables_analyzed": len(deliverables)}
+            
+            mark.carry_over(carried_over)
+            await learning_watermarks.save(self.WATERMARK_NAME, workspace_id, mark)
             
             logger.info(f"✅ Generated {insights_stored} business-valuable insights from content analysis")
             return {
@@ -182,6 +227,8 @@ class ContentAwareLearningEngine:
                 "insights_generated": insights_stored,
                 "domains_analyzed": list(domain_groups.keys()),
                 "deliverables_analyzed": len(deliverables),
+                "deliverables_pending": len(mark.pending_ids),
+                "watermark": mark.watermark,
                 "analysis_timestamp": datetime.now().isoformat()
             }
             
@@ -189,26 +236,24 @@ class ContentAwareLearningEngine:
             logger.error(f"Error analyzing workspace content: {e}")
             return {"status": "error", "error": str(e)}
     
-    async def _get_quality_deliverables(self, workspace_id: str) -> List[Dict[str, Any]]:
-        """Get deliverables that meet quality threshold"""
+    async def _get_quality_deliverables(self, workspace_id: str, mark: Optional[LearningWatermark] = None) -> List[Dict[str, Any]]:
+        """Get deliverables that meet quality threshold, only those changed since ``mark`` (advanced in place)"""
         try:
             supabase = get_supabase_client()
             
             # Get deliverables with quality scores
             cutoff_date = datetime.now() - timedelta(days=self.analysis_window_days)
             
-            response = supabase.table('deliverables')\
-                .select('*')\
-                .eq('workspace_id', workspace_id)\
-                .gte('created_at', cutoff_date.isoformat())\
-                .execute()
+            mark = mark or LearningWatermark()
+            rows = fetch_changed_deliverables(supabase, workspace_id, cutoff_date, mark)
+            mark.advance(rows)
             
-            if not response.data:
+            if not rows:
                 return []
             
             # Filter by quality (using various quality indicators)
             quality_deliverables = []
-            for deliverable in response.data:
+            for deliverable in rows:
                 quality_score = self._calculate_deliverable_quality(deliverable)
                 if quality_score >= self.quality_threshold:
                     quality_deliverables.append(deliverable)
@@ -255,7 +300,7 @@ class ContentAwareLearningEngine:
             domain_groups = defaultdict(list)
             
             for deliverable in deliverables:
-                domain = await self._detect_deliverable_domain(deliverable)
+                domain = await self._classify_deliverable(deliverable)
                 domain_groups[domain].append(deliverable)
             
             return dict(domain_groups)
@@ -264,6 +309,25 @@ class ContentAwareLearningEngine:
             logger.error(f"Error grouping deliverables by domain: {e}")
             return {DomainType.GENERAL: deliverables}
     
+    async def _classify_deliverable(self, deliverable: Dict[str, Any]) -> DomainType:
+        """Domain of a deliverable, cached per (id, updated_at) so unchanged deliverables are not re-classified"""
+        if not deliverable.get('id'):
+            return await self._detect_deliverable_domain(deliverable)
+        
+        async def detect():
+            self.learning_stats["domains_classified"] += 1
+            return (await self._detect_deliverable_domain(deliverable)).value
+        
+        self.learning_stats["domain_lookups"] += 1
+        value = await ai_result_store.get_or_compute(
+            DELIVERABLE_DOMAIN_NAMESPACE, DELIVERABLE_DOMAIN_VERSION,
+            (str(deliverable['id']), deliverable_timestamp(deliverable)), detect,
+        )
+        try:
+            return DomainType(value)
+        except ValueError:
+            return DomainType.GENERAL
+    
     async def _detect_deliverable_domain(self, deliverable: Dict[str, Any]) -> DomainType:
         """Detect the business domain of a deliverable"""
         try:
@@ -305,8 +369,8 @@ class ContentAwareLearningEngine:
             logger.error(f"Error detecting deliverable domain: {e}")
             return DomainType.GENERAL
     
-    async def _extract_domain_insights(self, domain: DomainType, deliverables: List[Dict[str, Any]]) -> List[BusinessInsight]:
-        """Extract domain-specific insights from deliverables"""
+    async def _extract_domain_insights(self, domain: DomainType, deliverables: List[Dict[str, Any]]) -> Optional[List[BusinessInsight]]:
+        """Extract domain-specific insights from deliverables (None if the extractor failed)"""
         try:
             # Use domain-specific extractor if available
             if domain in self.domain_extractors:
@@ -316,7 +380,7 @@ class ContentAwareLearningEngine:
                 
         except Exception as e:
             logger.error(f"Error extracting domain insights for {domain}: {e}")
-            return []
+            return None
     
     async def _extract_instagram_insights(self, deliverables: List[Dict[str, Any]]) -> List[BusinessInsight]:
         """Extract Instagram marketing specific insights"""
@@ -757,16 +821,39 @@ Return specific, quantified insights where possible."""
             logger.error(f"Error generating comparative insights: {e}")
             return comparative_insights
     
-    async def _store_business_insights(self, workspace_id: str, insights: List[BusinessInsight]) -> int:
-        """Store business insights in the database"""
-        stored_count = 0
-        
+    async def _store_business_insights(self, workspace_id: str, insights: List[BusinessInsight]) -> Optional[int]:
+        """Store business insights: one hash lookup and one insert for the whole batch (None if any insert failed)"""
+        candidates = {}
         for insight in insights:
-            success = await self._store_insight(workspace_id, insight)
-            if success:
-                stored_count += 1
+            candidates.setdefault(self._generate_insight_hash(insight), insight)
+        if not candidates:
+            return 0
         
-        return stored_count
+        try:
+            existing = await get_existing_insight_hashes(workspace_id, list(candidates))
+            new_insights = [(content_hash, insight) for content_hash, insight in candidates.items()
+                            if content_hash not in existing]
+            
+            skipped = len(insights) - len(new_insights)
+            self.learning_stats["duplicates_skipped"] += skipped
+            if skipped:
+                logger.info(f"🚫 Skipping {skipped} duplicate insights")
+            if not new_insights:
+                return 0
+            
+            stored_count = await add_memory_insights(
+                workspace_id, [self._insight_record(insight, content_hash) for content_hash, insight in new_insights]
+            )
+            self.learning_stats["insights_stored"] += stored_count or 0
+            if stored_count is None or stored_count < len(new_insights):
+                logger.warning(f"Stored {stored_count or 0} of {len(new_insights)} new business insights")
+                return None
+            logger.info(f"✅ Stored {stored_count} new business insights")
+            return stored_count
+            
+        except Exception as e:
+            logger.error(f"Error storing business insights: {e}")
+            return None
     
     def _generate_insight_hash(self, insight: BusinessInsight) -> str:
         """Generate unique hash for insight content to detect duplicates"""
@@ -777,97 +864,50 @@ Return specific, quantified insights where possible."""
     
     async def _check_insight_exists(self, workspace_id: str, content_hash: str) -> bool:
         """Check if an insight with the same content hash already exists"""
-        try:
-            from database import get_supabase_client
-            supabase = get_supabase_client()
-            
-            # Check for existing insights with same content hash
-            # Since we don't have content_hash column yet, we'll check by content similarity
-            result = supabase.table('workspace_insights')\
-                .select('content')\
-                .eq('workspace_id', workspace_id)\
-                .execute()
-            
-            if result.data:
-                for existing_insight in result.data:
-                    existing_content = existing_insight.get('content', '')
-                    if isinstance(existing_content, str):
-                        try:
-                            parsed_content = json.loads(existing_content)
-                            existing_learning = parsed_content.get('learning', '')
-                        except:
-                            existing_learning = existing_content
-                    elif isinstance(existing_content, dict):
-                        existing_learning = existing_content.get('learning', str(existing_content))
-                    else:
-                        existing_learning = str(existing_content)
-                    
-                    # Generate hash for existing content for comparison
-                    normalized_existing = existing_learning.strip().lower()
-                    # Simple duplicate detection by comparing normalized content
-                    if len(normalized_existing) > 10:  # Avoid empty content
-                        similarity_hash = hashlib.md5(normalized_existing.encode()).hexdigest()
-                        if similarity_hash == content_hash or normalized_existing in content_hash or content_hash in normalized_existing:
-                            return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error checking insight existence: {e}")
-            return False
+        return content_hash in await get_existing_insight_hashes(workspace_id, [content_hash])
+    
+    def _insight_record(self, insight: BusinessInsight, content_hash: str) -> Dict[str, Any]:
+        """Storage record for add_memory_insights"""
+        # Create structured content for storage
+        insight_content = {
+            "learning": insight.to_learning_format(),
+            "insight_type": insight.insight_type,
+            "domain": insight.domain.value,
+            "confidence_score": insight.confidence_score,
+            "extraction_method": insight.extraction_method,
+            "evidence_sources": insight.evidence_sources,
+            "created_at": insight.created_at.isoformat(),
+            "content_hash": content_hash  # Store hash for future reference
+        }
+        
+        # Add metrics if available
+        if insight.metric_name:
+            insight_content["metric_name"] = insight.metric_name
+        if insight.metric_value is not None:
+            insight_content["metric_value"] = insight.metric_value
+        if insight.comparison_baseline:
+            insight_content["comparison_baseline"] = insight.comparison_baseline
+        if insight.actionable_recommendation:
+            insight_content["recommendation"] = insight.actionable_recommendation
+        
+        return {
+            "insight_type": "business_learning",
+            "content": json.dumps(insight_content, indent=2),
+            "confidence_score": insight.confidence_score,
+            "relevance_tags": [insight.domain.value, insight.insight_type],
+            "content_hash": content_hash,
+        }
     
     async def _store_insight(self, workspace_id: str, insight: BusinessInsight) -> bool:
         """Store a single insight in the database with deduplication"""
-        try:
-            # Generate content hash for duplicate detection
-            content_hash = self._generate_insight_hash(insight)
-            
-            # Check if similar insight already exists
-            if await self._check_insight_exists(workspace_id, content_hash):
-                logger.info(f"🚫 Skipping duplicate insight: {insight.to_learning_format()[:60]}...")
-                return False
-            
-            # Convert to learning format
-            learning_text = insight.to_learning_format()
-            
-            # Create structured content for storage
-            insight_content = {
-                "learning": learning_text,
-                "insight_type": insight.insight_type,
-                "domain": insight.domain.value,
-                "confidence_score": insight.confidence_score,
-                "extraction_method": insight.extraction_method,
-                "evidence_sources": insight.evidence_sources,
-                "created_at": insight.created_at.isoformat(),
-                "content_hash": content_hash  # Store hash for future reference
-            }
-            
-            # Add metrics if available
-            if insight.metric_name:
-                insight_content["metric_name"] = insight.metric_name
-            if insight.metric_value is not None:
-                insight_content["metric_value"] = insight.metric_value
-            if insight.comparison_baseline:
-                insight_content["comparison_baseline"] = insight.comparison_baseline
-            if insight.actionable_recommendation:
-                insight_content["recommendation"] = insight.actionable_recommendation
-            
-            # Store in workspace_insights
-            await add_memory_insight(
-                workspace_id=workspace_id,
-                insight_type="business_learning",
-                content=json.dumps(insight_content, indent=2),
-                agent_role="content_aware_learning_engine",
-                confidence_score=insight.confidence_score,
-                relevance_tags=[insight.domain.value, insight.insight_type]
-            )
-            
-            logger.info(f"✅ Stored new business insight: {learning_text[:60]}...")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error storing business insight: {e}")
-            return False
+        return await self._store_business_insights(workspace_id, [insight]) == 1
+    
+    def get_learning_stats(self) -> Dict[str, Any]:
+        """Incremental learning counters (domain cache hits are lookups that skipped classification)"""
+        return {
+            **self.learning_stats,
+            "domain_cache_hits": self.learning_stats["domain_lookups"] - self.learning_stats["domains_classified"],
+        }
     
     async def get_actionable_learnings(self, workspace_id: str, domain: Optional[DomainType] = None) -> List[str]:
         """Get actionable learnings for a workspace, optionally filtered by domain"""
@@ -926,11 +966,13 @@ Return specific, quantified insights where possible."""
                 return {"status": "below_quality_threshold", "quality_score": quality_score}
             
             # Extract domain-specific insights from this deliverable
-            domain = await self._detect_deliverable_domain(deliverable)
+            domain = await self._classify_deliverable(deliverable)
             insights = await self._extract_domain_insights(domain, [deliverable])
             
             # Store insights
-            stored_count = await self._store_business_insights(workspace_id, insights)
+            stored_count = None if insights is None else await self._store_business_insights(workspace_id, insights)
+            if stored_count is None:
+                return {"status": "error", "error": "insight extraction or storage failed"}
             
             return {
                 "status": "completed",
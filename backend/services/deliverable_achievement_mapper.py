@@ -10,6 +10,8 @@ import re
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from utils.telemetry_counters import telemetry_counters
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -94,29 +96,35 @@ class DeliverableAchievementMapper:
             
             # Method 1: AI Semantic Analysis (if available)
             ai_result = await self._extract_with_ai_semantic(task_result, task_name)
+            telemetry_counters.observe("ai_confidence", ai_result.confidence_score)
             if ai_result.confidence_score >= 0.6:
                 logger.info(f"✅ AI semantic analysis succeeded (confidence: {ai_result.confidence_score:.2f})")
+                telemetry_counters.record_outcome("achievement_extraction", True)
                 return ai_result
             
             # Method 2: Enhanced Pattern Recognition
             pattern_result = await self._extract_with_enhanced_patterns(task_result, task_name)
             if pattern_result.confidence_score >= 0.5:
                 logger.info(f"✅ Enhanced pattern recognition succeeded (confidence: {pattern_result.confidence_score:.2f})")
+                telemetry_counters.record_outcome("achievement_extraction", True)
                 return pattern_result
             
             # Method 3: Structural Analysis
             structural_result = await self._extract_with_structural_analysis(task_result, task_name)
             if structural_result.confidence_score >= 0.4:
                 logger.info(f"✅ Structural analysis succeeded (confidence: {structural_result.confidence_score:.2f})")
+                telemetry_counters.record_outcome("achievement_extraction", True)
                 return structural_result
             
-            # Method 4: Task Name Inference (fallback)
+            # Method 4: Task Name Inference (fallback) - counted as a failed extraction
             inference_result = await self._extract_with_task_inference(task_name)
             logger.info(f"✅ Using task name inference fallback (confidence: {inference_result.confidence_score:.2f})")
+            telemetry_counters.record_outcome("achievement_extraction", False)
             return inference_result
             
         except Exception as e:
             logger.error(f"Error in robust achievement extraction: {e}")
+            telemetry_counters.record_outcome("achievement_extraction", False)
             return AchievementResult(
                 reasoning=f"Extraction failed: {str(e)}",
                 extraction_method="error_fallback"
@@ -413,10 +421,15 @@ Return ONLY a JSON object with the extracted data.
                         })
                         
                         # Update in database
-                        supabase.table('workspace_goals').update({
-                            'current_value': new_value,
-                            'updated_at': 'now()'
-                        }).eq('id', goal_id).execute()
+                        try:
+                            supabase.table('workspace_goals').update({
+                                'current_value': new_value,
+                                'updated_at': 'now()'
+                            }).eq('id', goal_id).execute()
+                        except Exception:
+                            telemetry_counters.record_outcome("goal_update", False)
+                            raise
+                        telemetry_counters.record_outcome("goal_update", True)
                         
                         logger.info(f"✅ Goal updated: {metric_type} {current_value}→{new_value} (+{increment}) via {achievements.extraction_method}")
             
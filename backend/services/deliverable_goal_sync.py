@@ -30,6 +30,7 @@ from enum import Enum
 import json
 
 from database import supabase
+from utils.task_event_bus import task_event_bus, GOAL_CHANGED
 from models import GoalStatus, TaskStatus
 from services.universal_ai_pipeline_engine import universal_ai_pipeline_engine as universal_ai_pipeline
 
@@ -164,6 +165,7 @@ class DeliverableGoalSyncService:
                         "updated_at": datetime.now().isoformat(),
                         "last_sync_at": datetime.now().isoformat()
                     }).eq("id", goal['id']).execute()
+                    task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=goal['id'])
                     
                     if update_response.data:
                         updated_goals.append(goal['id'])
@@ -244,6 +246,7 @@ class DeliverableGoalSyncService:
                             "updated_at": datetime.now().isoformat(),
                             "last_sync_at": datetime.now().isoformat()
                         }).eq("id", goal_id).execute()
+                        task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=goal_id)
                         
                         if update_response.data:
                             updated_count += 1
@@ -449,6 +452,7 @@ class DeliverableGoalSyncService:
                 "completed_at": datetime.now().isoformat(),
                 "updated_at": datetime.now().isoformat()
             }).eq("id", goal_id).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=(update_response.data or [{}])[0].get("workspace_id"), goal_id=goal_id)
             
             if update_response.data:
                 logger.info(f"✅ Goal {goal_id} marked as completed")
@@ -601,6 +605,7 @@ class DeliverableGoalSyncService:
                     "progress": progress,
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", goal_id).execute()
+                task_event_bus.publish(GOAL_CHANGED, workspace_id=(update_response.data or [{}])[0].get("workspace_id"), goal_id=goal_id)
                 
                 if not update_response.data:
                     logger.error(f"Failed to rollback goal {goal_id}")
@@ -13,6 +13,8 @@ from database import get_supabase_client, get_workspace
 from services.ai_agent_assignment_service import ai_agent_assignment_service
 from services.universal_learning_engine import universal_learning_engine
 from services.ai_provider_abstraction import ai_provider_manager
+from utils.telemetry_counters import telemetry_counters
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
 
 logger = logging.getLogger(__name__)
 
@@ -206,6 +208,7 @@ class GoalProgressAutoRecovery:
                 'status': 'auto_recovering',
                 'updated_at': datetime.now().isoformat()
             }).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             logger.info(f"🔧 Starting auto-recovery for workspace {workspace_id}")
             
@@ -219,6 +222,8 @@ class GoalProgressAutoRecovery:
                     issue
                 )
                 recovery_results.append(strategy_result)
+                telemetry_counters.increment("recovery_actions")
+                telemetry_counters.record_outcome("recovery", bool(strategy_result.get('success')))
             
             # Capture learning from recovery
             await self._capture_recovery_learning(
@@ -235,6 +240,7 @@ class GoalProgressAutoRecovery:
                 'status': new_status,
                 'updated_at': datetime.now().isoformat()
             }).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             logger.info(f"✅ Recovery completed for workspace {workspace_id}. New status: {new_status}")
             
@@ -21,6 +21,7 @@ from datetime import datetime, timedelta
 from uuid import uuid4
 
 from database import supabase
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED
 from models import GoalStatus, TaskStatus
 
 logger = logging.getLogger(__name__)
@@ -363,7 +364,9 @@ class GoalTaskHealthMonitor:
             # Insert agents
             for agent in agents:
                 try:
-                    supabase.table("agents").insert(agent).execute()
+                    result = supabase.table("agents").insert(agent).execute()
+                    if result.data:
+                        task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=result.data[0].get("id"))
                     logger.info(f"✅ Created agent: {agent['name']}")
                 except Exception as e:
                     logger.error(f"Failed to create agent {agent['name']}: {e}")
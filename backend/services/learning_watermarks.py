@@ -0,0 +1,164 @@
+# backend/services/learning_watermarks.py
+"""
+📍 Learning Watermarks - incremental content learning state per workspace
+
+The scheduled content learning engines only need the deliverables created or
+updated since their previous run. Each (engine, workspace) pair keeps a
+high-watermark (the newest ``updated_at`` already analysed), the ids sharing that
+exact timestamp (the next query uses ``>=`` so late commits at the same instant
+are not lost), and the ids of deliverables carried over until enough related
+ones arrive to form a pattern.
+
+State lives in the persistent AI result store, so it survives restarts. If an
+entry is evicted the next run simply rescans the analysis window; insight
+deduplication by content hash keeps that harmless.
+"""
+
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from utils.ai_result_store import ai_result_store
+
+logger = logging.getLogger(__name__)
+
+LEARNING_INCREMENTAL_ENABLED = os.getenv("LEARNING_INCREMENTAL_ENABLED", "true").lower() == "true"
+LEARNING_WATERMARK_NAMESPACE = "learning_watermark"
+LEARNING_WATERMARK_VERSION = "v1"
+# Deliverables carried over between runs while waiting for related ones (per workspace)
+LEARNING_MAX_PENDING_DELIVERABLES = int(os.getenv("LEARNING_MAX_PENDING_DELIVERABLES", "200"))
+
+
+def deliverable_timestamp(deliverable: Dict[str, Any]) -> Optional[str]:
+    """The deliverable's change timestamp: updated_at, falling back to created_at"""
+    return deliverable.get("updated_at") or deliverable.get("created_at")
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Timezone-aware datetime for a Postgres ISO timestamp (naive values are UTC)"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class LearningWatermark:
+    """Incremental learning position of one engine in one workspace"""
+    watermark: Optional[str] = None
+    seen_at_watermark: List[str] = field(default_factory=list)
+    pending_ids: List[str] = field(default_factory=list)
+    context: Optional[Dict[str, Any]] = None
+    context_detected_at: Optional[str] = None
+    runs: int = 0
+
+    def is_new(self, deliverable: Dict[str, Any]) -> bool:
+        """False for deliverables already analysed at or before the watermark"""
+        if not self.watermark:
+            return True
+        changed = parse_timestamp(deliverable_timestamp(deliverable))
+        mark = parse_timestamp(self.watermark)
+        if changed is None or mark is None:
+            return True
+        if changed > mark:
+            return True
+        return changed == mark and str(deliverable.get("id")) not in self.seen_at_watermark
+
+    def advance(self, deliverables: Iterable[Dict[str, Any]]):
+        """Move the watermark past every deliverable fetched in this run"""
+        newest = parse_timestamp(self.watermark)
+        seen = set(self.seen_at_watermark)
+        for deliverable in deliverables:
+            raw = deliverable_timestamp(deliverable)
+            changed = parse_timestamp(raw)
+            if changed is None:
+                continue
+            if newest is None or changed > newest:
+                newest, self.watermark, seen = changed, raw, set()
+            if changed == newest:
+                seen.add(str(deliverable.get("id")))
+        self.seen_at_watermark = sorted(seen)
+
+    def carry_over(self, deliverable_ids: Iterable[Any]):
+        """Remember deliverables that still need related ones before they form a pattern"""
+        self.pending_ids = [str(i) for i in dict.fromkeys(deliverable_ids)][-LEARNING_MAX_PENDING_DELIVERABLES:]
+
+
+class LearningWatermarkStore:
+    """Loads and saves LearningWatermark entries in the AI result store"""
+
+    def __init__(self, enabled: bool = LEARNING_INCREMENTAL_ENABLED):
+        self.enabled = enabled
+
+    @staticmethod
+    def _key(engine: str, workspace_id: str) -> str:
+        return f"{engine}:{workspace_id}"
+
+    async def get(self, engine: str, workspace_id: str) -> LearningWatermark:
+        if not self.enabled:
+            return LearningWatermark()
+        stored = await ai_result_store.get(LEARNING_WATERMARK_NAMESPACE, self._key(engine, workspace_id))
+        if not stored:
+            return LearningWatermark()
+        try:
+            return LearningWatermark(**stored)
+        except TypeError as e:
+            logger.warning(f"⚠️ Discarding unreadable learning watermark for {workspace_id}: {e}")
+            return LearningWatermark()
+
+    async def save(self, engine: str, workspace_id: str, mark: LearningWatermark):
+        if not self.enabled:
+            return
+        mark.runs += 1
+        await ai_result_store.set(
+            LEARNING_WATERMARK_NAMESPACE, self._key(engine, workspace_id), asdict(mark), LEARNING_WATERMARK_VERSION
+        )
+
+    async def reset(self, engine: str, workspace_id: str):
+        """Forget the position so the next run rescans the whole analysis window"""
+        await ai_result_store.set(LEARNING_WATERMARK_NAMESPACE, self._key(engine, workspace_id), {},
+                                  LEARNING_WATERMARK_VERSION)
+
+
+def fetch_changed_deliverables(supabase, workspace_id: str, cutoff: datetime,
+                               mark: LearningWatermark) -> List[Dict[str, Any]]:
+    """
+    Deliverables of the analysis window changed since the watermark, plus the ones
+    carried over from earlier runs (one extra in_() query by id).
+    """
+    query = supabase.table('deliverables')\
+        .select('*')\
+        .eq('workspace_id', workspace_id)\
+        .gte('created_at', cutoff.isoformat())
+    if mark.watermark:
+        query = query.gte('updated_at', mark.watermark)
+    rows = [row for row in (query.execute().data or []) if mark.is_new(row)]
+
+    known = {str(row.get('id')) for row in rows}
+    pending = [i for i in mark.pending_ids if i not in known]
+    if pending:
+        carried = supabase.table('deliverables').select('*').in_('id', pending).execute()
+        cutoff = cutoff if cutoff.tzinfo else cutoff.replace(tzinfo=timezone.utc)
+        for row in carried.data or []:
+            created = parse_timestamp(row.get('created_at'))
+            if created is None or created >= cutoff:
+                rows.append(row)
+    return rows
+
+
+# Global instance
+learning_watermarks = LearningWatermarkStore()
+
+__all__ = [
+    "LearningWatermark",
+    "LearningWatermarkStore",
+    "learning_watermarks",
+    "fetch_changed_deliverables",
+    "deliverable_timestamp",
+    "LEARNING_INCREMENTAL_ENABLED",
+]
@@ -0,0 +1,494 @@
+# backend/services/llm_rate_limiter.py
+"""
+🚦 LLM Rate Limiter - request/token budgets per model with priority classes
+
+Central admission control for every LLM call made through
+``AIProviderManager.call_ai`` and the OpenAI client factory:
+
+- Each model has two continuously refilling budgets, requests per minute and
+  tokens per minute. A call reserves one request plus its estimated tokens, and
+  the estimate is settled against the real usage once the call returns.
+- Waiters sit in one queue per model ordered by priority class and then by
+  arrival, and are granted by the event loop as budget refills. Nobody sleeps
+  while holding a lock.
+- Lower classes may not drain the budget below a reserved share
+  (``LLM_TASK_RESERVE`` / ``LLM_BACKGROUND_RESERVE``), so background monitors can
+  never starve user-facing chat.
+- Effective rates follow an AIMD controller: a 429 halves them (honouring
+  ``retry-after`` and the ``x-ratelimit-*`` headers of the error response), and
+  every success adds back ``LLM_AIMD_INCREASE`` of the configured rate.
+
+The priority of a call comes from the ``llm_priority`` context (set once by a
+route or background loop and inherited by every task it spawns) unless passed
+explicitly.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import re
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+LLM_RATE_LIMITER_ENABLED = os.getenv("LLM_RATE_LIMITER_ENABLED", "true").lower() == "true"
+LLM_DEFAULT_RPM = float(os.getenv("LLM_DEFAULT_RPM", "500"))
+LLM_DEFAULT_TPM = float(os.getenv("LLM_DEFAULT_TPM", "200000"))
+# Per-model overrides, e.g. "gpt-4o=500:30000,gpt-4o-mini=500:200000" (rpm:tpm)
+LLM_MODEL_LIMITS = os.getenv("LLM_MODEL_LIMITS", "")
+LLM_DEFAULT_MODEL = os.getenv("DEFAULT_AI_MODEL", "gpt-4o-mini")
+LLM_DEFAULT_COMPLETION_TOKENS = int(os.getenv("LLM_DEFAULT_COMPLETION_TOKENS", "800"))
+LLM_TASK_RESERVE = float(os.getenv("LLM_TASK_RESERVE", "0.1"))
+LLM_BACKGROUND_RESERVE = float(os.getenv("LLM_BACKGROUND_RESERVE", "0.3"))
+LLM_AIMD_DECREASE = float(os.getenv("LLM_AIMD_DECREASE", "0.5"))
+LLM_AIMD_INCREASE = float(os.getenv("LLM_AIMD_INCREASE", "0.02"))
+LLM_AIMD_MIN_FACTOR = float(os.getenv("LLM_AIMD_MIN_FACTOR", "0.05"))
+
+# Priority classes, lowest value is served first
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_TASK = "task"
+PRIORITY_BACKGROUND = "background"
+PRIORITY_ORDER = {PRIORITY_INTERACTIVE: 0, PRIORITY_TASK: 1, PRIORITY_BACKGROUND: 2}
+PRIORITY_RESERVES = {
+    PRIORITY_INTERACTIVE: 0.0,
+    PRIORITY_TASK: LLM_TASK_RESERVE,
+    PRIORITY_BACKGROUND: LLM_BACKGROUND_RESERVE,
+}
+
+# Rough USD per 1K tokens (input, output) for cost accounting in stats
+MODEL_PRICING_PER_1K = {
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-4.1": (0.002, 0.008),
+    "gpt-4.1-mini": (0.0004, 0.0016),
+    "gpt-4.1-nano": (0.0001, 0.0004),
+    "gpt-4": (0.03, 0.06),
+    "gpt-3.5-turbo": (0.0005, 0.0015),
+}
+
+_current_priority: contextvars.ContextVar[str] = contextvars.ContextVar("llm_priority", default=PRIORITY_TASK)
+
+
+@contextmanager
+def llm_priority(priority: str):
+    """Run the enclosed code (and tasks it spawns) under an LLM priority class."""
+    if priority not in PRIORITY_ORDER:
+        raise ValueError(f"Unknown LLM priority '{priority}'")
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_llm_priority() -> str:
+    return _current_priority.get()
+
+
+def estimate_tokens(*parts: Any, completion_tokens: Optional[int] = None) -> int:
+    """Cheap token estimate (~4 characters per token) plus the expected completion."""
+    characters = 0
+    for part in parts:
+        if part is None:
+            continue
+        if isinstance(part, (list, tuple)):
+            characters += sum(len(str(item.get("content", "")) if isinstance(item, dict) else str(item)) for item in part)
+        else:
+            characters += len(str(part))
+    completion = completion_tokens if completion_tokens is not None else LLM_DEFAULT_COMPLETION_TOKENS
+    return max(1, characters // 4 + completion)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    name = type(error).__name__.lower()
+    text = str(error).lower()
+    return "ratelimit" in name or "rate_limit" in text or "429" in text
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse ``retry-after`` / ``x-ratelimit-reset-*`` values such as "2", "1.5s", "6m0s", "120ms"."""
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    total, matched = 0.0, False
+    for amount, unit in re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value):
+        matched = True
+        total += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total if matched else None
+
+
+def _parse_model_limits(spec: str) -> Dict[str, tuple]:
+    limits = {}
+    for entry in filter(None, (item.strip() for item in spec.split(","))):
+        try:
+            model, values = entry.split("=", 1)
+            rpm, tpm = values.split(":", 1)
+            limits[model.strip()] = (float(rpm), float(tpm))
+        except ValueError:
+            logger.warning(f"⚠️ Ignoring malformed LLM_MODEL_LIMITS entry: {entry}")
+    return limits
+
+
+@dataclass(order=True)
+class _Waiter:
+    rank: int
+    seq: int
+    priority: str = field(compare=False)
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False, default_factory=time.monotonic)
+
+
+class ModelBudget:
+    """Request and token buckets of one model, with its priority-ordered waiting queue."""
+
+    def __init__(self, model: str, rpm: float, tpm: float):
+        self.model = model
+        self.configured_rpm = max(1.0, rpm)
+        self.configured_tpm = max(1.0, tpm)
+        self.factor = 1.0
+        self.requests = self.rpm
+        self.tokens = self.tpm
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+        self.waiters: List[_Waiter] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {
+            "granted": 0,
+            "waited": 0,
+            "wait_seconds": 0.0,
+            "rate_limited": 0,
+            "tokens_reserved": 0,
+            "tokens_used": 0,
+            "cost_usd": 0.0,
+            "by_priority": {priority: 0 for priority in PRIORITY_ORDER},
+        }
+
+    @property
+    def rpm(self) -> float:
+        return self.configured_rpm * self.factor
+
+    @property
+    def tpm(self) -> float:
+        return self.configured_tpm * self.factor
+
+    def refill(self, now: float):
+        elapsed = max(0.0, now - self.updated)
+        self.updated = now
+        self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+
+    def _needs(self, priority: str, tokens: int):
+        reserve = PRIORITY_RESERVES[priority]
+        # A call bigger than the usable share waits for a full bucket instead of forever
+        token_need = min(tokens, self.tpm * (1.0 - reserve))
+        return 1.0, token_need, reserve * self.rpm, reserve * self.tpm
+
+    def fits(self, priority: str, tokens: int) -> bool:
+        request_need, token_need, request_floor, token_floor = self._needs(priority, tokens)
+        return self.requests - request_need >= request_floor and self.tokens - token_need >= token_floor
+
+    def seconds_until_fits(self, priority: str, tokens: int) -> float:
+        request_need, token_need, request_floor, token_floor = self._needs(priority, tokens)
+        request_gap = request_floor + request_need - self.requests
+        token_gap = token_floor + token_need - self.tokens
+        return max(0.0, request_gap * 60.0 / self.rpm, token_gap * 60.0 / self.tpm)
+
+    def debit(self, priority: str, tokens: int):
+        self.requests -= 1
+        self.tokens -= tokens
+        self.stats["granted"] += 1
+        self.stats["tokens_reserved"] += tokens
+        self.stats["by_priority"][priority] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "wait_seconds": round(self.stats["wait_seconds"], 3),
+            "cost_usd": round(self.stats["cost_usd"], 6),
+            "configured_rpm": self.configured_rpm,
+            "configured_tpm": self.configured_tpm,
+            "effective_rpm": round(self.rpm, 2),
+            "effective_tpm": round(self.tpm, 2),
+            "aimd_factor": round(self.factor, 3),
+            "available_requests": round(self.requests, 2),
+            "available_tokens": int(self.tokens),
+            "queued": len(self.waiters),
+            "paused_for": round(max(0.0, self.paused_until - time.monotonic()), 2),
+        }
+
+
+@dataclass
+class LLMPermit:
+    """A granted reservation; ``record_usage`` settles it against real token usage."""
+    model: str
+    priority: str
+    reserved_tokens: int
+    waited: float
+    used_tokens: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+
+    def record_usage(self, usage: Any):
+        """Accept an OpenAI ``usage`` object/dict (or a plain total) from the response."""
+        if usage is None:
+            return
+        if isinstance(usage, (int, float)):
+            self.used_tokens = int(usage)
+            return
+        getter = usage.get if isinstance(usage, dict) else lambda name: getattr(usage, name, None)
+        total = getter("total_tokens")
+        self.prompt_tokens = getter("prompt_tokens") or getter("input_tokens")
+        self.completion_tokens = getter("completion_tokens") or getter("output_tokens")
+        if total is None and (self.prompt_tokens or self.completion_tokens):
+            total = (self.prompt_tokens or 0) + (self.completion_tokens or 0)
+        if total is not None:
+            self.used_tokens = int(total)
+
+
+class LLMRateLimiter:
+    """Per-model request/token budgets with priority queues and AIMD adaptation."""
+
+    def __init__(
+        self,
+        default_rpm: float = LLM_DEFAULT_RPM,
+        default_tpm: float = LLM_DEFAULT_TPM,
+        model_limits: Optional[Mapping[str, tuple]] = None,
+        enabled: bool = LLM_RATE_LIMITER_ENABLED,
+    ):
+        self.default_rpm = default_rpm
+        self.default_tpm = default_tpm
+        self.model_limits = dict(model_limits if model_limits is not None else _parse_model_limits(LLM_MODEL_LIMITS))
+        self.enabled = enabled
+        self.budgets: Dict[str, ModelBudget] = {}
+        self._seq = itertools.count()
+
+    def budget_for(self, model: Optional[str]) -> ModelBudget:
+        model = model or LLM_DEFAULT_MODEL
+        budget = self.budgets.get(model)
+        if budget is None:
+            rpm, tpm = self.model_limits.get(model, (self.default_rpm, self.default_tpm))
+            budget = ModelBudget(model, rpm, tpm)
+            self.budgets[model] = budget
+        return budget
+
+    # === ADMISSION ===
+
+    async def acquire(self, model: Optional[str], tokens: int, priority: Optional[str] = None) -> LLMPermit:
+        """Wait (without holding any lock) until the model's budgets admit this call."""
+        priority = priority or current_llm_priority()
+        if priority not in PRIORITY_ORDER:
+            priority = PRIORITY_TASK
+        budget = self.budget_for(model)
+        if not self.enabled:
+            return LLMPermit(budget.model, priority, tokens, 0.0)
+
+        now = time.monotonic()
+        budget.refill(now)
+        if not budget.waiters and now >= budget.paused_until and budget.fits(priority, tokens):
+            budget.debit(priority, tokens)
+            return LLMPermit(budget.model, priority, tokens, 0.0)
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(PRIORITY_ORDER[priority], next(self._seq), priority, tokens, loop.create_future())
+        heapq.heappush(budget.waiters, waiter)
+        self._dispatch(budget)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted right as we were cancelled: hand the reservation back
+                self._refund(budget, 1, tokens)
+            raise
+
+        waited = time.monotonic() - waiter.enqueued_at
+        budget.stats["waited"] += 1
+        budget.stats["wait_seconds"] += waited
+        if waited > 1:
+            logger.info(f"⏱️ LLM rate limit wait for {budget.model} ({priority}): {waited:.1f}s")
+        return LLMPermit(budget.model, priority, tokens, waited)
+
+    def _dispatch(self, budget: ModelBudget):
+        """Grant waiters in priority/arrival order while the budget allows, else re-arm the timer."""
+        if budget.timer is not None:
+            budget.timer.cancel()
+            budget.timer = None
+
+        now = time.monotonic()
+        budget.refill(now)
+        while budget.waiters:
+            head = budget.waiters[0]
+            if head.future.done():
+                heapq.heappop(budget.waiters)
+                continue
+            if now < budget.paused_until:
+                delay = budget.paused_until - now
+            elif budget.fits(head.priority, head.tokens):
+                heapq.heappop(budget.waiters)
+                budget.debit(head.priority, head.tokens)
+                head.future.set_result(None)
+                continue
+            else:
+                delay = budget.seconds_until_fits(head.priority, head.tokens)
+            # Strict head-of-line: lower classes never overtake a waiting higher class
+            loop = head.future.get_loop()
+            budget.timer = loop.call_later(max(delay, 0.001), self._dispatch, budget)
+            return
+
+    def _refund(self, budget: ModelBudget, requests: float, tokens: float):
+        budget.requests = min(budget.rpm, budget.requests + requests)
+        budget.tokens = min(budget.tpm, budget.tokens + tokens)
+
+    def settle(self, permit: LLMPermit, dispatch: bool = True):
+        """Replace the token estimate of a finished call with its real usage."""
+        if permit.used_tokens is None:
+            return
+        budget = self.budget_for(permit.model)
+        budget.stats["tokens_used"] += permit.used_tokens
+        budget.stats["cost_usd"] += self._cost(permit)
+        if not self.enabled:
+            return
+        # Refund (or charge) the difference; the bucket may go into debt for big surprises
+        budget.tokens = min(budget.tpm, budget.tokens + permit.reserved_tokens - permit.used_tokens)
+        if dispatch and budget.waiters:
+            self._dispatch(budget)
+
+    @staticmethod
+    def _cost(permit: LLMPermit) -> float:
+        pricing = next(
+            (price for name, price in sorted(MODEL_PRICING_PER_1K.items(), key=lambda item: -len(item[0]))
+             if permit.model.startswith(name)),
+            None,
+        )
+        if pricing is None:
+            return 0.0
+        if permit.prompt_tokens is not None or permit.completion_tokens is not None:
+            return ((permit.prompt_tokens or 0) * pricing[0] + (permit.completion_tokens or 0) * pricing[1]) / 1000
+        return permit.used_tokens * (pricing[0] + pricing[1]) / 2 / 1000
+
+    def record_usage(self, model: Optional[str], usage: Any, priority: Optional[str] = None):
+        """
+        Charge a call that bypassed ``acquire`` (e.g. the synchronous client, possibly
+        from a worker thread): only counters move, waiters see it on their next dispatch.
+        """
+        budget = self.budget_for(model)
+        priority = priority or current_llm_priority()
+        permit = LLMPermit(budget.model, priority if priority in PRIORITY_ORDER else PRIORITY_TASK, 0, 0.0)
+        permit.record_usage(usage)
+        if permit.used_tokens is not None:
+            budget.refill(time.monotonic())
+            budget.debit(permit.priority, 0)
+            self.settle(permit, dispatch=False)
+
+    # === AIMD ADAPTATION ===
+
+    def on_success(self, permit: LLMPermit):
+        budget = self.budget_for(permit.model)
+        if budget.factor < 1.0:
+            budget.factor = min(1.0, budget.factor + LLM_AIMD_INCREASE)
+
+    def on_rate_limited(self, model: Optional[str], headers: Optional[Mapping[str, str]] = None):
+        """Multiplicative decrease plus a pause honouring ``retry-after`` / ``x-ratelimit-*``."""
+        budget = self.budget_for(model)
+        now = time.monotonic()
+        budget.stats["rate_limited"] += 1
+        headers = {str(key).lower(): value for key, value in (headers or {}).items()}
+        self.apply_headers(budget.model, headers)
+
+        # A burst of concurrent 429s is one congestion signal, not many
+        if now - budget.last_decrease >= 1.0:
+            budget.factor = max(LLM_AIMD_MIN_FACTOR, budget.factor * LLM_AIMD_DECREASE)
+            budget.last_decrease = now
+            budget.requests = min(budget.requests, budget.rpm)
+            budget.tokens = min(budget.tokens, budget.tpm)
+            logger.warning(
+                f"🚫 LLM rate limited on {budget.model}: effective rate now "
+                f"{budget.rpm:.0f} rpm / {budget.tpm:.0f} tpm"
+            )
+
+        pause = _parse_duration(headers.get("retry-after"))
+        if pause is None:
+            resets = [
+                _parse_duration(headers.get("x-ratelimit-reset-requests")),
+                _parse_duration(headers.get("x-ratelimit-reset-tokens")),
+            ]
+            pause = max((value for value in resets if value is not None), default=1.0)
+        budget.paused_until = max(budget.paused_until, now + min(pause, 60.0))
+        if budget.waiters:
+            self._dispatch(budget)
+
+    def apply_headers(self, model: Optional[str], headers: Mapping[str, str]):
+        """Learn limits and remaining budget from ``x-ratelimit-*`` response headers."""
+        budget = self.budget_for(model)
+        headers = {str(key).lower(): value for key, value in headers.items()}
+        try:
+            if headers.get("x-ratelimit-limit-requests"):
+                budget.configured_rpm = max(1.0, float(headers["x-ratelimit-limit-requests"]))
+            if headers.get("x-ratelimit-limit-tokens"):
+                budget.configured_tpm = max(1.0, float(headers["x-ratelimit-limit-tokens"]))
+            budget.refill(time.monotonic())
+            if headers.get("x-ratelimit-remaining-requests") is not None:
+                budget.requests = min(budget.requests, float(headers["x-ratelimit-remaining-requests"]))
+            if headers.get("x-ratelimit-remaining-tokens") is not None:
+                budget.tokens = min(budget.tokens, float(headers["x-ratelimit-remaining-tokens"]))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Ignoring malformed rate limit headers for {budget.model}: {e}")
+
+    # === CALL WRAPPER ===
+
+    @asynccontextmanager
+    async def limit(self, model: Optional[str], tokens: int, priority: Optional[str] = None):
+        """
+        ``async with llm_rate_limiter.limit(model, tokens) as permit:`` around one
+        LLM call; call ``permit.record_usage(response.usage)`` when available.
+        """
+        permit = await self.acquire(model, tokens, priority)
+        try:
+            yield permit
+        except BaseException as e:
+            if isinstance(e, Exception) and is_rate_limit_error(e):
+                response = getattr(e, "response", None)
+                self.on_rate_limited(permit.model, getattr(response, "headers", None))
+            raise
+        else:
+            self.on_success(permit)
+        finally:
+            self.settle(permit)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "models": {model: budget.snapshot() for model, budget in self.budgets.items()},
+            "reserves": dict(PRIORITY_RESERVES),
+        }
+
+
+# Global instance shared by AIProviderManager and the OpenAI client factory
+llm_rate_limiter = LLMRateLimiter()
+
+__all__ = [
+    "LLMRateLimiter",
+    "LLMPermit",
+    "llm_rate_limiter",
+    "llm_priority",
+    "current_llm_priority",
+    "estimate_tokens",
+    "is_rate_limit_error",
+    "PRIORITY_INTERACTIVE",
+    "PRIORITY_TASK",
+    "PRIORITY_BACKGROUND",
+]
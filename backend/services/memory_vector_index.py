@@ -0,0 +1,363 @@
+# backend/services/memory_vector_index.py
+"""
+Memory Vector Index - local embedding search for UnifiedMemoryEngine
+Replaces the per-query LLM ranking of memory_context_entries with a vectorized
+dot product over embeddings that are computed once, when a context is stored (or
+when a workspace is first loaded from the database).
+
+- Embedders are pluggable. HashingEmbedder is fully local (signed feature hashing
+  of word unigrams + bigrams, L2-normalised) so ranking works offline and costs no
+  tokens; OpenAIEmbedder can be selected with MEMORY_EMBEDDER=openai.
+- Each workspace owns a flat float32 matrix (NumPy when available, pure Python
+  otherwise) with incremental upserts and a bounded size; ranking is one matrix-
+  vector product plus a partial sort.
+- Local hashing of batches runs in a worker thread, and periodic reloads only
+  embed rows whose id is new or whose text changed (crc32 fingerprint).
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import re
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+MEMORY_EMBEDDER = os.getenv("MEMORY_EMBEDDER", "hashing").lower()
+MEMORY_EMBEDDING_DIM = int(os.getenv("MEMORY_EMBEDDING_DIM", "512"))
+MEMORY_INDEX_MAX_ENTRIES = int(os.getenv("MEMORY_INDEX_MAX_ENTRIES", "5000"))
+# Seconds before a workspace index is reloaded from the database, to pick up rows
+# written by other processes
+MEMORY_INDEX_REFRESH_SECONDS = float(os.getenv("MEMORY_INDEX_REFRESH_SECONDS", "300"))
+# Batches up to this size are hashed inline; larger ones go to a worker thread
+MEMORY_EMBED_INLINE_MAX = int(os.getenv("MEMORY_EMBED_INLINE_MAX", "8"))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def context_to_text(context_type: str, content: Any) -> str:
+    """Flatten a context entry into the text that gets embedded."""
+    if isinstance(content, str):
+        body = content
+    else:
+        body = json.dumps(content, default=str, ensure_ascii=False)
+    return f"{context_type} {body}"
+
+
+class HashingEmbedder:
+    """Local, stateless embedder: signed feature hashing of unigrams and bigrams."""
+
+    name = "hashing"
+
+    def __init__(self, dim: int = MEMORY_EMBEDDING_DIM):
+        self.dim = dim
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dim
+        tokens = _TOKEN_RE.findall(text.lower())
+        features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        for feature in features:
+            # crc32 is stable across processes (unlike hash()) and cheap
+            h = zlib.crc32(feature.encode("utf-8"))
+            vector[h % self.dim] += 1.0 if (h >> 31) & 1 else -1.0
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm:
+            vector = [v / norm for v in vector]
+        return vector
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+    async def aembed(self, texts: Sequence[str]) -> List[List[float]]:
+        if len(texts) <= MEMORY_EMBED_INLINE_MAX:
+            return self.embed(texts)
+        # CPU-bound (~0.25 ms per entry): keep the event loop free for large batches
+        return await asyncio.to_thread(self.embed, list(texts))
+
+
+class OpenAIEmbedder:
+    """Remote embedder backed by the OpenAI embeddings endpoint."""
+
+    name = "openai"
+
+    def __init__(self, client, model: str = os.getenv("MEMORY_EMBEDDING_MODEL", "text-embedding-3-small"),
+                 dim: int = MEMORY_EMBEDDING_DIM):
+        self.client = client
+        self.model = model
+        self.dim = dim
+
+    async def aembed(self, texts: Sequence[str]) -> List[List[float]]:
+        response = await self.client.embeddings.create(
+            model=self.model, input=[text[:8000] for text in texts], dimensions=self.dim
+        )
+        return [item.embedding for item in response.data]
+
+
+def text_fingerprint(text: str) -> int:
+    """Cheap change detector for indexed text."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def create_embedder(openai_client=None):
+    """Build the embedder selected by MEMORY_EMBEDDER, falling back to local hashing."""
+    if MEMORY_EMBEDDER == "openai" and openai_client is not None:
+        return OpenAIEmbedder(openai_client)
+    return HashingEmbedder()
+
+
+class WorkspaceVectorIndex:
+    """Flat (exact) inner-product index for one workspace."""
+
+    def __init__(self, dim: int, max_entries: int = MEMORY_INDEX_MAX_ENTRIES):
+        self.dim = dim
+        self.max_entries = max_entries
+        self.ids: List[str] = []
+        self.positions: Dict[str, int] = {}
+        self.payloads: List[Any] = []
+        self.context_types: List[str] = []
+        self.importance: List[float] = []
+        self.created_at: List[float] = []
+        self.fingerprints: List[Optional[int]] = []
+        self._size = 0
+        self._matrix = np.zeros((16, dim), dtype=np.float32) if HAS_NUMPY else []
+        self.loaded_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def fingerprint(self, entry_id: str) -> Optional[int]:
+        position = self.positions.get(entry_id)
+        return self.fingerprints[position] if position is not None else None
+
+    def upsert(self, entry_id: str, vector: Optional[Sequence[float]], payload: Any, context_type: str,
+               importance: float, created_at: float, fingerprint: Optional[int] = None):
+        """Insert or update a row; ``vector=None`` keeps the stored vector of an existing row."""
+        position = self.positions.get(entry_id)
+        if position is None:
+            if vector is None:
+                raise ValueError(f"vector required for new entry {entry_id}")
+            if self._size >= self.max_entries:
+                self._evict_oldest()
+            position = self._size
+            self._size += 1
+            self.positions[entry_id] = position
+            self.ids.append(entry_id)
+            self.payloads.append(payload)
+            self.context_types.append(context_type)
+            self.importance.append(importance)
+            self.created_at.append(created_at)
+            self.fingerprints.append(fingerprint)
+            if HAS_NUMPY:
+                if position >= self._matrix.shape[0]:
+                    grown = np.zeros((self._matrix.shape[0] * 2, self.dim), dtype=np.float32)
+                    grown[:position] = self._matrix[:position]
+                    self._matrix = grown
+            else:
+                self._matrix.append(None)
+        else:
+            self.payloads[position] = payload
+            self.context_types[position] = context_type
+            self.importance[position] = importance
+            self.created_at[position] = created_at
+            if vector is None:
+                return
+            self.fingerprints[position] = fingerprint
+
+        if HAS_NUMPY:
+            self._matrix[position] = np.asarray(vector, dtype=np.float32)
+        else:
+            self._matrix[position] = list(vector)
+
+    def _evict_oldest(self):
+        oldest = min(range(self._size), key=self.created_at.__getitem__)
+        self.remove(self.ids[oldest])
+
+    def remove(self, entry_id: str) -> bool:
+        position = self.positions.pop(entry_id, None)
+        if position is None:
+            return False
+        last = self._size - 1
+        if position != last:
+            # Swap-remove keeps rows contiguous
+            moved_id = self.ids[last]
+            self.ids[position] = moved_id
+            self.payloads[position] = self.payloads[last]
+            self.context_types[position] = self.context_types[last]
+            self.importance[position] = self.importance[last]
+            self.created_at[position] = self.created_at[last]
+            self.fingerprints[position] = self.fingerprints[last]
+            self._matrix[position] = self._matrix[last]
+            self.positions[moved_id] = position
+        for column in (self.ids, self.payloads, self.context_types, self.importance, self.created_at,
+                       self.fingerprints):
+            column.pop()
+        if not HAS_NUMPY:
+            self._matrix.pop()
+        self._size = last
+        return True
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        k: int,
+        context_types: Optional[Iterable[str]] = None,
+        min_created_at: Optional[float] = None,
+        importance_weight: float = 0.5,
+    ) -> List[Tuple[Any, float]]:
+        """Top-k payloads by cosine similarity scaled by importance."""
+        if not self._size or k <= 0:
+            return []
+        allowed_types = set(context_types) if context_types else None
+        eligible = [
+            i for i in range(self._size)
+            if (allowed_types is None or self.context_types[i] in allowed_types)
+            and (min_created_at is None or self.created_at[i] >= min_created_at)
+        ]
+        if not eligible:
+            return []
+
+        if HAS_NUMPY:
+            rows = np.asarray(eligible)
+            query = np.asarray(query_vector, dtype=np.float32)
+            scores = self._matrix[rows] @ query
+            weights = (1.0 - importance_weight) + importance_weight * np.asarray(
+                [self.importance[i] for i in eligible], dtype=np.float32
+            )
+            scores = scores * weights
+            top = min(k, len(eligible))
+            best = np.argpartition(-scores, top - 1)[:top]
+            best = best[np.argsort(-scores[best])]
+            return [(self.payloads[eligible[j]], float(scores[j])) for j in best]
+
+        scored = []
+        for i in eligible:
+            similarity = sum(a * b for a, b in zip(self._matrix[i], query_vector))
+            weight = (1.0 - importance_weight) + importance_weight * self.importance[i]
+            scored.append((similarity * weight, i))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [(self.payloads[i], score) for score, i in scored[:k]]
+
+
+class MemoryVectorIndex:
+    """Per-workspace vector indexes sharing one embedder."""
+
+    def __init__(self, embedder=None, max_entries_per_workspace: int = MEMORY_INDEX_MAX_ENTRIES,
+                 refresh_seconds: float = MEMORY_INDEX_REFRESH_SECONDS):
+        self.embedder = embedder or HashingEmbedder()
+        self.max_entries_per_workspace = max_entries_per_workspace
+        self.refresh_seconds = refresh_seconds
+        self._indexes: Dict[str, WorkspaceVectorIndex] = {}
+        self.stats = {"upserts": 0, "searches": 0, "loads": 0, "embedded": 0, "embed_skipped": 0,
+                      "embed_seconds": 0.0, "search_seconds": 0.0}
+
+    def _index(self, workspace_id: str) -> WorkspaceVectorIndex:
+        index = self._indexes.get(workspace_id)
+        if index is None:
+            index = WorkspaceVectorIndex(self.embedder.dim, self.max_entries_per_workspace)
+            self._indexes[workspace_id] = index
+        return index
+
+    def is_loaded(self, workspace_id: str) -> bool:
+        index = self._indexes.get(workspace_id)
+        return (
+            index is not None
+            and index.loaded_at is not None
+            and time.monotonic() - index.loaded_at < self.refresh_seconds
+        )
+
+    async def upsert_many(self, workspace_id: str, entries: Sequence[Tuple[str, str, Any, str, float, float]]):
+        """
+        Embed and upsert (entry_id, text, payload, context_type, importance, created_at) tuples.
+        Rows already indexed with the same text only get their metadata refreshed.
+        """
+        if not entries:
+            return
+        index = self._index(workspace_id)
+        fingerprints = [text_fingerprint(text) for _, text, *_ in entries]
+        stale = [i for i, (entry, fingerprint) in enumerate(zip(entries, fingerprints))
+                 if index.fingerprint(entry[0]) != fingerprint]
+        vectors: Dict[int, List[float]] = {}
+        if stale:
+            start = time.perf_counter()
+            embedded = await self.embedder.aembed([entries[i][1] for i in stale])
+            self.stats["embed_seconds"] += time.perf_counter() - start
+            vectors = dict(zip(stale, embedded))
+        for i, (entry_id, _, payload, context_type, importance, created_at) in enumerate(entries):
+            index.upsert(entry_id, vectors.get(i), payload, context_type, importance, created_at, fingerprints[i])
+        self.stats["upserts"] += len(entries)
+        self.stats["embedded"] += len(stale)
+        self.stats["embed_skipped"] += len(entries) - len(stale)
+
+    async def upsert(self, workspace_id: str, entry_id: str, text: str, payload: Any, context_type: str,
+                     importance: float, created_at: float):
+        await self.upsert_many(workspace_id, [(entry_id, text, payload, context_type, importance, created_at)])
+
+    async def load_workspace(self, workspace_id: str, entries: Sequence[Tuple[str, str, Any, str, float, float]]):
+        """Bulk (re)load a workspace from the database; entries stored meanwhile are kept."""
+        await self.upsert_many(workspace_id, entries)
+        self._index(workspace_id).loaded_at = time.monotonic()
+        self.stats["loads"] += 1
+
+    async def search(
+        self,
+        workspace_id: str,
+        query: str,
+        k: int,
+        context_types: Optional[Iterable[str]] = None,
+        min_created_at: Optional[float] = None,
+    ) -> List[Tuple[Any, float]]:
+        index = self._indexes.get(workspace_id)
+        if index is None:
+            return []
+        query_vector = (await self.embedder.aembed([query]))[0]
+        start = time.perf_counter()
+        results = index.search(query_vector, k, context_types, min_created_at)
+        self.stats["search_seconds"] += time.perf_counter() - start
+        self.stats["searches"] += 1
+        return results
+
+    def remove(self, workspace_id: str, entry_id: str) -> bool:
+        index = self._indexes.get(workspace_id)
+        return index.remove(entry_id) if index else False
+
+    def drop_workspace(self, workspace_id: str):
+        self._indexes.pop(workspace_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        searches = self.stats["searches"]
+        return {
+            "embedder": self.embedder.name,
+            "dim": self.embedder.dim,
+            "numpy": HAS_NUMPY,
+            "workspaces": len(self._indexes),
+            "entries": sum(len(index) for index in self._indexes.values()),
+            "upserts": self.stats["upserts"],
+            "searches": searches,
+            "loads": self.stats["loads"],
+            "embedded": self.stats["embedded"],
+            "embed_skipped": self.stats["embed_skipped"],
+            "avg_search_us": round(self.stats["search_seconds"] / searches * 1e6, 1) if searches else 0.0,
+        }
+
+
+__all__ = [
+    "HashingEmbedder",
+    "OpenAIEmbedder",
+    "WorkspaceVectorIndex",
+    "MemoryVectorIndex",
+    "create_embedder",
+    "context_to_text",
+    "text_fingerprint",
+    "HAS_NUMPY",
+]
@@ -5,8 +5,10 @@ Provides centralized service discovery, health monitoring, and dependency tracki
 """
 
 import os
+import time
 import importlib
 import logging
+import threading
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -50,11 +52,62 @@ class ServiceInfo:
     error_count: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+class LazyService:
+    """
+    Proxy for a service singleton that is imported and constructed on first use.
+
+    ``target`` is ``"module.path:attribute"``; attribute access on the proxy
+    resolves the target once (thread-safe) and forwards to the real object.
+    """
+
+    def __init__(self, name: str, target: str, registry: "ServiceRegistry"):
+        module_path, _, attribute = target.partition(":")
+        self._name = name
+        self._module_path = module_path
+        self._attribute = attribute
+        self._registry = registry
+        self._instance: Any = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def resolve(self) -> Any:
+        """Import the module and return the service object, loading it on first call"""
+        if self._loaded:
+            return self._instance
+        with self._lock:
+            if not self._loaded:
+                started = time.perf_counter()
+                try:
+                    module = importlib.import_module(self._module_path)
+                    instance = getattr(module, self._attribute) if self._attribute else module
+                except Exception:
+                    self._registry._record_lazy_load(self._name, None, failed=True)
+                    raise
+                self._instance = instance
+                self._loaded = True
+                self._registry._record_lazy_load(self._name, time.perf_counter() - started)
+        return self._instance
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.resolve(), item)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._loaded else "deferred"
+        return f"<LazyService {self._name} ({self._module_path}:{self._attribute}) {state}>"
+
 class ServiceRegistry:
     """Central registry for managing services"""
     
     def __init__(self):
         self.services: Dict[str, ServiceInfo] = {}
+        self.lazy_services: Dict[str, LazyService] = {}
         self.services_dir = Path(__file__).parent
         self._initialize_core_services()
         
@@ -195,10 +248,10 @@ class ServiceRegistry:
     
     def register_service(self, name: str, category: ServiceCategory, status: ServiceStatus,
                         description: str, dependencies: List[str] = None, 
-                        owner: str = "unknown") -> None:
+                        owner: str = "unknown", module_path: Optional[str] = None) -> None:
         """Register a new service"""
         
-        module_path = f"services.{name}"
+        module_path = module_path or f"services.{name}"
         
         service_info = ServiceInfo(
             name=name,
@@ -213,6 +266,56 @@ class ServiceRegistry:
         self.services[name] = service_info
         logger.debug(f"Registered service: {name}")
     
+    def lazy(self, name: str, target: str,
+             category: ServiceCategory = ServiceCategory.CORE_SYSTEM,
+             status: ServiceStatus = ServiceStatus.ACTIVE,
+             description: str = "", owner: str = "unknown") -> LazyService:
+        """
+        Register a service whose singleton is only imported on first use.
+
+        ``target`` is ``"module.path:attribute"`` (attribute optional). Returns a
+        proxy; the same proxy is returned for repeated registrations of a name.
+        """
+        if name in self.lazy_services:
+            return self.lazy_services[name]
+
+        module_path = target.partition(":")[0]
+        if name not in self.services:
+            self.register_service(name, category, status, description or f"Lazily loaded {target}",
+                                  owner=owner, module_path=module_path)
+        self.services[name].metadata.update({"lazy": True, "target": target, "loaded": False})
+
+        proxy = LazyService(name, target, self)
+        self.lazy_services[name] = proxy
+        return proxy
+
+    def _record_lazy_load(self, name: str, seconds: Optional[float], failed: bool = False) -> None:
+        service = self.services.get(name)
+        if not service:
+            return
+        if failed:
+            service.error_count += 1
+            service.health_status = "import_error"
+            logger.error(f"❌ Lazy service {name} failed to load")
+            return
+        service.import_count += 1
+        service.health_status = "healthy"
+        service.last_health_check = datetime.now()
+        service.metadata.update({"loaded": True, "load_seconds": round(seconds, 4)})
+        logger.info(f"📦 Lazy service {name} loaded in {seconds * 1000:.0f}ms")
+
+    def get_lazy_service_stats(self) -> Dict[str, Any]:
+        """Load state and first-use import time of every lazily registered service"""
+        loaded = {name: self.services[name].metadata.get("load_seconds")
+                  for name, proxy in self.lazy_services.items() if proxy.loaded}
+        return {
+            "registered": len(self.lazy_services),
+            "loaded": len(loaded),
+            "deferred": sorted(name for name, proxy in self.lazy_services.items() if not proxy.loaded),
+            "load_seconds": loaded,
+            "total_load_seconds": round(sum(v or 0 for v in loaded.values()), 4),
+        }
+
     def get_service(self, name: str) -> Optional[ServiceInfo]:
         """Get service information"""
         return self.services.get(name)
@@ -293,6 +396,7 @@ class ServiceRegistry:
             "total_services": total_services,
             "status_distribution": status_counts,
             "category_distribution": category_counts,
+            "lazy_services": self.get_lazy_service_stats(),
             "last_updated": datetime.now().isoformat()
         }
     
@@ -330,7 +434,9 @@ class ServiceRegistry:
                 continue
                 
             service_name = file_path.stem
-            if service_name not in self.services:
+            if service_name not in self.services and f"services.{service_name}" not in {
+                service.module_path for service in self.services.values()
+            }:
                 discovered.append(service_name)
         
         return discovered
@@ -359,6 +465,10 @@ def get_service_stats() -> Dict[str, Any]:
     """Get service registry statistics"""
     return service_registry.get_service_stats()
 
+def lazy_service(name: str, target: str, **kwargs) -> LazyService:
+    """Register a service singleton that is imported on first use"""
+    return service_registry.lazy(name, target, **kwargs)
+
 if __name__ == "__main__":
     # Test the service registry
     print("AI Team Orchestrator - Service Registry")
@@ -1,19 +1,33 @@
 """
 🤖 AI-Driven System Telemetry and Monitoring
 Advanced telemetry, logging, and proactive alerting for the goal-driven orchestration system
+
+Collection cost is constant: task and workspace figures come from SQL aggregate
+RPCs (migration 027), service-level rates from in-process counters
+(utils/telemetry_counters.py), and history is kept in fixed-size rings.
 """
 
 import asyncio
+import gzip
 import json
 import logging
+import logging.handlers
 import os
+import shutil
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from collections import defaultdict
+from dataclasses import dataclass, asdict, fields
+from collections import defaultdict, deque
+
+from utils.telemetry_counters import MetricRing, telemetry_counters
 
 logger = logging.getLogger(__name__)
 
+TELEMETRY_LOG_MAX_BYTES = int(os.getenv("TELEMETRY_LOG_MAX_BYTES", str(5 * 1024 * 1024)))
+TELEMETRY_LOG_BACKUPS = int(os.getenv("TELEMETRY_LOG_BACKUPS", "5"))
+CRITICAL_TASK_KEYWORDS = ('urgent', 'critical', 'emergency')
+
 @dataclass
 class SystemAlert:
     """System alert with metadata"""
@@ -41,12 +55,13 @@ class TelemetryMetrics:
     pending_tasks_total: int
     critical_tasks_total: int
     task_completion_rate: float  # tasks/hour
-    average_task_wait_time: float  # minutes
-    anti_loop_triggers: int
-    achievement_extraction_success_rate: float
-    goal_update_success_rate: float
-    ai_confidence_average: float
-    workspace_recovery_actions: int
+    average_task_wait_time: Optional[float]  # minutes; None without the aggregate RPC
+    anti_loop_triggers: int  # since the previous collection
+    achievement_extraction_success_rate: Optional[float]  # None until attempts are recorded
+    goal_update_success_rate: Optional[float]
+    ai_confidence_average: Optional[float]
+    workspace_recovery_actions: int  # since the previous collection
+    quality_gate_approval_rate: Optional[float] = None
 
 class SystemTelemetryMonitor:
     """
@@ -56,8 +71,14 @@ class SystemTelemetryMonitor:
     """
     
     def __init__(self):
-        self.metrics_history: List[TelemetryMetrics] = []
+        self.max_history_entries = int(os.getenv("MAX_TELEMETRY_HISTORY", "1000"))
+        self.metrics_history: deque = deque(maxlen=self.max_history_entries)
         self.alert_history: List[SystemAlert] = []
+        # Rolling time series per numeric metric, one fixed-size ring each
+        self.series: Dict[str, MetricRing] = {}
+        self._counter_baseline: Dict[str, int] = {}
+        # Until this time the aggregate RPCs are skipped (set after a failed call)
+        self._aggregate_rpcs_retry_at = 0.0
         
         # Configuration
         self.monitoring_enabled = os.getenv("ENABLE_ADVANCED_TELEMETRY", "true").lower() == "true"
@@ -73,9 +94,9 @@ class SystemTelemetryMonitor:
             "ai_confidence_warning": float(os.getenv("AI_CONFIDENCE_WARNING_THRESHOLD", "0.5")),
         }
         
-        # Telemetry storage
-        self.telemetry_file = os.getenv("TELEMETRY_LOG_FILE", "system_telemetry.json")
-        self.max_history_entries = int(os.getenv("MAX_TELEMETRY_HISTORY", "1000"))
+        # Telemetry storage: JSON lines, rotated by size, rotated files gzip-compressed
+        self.telemetry_file = os.getenv("TELEMETRY_LOG_FILE", "system_telemetry.jsonl")
+        self._file_logger: Optional[logging.Logger] = None
         
         logger.info("🤖 SystemTelemetryMonitor initialized with proactive alerting")
     
@@ -86,12 +107,12 @@ class SystemTelemetryMonitor:
         try:
             logger.debug("📊 Collecting comprehensive system telemetry...")
             
-            # System health calculations
-            system_health = await self._calculate_system_health()
-            
             # Workspace metrics
             workspace_metrics = await self._collect_workspace_metrics()
             
+            # System health calculations
+            system_health = await self._calculate_system_health(workspace_metrics)
+            
             # Task metrics  
             task_metrics = await self._collect_task_metrics()
             
@@ -109,20 +130,18 @@ class SystemTelemetryMonitor:
                 pending_tasks_total=task_metrics.get("pending", 0),
                 critical_tasks_total=task_metrics.get("critical", 0),
                 task_completion_rate=task_metrics.get("completion_rate", 0.0),
-                average_task_wait_time=task_metrics.get("avg_wait_time", 0.0),
+                average_task_wait_time=task_metrics.get("avg_wait_time"),
                 anti_loop_triggers=system_metrics.get("anti_loop_triggers", 0),
-                achievement_extraction_success_rate=ai_metrics.get("extraction_success_rate", 0.0),
-                goal_update_success_rate=ai_metrics.get("goal_update_success_rate", 0.0),
-                ai_confidence_average=ai_metrics.get("avg_confidence", 0.0),
-                workspace_recovery_actions=system_metrics.get("recovery_actions", 0)
+                achievement_extraction_success_rate=ai_metrics.get("extraction_success_rate"),
+                goal_update_success_rate=ai_metrics.get("goal_update_success_rate"),
+                ai_confidence_average=ai_metrics.get("avg_confidence"),
+                workspace_recovery_actions=system_metrics.get("recovery_actions", 0),
+                quality_gate_approval_rate=ai_metrics.get("quality_gate_approval_rate")
             )
             
-            # Store metrics
+            # Store metrics (bounded ring) and feed the per-metric time series
             self.metrics_history.append(telemetry)
-            
-            # Keep history size manageable
-            if len(self.metrics_history) > self.max_history_entries:
-                self.metrics_history = self.metrics_history[-self.max_history_entries:]
+            self._record_series(telemetry)
             
             # Analyze for proactive alerts
             if self.alert_enabled:
@@ -148,28 +167,24 @@ class SystemTelemetryMonitor:
                 task_completion_rate=0.0,
                 average_task_wait_time=0.0,
                 anti_loop_triggers=0,
-                achievement_extraction_success_rate=0.0,
-                goal_update_success_rate=0.0,
-                ai_confidence_average=0.0,
+                achievement_extraction_success_rate=None,
+                goal_update_success_rate=None,
+                ai_confidence_average=None,
                 workspace_recovery_actions=0
             )
     
-    async def _calculate_system_health(self) -> float:
+    async def _calculate_system_health(self, workspace_metrics: Optional[Dict[str, int]] = None) -> float:
         """Calculate overall system health score (0.0 to 1.0)"""
         try:
             health_components = []
             
             # Component 1: Workspace health
             try:
-                from database import supabase
-                from models import WorkspaceStatus
-                
-                workspaces_response = supabase.table('workspaces').select('status').execute()
-                workspaces = workspaces_response.data or []
+                if workspace_metrics is None:
+                    workspace_metrics = await self._collect_workspace_metrics()
                 
-                if workspaces:
-                    active_count = len([w for w in workspaces if w.get('status') == WorkspaceStatus.ACTIVE.value])
-                    workspace_health = active_count / len(workspaces)
+                if workspace_metrics.get("total"):
+                    workspace_health = workspace_metrics["active"] / workspace_metrics["total"]
                     health_components.append(workspace_health)
             except Exception as e:
                 logger.debug(f"Error calculating workspace health: {e}")
@@ -205,19 +220,20 @@ class SystemTelemetryMonitor:
             return 0.5
     
     async def _collect_workspace_metrics(self) -> Dict[str, int]:
-        """Collect workspace status metrics"""
+        """Collect workspace status metrics (one grouped count, no rows transferred)"""
         try:
-            from database import supabase
+            from database import async_supabase
             from models import WorkspaceStatus
             
-            workspaces_response = supabase.table('workspaces').select('status').execute()
-            workspaces = workspaces_response.data or []
+            counts = await self._workspace_status_counts(async_supabase, [
+                WorkspaceStatus.ACTIVE.value, WorkspaceStatus.PAUSED.value, WorkspaceStatus.COMPLETED.value
+            ])
             
             metrics = {
-                "active": len([w for w in workspaces if w.get('status') == WorkspaceStatus.ACTIVE.value]),
-                "paused": len([w for w in workspaces if w.get('status') == WorkspaceStatus.PAUSED.value]),
-                "completed": len([w for w in workspaces if w.get('status') == WorkspaceStatus.COMPLETED.value]),
-                "total": len(workspaces)
+                "active": counts.get(WorkspaceStatus.ACTIVE.value, 0),
+                "paused": counts.get(WorkspaceStatus.PAUSED.value, 0),
+                "completed": counts.get(WorkspaceStatus.COMPLETED.value, 0),
+                "total": counts.get("__total__", sum(counts.values()))
             }
             
             return metrics
@@ -226,82 +242,135 @@ class SystemTelemetryMonitor:
             logger.warning(f"Error collecting workspace metrics: {e}")
             return {"active": 0, "paused": 0, "completed": 0, "total": 0}
     
+    async def _workspace_status_counts(self, db, statuses: List[str]) -> Dict[str, int]:
+        """Workspaces per status via the telemetry_workspace_status_counts RPC, else one count query per status"""
+        if time.time() >= self._aggregate_rpcs_retry_at:
+            try:
+                response = await db.rpc('telemetry_workspace_status_counts', {}).execute()
+                counts = {row['status']: int(row['workspace_count']) for row in response.data or []}
+                counts["__total__"] = sum(counts.values())
+                return counts
+            except Exception as e:
+                self._disable_aggregate_rpcs(e)
+        
+        counts = {}
+        for status in statuses:
+            response = await db.table('workspaces').select('id', count='exact').eq('status', status).limit(1).execute()
+            counts[status] = response.count or 0
+        response = await db.table('workspaces').select('id', count='exact').limit(1).execute()
+        counts["__total__"] = response.count or 0
+        return counts
+    
     async def _collect_task_metrics(self) -> Dict[str, float]:
-        """Collect task processing metrics"""
+        """Collect task processing metrics (aggregated in SQL, no per-task rows transferred)"""
         try:
-            from database import supabase
-            
-            # Get pending tasks
-            pending_response = supabase.table('tasks').select('id, created_at').eq('status', 'pending').execute()
-            pending_tasks = pending_response.data or []
+            from database import async_supabase
             
-            # Get completed tasks from last hour
             one_hour_ago = (datetime.now() - timedelta(hours=1)).isoformat()
-            completed_response = supabase.table('tasks').select('id').eq('status', 'completed').gte('updated_at', one_hour_ago).execute()
-            completed_tasks = completed_response.data or []
             
-            # Calculate wait times
-            total_wait = 0.0
-            for task in pending_tasks:
+            if time.time() >= self._aggregate_rpcs_retry_at:
                 try:
-                    created_at = datetime.fromisoformat(task['created_at'].replace('Z', '+00:00'))
-                    wait_time = (datetime.now().replace(tzinfo=created_at.tzinfo) - created_at).total_seconds() / 60
-                    total_wait += wait_time
-                except:
-                    continue
-            
-            avg_wait_time = total_wait / len(pending_tasks) if pending_tasks else 0.0
-            completion_rate = len(completed_tasks)  # tasks per hour
-            
-            # Count critical tasks
-            critical_count = 0
-            for task in pending_tasks:
-                # Would use actual critical task detection here
-                if any(keyword in task.get('name', '').lower() for keyword in ['urgent', 'critical', 'emergency']):
-                    critical_count += 1
-            
-            return {
-                "pending": len(pending_tasks),
-                "critical": critical_count,
-                "completion_rate": completion_rate,
-                "avg_wait_time": avg_wait_time
-            }
+                    response = await async_supabase.rpc(
+                        'telemetry_task_summary', {'p_completed_since': one_hour_ago}
+                    ).execute()
+                    row = (response.data or [{}])[0]
+                    return {
+                        "pending": int(row.get("pending_count") or 0),
+                        "critical": int(row.get("critical_count") or 0),
+                        "completion_rate": float(row.get("completed_since_count") or 0),  # tasks per hour
+                        "avg_wait_time": float(row.get("avg_wait_minutes") or 0.0)
+                    }
+                except Exception as e:
+                    self._disable_aggregate_rpcs(e)
+            
+            return await self._collect_task_metrics_with_counts(async_supabase, one_hour_ago)
             
         except Exception as e:
             logger.warning(f"Error collecting task metrics: {e}")
-            return {"pending": 0, "critical": 0, "completion_rate": 0.0, "avg_wait_time": 0.0}
+            return {"pending": 0, "critical": 0, "completion_rate": 0.0, "avg_wait_time": None}
     
-    async def _collect_ai_performance_metrics(self) -> Dict[str, float]:
-        """Collect AI system performance metrics"""
+    async def _collect_task_metrics_with_counts(self, db, one_hour_ago: str) -> Dict[str, Optional[float]]:
+        """
+        Fallback without the RPC: exact count queries only. The average wait needs an
+        aggregate over every pending task, so it is reported as None rather than
+        estimated from a sample.
+        """
+        pending_response = await db.table('tasks').select('id', count='exact').eq('status', 'pending').limit(1).execute()
+        critical_response = await db.table('tasks').select('id', count='exact').eq('status', 'pending')\
+            .or_(','.join(f'name.ilike.%{keyword}%' for keyword in CRITICAL_TASK_KEYWORDS)).limit(1).execute()
+        completed_response = await db.table('tasks').select('id', count='exact')\
+            .eq('status', 'completed').gte('updated_at', one_hour_ago).limit(1).execute()
+        
+        return {
+            "pending": pending_response.count or 0,
+            "critical": critical_response.count or 0,
+            "completion_rate": float(completed_response.count or 0),  # tasks per hour
+            "avg_wait_time": None
+        }
+    
+    def _disable_aggregate_rpcs(self, error: Exception):
+        """The aggregate RPCs failed (e.g. migration 027 not applied): use count queries for the next hour"""
+        self._aggregate_rpcs_retry_at = time.time() + 3600
+        logger.warning(f"⚠️ Telemetry aggregate RPCs unavailable ({error}), falling back to count queries")
+    
+    async def _collect_ai_performance_metrics(self) -> Dict[str, Optional[float]]:
+        """Collect AI system performance metrics from the in-process counters (None until recorded)"""
         try:
-            # Would collect real AI performance data
-            # For now, return reasonable defaults
-            
             return {
-                "extraction_success_rate": 0.85,  # Would track actual success rate
-                "goal_update_success_rate": 0.90,  # Would track actual goal updates
-                "avg_confidence": 0.75  # Would track actual AI confidence scores
+                "extraction_success_rate": telemetry_counters.success_rate("achievement_extraction"),
+                "goal_update_success_rate": telemetry_counters.success_rate("goal_update"),
+                "avg_confidence": telemetry_counters.average("ai_confidence"),
+                "quality_gate_approval_rate": telemetry_counters.success_rate("quality_gate_approval")
             }
             
         except Exception as e:
             logger.warning(f"Error collecting AI metrics: {e}")
-            return {"extraction_success_rate": 0.0, "goal_update_success_rate": 0.0, "avg_confidence": 0.0}
+            return {"extraction_success_rate": None, "goal_update_success_rate": None, "avg_confidence": None,
+                    "quality_gate_approval_rate": None}
     
     async def _collect_system_action_metrics(self) -> Dict[str, int]:
-        """Collect system action metrics (anti-loop, recovery, etc.)"""
+        """Collect system action metrics (anti-loop, recovery, etc.) recorded since the previous collection"""
         try:
-            # Would collect real system action data
-            # For now, return reasonable defaults
-            
             return {
-                "anti_loop_triggers": 0,  # Would track actual anti-loop activations
-                "recovery_actions": 0  # Would track actual recovery actions
+                "anti_loop_triggers": self._counter_delta("anti_loop_triggers"),
+                "recovery_actions": self._counter_delta("recovery_actions")
             }
             
         except Exception as e:
             logger.warning(f"Error collecting system action metrics: {e}")
             return {"anti_loop_triggers": 0, "recovery_actions": 0}
     
+    def _counter_delta(self, name: str) -> int:
+        current = telemetry_counters.counter(name)
+        previous = self._counter_baseline.get(name, 0)
+        self._counter_baseline[name] = current
+        return max(0, current - previous)
+    
+    def _record_series(self, telemetry: TelemetryMetrics):
+        """Append every numeric metric of a snapshot to its time-series ring"""
+        try:
+            timestamp = datetime.fromisoformat(telemetry.timestamp).timestamp()
+        except ValueError:
+            timestamp = time.time()
+        for field_info in fields(telemetry):
+            value = getattr(telemetry, field_info.name)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                ring = self.series.get(field_info.name)
+                if ring is None:
+                    ring = self.series[field_info.name] = MetricRing(self.max_history_entries)
+                ring.append(value, timestamp)
+    
+    def get_time_series(self, metric: str, hours: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Rolling samples of one metric, optionally limited to the last ``hours``"""
+        ring = self.series.get(metric)
+        if ring is None:
+            return []
+        since = time.time() - hours * 3600 if hours else None
+        return [
+            {"timestamp": datetime.fromtimestamp(ts).isoformat(), "value": value}
+            for ts, value in ring.samples if since is None or ts >= since
+        ]
+    
     async def _analyze_for_proactive_alerts(self, telemetry: TelemetryMetrics):
         """
         🤖 AI-DRIVEN: Analyze telemetry for proactive alerts
@@ -329,23 +398,24 @@ class SystemTelemetryMonitor:
                     threshold=self.thresholds["system_health_warning"]
                 ))
             
-            # High task wait times
-            if telemetry.average_task_wait_time >= self.thresholds["task_wait_time_critical"]:
+            # High task wait times (unknown without the aggregate RPC)
+            wait_time = telemetry.average_task_wait_time
+            if wait_time is not None and wait_time >= self.thresholds["task_wait_time_critical"]:
                 alerts.append(SystemAlert(
                     alert_type="task_wait_time",
                     severity="critical",
-                    message=f"Critical task wait time: {telemetry.average_task_wait_time:.1f} minutes",
+                    message=f"Critical task wait time: {wait_time:.1f} minutes",
                     component="task_processor",
-                    metric_value=telemetry.average_task_wait_time,
+                    metric_value=wait_time,
                     threshold=self.thresholds["task_wait_time_critical"]
                 ))
-            elif telemetry.average_task_wait_time >= self.thresholds["task_wait_time_warning"]:
+            elif wait_time is not None and wait_time >= self.thresholds["task_wait_time_warning"]:
                 alerts.append(SystemAlert(
                     alert_type="task_wait_time",
                     severity="warning",
-                    message=f"High task wait time: {telemetry.average_task_wait_time:.1f} minutes",
+                    message=f"High task wait time: {wait_time:.1f} minutes",
                     component="task_processor",
-                    metric_value=telemetry.average_task_wait_time,
+                    metric_value=wait_time,
                     threshold=self.thresholds["task_wait_time_warning"]
                 ))
             
@@ -371,8 +441,9 @@ class SystemTelemetryMonitor:
                     threshold=5
                 ))
             
-            # Low AI confidence
-            if telemetry.ai_confidence_average <= self.thresholds["ai_confidence_warning"]:
+            # Low AI confidence (only once confidence scores have been recorded)
+            if (telemetry.ai_confidence_average is not None
+                    and telemetry.ai_confidence_average <= self.thresholds["ai_confidence_warning"]):
                 alerts.append(SystemAlert(
                     alert_type="low_ai_confidence",
                     severity="warning",
@@ -415,17 +486,32 @@ class SystemTelemetryMonitor:
             logger.error(f"Error processing alert: {e}")
     
     async def _write_telemetry_to_file(self, telemetry: TelemetryMetrics):
-        """Write telemetry data to file for external analysis"""
+        """Append telemetry as a JSON line; the file rotates by size and rotated files are gzip-compressed"""
         try:
             telemetry_data = asdict(telemetry)
-            
-            # Append to telemetry file
-            with open(self.telemetry_file, 'a') as f:
-                f.write(json.dumps(telemetry_data) + '\n')
+            file_logger = self._get_file_logger()
+            await asyncio.to_thread(file_logger.info, json.dumps(telemetry_data))
                 
         except Exception as e:
             logger.warning(f"Error writing telemetry to file: {e}")
     
+    def _get_file_logger(self) -> logging.Logger:
+        if self._file_logger is None:
+            handler = logging.handlers.RotatingFileHandler(
+                self.telemetry_file, maxBytes=TELEMETRY_LOG_MAX_BYTES, backupCount=TELEMETRY_LOG_BACKUPS,
+                encoding="utf-8", delay=True
+            )
+            handler.namer = lambda name: name + ".gz"
+            handler.rotator = _gzip_rotator
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            
+            file_logger = logging.getLogger(f"{__name__}.file.{id(self)}")
+            file_logger.handlers = [handler]
+            file_logger.setLevel(logging.INFO)
+            file_logger.propagate = False
+            self._file_logger = file_logger
+        return self._file_logger
+    
     async def get_system_status_report(self) -> Dict[str, Any]:
         """Get comprehensive system status report"""
         try:
@@ -465,8 +551,9 @@ class SystemTelemetryMonitor:
             if len(self.metrics_history) < 2:
                 return {"status": "insufficient_data"}
             
-            recent_metrics = self.metrics_history[-5:]  # Last 5 data points
-            older_metrics = self.metrics_history[-10:-5] if len(self.metrics_history) >= 10 else self.metrics_history[:-5]
+            history = list(self.metrics_history)
+            recent_metrics = history[-5:]  # Last 5 data points
+            older_metrics = history[-10:-5] if len(history) >= 10 else history[:-5]
             
             if not older_metrics:
                 return {"status": "insufficient_historical_data"}
@@ -475,15 +562,21 @@ class SystemTelemetryMonitor:
             recent_health = sum(m.system_health_score for m in recent_metrics) / len(recent_metrics)
             older_health = sum(m.system_health_score for m in older_metrics) / len(older_metrics)
             
-            recent_wait_time = sum(m.average_task_wait_time for m in recent_metrics) / len(recent_metrics)
-            older_wait_time = sum(m.average_task_wait_time for m in older_metrics) / len(older_metrics)
+            recent_waits = [m.average_task_wait_time for m in recent_metrics if m.average_task_wait_time is not None]
+            older_waits = [m.average_task_wait_time for m in older_metrics if m.average_task_wait_time is not None]
             
-            return {
+            trends = {
                 "system_health": "improving" if recent_health > older_health else "stable" if abs(recent_health - older_health) < 0.1 else "degrading",
-                "task_wait_time": "improving" if recent_wait_time < older_wait_time else "stable" if abs(recent_wait_time - older_wait_time) < 5 else "degrading",
+                "task_wait_time": "unknown",
                 "health_change": recent_health - older_health,
-                "wait_time_change": recent_wait_time - older_wait_time
+                "wait_time_change": None
             }
+            if recent_waits and older_waits:
+                recent_wait_time = sum(recent_waits) / len(recent_waits)
+                older_wait_time = sum(older_waits) / len(older_waits)
+                trends["task_wait_time"] = "improving" if recent_wait_time < older_wait_time else "stable" if abs(recent_wait_time - older_wait_time) < 5 else "degrading"
+                trends["wait_time_change"] = recent_wait_time - older_wait_time
+            return trends
             
         except Exception as e:
             logger.warning(f"Error calculating trends: {e}")
@@ -499,7 +592,7 @@ class SystemTelemetryMonitor:
                 recommendations.append("System health is critical - investigate workspace and task processor issues immediately")
             
             # Task processing recommendations
-            if telemetry.average_task_wait_time > 30:
+            if telemetry.average_task_wait_time is not None and telemetry.average_task_wait_time > 30:
                 recommendations.append(f"High task wait times ({telemetry.average_task_wait_time:.1f} min) - consider increasing task processor capacity")
             
             if telemetry.critical_tasks_total > 5:
@@ -510,7 +603,7 @@ class SystemTelemetryMonitor:
                 recommendations.append("More workspaces paused than active - review pause conditions and recovery mechanisms")
             
             # AI system recommendations
-            if telemetry.ai_confidence_average < 0.6:
+            if telemetry.ai_confidence_average is not None and telemetry.ai_confidence_average < 0.6:
                 recommendations.append(f"Low AI confidence ({telemetry.ai_confidence_average:.2f}) - review AI prompts and models")
             
             # Alert-based recommendations
@@ -527,6 +620,12 @@ class SystemTelemetryMonitor:
         
         return recommendations
 
+def _gzip_rotator(source: str, dest: str):
+    """RotatingFileHandler rotator: compress the full log into ``dest`` (named *.gz) and drop the original"""
+    with open(source, "rb") as plain, gzip.open(dest, "wb") as compressed:
+        shutil.copyfileobj(plain, compressed)
+    os.remove(source)
+
 # Global instance
 system_telemetry_monitor = SystemTelemetryMonitor()
 
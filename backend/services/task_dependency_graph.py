@@ -0,0 +1,177 @@
+"""
+🔗 Task Dependency Graph
+In-memory dependency DAG per workspace used to compute the set of pending tasks
+whose dependencies are all satisfied.
+
+The graph is updated incrementally: adding/removing a pending task touches only its
+own edges, and a status change only visits the tasks that depend on it, so the
+ready set is maintained in O(changed edges) instead of being recomputed with one
+database round-trip per dependency.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# A dependency that no longer exists in the database does not block its dependents
+# (same behaviour as the original per-dependency get_task() check)
+MISSING_DEPENDENCY = "__missing__"
+SATISFIED_STATUSES = {"completed", MISSING_DEPENDENCY}
+
+
+def extract_dependency_ids(task: Dict[str, Any]) -> List[str]:
+    """Dependency ids of a task row, supporting both the legacy and current column names."""
+    depends_on = task.get("depends_on_task_ids") or task.get("depends_on") or []
+    return [str(dep_id) for dep_id in depends_on if dep_id]
+
+
+class TaskDependencyGraph:
+    """Dependency DAG and ready set for the pending tasks of a single workspace."""
+
+    def __init__(self, workspace_id: str):
+        self.workspace_id = workspace_id
+        self._status: Dict[str, str] = {}
+        # pending task -> its dependencies
+        self._deps: Dict[str, Set[str]] = {}
+        # dependency -> pending tasks waiting on it
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        # pending task -> dependencies not yet satisfied
+        self._unmet: Dict[str, Set[str]] = {}
+        self._ready: Set[str] = set()
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._status
+
+    def upsert_pending_task(self, task_id: str, depends_on: Iterable[str]):
+        """Add (or rewire) a pending task; a no-op when its dependencies are unchanged."""
+        deps = set(depends_on)
+        deps.discard(task_id)
+        if self._deps.get(task_id) == deps and self._status.get(task_id) == "pending":
+            return
+
+        self._drop_edges(task_id)
+        self._status[task_id] = "pending"
+        self._deps[task_id] = deps
+        unmet = set()
+        for dep_id in deps:
+            self._dependents[dep_id].add(task_id)
+            if self._status.get(dep_id) not in SATISFIED_STATUSES:
+                unmet.add(dep_id)
+        self._unmet[task_id] = unmet
+        if not unmet:
+            self._ready.add(task_id)
+
+    def sync_pending(self, pending_tasks: List[Dict[str, Any]]):
+        """Reconcile the graph with a fresh list of pending task rows."""
+        pending_ids = set()
+        for task in pending_tasks:
+            task_id = str(task["id"])
+            pending_ids.add(task_id)
+            self.upsert_pending_task(task_id, extract_dependency_ids(task))
+
+        # Tasks that left the pending state elsewhere stop being candidates
+        for task_id in [t for t in self._deps if t not in pending_ids]:
+            self._drop_edges(task_id)
+            if self._status.get(task_id) == "pending":
+                del self._status[task_id]
+
+    def set_status(self, task_id: str, status: str) -> Set[str]:
+        """Record a status change and return the tasks that became ready because of it."""
+        previous = self._status.get(task_id)
+        if previous == status:
+            return set()
+        self._status[task_id] = status
+
+        if task_id in self._deps and status != "pending":
+            self._drop_edges(task_id)
+
+        newly_ready = set()
+        satisfied = status in SATISFIED_STATUSES
+        for dependent_id in self._dependents.get(task_id, ()):
+            unmet = self._unmet.get(dependent_id)
+            if unmet is None:
+                continue
+            if satisfied:
+                unmet.discard(task_id)
+                if not unmet and dependent_id not in self._ready:
+                    self._ready.add(dependent_id)
+                    newly_ready.add(dependent_id)
+            else:
+                unmet.add(task_id)
+                self._ready.discard(dependent_id)
+        return newly_ready
+
+    def unresolved_dependencies(self) -> Set[str]:
+        """Dependencies whose status is unknown or not yet satisfied."""
+        return {
+            dep_id
+            for dep_id, dependents in self._dependents.items()
+            if dependents and self._status.get(dep_id) not in SATISFIED_STATUSES
+        }
+
+    def ready_task_ids(self) -> Set[str]:
+        return set(self._ready)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pending_tasks": len(self._deps),
+            "ready_tasks": len(self._ready),
+            "edges": sum(len(deps) for deps in self._deps.values()),
+            "unresolved_dependencies": len(self.unresolved_dependencies()),
+        }
+
+    def _drop_edges(self, task_id: str):
+        for dep_id in self._deps.pop(task_id, ()):
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
+        self._unmet.pop(task_id, None)
+        self._ready.discard(task_id)
+
+
+class TaskDependencyGraphRegistry:
+    """Holds one TaskDependencyGraph per workspace and fans out status changes."""
+
+    def __init__(self):
+        self._graphs: Dict[str, TaskDependencyGraph] = {}
+
+    def get(self, workspace_id: str) -> TaskDependencyGraph:
+        graph = self._graphs.get(workspace_id)
+        if graph is None:
+            graph = TaskDependencyGraph(workspace_id)
+            self._graphs[workspace_id] = graph
+        return graph
+
+    def on_status_change(self, task_id: str, status: str, workspace_id: Optional[str] = None):
+        """Propagate a task status change to the graphs that reference the task."""
+        task_id = str(task_id)
+        graphs = [self._graphs[workspace_id]] if workspace_id in self._graphs else self._graphs.values()
+        for graph in graphs:
+            if task_id in graph:
+                newly_ready = graph.set_status(task_id, status)
+                if newly_ready:
+                    logger.debug(
+                        f"🔗 W:{graph.workspace_id[:8]} task {task_id} -> {status} unblocked {len(newly_ready)} tasks"
+                    )
+
+    def invalidate(self, workspace_id: str):
+        self._graphs.pop(workspace_id, None)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        return {workspace_id: graph.get_stats() for workspace_id, graph in self._graphs.items()}
+
+
+# Global instance
+task_dependency_graphs = TaskDependencyGraphRegistry()
+
+__all__ = [
+    "TaskDependencyGraph",
+    "TaskDependencyGraphRegistry",
+    "task_dependency_graphs",
+    "extract_dependency_ids",
+    "MISSING_DEPENDENCY",
+]
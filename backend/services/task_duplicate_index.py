@@ -0,0 +1,266 @@
+"""
+🧬 Task Duplicate Index
+Per-workspace MinHash/LSH index over task name + description, used by
+``database.create_task`` to shortlist near-duplicate candidates before any
+(LLM-backed) similarity check runs.
+
+Each task is reduced to a set of word unigram/bigram shingles and a MinHash
+signature; the signature is split into LSH bands so a lookup only touches the
+tasks that share at least one band bucket. Adding a task or changing its status is
+O(bands), and a lookup costs one signature plus a few dict probes, independently
+of how many tasks the workspace holds.
+"""
+
+import logging
+import os
+import re
+import time
+import unicodedata
+import zlib
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Statuses a new task is compared against (same set create_task always used)
+DUPLICATE_CHECK_STATUSES = {"pending", "in_progress", "completed"}
+
+DUPLICATE_INDEX_BANDS = int(os.getenv("DUPLICATE_INDEX_BANDS", "16"))
+DUPLICATE_INDEX_ROWS = int(os.getenv("DUPLICATE_INDEX_ROWS", "4"))
+# Estimated Jaccard similarity a candidate needs to be handed to the similarity engine
+DUPLICATE_CANDIDATE_MIN_JACCARD = float(os.getenv("DUPLICATE_CANDIDATE_MIN_JACCARD", "0.5"))
+DUPLICATE_MAX_CANDIDATES = int(os.getenv("DUPLICATE_MAX_CANDIDATES", "5"))
+# Seconds before a workspace index is rebuilt from the database (tasks created elsewhere)
+DUPLICATE_INDEX_REFRESH_SECONDS = float(os.getenv("DUPLICATE_INDEX_REFRESH_SECONDS", "300"))
+
+# Columns kept per task: what compute_semantic_similarity looks at, minus bulky payloads
+SNAPSHOT_FIELDS = ("id", "workspace_id", "goal_id", "name", "description", "status", "priority",
+                   "assigned_to_role", "created_at")
+
+_MASK_64 = (1 << 64) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize("NFKC", text or "").lower()
+
+
+def task_shingles(task: Dict[str, Any]) -> Set[str]:
+    """Word unigram + bigram shingles of a task's name and description."""
+    tokens = _TOKEN_RE.findall(_normalize(f"{task.get('name') or ''} {task.get('description') or ''}"))
+    shingles = set(tokens)
+    shingles.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+    return shingles
+
+
+class MinHasher:
+    """
+    Multiply-shift hashing ((a*x + b) mod 2^64) >> 32 with fixed-seed coefficients,
+    so signatures are identical across processes and with or without NumPy.
+    """
+
+    def __init__(self, num_perm: int, seed: int = 1):
+        self.num_perm = num_perm
+        state = seed
+        self._a: List[int] = []
+        self._b: List[int] = []
+        for _ in range(num_perm):
+            # Deterministic LCG-derived coefficients (no dependence on random's seed state)
+            state = (state * 6364136223846793005 + 1442695040888963407) & _MASK_64
+            self._a.append(state | 1)
+            state = (state * 6364136223846793005 + 1442695040888963407) & _MASK_64
+            self._b.append(state)
+        if HAS_NUMPY:
+            self._a_np = np.asarray(self._a, dtype=np.uint64)
+            self._b_np = np.asarray(self._b, dtype=np.uint64)
+
+    def signature(self, shingles: Iterable[str]) -> Tuple[int, ...]:
+        bases = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+        if not bases:
+            return tuple([_MAX_HASH] * self.num_perm)
+        if HAS_NUMPY:
+            values = np.asarray(bases, dtype=np.uint64)
+            # uint64 arithmetic wraps, which is exactly the mod 2^64 of the scheme
+            with np.errstate(over="ignore"):
+                hashed = (np.outer(self._a_np, values) + self._b_np[:, None]) >> np.uint64(32)
+            return tuple(int(v) for v in hashed.min(axis=1))
+        return tuple(
+            min(((a * x + b) & _MASK_64) >> 32 for x in bases)
+            for a, b in zip(self._a, self._b)
+        )
+
+
+def estimate_jaccard(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    if not sig1:
+        return 0.0
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class TaskDuplicateIndex:
+    """MinHash/LSH near-duplicate index for the tasks of a single workspace."""
+
+    def __init__(self, workspace_id: str, hasher: MinHasher, bands: int, rows: int):
+        self.workspace_id = workspace_id
+        self._hasher = hasher
+        self.bands = bands
+        self.rows = rows
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._buckets: Dict[Tuple[int, int], Set[str]] = defaultdict(set)
+        self.loaded_at: Optional[float] = None
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._signatures
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        return [
+            (band, hash(signature[band * self.rows:(band + 1) * self.rows]))
+            for band in range(self.bands)
+        ]
+
+    def upsert(self, task: Dict[str, Any]):
+        task_id = str(task.get("id") or "")
+        if not task_id:
+            return
+        snapshot = {field: task.get(field) for field in SNAPSHOT_FIELDS}
+        previous = self._snapshots.get(task_id)
+        if previous and previous.get("name") == snapshot["name"] and previous.get("description") == snapshot["description"]:
+            # Same text: only the metadata (status etc.) changed
+            self._snapshots[task_id] = snapshot
+            return
+
+        self.remove(task_id)
+        signature = self._hasher.signature(task_shingles(task))
+        self._signatures[task_id] = signature
+        self._snapshots[task_id] = snapshot
+        for key in self._band_keys(signature):
+            self._buckets[key].add(task_id)
+
+    def remove(self, task_id: str):
+        signature = self._signatures.pop(task_id, None)
+        self._snapshots.pop(task_id, None)
+        if signature is None:
+            return
+        for key in self._band_keys(signature):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(task_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def set_status(self, task_id: str, status: str):
+        snapshot = self._snapshots.get(task_id)
+        if snapshot is not None:
+            snapshot["status"] = status
+
+    def load(self, tasks: Iterable[Dict[str, Any]]):
+        """Replace the index content with a fresh list of task rows."""
+        self._signatures.clear()
+        self._snapshots.clear()
+        self._buckets.clear()
+        for task in tasks:
+            self.upsert(task)
+        self.loaded_at = time.monotonic()
+
+    def candidates(
+        self,
+        task: Dict[str, Any],
+        limit: int = DUPLICATE_MAX_CANDIDATES,
+        min_jaccard: float = DUPLICATE_CANDIDATE_MIN_JACCARD,
+        statuses: Optional[Set[str]] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """Most similar indexed tasks (snapshot, estimated Jaccard), best first."""
+        statuses = DUPLICATE_CHECK_STATUSES if statuses is None else statuses
+        signature = self._hasher.signature(task_shingles(task))
+        seen: Set[str] = set()
+        for key in self._band_keys(signature):
+            seen.update(self._buckets.get(key, ()))
+
+        scored = []
+        for task_id in seen:
+            snapshot = self._snapshots[task_id]
+            if snapshot.get("status") not in statuses:
+                continue
+            score = estimate_jaccard(signature, self._signatures[task_id])
+            if score >= min_jaccard:
+                scored.append((snapshot, score))
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:limit]
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"tasks": len(self._signatures), "buckets": len(self._buckets)}
+
+
+class TaskDuplicateIndexRegistry:
+    """Holds one TaskDuplicateIndex per workspace."""
+
+    def __init__(
+        self,
+        bands: int = DUPLICATE_INDEX_BANDS,
+        rows: int = DUPLICATE_INDEX_ROWS,
+        refresh_seconds: float = DUPLICATE_INDEX_REFRESH_SECONDS,
+    ):
+        self.bands = bands
+        self.rows = rows
+        self.refresh_seconds = refresh_seconds
+        self._hasher = MinHasher(bands * rows)
+        self._indexes: Dict[str, TaskDuplicateIndex] = {}
+
+    def get(self, workspace_id: str) -> TaskDuplicateIndex:
+        workspace_id = str(workspace_id)
+        index = self._indexes.get(workspace_id)
+        if index is None:
+            index = TaskDuplicateIndex(workspace_id, self._hasher, self.bands, self.rows)
+            self._indexes[workspace_id] = index
+        return index
+
+    def needs_load(self, workspace_id: str) -> bool:
+        index = self._indexes.get(str(workspace_id))
+        return (
+            index is None
+            or index.loaded_at is None
+            or time.monotonic() - index.loaded_at >= self.refresh_seconds
+        )
+
+    def on_task_created(self, task: Dict[str, Any]):
+        workspace_id = task.get("workspace_id")
+        if workspace_id and str(workspace_id) in self._indexes:
+            self._indexes[str(workspace_id)].upsert(task)
+
+    def on_status_change(self, task_id: str, status: str, workspace_id: Optional[str] = None):
+        task_id = str(task_id)
+        indexes = [self._indexes[workspace_id]] if workspace_id in self._indexes else self._indexes.values()
+        for index in indexes:
+            if task_id in index:
+                index.set_status(task_id, status)
+
+    def invalidate(self, workspace_id: str):
+        self._indexes.pop(str(workspace_id), None)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        return {workspace_id: index.get_stats() for workspace_id, index in self._indexes.items()}
+
+
+# Global instance
+task_duplicate_indexes = TaskDuplicateIndexRegistry()
+
+__all__ = [
+    "TaskDuplicateIndex",
+    "TaskDuplicateIndexRegistry",
+    "MinHasher",
+    "task_duplicate_indexes",
+    "task_shingles",
+    "estimate_jaccard",
+    "DUPLICATE_CHECK_STATUSES",
+]
@@ -0,0 +1,275 @@
+"""
+🧩 Task Similarity Clustering
+Shared all-pairs similarity engine for task texts, replacing the O(n²) loops of
+awaited similarity calls / difflib comparisons in the planner and executor.
+
+- Texts become TF-IDF weighted, L2-normalised vectors over hashed word unigrams and
+  bigrams (no vocabulary to maintain).
+- Pairs above a cosine threshold come from one sparse matrix product (SciPy), a
+  dense product on a smaller hashed space (NumPy only) or an inverted index (pure
+  Python), processed in row blocks to bound memory.
+- For large inputs, MinHash/LSH banding proposes candidate pairs that are then
+  verified with the exact cosine, keeping the work close to linear.
+- Union-find turns pairs into clusters.
+
+``cluster_texts_async`` / ``find_similar_pairs_async`` move large inputs to a worker
+thread so the event loop keeps serving while NumPy/SciPy do the work.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from services.task_duplicate_index import MinHasher
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+try:
+    from scipy import sparse
+    HAS_SCIPY = HAS_NUMPY
+except ImportError:
+    sparse = None
+    HAS_SCIPY = False
+
+logger = logging.getLogger(__name__)
+
+# Hashed feature space (sparse backends) and its smaller dense counterpart
+TASK_CLUSTERING_FEATURES = 1 << 20
+TASK_CLUSTERING_DENSE_FEATURES = int(os.getenv("TASK_CLUSTERING_DENSE_FEATURES", "4096"))
+# Above this many texts candidate pairs come from LSH instead of the all-pairs product
+TASK_CLUSTERING_LSH_MIN_TASKS = int(os.getenv("TASK_CLUSTERING_LSH_MIN_TASKS", "5000"))
+# Inputs at least this large are clustered in a worker thread by the async helpers
+TASK_CLUSTERING_OFFLOAD_MIN_TASKS = int(os.getenv("TASK_CLUSTERING_OFFLOAD_MIN_TASKS", "200"))
+TASK_CLUSTERING_BLOCK_ROWS = 512
+
+# Cosine above which two task descriptions count as the same task. Recalibrated from the
+# 0.8 SequenceMatcher ratio of the old executor loop: on rewordings of one task the cosine
+# sits at 0.7-1.0 (ratio 0.94-0.99), while different tasks built from a shared template
+# score below 0.5 even when their ratio reaches 0.85
+TASK_DESCRIPTION_DUPLICATE_THRESHOLD = float(os.getenv("TASK_DESCRIPTION_DUPLICATE_THRESHOLD", "0.6"))
+
+# 32 bands x 4 rows: pairs with shingle Jaccard >= 0.6 become candidates with p > 0.99
+LSH_BANDS = 32
+LSH_ROWS = 4
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOP_WORDS = frozenset({
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "a", "an", "is", "are",
+    "il", "la", "di", "e", "per", "un", "una", "del", "della", "con",
+})
+
+SparseVector = Dict[int, float]
+Pair = Tuple[int, int, float]
+
+
+def _shingles(text: str) -> List[str]:
+    tokens = [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOP_WORDS]
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def vectorize(texts: Sequence[str], n_features: int = TASK_CLUSTERING_FEATURES) -> List[SparseVector]:
+    """TF-IDF (sublinear tf, smoothed idf) over hashed shingles, L2-normalised."""
+    term_counts: List[Dict[int, int]] = []
+    document_frequency: Dict[int, int] = defaultdict(int)
+    for text in texts:
+        counts: Dict[int, int] = defaultdict(int)
+        for shingle in _shingles(text):
+            counts[zlib.crc32(shingle.encode("utf-8")) % n_features] += 1
+        for feature in counts:
+            document_frequency[feature] += 1
+        term_counts.append(counts)
+
+    n_docs = len(texts)
+    vectors = []
+    for counts in term_counts:
+        vector = {
+            feature: (1.0 + math.log(count)) * (math.log((1 + n_docs) / (1 + document_frequency[feature])) + 1.0)
+            for feature, count in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        vectors.append({f: w / norm for f, w in vector.items()} if norm else {})
+    return vectors
+
+
+def _sparse_dot(v1: SparseVector, v2: SparseVector) -> float:
+    if len(v1) > len(v2):
+        v1, v2 = v2, v1
+    return sum(w * v2.get(f, 0.0) for f, w in v1.items())
+
+
+def _pairs_scipy(vectors: List[SparseVector], threshold: float, n_features: int) -> List[Pair]:
+    rows, cols, data = [], [], []
+    for i, vector in enumerate(vectors):
+        rows.extend([i] * len(vector))
+        cols.extend(vector.keys())
+        data.extend(vector.values())
+    matrix = sparse.csr_matrix((data, (rows, cols)), shape=(len(vectors), n_features), dtype=np.float32)
+    transposed = matrix.T.tocsc()
+
+    pairs: List[Pair] = []
+    for start in range(0, len(vectors), TASK_CLUSTERING_BLOCK_ROWS):
+        block = (matrix[start:start + TASK_CLUSTERING_BLOCK_ROWS] @ transposed).tocoo()
+        keep = (block.data >= threshold) & (block.col > block.row + start)
+        pairs.extend(
+            (int(r) + start, int(c), float(v))
+            for r, c, v in zip(block.row[keep], block.col[keep], block.data[keep])
+        )
+    return pairs
+
+
+def _pairs_dense(texts: Sequence[str], threshold: float) -> List[Pair]:
+    vectors = vectorize(texts, TASK_CLUSTERING_DENSE_FEATURES)
+    matrix = np.zeros((len(vectors), TASK_CLUSTERING_DENSE_FEATURES), dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        for feature, weight in vector.items():
+            matrix[i, feature] = weight
+
+    pairs: List[Pair] = []
+    for start in range(0, len(vectors), TASK_CLUSTERING_BLOCK_ROWS):
+        block = matrix[start:start + TASK_CLUSTERING_BLOCK_ROWS] @ matrix.T
+        # Keep the strict upper triangle only
+        block_rows, block_cols = np.nonzero(block >= threshold)
+        for r, c in zip(block_rows, block_cols):
+            i = int(r) + start
+            if c > i:
+                pairs.append((i, int(c), float(block[r, c])))
+    return pairs
+
+
+def _pairs_inverted_index(vectors: List[SparseVector], threshold: float) -> List[Pair]:
+    postings: Dict[int, List[Tuple[int, float]]] = defaultdict(list)
+    pairs: List[Pair] = []
+    for i, vector in enumerate(vectors):
+        # Dot products with every earlier document sharing a feature
+        dots: Dict[int, float] = defaultdict(float)
+        for feature, weight in vector.items():
+            for j, other_weight in postings[feature]:
+                dots[j] += weight * other_weight
+        pairs.extend((j, i, score) for j, score in dots.items() if score >= threshold)
+        for feature, weight in vector.items():
+            postings[feature].append((i, weight))
+    return pairs
+
+
+def _pairs_lsh(texts: Sequence[str], vectors: List[SparseVector], threshold: float) -> List[Pair]:
+    hasher = MinHasher(LSH_BANDS * LSH_ROWS)
+    buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for i, text in enumerate(texts):
+        signature = hasher.signature(set(_shingles(text)))
+        for band in range(LSH_BANDS):
+            buckets[(band, hash(signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]))].append(i)
+
+    candidates: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) > 1:
+            candidates.update((a, b) for k, a in enumerate(members) for b in members[k + 1:])
+
+    pairs: List[Pair] = []
+    for i, j in candidates:
+        score = _sparse_dot(vectors[i], vectors[j])
+        if score >= threshold:
+            pairs.append((i, j, score))
+    return pairs
+
+
+def find_similar_pairs(texts: Sequence[str], threshold: float, method: str = "auto") -> List[Pair]:
+    """
+    All (i, j, cosine) with i < j and cosine >= threshold.
+
+    ``method``: "auto", "sparse" (SciPy), "dense" (NumPy), "inverted" (pure Python) or "lsh".
+    """
+    if len(texts) < 2:
+        return []
+    if method == "auto":
+        if len(texts) >= TASK_CLUSTERING_LSH_MIN_TASKS:
+            method = "lsh"
+        elif HAS_SCIPY:
+            method = "sparse"
+        elif HAS_NUMPY:
+            method = "dense"
+        else:
+            method = "inverted"
+
+    if method == "dense":
+        return _pairs_dense(texts, threshold)
+    vectors = vectorize(texts)
+    if method == "sparse":
+        return _pairs_scipy(vectors, threshold, TASK_CLUSTERING_FEATURES)
+    if method == "lsh":
+        return _pairs_lsh(texts, vectors, threshold)
+    return _pairs_inverted_index(vectors, threshold)
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+
+
+def clusters_from_pairs(size: int, pairs: Sequence[Pair]) -> List[List[int]]:
+    """Connected components (of size > 1) of the similarity graph, ordered by first member."""
+    union_find = UnionFind(size)
+    for i, j, _ in pairs:
+        union_find.union(i, j)
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for item in range(size):
+        groups[union_find.find(item)].append(item)
+    return sorted((members for members in groups.values() if len(members) > 1), key=lambda m: m[0])
+
+
+def cluster_texts(texts: Sequence[str], threshold: float, method: str = "auto") -> List[List[int]]:
+    """Groups of indices whose texts are transitively similar above ``threshold``."""
+    return clusters_from_pairs(len(texts), find_similar_pairs(texts, threshold, method))
+
+
+async def find_similar_pairs_async(texts: Sequence[str], threshold: float, method: str = "auto") -> List[Pair]:
+    if len(texts) >= TASK_CLUSTERING_OFFLOAD_MIN_TASKS:
+        return await asyncio.to_thread(find_similar_pairs, list(texts), threshold, method)
+    return find_similar_pairs(texts, threshold, method)
+
+
+async def cluster_texts_async(texts: Sequence[str], threshold: float, method: str = "auto") -> List[List[int]]:
+    if len(texts) >= TASK_CLUSTERING_OFFLOAD_MIN_TASKS:
+        return await asyncio.to_thread(cluster_texts, list(texts), threshold, method)
+    return cluster_texts(texts, threshold, method)
+
+
+__all__ = [
+    "vectorize",
+    "find_similar_pairs",
+    "find_similar_pairs_async",
+    "cluster_texts",
+    "cluster_texts_async",
+    "clusters_from_pairs",
+    "UnionFind",
+    "TASK_CLUSTERING_OFFLOAD_MIN_TASKS",
+    "TASK_DESCRIPTION_DUPLICATE_THRESHOLD",
+]
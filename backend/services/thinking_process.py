@@ -13,6 +13,8 @@ from uuid import UUID, uuid4
 from dataclasses import dataclass
 
 from database import get_supabase_client
+from utils.async_supabase import AsyncSupabaseClient
+from services.thinking_step_writer import ThinkingStepWriter, ThinkingEventDispatcher
 from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
@@ -52,9 +54,15 @@ class RealTimeThinkingEngine:
     
     def __init__(self):
         self.supabase = get_supabase_client()
+        self.async_supabase = AsyncSupabaseClient(lambda: self.supabase)
         self.active_processes: Dict[str, ThinkingProcess] = {}
         self.websocket_handlers: List[Any] = []
         
+        # Steps are persisted write-behind and broadcast from a bounded queue so
+        # add_thinking_step never waits on the database or on WebSocket clients
+        self.step_writer = ThinkingStepWriter(self._insert_thinking_steps)
+        self.event_dispatcher = ThinkingEventDispatcher(self._deliver_thinking_event)
+        
         # Initialize OpenAI client for AI title generation
         self.openai_client = None
         if os.getenv("OPENAI_API_KEY"):
@@ -121,7 +129,7 @@ class RealTimeThinkingEngine:
         # Add to active process
         self.active_processes[process_id].steps.append(step)
         
-        # Update database
+        # Queue for batched database insert
         await self._store_thinking_step(process_id, step)
         
         # Broadcast step in real-time
@@ -167,12 +175,16 @@ class RealTimeThinkingEngine:
                 "estimated_tokens": self._estimate_token_count(thinking_process)
             })
         
+        # Persist buffered steps before the process is marked complete
+        await self.step_writer.flush()
+        
         # Update database with new title
         await self._update_thinking_process_completion(thinking_process)
         
         # Broadcast completion
         await self._broadcast_thinking_event("process_completed", {
             "process_id": process_id,
+            "workspace_id": thinking_process.workspace_id,
             "conclusion": conclusion,
             "confidence": overall_confidence,
             "total_steps": len(thinking_process.steps)
@@ -192,7 +204,7 @@ class RealTimeThinkingEngine:
         
         # Retrieve from database
         try:
-            response = self.supabase.table("thinking_processes") \
+            response = await self.async_supabase.table("thinking_processes") \
                 .select("*") \
                 .eq("process_id", process_id) \
                 .execute()
@@ -203,7 +215,7 @@ class RealTimeThinkingEngine:
             process_data = response.data[0]
             
             # Get steps
-            steps_response = self.supabase.table("thinking_steps") \
+            steps_response = await self.async_supabase.table("thinking_steps") \
                 .select("*") \
                 .eq("process_id", process_id) \
                 .order("created_at", desc=False) \
@@ -240,7 +252,7 @@ class RealTimeThinkingEngine:
     async def get_workspace_thinking(self, workspace_id: UUID, limit: int = 10) -> List[ThinkingProcess]:
         """Get recent thinking processes for workspace"""
         try:
-            response = self.supabase.table("thinking_processes") \
+            response = await self.async_supabase.table("thinking_processes") \
                 .select("*") \
                 .eq("workspace_id", str(workspace_id)) \
                 .order("started_at", desc=True) \
@@ -250,7 +262,7 @@ class RealTimeThinkingEngine:
             processes = []
             for process_data in response.data:
                 # Get steps for each process (limit to avoid performance issues)
-                steps_response = self.supabase.table("thinking_steps") \
+                steps_response = await self.async_supabase.table("thinking_steps") \
                     .select("*") \
                     .eq("process_id", process_data["process_id"]) \
                     .order("created_at", desc=False) \
@@ -364,13 +376,13 @@ class RealTimeThinkingEngine:
                 "summary_metadata": thinking_process.summary_metadata  # Store metadata
             }
             
-            self.supabase.table("thinking_processes").insert(process_data).execute()
+            await self.async_supabase.table("thinking_processes").insert(process_data).execute()
             
         except Exception as e:
             logger.error(f"Failed to store thinking process: {e}")
     
     async def _store_thinking_step(self, process_id: str, step: ThinkingStep):
-        """Store thinking step in database"""
+        """Queue thinking step for a batched database insert"""
         try:
             step_data = {
                 "step_id": step.step_id,
@@ -382,11 +394,25 @@ class RealTimeThinkingEngine:
                 "created_at": step.timestamp
             }
             
-            self.supabase.table("thinking_steps").insert(step_data).execute()
+            await self.step_writer.enqueue(step_data)
             
         except Exception as e:
             logger.error(f"Failed to store thinking step: {e}")
     
+    async def _insert_thinking_steps(self, rows: List[Dict[str, Any]]):
+        """Bulk insert thinking steps (called by the write-behind buffer)"""
+        await self.async_supabase.table("thinking_steps").insert(rows).execute()
+    
+    async def flush_thinking_steps(self):
+        """Persist every buffered thinking step and deliver pending broadcasts"""
+        await self.step_writer.flush()
+        await self.event_dispatcher.drain()
+    
+    async def shutdown(self):
+        """Flush buffered steps and stop the background writer/dispatcher"""
+        await self.step_writer.close()
+        await self.event_dispatcher.close()
+    
     async def _update_thinking_process_completion(self, thinking_process: ThinkingProcess):
         """Update thinking process completion in database"""
         try:
@@ -398,7 +424,7 @@ class RealTimeThinkingEngine:
                 "summary_metadata": thinking_process.summary_metadata  # Include updated metadata
             }
             
-            self.supabase.table("thinking_processes") \
+            await self.async_supabase.table("thinking_processes") \
                 .update(update_data) \
                 .eq("process_id", thinking_process.process_id) \
                 .execute()
@@ -407,15 +433,18 @@ class RealTimeThinkingEngine:
             logger.error(f"Failed to update thinking process completion: {e}")
     
     async def _broadcast_thinking_event(self, event_type: str, data: Dict[str, Any]):
+        """Queue thinking event for WebSocket clients (delivered in order, off the caller's path)"""
+        # Resolve the workspace now: the process may have completed by delivery time
+        workspace_id = data.get("workspace_id")
+        if not workspace_id and data.get("process_id") in self.active_processes:
+            workspace_id = self.active_processes[data["process_id"]].workspace_id
+        self.event_dispatcher.dispatch(event_type, data, workspace_id)
+    
+    async def _deliver_thinking_event(self, event_type: str, data: Dict[str, Any], workspace_id: Optional[str]):
         """Broadcast thinking event to WebSocket clients"""
         try:
             # Format the thinking step for WebSocket broadcast
             if event_type == "step_added" and "step" in data:
-                # Extract workspace_id from process
-                workspace_id = None
-                if data.get("process_id") and data["process_id"] in self.active_processes:
-                    workspace_id = self.active_processes[data["process_id"]].workspace_id
-                
                 if workspace_id:
                     # Broadcast thinking step via WebSocket
                     try:
@@ -439,11 +468,6 @@ class RealTimeThinkingEngine:
                     logger.warning(f"Goal decomposition start broadcast failed: {ws_error}")
             
             elif event_type == "process_completed" and data.get("process_id"):
-                # Find workspace_id for completed process
-                workspace_id = None
-                if data["process_id"] in self.active_processes:
-                    workspace_id = self.active_processes[data["process_id"]].workspace_id
-                
                 if workspace_id:
                     try:
                         from routes.websocket import broadcast_goal_decomposition_complete
@@ -691,6 +715,9 @@ class RealTimeThinkingEngine:
             bool: True if successful, False otherwise
         """
         try:
+            # The row may still be sitting in the write-behind buffer
+            await self.step_writer.flush()
+            
             # Find the step in active processes
             step_found = False
             for process_id, process in self.active_processes.items():
@@ -714,7 +741,7 @@ class RealTimeThinkingEngine:
             
             if not step_found:
                 # Try updating in database directly
-                response = self.supabase.table("thinking_steps") \
+                response = await self.async_supabase.table("thinking_steps") \
                     .select("metadata") \
                     .eq("step_id", step_id) \
                     .execute()
@@ -729,7 +756,7 @@ class RealTimeThinkingEngine:
                         "updated_at": datetime.utcnow().isoformat()
                     }
                     
-                    self.supabase.table("thinking_steps") \
+                    await self.async_supabase.table("thinking_steps") \
                         .update({"metadata": existing_metadata}) \
                         .eq("step_id", step_id) \
                         .execute()
@@ -738,7 +765,7 @@ class RealTimeThinkingEngine:
                     return True
             else:
                 # Update in database
-                self.supabase.table("thinking_steps") \
+                await self.async_supabase.table("thinking_steps") \
                     .update({"metadata": step.metadata}) \
                     .eq("step_id", step_id) \
                     .execute()
@@ -762,6 +789,9 @@ class RealTimeThinkingEngine:
             bool: True if successful, False otherwise
         """
         try:
+            # The row may still be sitting in the write-behind buffer
+            await self.step_writer.flush()
+            
             # Find the step in active processes
             step_found = False
             for process_id, process in self.active_processes.items():
@@ -786,7 +816,7 @@ class RealTimeThinkingEngine:
             
             if not step_found:
                 # Try updating in database directly
-                response = self.supabase.table("thinking_steps") \
+                response = await self.async_supabase.table("thinking_steps") \
                     .select("metadata") \
                     .eq("step_id", step_id) \
                     .execute()
@@ -802,7 +832,7 @@ class RealTimeThinkingEngine:
                         "updated_at": datetime.utcnow().isoformat()
                     }
                     
-                    self.supabase.table("thinking_steps") \
+                    await self.async_supabase.table("thinking_steps") \
                         .update({"metadata": existing_metadata}) \
                         .eq("step_id", step_id) \
                         .execute()
@@ -811,7 +841,7 @@ class RealTimeThinkingEngine:
                     return True
             else:
                 # Update in database
-                self.supabase.table("thinking_steps") \
+                await self.async_supabase.table("thinking_steps") \
                     .update({"metadata": step.metadata}) \
                     .eq("step_id", step_id) \
                     .execute()
@@ -885,7 +915,7 @@ class RealTimeThinkingEngine:
         try:
             # Get recent thinking processes
             # Filter by step_type 'reasoning' which contains agent actions
-            query = self.supabase.table("thinking_steps") \
+            query = self.async_supabase.table("thinking_steps") \
                 .select("step_id, step_type, confidence, metadata, created_at") \
                 .eq("step_type", "reasoning")
             
@@ -894,7 +924,7 @@ class RealTimeThinkingEngine:
                 # as Supabase doesn't support direct JSON field queries with ilike
                 pass  # Will filter in post-processing
             
-            response = query.execute()
+            response = await query.execute()
             
             if not response.data:
                 return {}
@@ -969,7 +999,7 @@ class RealTimeThinkingEngine:
             
             # Get tool execution steps
             # Use 'evaluation' step_type which contains tool executions
-            response = self.supabase.table("thinking_steps") \
+            response = await self.async_supabase.table("thinking_steps") \
                 .select("step_id, metadata, confidence, created_at") \
                 .eq("step_type", "evaluation") \
                 .gte("created_at", cutoff_time) \
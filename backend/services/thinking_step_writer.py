@@ -0,0 +1,238 @@
+# services/thinking_step_writer.py
+"""
+💾 Write-behind persistence and broadcast fan-out for thinking steps
+Keeps database round-trips and WebSocket delivery off the critical path of
+``RealTimeThinkingEngine.add_thinking_step``:
+
+- ThinkingStepWriter buffers ``thinking_steps`` rows and bulk-inserts them when the
+  buffer reaches ``batch_size``, every ``flush_interval`` seconds, or when a caller
+  asks for an explicit flush (process completion, shutdown). Rows are written in
+  the order they were enqueued: a single lock serialises flushes and every flush
+  takes the whole prefix of the buffer.
+- ThinkingEventDispatcher delivers broadcast events from a bounded queue on a
+  background task, dropping the oldest event when clients cannot keep up (the
+  database remains the source of truth for the steps).
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+THINKING_STEP_BATCH_SIZE = int(os.getenv("THINKING_STEP_BATCH_SIZE", "50"))
+THINKING_STEP_FLUSH_INTERVAL = float(os.getenv("THINKING_STEP_FLUSH_INTERVAL", "0.25"))
+THINKING_STEP_MAX_BUFFERED = int(os.getenv("THINKING_STEP_MAX_BUFFERED", "5000"))
+THINKING_BROADCAST_QUEUE_SIZE = int(os.getenv("THINKING_BROADCAST_QUEUE_SIZE", "1000"))
+
+# Bulk inserts are expected in the tens of milliseconds
+FLUSH_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class ThinkingStepWriter:
+    """Ordered write-behind buffer that coalesces step rows into bulk inserts."""
+
+    def __init__(
+        self,
+        insert_rows: Callable[[List[Dict[str, Any]]], Awaitable[Any]],
+        batch_size: int = THINKING_STEP_BATCH_SIZE,
+        flush_interval: float = THINKING_STEP_FLUSH_INTERVAL,
+        max_buffered: int = THINKING_STEP_MAX_BUFFERED,
+    ):
+        self._insert_rows = insert_rows
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_buffered = max(self.batch_size, max_buffered)
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+        self.flush_latency = LatencyHistogram(FLUSH_BUCKETS_SECONDS)
+        self.stats = {"enqueued": 0, "written": 0, "batches": 0, "failed": 0, "backpressure_flushes": 0}
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the previous event loop went away (tests, worker restarts):
+            # rebind the primitives; rows still buffered are carried over
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._wakeup = asyncio.Event()
+            self._flusher = None
+        if not self._closed and (self._flusher is None or self._flusher.done()):
+            self._flusher = loop.create_task(self._flush_loop())
+
+    async def enqueue(self, row: Dict[str, Any]):
+        """Buffer a row for insertion; only waits when the buffer is over its bound."""
+        self._ensure_started()
+        self._buffer.append(row)
+        self.stats["enqueued"] += 1
+
+        if len(self._buffer) >= self.max_buffered:
+            # The database is not keeping up: apply backpressure to the producer
+            self.stats["backpressure_flushes"] += 1
+            await self.flush()
+        elif len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def flush(self):
+        """Write every row buffered so far, preserving enqueue order."""
+        if self._loop is None:
+            return
+        self._ensure_started()
+        # Taking the lock even with an empty buffer waits for a batch that another
+        # flush already took but has not finished writing
+        async with self._lock:
+            # Only rows present now: stragglers arriving mid-write wait for the next
+            # trigger instead of being shipped as a trail of tiny batches
+            pending = len(self._buffer)
+            while pending > 0:
+                batch = self._buffer[:min(pending, self.batch_size)]
+                del self._buffer[:len(batch)]
+                pending -= len(batch)
+                await self._write_batch(batch)
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]):
+        start = time.monotonic()
+        try:
+            await self._insert_rows(batch)
+            self.stats["written"] += len(batch)
+        except Exception as e:
+            # Retry row by row so a single bad row does not lose the whole batch
+            logger.warning(f"Bulk insert of {len(batch)} thinking steps failed, retrying per row: {e}")
+            for row in batch:
+                try:
+                    await self._insert_rows([row])
+                    self.stats["written"] += 1
+                except Exception as row_error:
+                    self.stats["failed"] += 1
+                    logger.error(f"Failed to store thinking step {row.get('step_id')}: {row_error}")
+        self.stats["batches"] += 1
+        self.flush_latency.observe(time.monotonic() - start)
+
+    async def _flush_loop(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Thinking step flush failed: {e}")
+
+    async def close(self):
+        """Flush what is left and stop the background flusher."""
+        if self._loop is None:
+            return
+        self._closed = True
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done() and self._loop is asyncio.get_running_loop():
+            # Let an in-flight batch finish instead of cancelling it half-written
+            self._wakeup.set()
+            await flusher
+        await self.flush()
+        self._closed = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "buffered": len(self._buffer),
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval,
+            "flush_latency": self.flush_latency.to_dict(),
+        }
+
+
+class ThinkingEventDispatcher:
+    """Bounded queue + background worker for WebSocket broadcast events."""
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[Any]],
+        maxsize: int = THINKING_BROADCAST_QUEUE_SIZE,
+    ):
+        self._send = send
+        self.maxsize = max(1, maxsize)
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {"dispatched": 0, "delivered": 0, "dropped": 0}
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    def dispatch(self, *event: Any):
+        """Queue ``send(*event)`` for delivery without waiting on the clients."""
+        self._ensure_started()
+        if self._queue.full():
+            # Drop the oldest event: slow clients must not stall reasoning
+            try:
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.stats["dropped"] += 1
+            except asyncio.QueueEmpty:
+                pass
+        self._queue.put_nowait(event)
+        self.stats["dispatched"] += 1
+
+    async def _run(self):
+        while True:
+            event: Tuple[Any, ...] = await self._queue.get()
+            try:
+                await self._send(*event)
+                self.stats["delivered"] += 1
+            except Exception as e:
+                logger.warning(f"Thinking event delivery failed: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def drain(self, timeout: float = 5.0):
+        """Wait (bounded) until every queued event has been delivered."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Thinking event dispatcher: {self._queue.qsize()} events undelivered at shutdown")
+
+    async def close(self, timeout: float = 5.0):
+        await self.drain(timeout)
+        worker, self._worker = self._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "maxsize": self.maxsize,
+        }
+
+
+__all__ = [
+    "ThinkingStepWriter",
+    "ThinkingEventDispatcher",
+    "THINKING_STEP_BATCH_SIZE",
+    "THINKING_STEP_FLUSH_INTERVAL",
+    "THINKING_BROADCAST_QUEUE_SIZE",
+]
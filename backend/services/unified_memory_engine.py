@@ -15,7 +15,7 @@ import logging
 import json
 import os
 import hashlib
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, asdict, field
 from uuid import UUID, uuid4
@@ -40,6 +40,15 @@ except ImportError:
             return func
         return decorator
 
+from utils.async_supabase import AsyncSupabaseClient
+from utils.performance_cache import PerformanceCache, make_tag
+from services.memory_vector_index import (
+    MemoryVectorIndex,
+    MEMORY_INDEX_MAX_ENTRIES,
+    context_to_text,
+    create_embedder,
+)
+
 logger = logging.getLogger(__name__)
 
 # --- Configuration ---
@@ -48,6 +57,11 @@ MAX_CONTEXT_ENTRIES = int(os.getenv("MAX_CONTEXT_ENTRIES", "1000"))
 MEMORY_SIMILARITY_THRESHOLD = float(os.getenv("MEMORY_SIMILARITY_THRESHOLD", "0.7"))
 ENABLE_CROSS_WORKSPACE_LEARNING = os.getenv("ENABLE_CROSS_WORKSPACE_LEARNING", "true").lower() == "true"
 CACHE_EXPIRATION_MINUTES = int(os.getenv("CACHE_EXPIRATION_MINUTES", "60"))
+MEMORY_RELEVANCE_CACHE_MAX_ENTRIES = int(os.getenv("MEMORY_RELEVANCE_CACHE_MAX_ENTRIES", "500"))
+MEMORY_RELEVANCE_CACHE_MAX_BYTES = int(os.getenv("MEMORY_RELEVANCE_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+# Relevance ranking uses the local vector index; the LLM only reranks its shortlist when enabled
+MEMORY_LLM_RERANK = os.getenv("MEMORY_LLM_RERANK", "false").lower() == "true"
+MEMORY_RERANK_POOL_FACTOR = int(os.getenv("MEMORY_RERANK_POOL_FACTOR", "3"))
 
 
 # === ENUMS and DATA CLASSES (Consolidated) ===
@@ -127,7 +141,15 @@ class UnifiedMemoryEngine:
                     logger.warning(f"AI client initialization failed: {e}")
 
             self.supabase = get_supabase_client()
-            self.relevance_cache: Dict[str, Tuple[List[ContextEntry], datetime]] = {}
+            # Non-blocking facade; resolves self.supabase lazily so client swaps are honoured
+            self.async_supabase = AsyncSupabaseClient(lambda: self.supabase)
+            # Bounded LRU + TTL, tagged by workspace so store_context can invalidate it
+            self.relevance_cache = PerformanceCache(
+                max_size=MEMORY_RELEVANCE_CACHE_MAX_ENTRIES,
+                default_ttl=CACHE_EXPIRATION_MINUTES * 60,
+                max_bytes=MEMORY_RELEVANCE_CACHE_MAX_BYTES,
+            )
+            self.vector_index = MemoryVectorIndex(create_embedder(self.openai_client))
 
             self.stats = {
                 "contexts_stored": 0,
@@ -193,10 +215,12 @@ class UnifiedMemoryEngine:
             if 'goal_context' not in db_record:
                 db_record['goal_context'] = None
 
-            response = self.supabase.table("memory_context_entries").insert(db_record).execute()
+            response = await self.async_supabase.table("memory_context_entries").insert(db_record).execute()
 
             if response.data:
                 logger.debug(f"✅ Context stored in DB: {entry_id} for workspace {workspace_id_str}")
+                self.invalidate_relevance_cache(workspace_id_str)
+                await self._index_contexts(workspace_id_str, [context_entry])
                 return entry_id
             else:
                 raise Exception(f"Failed to store context in DB: {response.error}")
@@ -214,7 +238,7 @@ class UnifiedMemoryEngine:
         max_results: int = 10,
         limit: Optional[int] = None  # Ignored for compatibility
     ) -> List[ContextEntry]:
-        """Retrieves relevant context using AI-driven semantic search from the database."""
+        """Retrieves relevant context ranked by the workspace vector index (optionally LLM-reranked)."""
         self.stats["contexts_retrieved"] += 1
         workspace_id_str = str(workspace_id)
 
@@ -225,11 +249,10 @@ class UnifiedMemoryEngine:
                 logger.info("✅ Supabase client initialized on demand for context retrieval")
 
         cache_key = f"{workspace_id_str}_{query}_{str(context_types)}_{max_results}"
-        if cache_key in self.relevance_cache:
-            cached_results, cache_time = self.relevance_cache[cache_key]
-            if datetime.utcnow() - cache_time < timedelta(minutes=CACHE_EXPIRATION_MINUTES):
-                self.stats["cache_hits"] += 1
-                return cached_results
+        cached_results = self.relevance_cache.get(cache_key)
+        if cached_results is not None:
+            self.stats["cache_hits"] += 1
+            return cached_results
         
         self.stats["cache_misses"] += 1
 
@@ -239,28 +262,28 @@ class UnifiedMemoryEngine:
             if not self.supabase:
                 return []
 
-            # Base query - FIX: use correct table name
-            query_builder = self.supabase.table("memory_context_entries").select("*") \
-                .eq("workspace_id", workspace_id_str) \
-                .gte("created_at", (datetime.utcnow() - timedelta(days=MEMORY_RETENTION_DAYS)).isoformat())
-            
-            if context_types:
-                query_builder = query_builder.in_("context_type", context_types)
-
-            response = query_builder.order("importance_score", desc=True).limit(100).execute() # Fetch a larger pool for AI ranking
-            
-            if not response.data:
-                return []
-
-            all_contexts = [ContextEntry(**d) for d in response.data]
+            retention_cutoff = datetime.utcnow() - timedelta(days=MEMORY_RETENTION_DAYS)
+            if not self.vector_index.is_loaded(workspace_id_str):
+                await self._load_vector_index(workspace_id_str, retention_cutoff)
+
+            rerank = MEMORY_LLM_RERANK and self.openai_client is not None
+            pool_size = max_results * MEMORY_RERANK_POOL_FACTOR if rerank else max_results
+            ranked = await self.vector_index.search(
+                workspace_id_str,
+                query,
+                pool_size,
+                context_types=context_types,
+                min_created_at=self._to_timestamp(retention_cutoff),
+            )
+            candidates = [entry for entry, _ in ranked]
 
-            if self.openai_client:
+            if rerank and len(candidates) > max_results:
                 self.stats["ai_calls"] += 1
-                relevant_contexts = await self._ai_semantic_search(query, all_contexts, max_results)
+                relevant_contexts = await self._ai_semantic_search(query, candidates, max_results)
             else:
-                relevant_contexts = self._keyword_search(query, all_contexts, max_results)
+                relevant_contexts = candidates[:max_results]
             
-            self.relevance_cache[cache_key] = (relevant_contexts, datetime.utcnow())
+            self.relevance_cache.set(cache_key, relevant_contexts, tags=[make_tag("workspace_id", workspace_id_str)])
             logger.debug(f"✅ Retrieved {len(relevant_contexts)} relevant contexts for query: {query[:50]}...")
             return relevant_contexts
 
@@ -268,8 +291,60 @@ class UnifiedMemoryEngine:
             logger.error(f"Error retrieving relevant context: {e}", exc_info=True)
             return []
 
+    def invalidate_relevance_cache(self, workspace_id: Union[str, UUID]) -> int:
+        """Drops cached relevance results for a workspace after its contexts change."""
+        return self.relevance_cache.invalidate_tags(make_tag("workspace_id", str(workspace_id)))
+
+    async def _load_vector_index(self, workspace_id: str, retention_cutoff: datetime):
+        """
+        Embeds the workspace's recent context entries into its vector index (once per refresh period).
+        Parsing runs in a worker thread and only new or edited rows are re-embedded.
+        """
+        response = await self.async_supabase.table("memory_context_entries").select("*") \
+            .eq("workspace_id", workspace_id) \
+            .gte("created_at", retention_cutoff.isoformat()) \
+            .order("created_at", desc=True) \
+            .limit(MEMORY_INDEX_MAX_ENTRIES) \
+            .execute()
+        entries = await asyncio.to_thread(
+            lambda: [self._index_entry(ContextEntry(**d)) for d in (response.data or [])]
+        )
+        await self.vector_index.load_workspace(workspace_id, entries)
+        logger.debug(f"🧠 Loaded {len(entries)} contexts into vector index for workspace {workspace_id}")
+
+    async def _index_contexts(self, workspace_id: str, contexts: List[ContextEntry]):
+        """Embeds freshly stored contexts; indexing problems never fail the write."""
+        try:
+            await self.vector_index.upsert_many(workspace_id, [self._index_entry(ctx) for ctx in contexts])
+        except Exception as e:
+            logger.warning(f"Vector index upsert failed for workspace {workspace_id}: {e}")
+
+    def _index_entry(self, ctx: ContextEntry) -> Tuple[str, str, ContextEntry, str, float, float]:
+        return (
+            ctx.id,
+            context_to_text(ctx.context_type, ctx.content),
+            ctx,
+            ctx.context_type,
+            float(ctx.importance_score or 0.0),
+            self._to_timestamp(ctx.created_at),
+        )
+
+    @staticmethod
+    def _to_timestamp(value: Union[str, datetime, None]) -> float:
+        """Epoch seconds for DB timestamps (ISO strings) and naive-UTC datetimes."""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                return 0.0
+        if not isinstance(value, datetime):
+            return 0.0
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+
     async def _ai_semantic_search(self, query: str, contexts: List[ContextEntry], max_results: int) -> List[ContextEntry]:
-        """AI-powered semantic search to rank contexts."""
+        """AI-powered reranking of the vector index shortlist."""
         from services.ai_provider_abstraction import ai_provider_manager
         # 🤖 **SELF-CONTAINED**: Use internal semantic search configuration
         SEMANTIC_SEARCH_AGENT_CONFIG = {
@@ -292,7 +367,8 @@ class UnifiedMemoryEngine:
                 provider_type='openai_sdk',
                 agent=SEMANTIC_SEARCH_AGENT_CONFIG,
                 prompt=ranking_prompt,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                cache="memory_semantic_search"
             )
 
             ranked_ids = ranking_result.get("ranked_ids", [])
@@ -363,7 +439,7 @@ class UnifiedMemoryEngine:
             db_record = asdict(pattern)
             db_record['last_used'] = None # Ensure it's null on creation
 
-            response = self.supabase.table("memory_patterns").insert(db_record).execute()
+            response = await self.async_supabase.table("memory_patterns").insert(db_record).execute()
 
             if response.data:
                 logger.info(f"🧠 Learned new pattern: {pattern_id} for {content_type}")
@@ -393,7 +469,7 @@ class UnifiedMemoryEngine:
             if not self.supabase:
                 return [] # Fallback for environments without DB (already logged above)
 
-            response = self.supabase.table("memory_patterns") \
+            response = await self.async_supabase.table("memory_patterns") \
                 .select("*") \
                 .eq("pattern_type", content_type) \
                 .order("confidence", desc=True) \
@@ -575,7 +651,21 @@ class UnifiedMemoryEngine:
     def get_stats(self) -> Dict[str, Any]:
         """Returns current engine statistics."""
         cache_efficiency = self.stats["cache_hits"] / max(1, self.stats["cache_hits"] + self.stats["cache_misses"])
-        return {**self.stats, "cache_hit_ratio": f"{cache_efficiency:.2%}"}
+        relevance_cache_stats = self.relevance_cache.get_stats()
+        return {
+            **self.stats,
+            "cache_hit_ratio": f"{cache_efficiency:.2%}",
+            "cache_evictions": relevance_cache_stats["evictions"],
+            "cache_expirations": relevance_cache_stats["expirations"],
+            "cache_invalidations": relevance_cache_stats["invalidations"],
+            "relevance_cache": {
+                "entries": relevance_cache_stats["cache_size"],
+                "max_entries": self.relevance_cache.max_size,
+                "bytes_used": relevance_cache_stats["bytes_used"],
+                "max_bytes": self.relevance_cache.max_bytes,
+            },
+            "vector_index": self.vector_index.get_stats(),
+        }
 
     # === AGENT PERFORMANCE MEMORY ===
 
@@ -599,7 +689,7 @@ class UnifiedMemoryEngine:
 
         try:
             # Use an RPC call to an upsert function for atomic updates
-            self.supabase.rpc(
+            await self.async_supabase.rpc(
                 'update_agent_performance',
                 {
                     'p_agent_id': str(agent_id),
@@ -630,7 +720,7 @@ class UnifiedMemoryEngine:
             return [] # Fallback for environments without DB (already logged above)
         
         try:
-            response = self.supabase.table('agent_performance_metrics') \
+            response = await self.async_supabase.table('agent_performance_metrics') \
                 .select('agent_id, avg_quality_score, agents(name, role, seniority)') \
                 .eq('workspace_id', str(workspace_id)) \
                 .ilike('agents.role', f'%{role}%') \
@@ -658,7 +748,7 @@ class UnifiedMemoryEngine:
             
             # Retrieve recent contexts with high importance
             if self.supabase:
-                response = self.supabase.table("memory_context_entries").select("*") \
+                response = await self.async_supabase.table("memory_context_entries").select("*") \
                     .eq("workspace_id", workspace_id_str) \
                     .gte("importance_score", 0.7) \
                     .order("created_at", desc=True) \
@@ -737,7 +827,88 @@ class UnifiedMemoryEngine:
         return await self.store_context(
             workspace_id, "insight", context_content, confidence_score, full_metadata
         )
-    
+
+    async def store_insights(self, workspace_id: str, insights: List[Dict[str, Any]]) -> int:
+        """
+        Stores many insights with one insert (per-row fallback if the batch is rejected).
+
+        Each item carries content, insight_type, relevance_tags, confidence_score and
+        optionally content_hash, which becomes the entry's semantic_hash so callers
+        can deduplicate with get_existing_semantic_hashes.
+        """
+        if not insights:
+            return 0
+        if not self.supabase:
+            self.supabase = get_supabase_client()
+        workspace_id_str = str(workspace_id)
+
+        entries = []
+        for insight in insights:
+            content = {
+                "insight_content": insight["content"],
+                "relevance_tags": insight.get("relevance_tags") or [],
+            }
+            entries.append(ContextEntry(
+                id=str(uuid4()),
+                workspace_id=workspace_id_str,
+                context_type="insight",
+                content=content,
+                importance_score=insight.get("confidence_score", 0.8),
+                semantic_hash=insight.get("content_hash")
+                or hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest(),
+            ))
+        if not self.supabase:
+            return 0
+
+        records = []
+        for entry in entries:
+            record = asdict(entry)
+            record['created_at'] = record['created_at'].isoformat()
+            del record['metadata']
+            records.append(record)
+
+        stored = entries
+        try:
+            response = await self.async_supabase.table("memory_context_entries").insert(records).execute()
+            if not response.data:
+                raise Exception("batch insert returned no rows")
+        except Exception as e:
+            logger.warning(f"Batch insight insert failed ({e}), storing {len(records)} insights one by one")
+            stored = []
+            for entry, record in zip(entries, records):
+                try:
+                    response = await self.async_supabase.table("memory_context_entries").insert(record).execute()
+                    if response.data:
+                        stored.append(entry)
+                except Exception as row_error:
+                    logger.error(f"Error storing insight {entry.semantic_hash}: {row_error}")
+
+        self.stats["contexts_stored"] += len(stored)
+        if stored:
+            self.invalidate_relevance_cache(workspace_id_str)
+            await self._index_contexts(workspace_id_str, stored)
+        return len(stored)
+
+    async def get_existing_semantic_hashes(self, workspace_id: str, hashes: List[str]) -> set:
+        """Subset of ``hashes`` already stored for the workspace, one in_() query per 200 hashes."""
+        hashes = list(dict.fromkeys(h for h in hashes if h))
+        if not hashes:
+            return set()
+        if not self.supabase:
+            self.supabase = get_supabase_client()
+            if not self.supabase:
+                return set()
+
+        existing = set()
+        for start in range(0, len(hashes), 200):
+            batch = hashes[start:start + 200]
+            response = await self.async_supabase.table("memory_context_entries").select("semantic_hash") \
+                .eq("workspace_id", str(workspace_id)) \
+                .in_("semantic_hash", batch) \
+                .execute()
+            existing.update(row.get("semantic_hash") for row in response.data or [])
+        return existing
+
     # === HOLISTIC MEMORY MANAGER INTERFACE BRIDGE ===
     
     async def store_memory(
@@ -883,7 +1054,7 @@ class UnifiedMemoryEngine:
                     return []
             
             # Build query based on filters
-            query = self.supabase.table('memory_contexts').select('*')
+            query = self.async_supabase.table('memory_contexts').select('*')
             
             # 🔧 **UUID FIX**: Always filter by workspace_id (no more "default")
             if workspace_id:
@@ -894,7 +1065,7 @@ class UnifiedMemoryEngine:
                 query = query.eq('context_type', context_filter["context_type"])
             
             # Execute query with limit
-            response = query.order('created_at', desc=True).limit(limit).execute()
+            response = await query.order('created_at', desc=True).limit(limit).execute()
             
             return response.data or []
             
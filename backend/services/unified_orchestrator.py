@@ -62,6 +62,7 @@ from database import (
     update_task_status, create_task
 )
 from models import TaskStatus, WorkspaceStatus, GoalStatus, WorkspaceGoal
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED, GOAL_CHANGED, DELIVERABLE_CHANGED
 from config.quality_system_config import get_env_bool, get_env_int, get_env_float
 from services.unified_memory_engine import get_universal_memory_architecture
 
@@ -1506,7 +1507,7 @@ class UnifiedOrchestrator:
                 "timestamp": datetime.now().isoformat()
             }
             
-            supabase.table("deliverables").insert({
+            insert_result = supabase.table("deliverables").insert({
                 "workspace_id": str(result.workspace_id),
                 "goal_id": str(result.goal_id),
                 "title": f"Unified Workflow Report - {goal.get('title')}",
@@ -1516,6 +1517,8 @@ class UnifiedOrchestrator:
                 "quality_score": result.quality_score,
                 "approval_status": "approved" if result.quality_score >= 80 else "needs_review"
             }).execute()
+            if insert_result.data:
+                task_event_bus.publish(DELIVERABLE_CHANGED, workspace_id=str(result.workspace_id))
             
             result.stage_results["deliverable_creation"] = deliverable_content
             logger.info(f"📦 Created unified workflow deliverable with optimization metadata")
@@ -1542,6 +1545,7 @@ class UnifiedOrchestrator:
                 update_data["optimization_metadata"] = safe_json_dumps(adaptive_settings)
             
             supabase.table("workspaces").update(update_data).eq("id", str(result.workspace_id)).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=str(result.workspace_id))
             
             # Update goal status with optimization results
             goal_update_data = {
@@ -1558,6 +1562,7 @@ class UnifiedOrchestrator:
                 })
             
             supabase.table("workspace_goals").update(goal_update_data).eq("id", str(result.goal_id)).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=str(result.workspace_id), goal_id=str(result.goal_id))
             
             logger.info(f"🎯 Finalized unified workflow for workspace {result.workspace_id}")
             
@@ -1585,11 +1590,13 @@ class UnifiedOrchestrator:
                 "asset_completion_rate": 0,
                 "updated_at": datetime.now().isoformat()
             }).eq("id", str(result.goal_id)).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=str(result.workspace_id), goal_id=str(result.goal_id))
             
             supabase.table("workspaces").update({
                 "status": "active",
                 "updated_at": datetime.now().isoformat()
             }).eq("id", str(result.workspace_id)).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=str(result.workspace_id))
             
             result.rollback_success = True
             result.final_status = WorkflowStatus.ROLLBACK_COMPLETED
@@ -21,6 +21,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 from database import supabase
+from utils.task_event_bus import task_event_bus, GOAL_CHANGED
 from models import WorkspaceGoal, GoalStatus, TaskStatus
 from dataclasses import dataclass
 
@@ -289,6 +290,7 @@ Be conservative but fair in your assessment."""
                 "last_validation_at": datetime.now().isoformat(),
                 "updated_at": datetime.now().isoformat()
             }).eq("id", progress_event.goal_id).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=progress_event.workspace_id, goal_id=progress_event.goal_id)
             
             # Check if goal is now completed
             if new_value >= target_value:
@@ -318,6 +320,7 @@ Be conservative but fair in your assessment."""
                 "status": GoalStatus.COMPLETED.value,
                 "completed_at": datetime.now().isoformat()
             }).eq("id", goal_id).execute()
+            task_event_bus.publish(GOAL_CHANGED, workspace_id=workspace_id, goal_id=goal_id)
             
             # Trigger deliverable creation
             from services.deliverable_achievement_mapper import deliverable_achievement_mapper
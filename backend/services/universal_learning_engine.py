@@ -9,21 +9,27 @@ AI-driven approach that works for ANY business domain in ANY language.
 import logging
 import json
 import hashlib
+import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
 from database import (
     get_memory_insights, 
-    add_memory_insight, 
+    add_memory_insights,
+    get_existing_insight_hashes,
     get_supabase_client,
     get_deliverables
 )
 from services.ai_provider_abstraction import ai_provider_manager
+from services.learning_watermarks import LearningWatermark, fetch_changed_deliverables, learning_watermarks
 from config.quality_system_config import QualitySystemConfig
 
 logger = logging.getLogger(__name__)
 
+# How long a workspace's AI-detected domain/language is reused before it is detected again
+LEARNING_CONTEXT_TTL_SECONDS = int(os.getenv("LEARNING_CONTEXT_TTL_SECONDS", str(24 * 3600)))
+
 @dataclass
 class UniversalBusinessInsight:
     """
@@ -64,14 +70,29 @@ class UniversalLearningEngine:
     - Works universally for any business (Pillar #3) 
     - Auto-learns from new domains (Pillar #4)
     - Multi-language support (Pillar #3)
+    
+    Runs are incremental: only deliverables changed since the workspace watermark
+    are analysed, and the detected context is reused between runs.
     """
     
+    WATERMARK_NAME = "universal_learning"
+    
     def __init__(self):
         self.analysis_window_days = 30
         self.minimum_deliverables_for_pattern = 2
         self.quality_threshold = 0.7
         # NO domain lists, NO patterns, NO hard-coded extractors
         # Everything is AI-driven
+        
+        self.learning_stats = {
+            "runs": 0,
+            "deliverables_analyzed": 0,
+            "context_detections": 0,
+            "context_reuses": 0,
+            "insights_stored": 0,
+            "duplicates_skipped": 0,
+            "failed_runs": 0,
+        }
     
     async def analyze_workspace_content(self, workspace_id: str) -> Dict[str, Any]:
         """
@@ -80,34 +101,55 @@ class UniversalLearningEngine:
         """
         try:
             logger.info(f"🤖 AI-Universal analysis for workspace {workspace_id}")
+            self.learning_stats["runs"] += 1
             
-            # Get quality deliverables
-            deliverables = await self._get_quality_deliverables(workspace_id)
+            # Get quality deliverables changed since the watermark (plus those carried over)
+            mark = await learning_watermarks.get(self.WATERMARK_NAME, workspace_id)
+            deliverables = await self._get_quality_deliverables(workspace_id, mark)
             
             if not deliverables or len(deliverables) < self.minimum_deliverables_for_pattern:
-                logger.info("Insufficient deliverables for analysis")
-                return {"status": "insufficient_data", "insights_generated": 0}
+                # Keep them for the next run instead of dropping them below the pattern minimum
+                mark.carry_over(d['id'] for d in deliverables)
+                await learning_watermarks.save(self.WATERMARK_NAME, workspace_id, mark)
+                logger.info("Insufficient new deliverables for analysis")
+                return {"status": "insufficient_data", "insights_generated": 0,
+                        "deliverables_pending": len(mark.pending_ids)}
+            
+            self.learning_stats["deliverables_analyzed"] += len(deliverables)
             
-            # AI detects domain and language dynamically
-            context = await self._ai_detect_context(deliverables)
-            logger.info(f"🌍 AI detected: {context['domain']} domain in {context['language']}")
+            # AI detects domain and language dynamically (reused from earlier runs while fresh)
+            context = await self._workspace_context(deliverables, mark)
+            logger.info(f"🌍 AI detected: {context.get('domain')} domain in {context.get('language')}")
             
             # AI extracts insights universally (no domain-specific methods)
             insights = await self._ai_extract_universal_insights(deliverables, context)
             
             # Store insights
-            insights_stored = await self._store_universal_insights(workspace_id, insights)
+            insights_stored = None if insights is None else await self._store_universal_insights(workspace_id, insights)
+            
+            if insights_stored is None:
+                # Leave the watermark where it was: the next run re-analyses these deliverables
+                # (insights stored this time are skipped as duplicates)
+                self.learning_stats["failed_runs"] += 1
+                logger.warning(f"Universal learning for workspace {workspace_id} failed, "
+                               f"{len(deliverables)} deliverables will be re-analysed on the next run")
+                return {"status": "error", "error": "insight extraction or storage failed",
+                        "insights_generated": 0, "deliverables_analyzed": len(deliverables)}
             
             # Generate cross-domain patterns with AI
             patterns = await self._ai_find_patterns(insights)
             
+            mark.carry_over([])
+            await learning_watermarks.save(self.WATERMARK_NAME, workspace_id, mark)
+            
             logger.info(f"✅ Generated {insights_stored} universal insights via AI")
             return {
                 "status": "completed",
                 "insights_generated": insights_stored,
-                "domain_detected": context['domain'],
-                "language_detected": context['language'],
+                "domain_detected": context.get('domain'),
+                "language_detected": context.get('language'),
                 "deliverables_analyzed": len(deliverables),
+                "watermark": mark.watermark,
                 "extraction_method": "ai_universal",
                 "patterns_found": len(patterns),
                 "analysis_timestamp": datetime.now().isoformat()
@@ -117,6 +159,25 @@ class UniversalLearningEngine:
             logger.error(f"Error in universal analysis: {e}")
             return {"status": "error", "error": str(e)}
     
+    async def _workspace_context(self, deliverables: List[Dict[str, Any]], mark: LearningWatermark) -> Dict[str, Any]:
+        """Context stored with the watermark while younger than LEARNING_CONTEXT_TTL_SECONDS, else detected anew"""
+        detected_at = mark.context_detected_at
+        if mark.context and detected_at:
+            try:
+                age = (datetime.now() - datetime.fromisoformat(detected_at)).total_seconds()
+            except ValueError:
+                age = None
+            if age is not None and 0 <= age < LEARNING_CONTEXT_TTL_SECONDS:
+                self.learning_stats["context_reuses"] += 1
+                return mark.context
+        
+        self.learning_stats["context_detections"] += 1
+        context = await self._ai_detect_context(deliverables)
+        if context.get('domain') not in (None, 'unknown'):
+            mark.context = context
+            mark.context_detected_at = datetime.now().isoformat()
+        return context
+    
     async def _ai_detect_context(self, deliverables: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Use AI to detect domain and language dynamically.
@@ -175,10 +236,11 @@ class UniversalLearningEngine:
         self, 
         deliverables: List[Dict[str, Any]], 
         context: Dict[str, Any]
-    ) -> List[UniversalBusinessInsight]:
+    ) -> Optional[List[UniversalBusinessInsight]]:
         """
         Extract insights from ANY domain using AI.
         No hard-coded patterns or domain-specific logic.
+        Returns None when the AI call failed (as opposed to [] for no insights).
         """
         insights = []
         
@@ -249,7 +311,11 @@ class UniversalLearningEngine:
                 response_format={"type": "json_object"}
             )
             
-            if response and 'insights' in response:
+            if not isinstance(response, dict) or not isinstance(response.get('insights'), list):
+                logger.warning("Universal insight extraction returned no usable result")
+                return None
+            
+            if response['insights']:
                 for item in response['insights']:
                     # Generate title if not provided or too long
                     title = item.get('title', '')
@@ -287,7 +353,7 @@ class UniversalLearningEngine:
             
         except Exception as e:
             logger.error(f"Error extracting universal insights: {e}")
-            return insights
+            return None
     
     async def _ai_find_patterns(self, insights: List[UniversalBusinessInsight]) -> List[Dict[str, Any]]:
         """
@@ -345,25 +411,23 @@ class UniversalLearningEngine:
             logger.error(f"Error finding patterns: {e}")
             return []
     
-    async def _get_quality_deliverables(self, workspace_id: str) -> List[Dict[str, Any]]:
-        """Get deliverables that meet quality threshold"""
+    async def _get_quality_deliverables(self, workspace_id: str, mark: Optional[LearningWatermark] = None) -> List[Dict[str, Any]]:
+        """Get deliverables that meet quality threshold, only those changed since ``mark`` (advanced in place)"""
         try:
             supabase = get_supabase_client()
             
             cutoff_date = datetime.now() - timedelta(days=self.analysis_window_days)
             
-            response = supabase.table('deliverables')\
-                .select('*')\
-                .eq('workspace_id', workspace_id)\
-                .gte('created_at', cutoff_date.isoformat())\
-                .execute()
+            mark = mark or LearningWatermark()
+            rows = fetch_changed_deliverables(supabase, workspace_id, cutoff_date, mark)
+            mark.advance(rows)
             
-            if not response.data:
+            if not rows:
                 return []
             
             # Filter by quality using AI-driven quality assessment
             quality_deliverables = []
-            for deliverable in response.data:
+            for deliverable in rows:
                 quality_score = await self._ai_assess_quality(deliverable)
                 if quality_score >= self.quality_threshold:
                     quality_deliverables.append(deliverable)
@@ -436,38 +500,15 @@ class UniversalLearningEngine:
     
     async def _check_insight_exists(self, workspace_id: str, content_hash: str) -> bool:
         """Check if insight already exists"""
-        try:
-            supabase = get_supabase_client()
-            
-            result = supabase.table('workspace_insights')\
-                .select('content')\
-                .eq('workspace_id', workspace_id)\
-                .execute()
-            
-            if result.data:
-                for existing_insight in result.data:
-                    existing_content = existing_insight.get('content', '')
-                    if isinstance(existing_content, str):
-                        try:
-                            parsed = json.loads(existing_content)
-                            if parsed.get('content_hash') == content_hash:
-                                return True
-                        except:
-                            pass
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Error checking existence: {e}")
-            return False
+        return content_hash in await get_existing_insight_hashes(workspace_id, [content_hash])
     
     async def _store_universal_insights(
         self, 
         workspace_id: str, 
         insights: List[UniversalBusinessInsight]
-    ) -> int:
-        """Store insights with deduplication"""
-        stored_count = 0
+    ) -> Optional[int]:
+        """Store insights with deduplication: one hash lookup and one insert for the whole batch (None if any insert failed)"""
+        candidates = {}
         
         for insight in insights:
             try:
@@ -486,59 +527,82 @@ class UniversalLearningEngine:
                         actionable_recommendation=insight.get('actionable_recommendation', insight.get('learning', ''))
                     )
                 
-                # Check for duplicates
-                content_hash = self._generate_insight_hash(insight)
-                
-                if await self._check_insight_exists(workspace_id, content_hash):
-                    logger.info(f"Skipping duplicate insight: {insight.to_learning_format()[:60]}...")
-                    continue
-                
-                # Create storage format
-                insight_content = {
-                    "learning": insight.to_learning_format(),
-                    "title": insight.title,  # Add title for UI display
-                    "insight_type": insight.insight_type,
-                    "domain_context": insight.domain_context,  # Dynamic domain
-                    "language": insight.language,  # Multi-language support
-                    "confidence_score": insight.confidence_score,
-                    "extraction_method": insight.extraction_method,
-                    "evidence_sources": insight.evidence_sources,
-                    "created_at": insight.created_at.isoformat(),
-                    "content_hash": content_hash
-                }
-                
-                # Add metrics if available
-                if insight.metric_name:
-                    insight_content["metric_name"] = insight.metric_name
-                if insight.metric_value is not None:
-                    insight_content["metric_value"] = insight.metric_value
-                if insight.comparison_baseline:
-                    insight_content["comparison_baseline"] = insight.comparison_baseline
-                if insight.actionable_recommendation:
-                    insight_content["recommendation"] = insight.actionable_recommendation
-                
-                # Store in database
-                await add_memory_insight(
-                    workspace_id=workspace_id,
-                    insight_type="universal_business_learning",
-                    content=json.dumps(insight_content, ensure_ascii=False, indent=2),
-                    agent_role="universal_learning_engine",
-                    confidence_score=insight.confidence_score,
-                    relevance_tags=[insight.domain_context, insight.insight_type, insight.language],
-                    title=insight.title  # Pass title directly for database storage
-                )
-                
-                logger.info(f"✅ Stored universal insight: {insight.to_learning_format()[:60]}...")
-                stored_count += 1
+                candidates.setdefault(self._generate_insight_hash(insight), insight)
                 
             except AttributeError as e:
                 # Handle case where insight is not the expected type
                 logger.error(f"Error storing insight - invalid format: {e}")
                 logger.debug(f"Insight type: {type(insight)}, content: {insight}")
-            except Exception as e:
-                logger.error(f"Error storing insight: {e}")
         
-        return stored_count
+        if not candidates:
+            return 0
+        
+        try:
+            # Check for duplicates
+            existing = await get_existing_insight_hashes(workspace_id, list(candidates))
+            new_insights = [(content_hash, insight) for content_hash, insight in candidates.items()
+                            if content_hash not in existing]
+            
+            skipped = len(insights) - len(new_insights)
+            self.learning_stats["duplicates_skipped"] += skipped
+            if skipped:
+                logger.info(f"Skipping {skipped} duplicate insights")
+            if not new_insights:
+                return 0
+            
+            # Store in database
+            stored_count = await add_memory_insights(
+                workspace_id, [self._insight_record(insight, content_hash) for content_hash, insight in new_insights]
+            )
+            self.learning_stats["insights_stored"] += stored_count or 0
+            if stored_count is None or stored_count < len(new_insights):
+                logger.warning(f"Stored {stored_count or 0} of {len(new_insights)} universal insights")
+                return None
+            logger.info(f"✅ Stored {stored_count} universal insights")
+            return stored_count
+            
+        except Exception as e:
+            logger.error(f"Error storing insights: {e}")
+            return None
+    
+    def _insight_record(self, insight: UniversalBusinessInsight, content_hash: str) -> Dict[str, Any]:
+        """Storage record for add_memory_insights"""
+        # Create storage format
+        insight_content = {
+            "learning": insight.to_learning_format(),
+            "title": insight.title,  # Add title for UI display
+            "insight_type": insight.insight_type,
+            "domain_context": insight.domain_context,  # Dynamic domain
+            "language": insight.language,  # Multi-language support
+            "confidence_score": insight.confidence_score,
+            "extraction_method": insight.extraction_method,
+            "evidence_sources": insight.evidence_sources,
+            "created_at": insight.created_at.isoformat(),
+            "content_hash": content_hash
+        }
+        
+        # Add metrics if available
+        if insight.metric_name:
+            insight_content["metric_name"] = insight.metric_name
+        if insight.metric_value is not None:
+            insight_content["metric_value"] = insight.metric_value
+        if insight.comparison_baseline:
+            insight_content["comparison_baseline"] = insight.comparison_baseline
+        if insight.actionable_recommendation:
+            insight_content["recommendation"] = insight.actionable_recommendation
+        
+        return {
+            "insight_type": "universal_business_learning",
+            "content": json.dumps(insight_content, ensure_ascii=False, indent=2),
+            "confidence_score": insight.confidence_score,
+            "relevance_tags": [insight.domain_context, insight.insight_type, insight.language],
+            "title": insight.title,
+            "content_hash": content_hash,
+        }
+    
+    def get_learning_stats(self) -> Dict[str, Any]:
+        """Incremental learning counters"""
+        return dict(self.learning_stats)
     
     async def get_actionable_learnings(
         self, 
@@ -625,7 +689,9 @@ class UniversalLearningEngine:
             insights = await self._ai_extract_universal_insights([deliverable], context)
             
             # Store insights
-            stored_count = await self._store_universal_insights(workspace_id, insights)
+            stored_count = None if insights is None else await self._store_universal_insights(workspace_id, insights)
+            if stored_count is None:
+                return {"status": "error", "error": "insight extraction or storage failed"}
             
             return {
                 "status": "completed",
@@ -0,0 +1,256 @@
+"""
+🗂️ Workspace Context Snapshot Service
+Assembles the conversational workspace context (workspace, team, tasks,
+deliverables, budget, goals, memory and learning insights) from independent
+section loaders that run concurrently, so a chat turn waits for the slowest
+section instead of the sum of all of them.
+
+- Every section has its own timeout; a section that fails or times out falls back
+  to its default value and is listed in ``_snapshot.partial_sections``.
+- A section can depend on another one (budget and learning insights need the
+  workspace row); it starts as soon as that dependency resolves.
+- Assembled snapshots are cached per workspace and variant (e.g. the full chat
+  context and the lightweight one) and dropped when a task, goal, deliverable,
+  agent or the workspace row itself changes (task event bus). Partial snapshots
+  are not cached (other variants of the workspace are kept).
+- Per-section latency histograms are exposed through ``get_stats``.
+"""
+
+import asyncio
+import copy
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.latency_histogram import LatencyHistogram
+from utils.performance_cache import PerformanceCache, make_tag
+from utils.task_event_bus import (
+    AGENT_CHANGED,
+    DELIVERABLE_CHANGED,
+    GOAL_CHANGED,
+    TASK_CREATED,
+    TASK_STATUS_CHANGED,
+    WORKSPACE_CHANGED,
+    TaskEvent,
+    task_event_bus,
+)
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE_CONTEXT_SECTION_TIMEOUT_SECONDS = float(os.getenv("WORKSPACE_CONTEXT_SECTION_TIMEOUT_SECONDS", "5"))
+WORKSPACE_CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("WORKSPACE_CONTEXT_CACHE_TTL_SECONDS", "120"))
+WORKSPACE_CONTEXT_CACHE_MAX_ENTRIES = int(os.getenv("WORKSPACE_CONTEXT_CACHE_MAX_ENTRIES", "200"))
+
+# Events after which a cached snapshot of the workspace is stale
+INVALIDATING_EVENTS = {
+    TASK_CREATED, TASK_STATUS_CHANGED, GOAL_CHANGED, DELIVERABLE_CHANGED, WORKSPACE_CHANGED, AGENT_CHANGED,
+}
+
+
+@dataclass
+class ContextSection:
+    """
+    One independently loadable part of the snapshot.
+
+    ``loader`` receives the already loaded value of ``depends_on`` (when set) and
+    returns the section value; ``default`` builds the fallback value.
+    """
+    name: str
+    loader: Callable[..., Awaitable[Any]]
+    default: Callable[[], Any] = dict
+    depends_on: Optional[str] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class SectionOutcome:
+    value: Any
+    seconds: float
+    status: str = "ok"  # ok | timeout | error
+    error: Optional[str] = None
+
+
+class WorkspaceContextSnapshotService:
+    """Concurrent, cached assembly of per-workspace context snapshots."""
+
+    def __init__(
+        self,
+        section_timeout: float = WORKSPACE_CONTEXT_SECTION_TIMEOUT_SECONDS,
+        cache_ttl: int = WORKSPACE_CONTEXT_CACHE_TTL_SECONDS,
+        max_entries: int = WORKSPACE_CONTEXT_CACHE_MAX_ENTRIES,
+        event_bus=task_event_bus,
+    ):
+        self.section_timeout = section_timeout
+        self.cache_ttl = cache_ttl
+        self.cache = PerformanceCache(max_size=max_entries, default_ttl=cache_ttl)
+        # Bumped when a workspace is invalidated while it is loading, so loads started
+        # before the invalidation never land under the new key; idle workspaces are
+        # forgotten, keeping the map bounded by the workspaces with recent races
+        self._generations: Dict[str, int] = {}
+        self._loading: Dict[str, int] = {}
+        self.max_generations = max_entries
+        self._section_latency: Dict[str, LatencyHistogram] = {}
+        self._section_failures: Dict[str, Dict[str, int]] = {}
+        self.stats = {"snapshots_built": 0, "partial_snapshots": 0, "invalidations": 0}
+        self._event_bus = event_bus
+        if event_bus is not None:
+            event_bus.add_listener(self._on_event)
+
+    # ------------------------------------------------------------------ cache
+
+    def _cache_key(self, workspace_id: str, variant: str) -> str:
+        return f"workspace_context:{variant}:{workspace_id}:{self._generations.get(workspace_id, 0)}"
+
+    @staticmethod
+    def _variant_tag(workspace_id: str, variant: str) -> str:
+        return make_tag("workspace_context", f"{variant}:{workspace_id}")
+
+    def invalidate(self, workspace_id: str) -> int:
+        """Drop the cached snapshots (every variant) of a workspace."""
+        workspace_id = str(workspace_id)
+        if self._loading.get(workspace_id):
+            self._generations[workspace_id] = self._generations.get(workspace_id, 0) + 1
+            self._prune_generations()
+        else:
+            # Nothing in flight and every cached variant is dropped below: the key can restart
+            self._generations.pop(workspace_id, None)
+        self.stats["invalidations"] += 1
+        return self.cache.invalidate_tags(make_tag("workspace_id", workspace_id))
+
+    def _prune_generations(self):
+        """Forget the generations of idle workspaces once more than ``max_generations`` are tracked."""
+        if len(self._generations) <= self.max_generations:
+            return
+        for workspace_id in [ws for ws in self._generations if not self._loading.get(ws)]:
+            del self._generations[workspace_id]
+            # A stale load may have landed under an older key that is reachable again
+            self.cache.invalidate_tags(make_tag("workspace_id", workspace_id))
+
+    def _on_event(self, event: TaskEvent):
+        if event.event_type in INVALIDATING_EVENTS and event.workspace_id:
+            self.invalidate(event.workspace_id)
+
+    # ------------------------------------------------------------------ loading
+
+    async def get_snapshot(
+        self,
+        workspace_id: str,
+        sections: List[ContextSection],
+        force_refresh: bool = False,
+        variant: str = "full",
+    ) -> Dict[str, Any]:
+        """
+        Return the workspace snapshot, from cache when fresh.
+
+        ``variant`` names the section set: callers assembling different sections
+        for the same workspace must use different variants.
+
+        The returned dict is a shallow copy: callers may add keys without touching
+        the cached snapshot.
+        """
+        workspace_id = str(workspace_id)
+        if force_refresh:
+            self.invalidate(workspace_id)
+
+        variant_tag = self._variant_tag(workspace_id, variant)
+        self._loading[workspace_id] = self._loading.get(workspace_id, 0) + 1
+        try:
+            snapshot = await self.cache.get_or_load(
+                self._cache_key(workspace_id, variant),
+                lambda: self._build_snapshot(workspace_id, sections),
+                tags=[make_tag("workspace_id", workspace_id), variant_tag],
+            )
+        finally:
+            self._loading[workspace_id] -= 1
+            if not self._loading[workspace_id]:
+                del self._loading[workspace_id]
+        if snapshot["_snapshot"]["partial_sections"]:
+            # Do not serve a degraded snapshot beyond the requests that waited for it
+            self.cache.invalidate_tags(variant_tag)
+
+        return copy.copy(snapshot)
+
+    async def _build_snapshot(self, workspace_id: str, sections: List[ContextSection]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        by_name = {section.name: section for section in sections}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run(section: ContextSection) -> SectionOutcome:
+            args: Tuple[Any, ...] = ()
+            if section.depends_on:
+                dependency = await tasks[section.depends_on]
+                args = (dependency.value,)
+            return await self._load_section(section, args)
+
+        for section in sections:
+            if section.depends_on and section.depends_on not in by_name:
+                raise ValueError(f"Section '{section.name}' depends on unknown section '{section.depends_on}'")
+        for section in sections:
+            tasks[section.name] = asyncio.create_task(run(section))
+
+        outcomes = dict(zip(tasks.keys(), await asyncio.gather(*tasks.values())))
+
+        snapshot: Dict[str, Any] = {name: outcome.value for name, outcome in outcomes.items()}
+        partial = [name for name, outcome in outcomes.items() if outcome.status != "ok"]
+        snapshot["_snapshot"] = {
+            "workspace_id": workspace_id,
+            "built_at": time.time(),
+            "total_seconds": round(time.perf_counter() - started, 4),
+            "section_seconds": {name: round(outcome.seconds, 4) for name, outcome in outcomes.items()},
+            "partial_sections": partial,
+        }
+
+        self.stats["snapshots_built"] += 1
+        if partial:
+            self.stats["partial_snapshots"] += 1
+            logger.warning(f"⚠️ Workspace {workspace_id} context built without fresh sections: {partial}")
+        return snapshot
+
+    async def _load_section(self, section: ContextSection, args: Tuple[Any, ...]) -> SectionOutcome:
+        timeout = section.timeout if section.timeout is not None else self.section_timeout
+        started = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(section.loader(*args), timeout=timeout)
+            outcome = SectionOutcome(value=value, seconds=time.perf_counter() - started)
+        except asyncio.TimeoutError:
+            outcome = SectionOutcome(
+                value=section.default(), seconds=time.perf_counter() - started, status="timeout",
+                error=f"timed out after {timeout}s",
+            )
+        except Exception as e:
+            outcome = SectionOutcome(
+                value=section.default(), seconds=time.perf_counter() - started, status="error", error=str(e),
+            )
+
+        self._section_latency.setdefault(section.name, LatencyHistogram()).observe(outcome.seconds)
+        if outcome.status != "ok":
+            failures = self._section_failures.setdefault(section.name, {"timeout": 0, "error": 0})
+            failures[outcome.status] += 1
+            logger.warning(f"⚠️ Context section '{section.name}' {outcome.status}: {outcome.error}")
+        return outcome
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "tracked_generations": len(self._generations),
+            "cache": self.cache.get_stats(),
+            "sections": {
+                name: {
+                    **histogram.to_dict(),
+                    **self._section_failures.get(name, {"timeout": 0, "error": 0}),
+                }
+                for name, histogram in self._section_latency.items()
+            },
+        }
+
+
+# Global instance
+workspace_context_snapshots = WorkspaceContextSnapshotService()
+
+__all__ = [
+    "ContextSection",
+    "WorkspaceContextSnapshotService",
+    "workspace_context_snapshots",
+]
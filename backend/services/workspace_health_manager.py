@@ -28,7 +28,8 @@ try:
 except ImportError:
     date_parser = None
 
-from database import supabase, list_tasks, get_workspace
+from database import async_supabase, list_tasks, get_workspace
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED, AGENT_CHANGED
 from models import TaskStatus, WorkspaceStatus
 
 logger = logging.getLogger(__name__)
@@ -112,12 +113,16 @@ class WorkspaceHealthManager:
     async def check_workspace_health_with_recovery(
         self, 
         workspace_id: str,
-        attempt_auto_recovery: bool = True
+        attempt_auto_recovery: bool = True,
+        workspace_data: Optional[Dict] = None,
+        agents: Optional[List[Dict]] = None
     ) -> WorkspaceHealthReport:
         """
         🔍 CORE FUNCTION: Comprehensive health check with auto-recovery
         
-        Returns detailed health report and attempts recovery if issues found
+        Returns detailed health report and attempts recovery if issues found.
+        Callers checking many workspaces can pass rows they already batch-loaded
+        (``workspace_data``, ``agents``) to skip the per-workspace queries.
         """
         try:
             start_time = datetime.now()
@@ -132,12 +137,13 @@ class WorkspaceHealthManager:
             logger.info(f"🏥 Starting comprehensive health check for workspace {workspace_id}")
             
             # 1. Basic workspace validation
-            workspace_data = await get_workspace(workspace_id)
+            if workspace_data is None:
+                workspace_data = await get_workspace(workspace_id)
             if not workspace_data:
                 return self._create_error_report(workspace_id, "Workspace not found")
             
             # 2. Gather health data
-            health_data = await self._gather_health_data(workspace_id, workspace_data)
+            health_data = await self._gather_health_data(workspace_id, workspace_data, agents)
             
             # 3. Analyze health issues
             issues = await self._analyze_health_issues(workspace_id, health_data)
@@ -276,11 +282,11 @@ class WorkspaceHealthManager:
                 return self.base_task_limit
             
             # Get agent count
-            agents_response = supabase.table("agents").select("id").eq("workspace_id", workspace_id).execute()
+            agents_response = await async_supabase.table("agents").select("id").eq("workspace_id", workspace_id).execute()
             agent_count = len(agents_response.data) if agents_response.data else 1
             
             # Get goal complexity (number of active goals)
-            goals_response = supabase.table("workspace_goals").select("id").eq(
+            goals_response = await async_supabase.table("workspace_goals").select("id").eq(
                 "workspace_id", workspace_id
             ).eq("status", "active").execute()
             goal_count = len(goals_response.data) if goals_response.data else 1
@@ -304,26 +310,31 @@ class WorkspaceHealthManager:
             logger.error(f"Error calculating dynamic task limit for {workspace_id}: {e}")
             return self.base_task_limit
     
-    async def _gather_health_data(self, workspace_id: str, workspace_data: Dict) -> Dict:
-        """Gather all relevant data for health analysis"""
+    async def _gather_health_data(self, workspace_id: str, workspace_data: Dict, agents: Optional[List[Dict]] = None) -> Dict:
+        """Gather all relevant data for health analysis (queries run concurrently, off the event loop)"""
         
-        # Get tasks
-        tasks = await list_tasks(workspace_id)
+        async def load_agents() -> List[Dict]:
+            if agents is not None:
+                return agents
+            agents_response = await async_supabase.table("agents").select("*").eq("workspace_id", workspace_id).execute()
+            return agents_response.data or []
         
-        # Get agents
-        agents_response = supabase.table("agents").select("*").eq("workspace_id", workspace_id).execute()
-        agents = agents_response.data or []
+        async def load_goals() -> List[Dict]:
+            goals_response = await async_supabase.table("workspace_goals").select("*").eq("workspace_id", workspace_id).execute()
+            return goals_response.data or []
         
-        # Get goals
-        goals_response = supabase.table("workspace_goals").select("*").eq("workspace_id", workspace_id).execute()
-        goals = goals_response.data or []
+        async def load_recent_logs() -> List[Dict]:
+            # Recent execution logs (last hour)
+            one_hour_ago = (datetime.now() - timedelta(hours=1)).isoformat()
+            logs_response = await async_supabase.table("execution_logs").select("*").eq(
+                "workspace_id", workspace_id
+            ).gte("created_at", one_hour_ago).execute()
+            return logs_response.data or []
         
-        # Get recent execution logs (last hour)
-        one_hour_ago = (datetime.now() - timedelta(hours=1)).isoformat()
-        logs_response = supabase.table("execution_logs").select("*").eq(
-            "workspace_id", workspace_id
-        ).gte("created_at", one_hour_ago).execute()
-        recent_logs = logs_response.data or []
+        # Tasks only need name and status for the health analysis
+        tasks, agents, goals, recent_logs = await asyncio.gather(
+            list_tasks(workspace_id, fields="summary"), load_agents(), load_goals(), load_recent_logs()
+        )
         
         return {
             "workspace": workspace_data,
@@ -518,13 +529,14 @@ class WorkspaceHealthManager:
             
             if strategy == RecoveryStrategy.STATUS_RESET:
                 # Reset workspace status to active with enhanced logging
-                current_status_response = supabase.table("workspaces").select("status, updated_at").eq("id", workspace_id).single().execute()
+                current_status_response = await async_supabase.table("workspaces").select("status, updated_at").eq("id", workspace_id).single().execute()
                 current_status = current_status_response.data.get("status") if current_status_response.data else "unknown"
                 
-                supabase.table("workspaces").update({
+                await async_supabase.table("workspaces").update({
                     "status": "active",
                     "updated_at": datetime.now().isoformat()
                 }).eq("id", workspace_id).execute()
+                task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
                 
                 logger.info(f"✅ Reset workspace {workspace_id} status from '{current_status}' to 'active'")
                 
@@ -556,15 +568,16 @@ class WorkspaceHealthManager:
                     
             elif strategy == RecoveryStrategy.AGENT_REACTIVATION:
                 # Reactivate failed agents
-                inactive_agents = supabase.table("agents").select("id").eq(
+                inactive_agents = await async_supabase.table("agents").select("id").eq(
                     "workspace_id", workspace_id
                 ).neq("status", "active").neq("status", "available").execute()
                 
                 if inactive_agents.data:
                     for agent in inactive_agents.data:
-                        supabase.table("agents").update({
+                        await async_supabase.table("agents").update({
                             "status": "active"
                         }).eq("id", agent["id"]).execute()
+                        task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=agent["id"])
                     
                     logger.info(f"✅ Reactivated {len(inactive_agents.data)} agents")
                     return True
@@ -592,7 +605,7 @@ class WorkspaceHealthManager:
             logger.info("🔍 Starting system-wide check for stuck workspaces...")
             
             # Get all workspaces in processing_tasks status
-            stuck_workspaces_response = supabase.table("workspaces").select(
+            stuck_workspaces_response = await async_supabase.table("workspaces").select(
                 "id, name, status, updated_at"
             ).eq("status", "processing_tasks").execute()
             
@@ -10,6 +10,7 @@ from typing import Dict, List, Optional, Set
 from dataclasses import dataclass
 
 from database import supabase, get_workspaces_with_pending_tasks, get_active_workspaces
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
 from models import WorkspaceStatus
 
 logger = logging.getLogger(__name__)
@@ -365,6 +366,7 @@ class WorkspacePauseManager:
                 pass
             
             result = supabase.table('workspaces').update(update_data).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             if result.data:
                 logger.info(f"✅ Recovered workspace W:{workspace_id[:8]} - Score: {recovery_info.recovery_score:.1f}, Critical: {recovery_info.critical_tasks_count}, Pending: {recovery_info.pending_tasks_count}")
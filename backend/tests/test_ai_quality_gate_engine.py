@@ -0,0 +1,175 @@
+# backend/tests/test_ai_quality_gate_engine.py
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from ai_quality_assurance import ai_quality_gate_engine as gate_module
+from ai_quality_assurance.ai_quality_gate_engine import AIQualityGateEngine
+from models import AssetArtifact, QualityRule
+
+
+class FakeCompletions:
+    """Answers multi-rule prompts with one verdict per rule key, single-rule prompts with one verdict"""
+
+    def __init__(self, failing_rules=(), drop_keys=(), fail_multi=False):
+        self.calls = []
+        self.failing_rules = set(failing_rules)
+        self.drop_keys = set(drop_keys)
+        self.fail_multi = fail_multi
+
+    async def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.calls.append(prompt)
+        await asyncio.sleep(0.01)
+        if "rule_results" in prompt:
+            if self.fail_multi:
+                raise RuntimeError("bad structured output")
+            results = []
+            for line in prompt.splitlines():
+                key, sep, name = line.strip().partition(": ")
+                if sep and key[:1] == "R" and key[1:].isdigit() and key not in self.drop_keys:
+                    results.append(self._verdict(name, rule_key=key))
+            payload = {"rule_results": results}
+        else:
+            name = prompt.split("Rule Name: ", 1)[1].splitlines()[0]
+            payload = self._verdict(name)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+    def _verdict(self, rule_name, **extra):
+        passed = rule_name not in self.failing_rules
+        return {"validation_passed": passed, "quality_score": 0.9 if passed else 0.1, **extra}
+
+
+def _rule(name, severity="medium"):
+    return QualityRule(id=uuid4(), rule_name=name, asset_type="report",
+                       ai_validation_prompt=f"Check {name}", severity=severity)
+
+
+def _artifact():
+    return SimpleNamespace(id=uuid4(), artifact_name="Q3 report", artifact_type="report", content_format="text",
+                           content="Revenue grew 12%", quality_score=0.0, business_value_score=0.0)
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    state = {"rules": [], "logged": [], "status": []}
+
+    async def rules_for(asset_type):
+        return state["rules"]
+
+    async def log_many(validations):
+        state["logged"].append(len(validations))
+        return []
+
+    async def update_status(artifact_id, status, score):
+        state["status"].append(status)
+        return True
+
+    monkeypatch.setattr(gate_module, "get_quality_rules_for_asset_type", rules_for)
+    monkeypatch.setattr(gate_module, "log_quality_validations", log_many)
+    monkeypatch.setattr(gate_module, "update_artifact_status", update_status)
+    monkeypatch.setenv("AUTO_ENHANCEMENT_ENABLED", "false")
+    monkeypatch.setenv("ENABLE_AUTO_LEARNING_QUALITY_RULES", "false")
+    return state
+
+
+def _engine(completions, **env):
+    engine = AIQualityGateEngine(openai_client=SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    for attribute, value in env.items():
+        setattr(engine, attribute, value)
+    return engine
+
+
+def test_all_rules_are_judged_in_one_call_and_logged_in_one_insert(harness, monkeypatch):
+    monkeypatch.setattr(gate_module.AIQualityGateEngine, "_trigger_goal_progress_update", lambda *a: asyncio.sleep(0))
+    harness["rules"] = [_rule(f"rule {i}") for i in range(8)]
+    completions = FakeCompletions()
+    engine = _engine(completions)
+
+    decision = asyncio.run(engine.validate_artifact_quality(_artifact()))
+
+    assert len(completions.calls) == 1
+    assert harness["logged"] == [8]
+    assert decision["status"] == "approved" and decision["total_validations"] == 8
+    assert engine.get_gate_stats()["llm_calls_per_artifact"] == 1.0
+
+
+def test_single_pass_handles_stored_artifacts_without_per_rule_fallback(harness):
+    # A real artifact: JSON object content and no business_value_score attribute
+    artifact = AssetArtifact(requirement_id=uuid4(), artifact_name="Q3 report", artifact_type="report",
+                             content={"summary": "Revenue grew 12%", "rows": [1, 2, 3]})
+    completions = FakeCompletions()
+    engine = _engine(completions)
+
+    results, _ = asyncio.run(engine._run_quality_gates(artifact, [_rule("a"), _rule("b"), _rule("c")]))
+
+    stats = engine.get_gate_stats()
+    assert len(completions.calls) == 1 and '"summary": "Revenue grew 12%"' in completions.calls[0]
+    assert stats["multi_rule_calls"] == 1 and stats["multi_rule_fallbacks"] == 0 and stats["single_rule_calls"] == 0
+    assert len(results) == 3 and all(r.passed for r in results)
+
+
+def test_missing_verdicts_and_broken_multi_rule_calls_fall_back_per_rule(harness):
+    harness["rules"] = [_rule("a"), _rule("b"), _rule("c")]
+
+    dropped = FakeCompletions(drop_keys={"R2"})
+    results, _ = asyncio.run(_engine(dropped)._run_quality_gates(_artifact(), harness["rules"]))
+    assert len(dropped.calls) == 2 and len(results) == 3 and all(r.passed for r in results)
+
+    broken = FakeCompletions(fail_multi=True)
+    results, _ = asyncio.run(_engine(broken)._run_quality_gates(_artifact(), harness["rules"]))
+    assert len(broken.calls) == 1 + 3 and all(r.passed for r in results)
+
+
+def test_hard_failure_short_circuits_remaining_rules(harness):
+    harness["rules"] = [_rule("must cite sources", severity="critical")] + [_rule(f"style {i}") for i in range(4)]
+    completions = FakeCompletions(failing_rules={"must cite sources"})
+    # Per-rule mode: hard rules run first, soft ones are skipped after a hard failure
+    engine = _engine(completions, multi_rule_evaluation=False)
+
+    decision = asyncio.run(engine.validate_artifact_quality(_artifact()))
+
+    assert len(completions.calls) == 1
+    assert decision["status"] == "needs_improvement"
+    assert decision["hard_failures"] == ["must cite sources"]
+    assert engine.get_gate_stats()["rules_skipped"] == 4
+
+
+def test_batch_validation_loads_in_bulk_and_writes_statuses_once(harness, monkeypatch):
+    artifacts = [_artifact() for _ in range(5)]
+    artifacts[-1].artifact_type = "deck"
+    queries, written, progress = [], [], []
+
+    async def load(ids):
+        queries.append("artifacts")
+        return artifacts
+
+    async def rules_for_types(types):
+        queries.append("rules")
+        return {t: [_rule(f"{t} a"), _rule(f"{t} b")] for t in types}
+
+    async def bulk_write(updates):
+        written.append(updates)
+        return len(updates)
+
+    async def broadcast(engine, workspace_id, artifact, decision, batch_progress):
+        progress.append(batch_progress["processed"])
+
+    monkeypatch.setattr(gate_module, "get_asset_artifacts_by_ids", load)
+    monkeypatch.setattr(gate_module, "get_quality_rules_for_asset_types", rules_for_types)
+    monkeypatch.setattr(gate_module, "bulk_update_artifact_statuses", bulk_write)
+    monkeypatch.setattr(AIQualityGateEngine, "_broadcast_validation_progress", broadcast)
+    completions = FakeCompletions()
+    engine = _engine(completions)
+
+    results = asyncio.run(engine.batch_validate_artifacts([a.id for a in artifacts] + [uuid4()], workspace_id=uuid4(),
+                                                          run_followups=False))
+
+    assert queries == ["artifacts", "rules"]
+    assert len(completions.calls) == 5
+    assert results["processed"] == 5 and results["approved"] == 5 and results["errors"] == 1
+    assert len(written) == 1 and len(written[0]) == 5 and harness["status"] == []
+    assert sorted(progress) == [1, 2, 3, 4, 5]
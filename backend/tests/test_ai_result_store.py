@@ -0,0 +1,111 @@
+# backend/tests/test_ai_result_store.py
+import asyncio
+
+from utils import ai_semantic_hash
+from utils.ai_result_store import AIResultStore, content_key
+
+
+def test_content_key_normalises_text_and_scopes_by_version():
+    assert content_key("v1", "Create  Email\nSequence") == content_key("v1", "create email sequence")
+    assert content_key("v1", "create email sequence") != content_key("v2", "create email sequence")
+
+
+def test_results_persist_across_store_instances(tmp_path):
+    path = str(tmp_path / "results.sqlite3")
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"score": 0.9}
+
+    async def scenario(store):
+        return await store.get_or_compute("similarity", "v1", ("task a", "task b"), compute)
+
+    first = AIResultStore(path=path)
+    assert asyncio.run(scenario(first)) == {"score": 0.9}
+    first.close()
+
+    second = AIResultStore(path=path)
+    assert asyncio.run(scenario(second)) == {"score": 0.9}
+    assert len(calls) == 1
+    assert second.get_stats()["namespaces"]["similarity"]["disk_hits"] == 1
+
+
+def test_concurrent_misses_share_one_computation_and_failures_are_not_stored(tmp_path):
+    store = AIResultStore(path=str(tmp_path / "results.sqlite3"))
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "essence"
+
+    async def scenario():
+        results = await asyncio.gather(*[
+            store.get_or_compute("semantic_essence", "v1", ("same text",), compute) for _ in range(5)
+        ])
+        failed = await store.get_or_compute("semantic_essence", "v1", ("other",), lambda: None)
+        return results, failed, await store.get("semantic_essence", content_key("v1", "other"))
+
+    results, failed, stored_failure = asyncio.run(scenario())
+
+    assert results == ["essence"] * 5
+    assert len(calls) == 1
+    assert failed is None and stored_failure is None
+
+
+def test_lru_bound_evicts_least_recently_used_rows(tmp_path):
+    store = AIResultStore(path=str(tmp_path / "results.sqlite3"), max_entries=10, memory_entries=0)
+
+    async def scenario():
+        for i in range(10):
+            await store.set("ns", f"k{i}", i)
+        await store.get("ns", "k0")  # refresh k0
+        await store.set("ns", "k10", 10)
+        return await store.get("ns", "k0"), await store.get("ns", "k1")
+
+    assert asyncio.run(scenario()) == (0, None)
+    assert store.get_stats()["evictions"] == 2
+
+
+def test_semantic_essence_is_extracted_once_per_task_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(ai_semantic_hash, "ai_result_store", AIResultStore(path=str(tmp_path / "r.sqlite3")))
+    calls = []
+
+    async def fake_essence(name, description, context):
+        calls.append(name)
+        return "create_email_sequence_marketing"
+
+    monkeypatch.setattr(ai_semantic_hash, "_ai_semantic_essence", fake_essence)
+
+    async def scenario():
+        first = await ai_semantic_hash.generate_ai_semantic_hash("Create email sequence", "For marketing", "goal-1")
+        second = await ai_semantic_hash.generate_ai_semantic_hash("create  email sequence", "for marketing", "goal-1")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_entries_older_than_max_age_are_recomputed(tmp_path):
+    store = AIResultStore(path=str(tmp_path / "results.sqlite3"))
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    async def scenario():
+        first = await store.get_or_compute("llm:test", "v1", ("prompt",), compute, max_age=60)
+        fresh = await store.get_or_compute("llm:test", "v1", ("prompt",), compute, max_age=60)
+        await asyncio.sleep(0.02)
+        stale = await store.get_or_compute("llm:test", "v1", ("prompt",), compute, max_age=0.01)
+        return first, fresh, stale
+
+    first, fresh, stale = asyncio.run(scenario())
+
+    assert first == fresh == {"n": 1}
+    assert stale == {"n": 2}
+    assert store.get_stats()["namespaces"]["llm:test"]["expired"] == 1
@@ -0,0 +1,99 @@
+# backend/tests/test_async_supabase.py
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from utils.async_supabase import AsyncSupabaseClient
+
+
+@pytest.mark.asyncio
+async def test_query_builder_chain_is_forwarded():
+    """Chained builder calls reach the sync client and execute() returns its response."""
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[{"id": "1"}])
+
+    db = AsyncSupabaseClient(client)
+    result = await db.table("tasks").select("id").eq("workspace_id", "ws").execute()
+
+    assert result.data == [{"id": "1"}]
+    client.table.assert_called_with("tasks")
+    client.table.return_value.select.assert_called_with("id")
+    assert db.get_stats()["queries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_runs_off_the_event_loop():
+    """Blocking execute() calls run in worker threads, not on the loop thread."""
+    loop_thread = threading.get_ident()
+    seen_threads = []
+
+    def blocking_execute():
+        seen_threads.append(threading.get_ident())
+        time.sleep(0.05)
+        return MagicMock(data=[])
+
+    client = MagicMock()
+    client.table.return_value.select.return_value.execute.side_effect = blocking_execute
+    db = AsyncSupabaseClient(client, max_concurrency=10)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(db.table("tasks").select("*").execute() for _ in range(10)))
+    elapsed = time.perf_counter() - start
+
+    assert loop_thread not in seen_threads
+    # Ten 50ms round-trips overlap instead of adding up to 500ms
+    assert elapsed < 0.4
+
+
+@pytest.mark.asyncio
+async def test_provider_is_resolved_lazily_and_awaitables_are_awaited():
+    """Swapping the underlying client is honoured and AsyncMock executes are awaited."""
+    holder = {"client": None}
+    db = AsyncSupabaseClient(lambda: holder["client"])
+
+    swapped = MagicMock()
+    swapped.table.return_value.insert.return_value.execute = AsyncMock(return_value=MagicMock(data=[{"id": "x"}]))
+    holder["client"] = swapped
+
+    result = await db.table("logs").insert({"a": 1}).execute()
+    assert result.data == [{"id": "x"}]
+
+
+@pytest.mark.asyncio
+async def test_errors_are_counted_and_propagated():
+    client = MagicMock()
+    client.rpc.return_value.execute.side_effect = RuntimeError("502 Bad Gateway")
+    db = AsyncSupabaseClient(client)
+
+    with pytest.raises(RuntimeError):
+        await db.rpc("broken_fn", {}).execute()
+
+    assert db.get_stats()["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_builder_properties_like_not_keep_the_chain_async(monkeypatch):
+    """postgrest's ``not_`` is a property returning the builder; the chain after it stays async."""
+    from postgrest import SyncPostgrestClient
+    from postgrest._sync.request_builder import SyncSelectRequestBuilder
+
+    executed = []
+    monkeypatch.setattr(
+        SyncSelectRequestBuilder, "execute",
+        lambda builder: executed.append(str(builder.params)) or MagicMock(data=[{"id": "1"}]),
+    )
+    rest = SyncPostgrestClient("http://localhost:54321/rest/v1")
+    client = MagicMock()
+    client.table.side_effect = rest.from_
+    db = AsyncSupabaseClient(client)
+
+    query = db.table("tasks").select("id").not_.is_("deleted_at", "null")
+    result = await query.execute()
+
+    assert result.data == [{"id": "1"}]
+    assert executed == ["select=id&deleted_at=not.is.null"]
+    # Plain (non-builder) attributes are still handed back untouched
+    assert str(db.table("tasks").select("id").params) == "select=id"
@@ -0,0 +1,128 @@
+# backend/tests/test_automated_goal_monitor.py
+import asyncio
+
+import pytest
+
+import automated_goal_monitor as monitor_module
+import utils.workspace_goals_cache as goals_cache_module
+from automated_goal_monitor import AutomatedGoalMonitor
+from workspace_recovery_system import workspace_recovery_system
+
+WORKSPACE_IDS = [f"ws-{index}" for index in range(10)]
+
+
+class FakeQuery:
+    def __init__(self, db, table):
+        self.db = db
+        self.table = table
+        self.in_values = None
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        return self
+
+    def or_(self, *args, **kwargs):
+        return self
+
+    def in_(self, column, values):
+        self.in_values = list(values)
+        self.db.in_queries.append((self.table, column, list(values)))
+        return self
+
+    async def execute(self):
+        if self.table == "workspace_goals":
+            data = [{"workspace_id": workspace_id} for workspace_id in self.db.goal_workspaces]
+        elif self.table == "workspaces":
+            data = [{"id": workspace_id, "status": "active"} for workspace_id in self.in_values]
+        else:
+            data = []
+        return type("Response", (), {"data": data})()
+
+
+class FakeDb:
+    def __init__(self, goal_workspaces=()):
+        self.goal_workspaces = list(goal_workspaces)
+        self.in_queries = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDb(WORKSPACE_IDS)
+    monkeypatch.setattr(monitor_module, "async_supabase", db)
+    return db
+
+
+def test_failing_workspace_does_not_abort_the_cycle(monkeypatch):
+    monitor = AutomatedGoalMonitor()
+    validated = []
+
+    async def recover():
+        return {"recovered": 0}
+
+    async def needing_validation():
+        return ["ws-a", "ws-failing", "ws-b"]
+
+    async def batch_goals(workspace_ids, status_filter=None):
+        return {workspace_id: [{"id": f"goal-{workspace_id}"}] for workspace_id in workspace_ids}
+
+    async def validate(workspace_id, preloaded_goals=None):
+        if workspace_id == "ws-failing":
+            raise RuntimeError("goal table unavailable")
+        validated.append((workspace_id, preloaded_goals))
+        return [{"id": "corrective"}]
+
+    monkeypatch.setattr(monitor_module, "AGENT_STATUS_MANAGER_AVAILABLE", False)
+    monkeypatch.setattr(workspace_recovery_system, "scan_and_recover_stuck_workspaces", recover)
+    monkeypatch.setattr(goals_cache_module, "batch_get_workspace_goals_cached", batch_goals)
+    monkeypatch.setattr(monitor, "_get_workspaces_needing_validation", needing_validation)
+    monkeypatch.setattr(monitor, "_process_workspace_validation", validate)
+
+    asyncio.run(monitor._run_monitoring_cycle())
+
+    assert sorted(validated) == [("ws-a", [{"id": "goal-ws-a"}]), ("ws-b", [{"id": "goal-ws-b"}])]
+    assert monitor.workspace_validation_outcomes["ws-failing"] == {"errors": 1}
+    assert monitor.workspace_validation_outcomes["ws-a"] == monitor.workspace_validation_outcomes["ws-b"] == {"ok": 1}
+    assert monitor.cycle_histogram.count == 1
+
+
+def test_batch_load_issues_one_in_query_per_chunk(fake_db):
+    monitor = AutomatedGoalMonitor()
+    monitor.batch_query_size = 4
+
+    rows = asyncio.run(monitor._batch_load_rows("workspaces", "id", WORKSPACE_IDS))
+
+    assert fake_db.in_queries == [
+        ("workspaces", "id", WORKSPACE_IDS[0:4]),
+        ("workspaces", "id", WORKSPACE_IDS[4:8]),
+        ("workspaces", "id", WORKSPACE_IDS[8:10]),
+    ]
+    assert [row["id"] for row in rows] == WORKSPACE_IDS
+
+
+def test_shard_ownership_filters_the_workspace_list(fake_db, monkeypatch):
+    monkeypatch.setenv("GOAL_MONITOR_REPLICAS", "replica-a,replica-b")
+    owned = {}
+    for replica in ("replica-a", "replica-b"):
+        monkeypatch.setenv("GOAL_MONITOR_REPLICA_ID", replica)
+        monitor = AutomatedGoalMonitor()
+
+        async def healthy(workspace_id, workspace_row=None, agents=None):
+            return True
+
+        monkeypatch.setattr(monitor, "_check_workspace_health", healthy)
+        fake_db.in_queries.clear()
+        owned[replica] = asyncio.run(monitor._get_workspaces_needing_validation())
+
+        assert sorted(owned[replica]) == sorted(monitor.shard_ring.slice_for(replica, WORKSPACE_IDS))
+        # Only the owned slice is loaded from the database
+        workspace_lookups = [values for table, _, values in fake_db.in_queries if table == "workspaces"]
+        assert sorted(sum(workspace_lookups, [])) == sorted(owned[replica])
+
+    assert owned["replica-a"] and owned["replica-b"]
+    assert not set(owned["replica-a"]) & set(owned["replica-b"])
+    assert sorted(owned["replica-a"] + owned["replica-b"]) == sorted(WORKSPACE_IDS)
@@ -0,0 +1,119 @@
+# backend/tests/test_concrete_asset_extractor.py
+import asyncio
+import json
+
+import pytest
+
+from deliverable_system import concrete_asset_extractor as extractor_module
+from deliverable_system.concrete_asset_extractor import ConcreteAssetExtractor
+from utils.ai_result_store import AIResultStore
+
+
+def _task(task_id, result, name="Research"):
+    return {"id": task_id, "name": name, "status": "completed", "result": result}
+
+
+@pytest.fixture
+def extractor(monkeypatch, tmp_path):
+    monkeypatch.setattr(extractor_module, "ai_result_store", AIResultStore(path=str(tmp_path / "ledger.sqlite3")))
+    extractor = ConcreteAssetExtractor()
+    extractor.calls = []
+
+    async def fake_extract(content, context=None):
+        extractor.calls.append(content)
+        await asyncio.sleep(1.0 if "slow" in content else 0.01)
+        return {"assets": [{"asset_name": context["task_name"], "content": content}], "ai_degraded": False}
+
+    extractor._extract_assets = fake_extract
+    return extractor
+
+
+def test_rerun_only_extracts_new_or_changed_results(extractor):
+    tasks = [_task("t1", "alpha plan"), _task("t2", {"rows": [1, 2]}), _task("t3", "gamma", name="Other"),
+             {"id": "t4", "status": "pending", "result": "ignored"}]
+
+    first = asyncio.run(extractor.extract_assets_from_task_batch(tasks))
+    tasks[0]["result"] = "alpha plan v2"
+    second = asyncio.run(extractor.extract_assets_from_task_batch(tasks))
+
+    assert set(first) == {"t1", "t2", "t3"}
+    assert len(extractor.calls) == 4  # three on the first run, only the changed t1 on the second
+    assert second["t2"] == first["t2"] and second["t1"][0]["content"] == "alpha plan v2"
+    stats = extractor.get_extraction_stats()
+    assert stats["extracted"] == 4 and stats["reused"] == 2
+
+
+def test_timeout_keeps_finished_results_and_next_run_resumes(extractor):
+    tasks = [_task("fast", "quick result"), _task("slow", "slow result")]
+
+    partial = asyncio.run(extractor.extract_assets_from_task_batch(tasks, timeout=0.3))
+    assert partial["fast"] and partial["slow"] == []
+    assert extractor.get_extraction_stats()["timed_out"] == 1
+
+    resumed = asyncio.run(extractor.extract_assets_from_task_batch(tasks, timeout=5))
+    assert resumed["slow"] and extractor.calls.count("quick result") == 1
+
+
+def test_failed_ai_analysis_is_returned_but_not_ledgered(monkeypatch, tmp_path):
+    monkeypatch.setattr(extractor_module, "ai_result_store", AIResultStore(path=str(tmp_path / "ledger.sqlite3")))
+    analysis_calls = []
+    ai_up = {"value": False}
+
+    async def fake_call_ai(**kwargs):
+        if kwargs["prompt"].startswith("Analyze the following content"):
+            analysis_calls.append(kwargs["prompt"])
+            if not ai_up["value"]:
+                raise RuntimeError("provider unavailable")
+            return {"assets": [{"asset_type": "data", "asset_name": "Launch plan",
+                                "content": "Week 1: announce beta to the waitlist, week 2: open signups"}]}
+        return {"assessments": []}
+
+    async def not_placeholder(content):
+        return False
+
+    async def quality(asset):
+        return 0.9
+
+    monkeypatch.setattr(extractor_module.ai_provider_manager, "call_ai", fake_call_ai)
+    extractor = ConcreteAssetExtractor()
+    monkeypatch.setattr(extractor, "_is_placeholder_content", not_placeholder)
+    monkeypatch.setattr(extractor, "_calculate_asset_quality", quality)
+    tasks = [_task("t1", "Plan:\n- announce beta to the waitlist\n- open signups after a week")]
+
+    degraded = asyncio.run(extractor.extract_assets_from_task_batch(tasks))
+    ai_up["value"] = True
+    recovered = asyncio.run(extractor.extract_assets_from_task_batch(tasks))
+    reused = asyncio.run(extractor.extract_assets_from_task_batch(tasks))
+
+    assert "Launch plan" not in [asset["asset_name"] for asset in degraded["t1"]]
+    assert "Launch plan" in [asset["asset_name"] for asset in recovered["t1"]]
+    assert reused == recovered
+    assert len(analysis_calls) == 2  # the degraded run was retried, the recovered one ledgered
+    stats = extractor.get_extraction_stats()
+    assert stats["ai_degraded"] == 1 and stats["extracted"] == 2 and stats["reused"] == 1
+
+
+def test_placeholder_and_quality_checks_share_one_model_call(monkeypatch):
+    calls = []
+
+    async def fake_call_ai(**kwargs):
+        calls.append(kwargs["prompt"])
+        return {"assessments": [
+            {"asset_key": "A1", "is_placeholder": False, "quality_score": 0.8},
+            {"asset_key": "A2", "is_placeholder": True, "placeholder_confidence": 0.9, "quality_score": 0.1},
+            {"asset_key": "A3", "is_placeholder": False, "quality_score": 0.05},
+        ]}
+
+    monkeypatch.setattr(extractor_module.ai_provider_manager, "call_ai", fake_call_ai)
+    assets = [
+        {"asset_name": "pricing", "content": {"tiers": ["basic", "pro"]}},
+        {"asset_name": "todo", "content": "TODO fill in later"},
+        {"asset_name": "thin", "content": "one short line"},
+        {"asset_name": "tiny", "content": "x"},
+    ]
+
+    validated = asyncio.run(ConcreteAssetExtractor()._validate_and_enrich_assets(assets, ""))
+
+    assert len(calls) == 1
+    assert [asset["asset_name"] for asset in validated] == ["pricing"]
+    assert validated[0]["quality_score"] == 0.8 and json.loads(json.dumps(validated[0]))["id"]
@@ -0,0 +1,40 @@
+# backend/tests/test_consistent_hash.py
+import pytest
+
+from utils.consistent_hash import ConsistentHashRing, ring_from_env
+
+WORKSPACES = [f"workspace-{i}" for i in range(2000)]
+
+
+def test_every_key_has_exactly_one_owner_and_slices_are_balanced():
+    ring = ConsistentHashRing(["api-0", "api-1", "api-2"])
+
+    slices = {node: ring.slice_for(node, WORKSPACES) for node in ring.nodes}
+
+    assert sorted(key for keys in slices.values() for key in keys) == sorted(WORKSPACES)
+    for keys in slices.values():
+        assert 400 < len(keys) < 950
+
+
+def test_adding_a_replica_only_moves_keys_to_the_new_replica():
+    before = ConsistentHashRing(["api-0", "api-1", "api-2"])
+    after = ConsistentHashRing(["api-0", "api-1", "api-2", "api-3"])
+
+    moved = [key for key in WORKSPACES if before.owner(key) != after.owner(key)]
+
+    assert all(after.owner(key) == "api-3" for key in moved)
+    assert len(moved) < len(WORKSPACES) / 2
+
+
+def test_ring_from_env(monkeypatch):
+    monkeypatch.delenv("TEST_REPLICAS", raising=False)
+    assert ring_from_env("TEST_REPLICAS", "TEST_REPLICA_ID") == (None, None)
+
+    monkeypatch.setenv("TEST_REPLICAS", "api-0, api-1")
+    monkeypatch.setenv("TEST_REPLICA_ID", "api-1")
+    ring, node = ring_from_env("TEST_REPLICAS", "TEST_REPLICA_ID")
+    assert ring.nodes == ("api-0", "api-1") and node == "api-1"
+
+    monkeypatch.setenv("TEST_REPLICA_ID", "api-9")
+    with pytest.raises(ValueError):
+        ring_from_env("TEST_REPLICAS", "TEST_REPLICA_ID")
@@ -0,0 +1,96 @@
+# backend/tests/test_content_aware_learning_engine.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from services import content_aware_learning_engine as engine_module
+from services import learning_watermarks as watermarks_module
+from services.content_aware_learning_engine import ContentAwareLearningEngine
+from services.learning_watermarks import LearningWatermarkStore
+from tests.test_learning_watermarks import FakeSupabase
+from utils.ai_result_store import AIResultStore
+
+EMAIL_BODY = "Email campaign report: open rate: 42% and click rate: 7% for the newsletter. " * 10
+
+
+def _deliverable(deliverable_id, updated_at, body=EMAIL_BODY):
+    return {"id": deliverable_id, "workspace_id": "ws", "title": "Newsletter results", "content": body,
+            "created_at": datetime.now().isoformat(), "updated_at": updated_at}
+
+
+@pytest.fixture
+def harness(monkeypatch, tmp_path):
+    store = AIResultStore(path=str(tmp_path / "learning.sqlite3"))
+    monkeypatch.setattr(watermarks_module, "ai_result_store", store)
+    monkeypatch.setattr(engine_module, "ai_result_store", store)
+    monkeypatch.setattr(engine_module, "learning_watermarks", LearningWatermarkStore(enabled=True))
+
+    state = {"supabase": FakeSupabase([]), "stored_hashes": set(), "hash_queries": 0, "inserts": [],
+             "failing_inserts": 0}
+
+    async def existing_hashes(workspace_id, hashes):
+        state["hash_queries"] += 1
+        return state["stored_hashes"] & set(hashes)
+
+    async def add_many(workspace_id, records):
+        if state["failing_inserts"]:
+            state["failing_inserts"] -= 1
+            return None
+        state["inserts"].append(len(records))
+        state["stored_hashes"].update(record["content_hash"] for record in records)
+        return len(records)
+
+    monkeypatch.setattr(engine_module, "get_supabase_client", lambda: state["supabase"])
+    monkeypatch.setattr(engine_module, "get_existing_insight_hashes", existing_hashes)
+    monkeypatch.setattr(engine_module, "add_memory_insights", add_many)
+    return state
+
+
+def test_reruns_only_analyze_changed_deliverables(harness):
+    harness["supabase"].rows = [_deliverable("d1", "2026-10-01T10:00:00+00:00"),
+                                _deliverable("d2", "2026-10-01T11:00:00+00:00")]
+    engine = ContentAwareLearningEngine()
+
+    first = asyncio.run(engine.analyze_workspace_content("ws"))
+    idle = asyncio.run(engine.analyze_workspace_content("ws"))
+
+    assert first["status"] == "completed" and first["deliverables_analyzed"] == 2
+    assert first["insights_generated"] > 0 and harness["inserts"] == [first["insights_generated"]]
+    assert harness["hash_queries"] == 1
+    assert idle == {"status": "insufficient_data", "insights_generated": 0, "deliverables_pending": 0}
+    assert engine.get_learning_stats()["domains_classified"] == 2
+
+
+def test_lone_new_deliverable_is_carried_until_it_has_company(harness):
+    harness["supabase"].rows = [_deliverable("d1", "2026-10-01T10:00:00+00:00"),
+                                _deliverable("d2", "2026-10-01T11:00:00+00:00")]
+    engine = ContentAwareLearningEngine()
+    asyncio.run(engine.analyze_workspace_content("ws"))
+
+    harness["supabase"].rows.append(_deliverable("d3", "2026-10-02T10:00:00+00:00"))
+    waiting = asyncio.run(engine.analyze_workspace_content("ws"))
+    harness["supabase"].rows.append(_deliverable("d4", "2026-10-03T10:00:00+00:00"))
+    resumed = asyncio.run(engine.analyze_workspace_content("ws"))
+
+    assert waiting["deliverables_pending"] == 1
+    assert resumed["status"] == "completed" and resumed["deliverables_analyzed"] == 2
+    # Same metrics as the first run: every insight is a duplicate, found with one lookup per run
+    assert resumed["insights_generated"] == 0 and len(harness["inserts"]) == 1
+    assert engine.get_learning_stats()["domains_classified"] == 4
+
+
+def test_failed_insert_keeps_the_watermark_so_the_next_run_retries(harness):
+    harness["supabase"].rows = [_deliverable("d1", "2026-10-01T10:00:00+00:00"),
+                                _deliverable("d2", "2026-10-01T11:00:00+00:00")]
+    harness["failing_inserts"] = 1
+    engine = ContentAwareLearningEngine()
+
+    failed = asyncio.run(engine.analyze_workspace_content("ws"))
+    inserts_after_failure = list(harness["inserts"])
+    retried = asyncio.run(engine.analyze_workspace_content("ws"))
+
+    assert failed["status"] == "error" and inserts_after_failure == []
+    assert retried["status"] == "completed" and retried["deliverables_analyzed"] == 2
+    assert retried["insights_generated"] > 0 and harness["inserts"] == [retried["insights_generated"]]
+    assert engine.get_learning_stats()["failed_runs"] == 1
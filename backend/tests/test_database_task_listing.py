@@ -0,0 +1,81 @@
+# backend/tests/test_database_task_listing.py
+import asyncio
+
+import database as database_module
+
+
+class FakeQuery:
+    def __init__(self, db):
+        self.db = db
+        self.calls = []
+
+    def __getattr__(self, name):
+        def record(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return record
+
+    async def execute(self):
+        self.db.queries.append(self.calls)
+        return type("Response", (), {"data": self.db.pages.pop(0)})()
+
+
+class FakeDb:
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.queries = []
+
+    def table(self, name):
+        return FakeQuery(self)
+
+
+def test_list_tasks_page_builds_a_keyset_cursor(monkeypatch):
+    first_page = [{"id": "t-3", "created_at": "2026-10-03"}, {"id": "t-2", "created_at": "2026-10-02"}]
+    db = FakeDb([first_page, [{"id": "t-1", "created_at": "2026-10-02"}]])
+    monkeypatch.setattr(database_module, "async_supabase", db)
+
+    page = asyncio.run(database_module.list_tasks_page("ws", fields=["agent_id"], page_size=2))
+    last = asyncio.run(database_module.list_tasks_page("ws", fields=["agent_id"], page_size=2,
+                                                       cursor=page["next_cursor"]))
+
+    assert page == {"tasks": first_page, "next_cursor": "2026-10-02|t-2"}
+    assert last["next_cursor"] is None
+    # The cursor columns are always selected, and the second page starts after the cursor row
+    assert ("select", ("agent_id, id, created_at",), {}) in db.queries[0]
+    assert ("or_", ('created_at.lt."2026-10-02",and(created_at.eq."2026-10-02",id.lt.t-2)',), {}) in db.queries[1]
+
+
+def test_workspace_execution_stats_use_counts_and_pages(monkeypatch):
+    pages = {
+        None: {"tasks": [{"agent_id": "a-1"}, {"agent_id": "a-2"}], "next_cursor": "c-1"},
+        "c-1": {"tasks": [{"agent_id": "a-1"}, {"agent_id": None}], "next_cursor": None},
+    }
+    requested = []
+
+    async def task_stats(workspace_id):
+        return {"total_tasks": 4}
+
+    async def by_status(workspace_id):
+        return {"pending": 1, "completed": 3, "failed": 0, "total": 4}
+
+    async def page(workspace_id, fields, page_size, cursor):
+        requested.append((fields, cursor))
+        return pages[cursor]
+
+    async def list_tasks(*args, **kwargs):
+        raise AssertionError("full task rows should not be loaded")
+
+    async def list_agents(workspace_id):
+        return [{"id": "a-1"}, {"id": "a-2"}]
+
+    monkeypatch.setattr(database_module, "get_task_execution_stats_python", task_stats)
+    monkeypatch.setattr(database_module, "count_tasks_by_status", by_status)
+    monkeypatch.setattr(database_module, "list_tasks_page", page)
+    monkeypatch.setattr(database_module, "list_tasks", list_tasks)
+    monkeypatch.setattr(database_module, "list_agents", list_agents)
+
+    stats = asyncio.run(database_module.get_workspace_execution_stats("ws"))
+
+    assert stats["tasks_by_status"] == {"pending": 1, "completed": 3}
+    assert stats["average_tasks_per_agent"] == 1.5
+    assert requested == [(["id", "agent_id"], None), (["id", "agent_id"], "c-1")]
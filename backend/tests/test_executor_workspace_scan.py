@@ -0,0 +1,120 @@
+# backend/tests/test_executor_workspace_scan.py
+import asyncio
+import time
+
+import pytest
+
+import executor as executor_module
+from executor import TaskExecutor, _workspace_scan_settings
+
+
+@pytest.fixture
+def task_executor():
+    instance = TaskExecutor()
+    instance.workspace_scan_concurrency = 4
+    instance.workspace_scan_timeout = 5
+    return instance
+
+
+def _poll(task_executor, monkeypatch, workspace_ids):
+    async def pending():
+        return list(workspace_ids)
+
+    monkeypatch.setattr(executor_module, "get_workspaces_with_pending_tasks", pending)
+    asyncio.run(task_executor.process_pending_tasks_anti_loop())
+
+
+def test_slow_or_failing_workspace_does_not_block_the_others(task_executor, monkeypatch):
+    finished = []
+
+    async def scan(workspace_id):
+        if workspace_id == "ws-failing":
+            raise RuntimeError("tenant database unavailable")
+        if workspace_id == "ws-slow":
+            await asyncio.sleep(0.3)
+        finished.append(workspace_id)
+
+    monkeypatch.setattr(task_executor, "_scan_workspace", scan)
+    _poll(task_executor, monkeypatch, ["ws-slow", "ws-failing", "ws-a", "ws-b"])
+
+    # The healthy workspaces finish while the slow one is still scanning
+    assert finished == ["ws-a", "ws-b", "ws-slow"]
+    outcomes = task_executor.workspace_scan_outcomes
+    assert outcomes["ws-failing"] == {"errors": 1}
+    assert outcomes["ws-a"] == outcomes["ws-b"] == outcomes["ws-slow"] == {"ok": 1}
+    assert task_executor.polling_cycle_histogram.count == 1
+
+
+def test_per_workspace_deadline_is_enforced(task_executor, monkeypatch):
+    task_executor.workspace_scan_timeout = 0.1
+    finished = []
+
+    async def scan(workspace_id):
+        if workspace_id == "ws-stuck":
+            await asyncio.sleep(30)
+        finished.append(workspace_id)
+
+    monkeypatch.setattr(task_executor, "_scan_workspace", scan)
+    started = time.perf_counter()
+    _poll(task_executor, monkeypatch, ["ws-stuck", "ws-a"])
+
+    assert time.perf_counter() - started < 2
+    assert finished == ["ws-a"]
+    assert task_executor.workspace_scan_outcomes["ws-stuck"] == {"timeouts": 1}
+    assert task_executor.workspace_scan_histograms["ws-stuck"].max < 2
+
+
+def test_scan_settings_stay_with_their_own_workspace(task_executor, monkeypatch):
+    settings = {
+        "ws-a": {"max_concurrent_tasks": 1, "task_timeout": 100},
+        "ws-b": {"max_concurrent_tasks": 7, "task_timeout": 700},
+    }
+    seen = {}
+
+    async def get_workspace_settings(workspace_id):
+        # ws-a loads first but is processed last, after ws-b has set its own settings
+        await asyncio.sleep(0 if workspace_id == "ws-a" else 0.05)
+        return settings[workspace_id]
+
+    async def count_tasks(workspace_id):
+        return 0
+
+    async def list_agents(workspace_id):
+        return []
+
+    async def process(workspace_id):
+        await asyncio.sleep(0.1 if workspace_id == "ws-a" else 0)
+        seen[workspace_id] = (task_executor.max_concurrent_tasks, task_executor.execution_timeout)
+
+    monkeypatch.setattr(task_executor, "get_workspace_settings", get_workspace_settings)
+    monkeypatch.setattr(executor_module, "count_tasks", count_tasks)
+    monkeypatch.setattr(task_executor, "_cached_list_agents", list_agents)
+    monkeypatch.setattr(task_executor, "process_workspace_tasks_anti_loop_with_health_check_enhanced", process)
+
+    async def run():
+        semaphore = asyncio.Semaphore(2)
+        await asyncio.gather(task_executor._scan_workspace_isolated("ws-a", semaphore),
+                             task_executor._scan_workspace_isolated("ws-b", semaphore))
+        return _workspace_scan_settings.get()
+
+    outer_settings = asyncio.run(run())
+
+    assert seen == {"ws-a": (1, 100), "ws-b": (7, 700)}
+    # The scans' task-local settings never reach the caller's context
+    assert outer_settings is None
+
+
+def test_queue_classification_reuses_the_scan_score(task_executor, caplog):
+    urgent = {"id": "t-1", "workspace_id": "ws-a", "name": "URGENT: close the revenue gap", "description": ""}
+    score = executor_module.get_task_priority_score_enhanced(urgent, "ws-a")
+
+    caplog.clear()
+    with caplog.at_level("CRITICAL", logger=executor_module.__name__):
+        task_executor.task_queue.put_nowait(
+            (None, urgent), priority=task_executor._get_queue_priority((None, urgent), score=score)
+        )
+
+    assert task_executor._get_queue_priority((None, urgent), score=score) == ("corrective", score, "ws-a")
+    # The task was scored (and its urgent marker logged) once, by the scan, not again on enqueue
+    assert not [record for record in caplog.records if "URGENT CORRECTIVE" in record.getMessage()]
+    assert task_executor.task_queue.get_metrics()["per_priority_class"]["corrective"]["depth"] == 1
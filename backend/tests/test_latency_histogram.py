@@ -0,0 +1,31 @@
+# backend/tests/test_latency_histogram.py
+from utils.latency_histogram import LatencyHistogram
+
+
+def test_empty_histogram_reports_zero():
+    histogram = LatencyHistogram(buckets=(0.1, 0.5, 1.0))
+
+    assert histogram.percentile(0.5) == 0.0
+    assert histogram.to_dict()["p95_seconds"] == 0.0
+
+
+def test_percentiles_are_bucket_upper_bounds():
+    histogram = LatencyHistogram(buckets=(1.0, 0.1, 0.5))
+    for seconds in [0.05] * 50 + [0.3] * 45 + [2.0] * 5:
+        histogram.observe(seconds)
+
+    assert histogram.buckets == (0.1, 0.5, 1.0)
+    assert histogram.percentile(0.5) == 0.1
+    assert histogram.percentile(0.95) == 0.5
+    # Observations above the last bucket report the largest value seen
+    assert histogram.percentile(0.99) == 2.0
+
+
+def test_bucket_bounds_are_inclusive():
+    histogram = LatencyHistogram(buckets=(0.1, 0.5))
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+
+    assert histogram.counts == [1, 1, 0]
+    assert histogram.to_dict()["buckets"] == {"le_0.1s": 1, "le_0.5s": 1, "le_inf": 0}
+    assert histogram.percentile(1.0) == 0.5
@@ -0,0 +1,100 @@
+# backend/tests/test_lazy_loading.py
+import asyncio
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+from services.service_registry import ServiceRegistry
+from utils.lazy_routers import DeferredRouterMiddleware, DeferredRouterMounter
+
+
+class FakeApp:
+    openapi_url = "/openapi.json"
+
+    def __init__(self):
+        self.included = []
+        self.openapi_schema = {"cached": True}
+
+    def include_router(self, router, **kwargs):
+        self.included.append((router, kwargs))
+
+
+def _fake_module(monkeypatch, name, **attrs):
+    module = types.ModuleType(name)
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    monkeypatch.setitem(sys.modules, name, module)
+    return module
+
+
+def test_lazy_service_imports_on_first_use_and_records_load(monkeypatch):
+    class Engine:
+        def ping(self):
+            return "pong"
+
+    _fake_module(monkeypatch, "fake_engine_module", engine=Engine())
+    registry = ServiceRegistry()
+    proxy = registry.lazy("fake_engine", "fake_engine_module:engine")
+
+    assert not proxy.loaded
+    assert registry.get_lazy_service_stats()["deferred"] == ["fake_engine"]
+    assert proxy.ping() == "pong"
+    assert proxy.loaded and registry.lazy("fake_engine", "fake_engine_module:engine") is proxy
+
+    stats = registry.get_lazy_service_stats()
+    assert stats["loaded"] == 1 and "fake_engine" in stats["load_seconds"]
+    assert registry.get_service("fake_engine").module_path == "fake_engine_module"
+
+
+def test_deferred_group_mounts_on_first_matching_request(monkeypatch):
+    _fake_module(monkeypatch, "fake_debug_routes", router="debug-router")
+    app = FakeApp()
+    mounter = DeferredRouterMounter(app, enabled=True)
+    mounter.defer("debug", "/api/debug", ("fake_debug_routes:router", {"prefix": "/x"}))
+    seen = []
+
+    async def downstream(scope, receive, send):
+        seen.append(list(app.included))
+
+    middleware = DeferredRouterMiddleware(downstream, mounter)
+    asyncio.run(middleware({"type": "http", "path": "/api/debugger"}, None, None))
+    asyncio.run(middleware({"type": "http", "path": "/api/debug/failed-tasks/1"}, None, None))
+    asyncio.run(middleware({"type": "http", "path": "/api/debug/task-details/2"}, None, None))
+
+    # Not mounted for a path that merely shares the prefix text, then mounted exactly once
+    assert seen[0] == []
+    assert seen[1] == seen[2] == [("debug-router", {"prefix": "/x"})]
+    assert app.openapi_schema is None
+    assert mounter.get_stats()["groups"]["debug"]["triggered_by"] == "/api/debug/failed-tasks/1"
+
+
+def test_openapi_loads_every_group_and_disabled_mode_mounts_eagerly(monkeypatch):
+    _fake_module(monkeypatch, "fake_usage_routes", router="usage-router")
+    app = FakeApp()
+    mounter = DeferredRouterMounter(app, enabled=True)
+    mounter.defer("usage", "/api/usage", "fake_usage_routes:router")
+    mounter.defer("broken", "/api/broken", "missing_routes_module:router")
+
+    mounter.ensure_loaded("/openapi.json")
+
+    assert app.included == [("usage-router", {})]
+    assert mounter.get_stats()["groups"]["broken"]["error"]
+    assert mounter.pending() == []
+
+    eager_app = FakeApp()
+    DeferredRouterMounter(eager_app, enabled=False).defer("usage", "/api/usage", "fake_usage_routes:router")
+    assert eager_app.included == [("usage-router", {})]
+
+
+def test_package_imports_do_not_load_heavy_modules():
+    # Fresh interpreter: the test session has usually imported these already
+    code = (
+        "import sys, services, services.service_registry, ai_agents, ai_agents.conversation_models\n"
+        "heavy = ['services.unified_memory_engine', 'ai_agents.specialist_enhanced', 'agents']\n"
+        "print([name for name in heavy if name in sys.modules])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip().splitlines()[-1] == "[]"
@@ -0,0 +1,108 @@
+# backend/tests/test_learning_watermarks.py
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from services import learning_watermarks as watermarks_module
+from services.learning_watermarks import LearningWatermark, LearningWatermarkStore, fetch_changed_deliverables
+from utils.ai_result_store import AIResultStore
+
+
+class FakeSupabase:
+    """Applies eq/gte/in_ filters to in-memory deliverable rows and records every query"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def table(self, name):
+        self.filters = []
+        self.queries.append(self.filters)
+        return self
+
+    def select(self, columns):
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(("eq", column, value))
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(("gte", column, value))
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(("in", column, list(values)))
+        return self
+
+    def execute(self):
+        def keep(row):
+            for op, column, value in self.filters:
+                if op == "eq" and row[column] != value:
+                    return False
+                if op == "gte" and row[column] < value:
+                    return False
+                if op == "in" and row[column] not in value:
+                    return False
+            return True
+        return SimpleNamespace(data=[dict(row) for row in self.rows if keep(row)])
+
+
+def _row(deliverable_id, updated_at, workspace_id="ws"):
+    created = datetime.now().isoformat()
+    return {"id": deliverable_id, "workspace_id": workspace_id, "created_at": created, "updated_at": updated_at}
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    monkeypatch.setattr(watermarks_module, "ai_result_store", AIResultStore(path=str(tmp_path / "marks.sqlite3")))
+    return LearningWatermarkStore(enabled=True)
+
+
+def test_second_run_fetches_only_changed_deliverables(store):
+    cutoff = datetime.now() - timedelta(days=30)
+    supabase = FakeSupabase([_row("a", "2026-10-01T10:00:00+00:00"), _row("b", "2026-10-02T10:00:00+00:00")])
+
+    mark = asyncio.run(store.get("engine", "ws"))
+    first = fetch_changed_deliverables(supabase, "ws", cutoff, mark)
+    mark.advance(first)
+    asyncio.run(store.save("engine", "ws", mark))
+
+    supabase.rows.append(_row("c", "2026-10-03T10:00:00+00:00"))
+    supabase.rows[0]["updated_at"] = "2026-10-03T11:00:00+00:00"  # "a" edited since the last run
+    mark = asyncio.run(store.get("engine", "ws"))
+    second = fetch_changed_deliverables(supabase, "ws", cutoff, mark)
+
+    assert [row["id"] for row in first] == ["a", "b"]
+    assert sorted(row["id"] for row in second) == ["a", "c"]
+    assert ("gte", "updated_at", "2026-10-02T10:00:00+00:00") in supabase.queries[-1]
+    assert mark.runs == 1
+
+
+def test_ties_at_the_watermark_are_neither_lost_nor_repeated():
+    mark = LearningWatermark()
+    mark.advance([_row("a", "2026-10-02T10:00:00Z")])
+
+    assert mark.seen_at_watermark == ["a"]
+    assert not mark.is_new(_row("a", "2026-10-02T10:00:00+00:00"))
+    assert mark.is_new(_row("late", "2026-10-02T10:00:00+00:00"))
+    assert not mark.is_new(_row("old", "2026-10-01T10:00:00"))
+
+    mark.advance([_row("late", "2026-10-02T10:00:00+00:00"), _row("old", "2026-10-01T10:00:00")])
+    assert mark.seen_at_watermark == ["a", "late"]
+
+
+def test_carried_over_deliverables_are_refetched_by_id(store):
+    cutoff = datetime.now() - timedelta(days=30)
+    supabase = FakeSupabase([_row("lonely", "2026-10-01T10:00:00+00:00")])
+    mark = LearningWatermark()
+    mark.advance(fetch_changed_deliverables(supabase, "ws", cutoff, mark))
+    mark.carry_over(["lonely"])
+
+    supabase.rows.append(_row("partner", "2026-10-05T10:00:00+00:00"))
+    rows = fetch_changed_deliverables(supabase, "ws", cutoff, mark)
+
+    assert sorted(row["id"] for row in rows) == ["lonely", "partner"]
+    assert ("in", "id", ["lonely"]) in supabase.queries[-1]
@@ -0,0 +1,94 @@
+# backend/tests/test_llm_rate_limiter.py
+import asyncio
+
+from services.llm_rate_limiter import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    LLMRateLimiter,
+    llm_priority,
+)
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("rate limited")
+        self.response = type("Response", (), {"headers": headers, "status_code": 429})()
+
+
+def test_interactive_calls_overtake_queued_background_calls():
+    async def scenario():
+        # 600 rpm -> a request every 100ms once the burst is spent
+        limiter = LLMRateLimiter(model_limits={"m": (600, 1_000_000)})
+        limiter.budget_for("m").requests = 0.0
+        order = []
+
+        async def call(name, priority):
+            with llm_priority(priority):
+                await limiter.acquire("m", 10)
+            order.append(name)
+
+        tasks = [asyncio.create_task(call(f"bg{i}", PRIORITY_BACKGROUND)) for i in range(2)]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(call("chat", PRIORITY_INTERACTIVE)))
+        await asyncio.sleep(0.3)
+        for task in tasks:
+            task.cancel()
+        return order
+
+    assert asyncio.run(scenario()) == ["chat"]
+
+
+def test_background_cannot_drain_the_reserved_share():
+    async def scenario():
+        limiter = LLMRateLimiter(model_limits={"m": (10, 1_000_000)})
+        for _ in range(7):
+            await limiter.acquire("m", 1, PRIORITY_BACKGROUND)
+        waiting = asyncio.create_task(limiter.acquire("m", 1, PRIORITY_BACKGROUND))
+        await asyncio.sleep(0.01)
+        blocked = not waiting.done()
+        # The 30% reserve is still there for chat
+        await asyncio.wait_for(limiter.acquire("m", 1, PRIORITY_INTERACTIVE), timeout=0.1)
+        waiting.cancel()
+        return blocked
+
+    assert asyncio.run(scenario())
+
+
+def test_token_estimate_is_settled_against_real_usage():
+    async def scenario():
+        limiter = LLMRateLimiter(model_limits={"gpt-4o-mini": (100, 10_000)})
+        async with limiter.limit("gpt-4o-mini", 4000) as permit:
+            permit.record_usage({"prompt_tokens": 300, "completion_tokens": 200})
+        return limiter.budget_for("gpt-4o-mini")
+
+    budget = asyncio.run(scenario())
+
+    assert 9400 <= budget.tokens <= 10_000
+    assert budget.stats["tokens_used"] == 500
+    assert budget.stats["cost_usd"] > 0
+
+
+def test_429_halves_rates_and_learns_headers_then_recovers_additively():
+    async def scenario():
+        limiter = LLMRateLimiter(model_limits={"m": (100, 10_000)})
+        headers = {"x-ratelimit-limit-requests": "80", "x-ratelimit-remaining-tokens": "4000", "retry-after": "0.01"}
+        try:
+            async with limiter.limit("m", 10):
+                raise RateLimitError(headers)
+        except RateLimitError:
+            pass
+        budget = limiter.budget_for("m")
+        after_429 = (budget.configured_rpm, budget.factor, budget.tokens, budget.stats["rate_limited"])
+        await asyncio.sleep(0.02)
+        async with limiter.limit("m", 1):
+            pass
+        return after_429, budget.factor
+
+    (configured_rpm, factor, tokens, rate_limited), recovered = asyncio.run(scenario())
+
+    assert configured_rpm == 80
+    assert tokens <= 4000
+    assert factor == 0.5 and rate_limited == 1
+    assert recovered > factor
@@ -0,0 +1,121 @@
+# backend/tests/test_llm_response_cache.py
+import asyncio
+
+import pytest
+
+from services import ai_provider_abstraction
+from services.ai_provider_abstraction import AIProviderManager, BaseProvider
+from utils.ai_result_store import AIResultStore
+
+
+class CountingProvider(BaseProvider):
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    async def call_ai(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return {"label": "analysis", "prompt": kwargs["prompt"]}
+
+
+AGENT = {"name": "Classifier", "model": "gpt-4o-mini", "temperature": 0.1}
+
+
+@pytest.fixture
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(ai_provider_abstraction, "ai_result_store", AIResultStore(path=str(tmp_path / "llm.sqlite3")))
+    manager = AIProviderManager()
+    manager.providers["counting"] = CountingProvider()
+    return manager
+
+
+def test_identical_calls_hit_cache_and_concurrent_ones_share_a_request(manager):
+    async def scenario():
+        concurrent = await asyncio.gather(*[
+            manager.call_ai("counting", agent=AGENT, prompt="Classify:  task A", cache="classifier")
+            for _ in range(5)
+        ])
+        # Whitespace-only differences normalise to the same key
+        repeated = await manager.call_ai("counting", agent=AGENT, prompt="Classify: task A\n", cache="classifier")
+        return concurrent, repeated
+
+    concurrent, repeated = asyncio.run(scenario())
+
+    assert manager.providers["counting"].calls == 1
+    assert all(result == concurrent[0] for result in concurrent) and repeated == concurrent[0]
+    stats = manager.get_cache_stats()["callers"]["classifier"]
+    assert stats["coalesced"] == 4 and stats["memory_hits"] == 1
+
+
+def test_key_covers_temperature_and_uncached_calls_always_go_out(manager):
+    async def scenario():
+        await manager.call_ai("counting", agent=AGENT, prompt="p", cache=True)
+        await manager.call_ai("counting", agent={**AGENT, "temperature": 0.7}, prompt="p", cache=True)
+        await manager.call_ai("counting", agent=AGENT, prompt="p", cache=True, temperature=0.9)
+        await manager.call_ai("counting", agent=AGENT, prompt="p")
+
+    asyncio.run(scenario())
+
+    assert manager.providers["counting"].calls == 4
+    assert "Classifier" in manager.get_cache_stats()["callers"]
+
+
+def test_fallback_results_are_not_cached(manager):
+    manager.providers["counting"] = CountingProvider(fail=True)
+
+    async def scenario():
+        first = await manager.call_ai("counting", agent=AGENT, prompt="p", cache="classifier")
+        second = await manager.call_ai("counting", agent=AGENT, prompt="p", cache="classifier")
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first["provider"] == "fallback" and second["provider"] == "fallback"
+    assert manager.providers["counting"].calls == 2
+
+
+def test_unparsed_and_error_shaped_results_are_not_cached(manager):
+    class ShapedProvider(BaseProvider):
+        def __init__(self, result):
+            self.calls = 0
+            self.result = result
+
+        async def call_ai(self, **kwargs):
+            self.calls += 1
+            return self.result
+
+    async def call_twice(result):
+        manager.providers["shaped"] = ShapedProvider(result)
+        for _ in range(2):
+            await manager.call_ai("shaped", agent=AGENT, prompt=f"p {result!r}", cache="classifier")
+        return manager.providers["shaped"].calls
+
+    async def scenario():
+        return {
+            "unparsed": await call_twice({"content": "The task looks like analysis"}),
+            "error": await call_twice({"error": "rate limited", "label": None}),
+            "empty": await call_twice({}),
+            "not_a_dict": await call_twice(0.9),
+            "parsed": await call_twice({"label": "analysis"}),
+        }
+
+    calls = asyncio.run(scenario())
+
+    assert calls == {"unparsed": 2, "error": 2, "empty": 2, "not_a_dict": 2, "parsed": 1}
+
+
+def test_cache_hits_are_copies_the_caller_may_mutate(manager):
+    async def scenario():
+        first = await manager.call_ai("counting", agent=AGENT, prompt="p", cache="classifier")
+        first["label"] = "mutated"
+        second = await manager.call_ai("counting", agent=AGENT, prompt="p", cache="classifier")
+        second["label"] = "mutated again"
+        return await manager.call_ai("counting", agent=AGENT, prompt="p", cache="classifier")
+
+    third = asyncio.run(scenario())
+
+    assert third == {"label": "analysis", "prompt": "p"}
+    assert manager.providers["counting"].calls == 1
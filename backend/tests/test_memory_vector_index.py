@@ -0,0 +1,81 @@
+# backend/tests/test_memory_vector_index.py
+import asyncio
+
+from services.memory_vector_index import HashingEmbedder, MemoryVectorIndex, WorkspaceVectorIndex, context_to_text
+
+
+def _entry(entry_id, context_type, content, importance=0.5, created_at=100.0):
+    return (entry_id, context_to_text(context_type, content), entry_id, context_type, importance, created_at)
+
+
+def test_hashing_embedder_is_normalised_and_deterministic():
+    embedder = HashingEmbedder(dim=64)
+    first, second = embedder.embed(["budget constraint for Q3", "budget constraint for Q3"])
+
+    assert first == second
+    assert abs(sum(v * v for v in first) - 1.0) < 1e-6
+
+
+def test_search_ranks_semantically_closer_entries_first():
+    async def scenario():
+        index = MemoryVectorIndex(HashingEmbedder(dim=256))
+        await index.load_workspace("ws", [
+            _entry("a", "constraint", {"text": "operational constraints: budget limited to 5k per month"}),
+            _entry("b", "insight", {"text": "linkedin posts perform best on tuesday mornings"}),
+            _entry("c", "constraint", {"text": "deadline constraint: launch before end of quarter"}),
+        ])
+        return await index.search("ws", "operational constraints budget", k=2)
+
+    results = asyncio.run(scenario())
+
+    assert [payload for payload, _ in results][0] == "a"
+    assert len(results) == 2
+
+
+def test_search_filters_by_context_type_and_age():
+    async def scenario():
+        index = MemoryVectorIndex(HashingEmbedder(dim=128))
+        await index.load_workspace("ws", [
+            _entry("old", "constraint", {"text": "budget"}, created_at=10.0),
+            _entry("new", "constraint", {"text": "budget"}, created_at=200.0),
+            _entry("other", "insight", {"text": "budget"}, created_at=200.0),
+        ])
+        return await index.search("ws", "budget", k=5, context_types=["constraint"], min_created_at=100.0)
+
+    assert [payload for payload, _ in asyncio.run(scenario())] == ["new"]
+
+
+def test_upsert_replaces_and_capacity_evicts_oldest():
+    index = WorkspaceVectorIndex(dim=4, max_entries=2)
+    index.upsert("a", [1, 0, 0, 0], "a", "t", 1.0, created_at=1.0)
+    index.upsert("b", [0, 1, 0, 0], "b", "t", 1.0, created_at=2.0)
+    index.upsert("a", [0, 0, 1, 0], "a2", "t", 1.0, created_at=3.0)
+    index.upsert("c", [0, 0, 0, 1], "c", "t", 1.0, created_at=4.0)
+
+    assert len(index) == 2
+    assert set(index.ids) == {"a", "c"}
+    assert index.search([0, 0, 1, 0], k=1)[0][0] == "a2"
+
+
+def test_reload_only_embeds_new_or_changed_entries(monkeypatch):
+    class CountingEmbedder(HashingEmbedder):
+        def __init__(self):
+            super().__init__(dim=64)
+            self.batches = []
+
+        def embed(self, texts):
+            self.batches.append(len(texts))
+            return super().embed(texts)
+
+    embedder = CountingEmbedder()
+    monkeypatch.setattr("services.memory_vector_index.MEMORY_EMBED_INLINE_MAX", 1)
+    index = MemoryVectorIndex(embedder)
+    rows = [_entry(str(i), "insight", {"text": f"insight number {i}"}) for i in range(20)]
+
+    asyncio.run(index.load_workspace("ws", rows))
+    rows[3] = _entry("3", "insight", {"text": "edited insight"}, importance=0.9)
+    asyncio.run(index.load_workspace("ws", rows + [_entry("new", "insight", {"text": "fresh"})]))
+
+    assert embedder.batches == [20, 2]
+    assert index.get_stats()["embed_skipped"] == 19
+    assert asyncio.run(index.search("ws", "edited insight", k=1))[0][0] == "3"
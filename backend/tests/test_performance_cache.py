@@ -0,0 +1,131 @@
+# backend/tests/test_performance_cache.py
+import asyncio
+
+from utils.performance_cache import PerformanceCache, make_tag
+
+
+def test_tag_invalidation_only_drops_tagged_entries():
+    cache = PerformanceCache()
+    cache.set("goals:ws1", ["g1"], tags=[make_tag("workspace_id", "ws1")])
+    cache.set("goals:ws2", ["g2"], tags=[make_tag("workspace_id", "ws2")])
+
+    assert cache.invalidate_tags(make_tag("workspace_id", "ws1")) == 1
+    assert cache.get("goals:ws1") is None
+    assert cache.get("goals:ws2") == ["g2"]
+
+
+def test_lru_evicts_least_recently_used():
+    cache = PerformanceCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_byte_budget_is_enforced():
+    cache = PerformanceCache(max_bytes=15)
+    cache.set("a", "x" * 8)
+    cache.set("b", "y" * 8)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 8
+    assert cache.get_stats()["bytes_used"] <= 15
+
+
+def test_expired_entries_are_reclaimed_by_the_wheel(monkeypatch):
+    clock = {"now": 1000.0}
+    monkeypatch.setattr("utils.performance_cache.time.time", lambda: clock["now"])
+    cache = PerformanceCache()
+    cache.set("short", 1, ttl=1)
+    cache.set("long", 2, ttl=100)
+
+    clock["now"] += 5
+    cache.get("long")
+
+    assert "short" not in cache.cache
+    assert cache.get_stats()["expirations"] == 1
+
+
+def test_concurrent_misses_share_one_load():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def scenario():
+        cache = PerformanceCache()
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(10)))
+        return results, cache.get_stats()
+
+    results, stats = asyncio.run(scenario())
+
+    assert results == ["value"] * 10
+    assert len(calls) == 1
+    assert stats["coalesced_loads"] == 9
+
+
+def test_cached_results_are_copies(monkeypatch):
+    from utils import performance_cache
+    monkeypatch.setattr(performance_cache, "_cache_instance", PerformanceCache())
+
+    @performance_cache.cached(ttl=30)
+    async def get_workspace(workspace_id):
+        return {"id": workspace_id, "status": "active"}
+
+    first = asyncio.run(get_workspace("ws1"))
+    first["status"] = "paused"
+    second = asyncio.run(get_workspace("ws1"))
+    performance_cache.invalidate_workspace_cache("ws1")
+
+    assert second == {"id": "ws1", "status": "active"}
+    assert performance_cache._cache_instance.get_stats()["cache_size"] == 0
+
+
+def test_direct_agent_insert_clears_cached_agent_list(monkeypatch):
+    import database
+    import auto_agent_provisioner as provisioner_module
+
+    rows = []
+
+    class FakeQuery:
+        def __init__(self, payload=None):
+            self.payload = payload
+
+        def select(self, *args, **kwargs):
+            return self
+
+        def eq(self, column, value):
+            return self
+
+        def insert(self, payload):
+            return FakeQuery(payload)
+
+        def execute(self):
+            if self.payload is not None:
+                rows.append(self.payload)
+                return type("Response", (), {"data": [self.payload]})()
+            return type("Response", (), {"data": list(rows)})()
+
+    class FakeAsyncQuery(FakeQuery):
+        async def execute(self):
+            return FakeQuery.execute(self)
+
+    monkeypatch.setattr(database, "async_supabase", type("Db", (), {"table": lambda self, name: FakeAsyncQuery()})())
+    monkeypatch.setattr(provisioner_module, "supabase", type("Db", (), {"table": lambda self, name: FakeQuery()})())
+    provisioner = provisioner_module.AutoAgentProvisioner()
+    provisioner.ai_available = False
+
+    async def scenario():
+        before = await database.list_agents("ws-provisioned")
+        await provisioner._provision_minimal_agent_team("ws-provisioned", [], {"name": "Acme"})
+        return before, await database.list_agents("ws-provisioned")
+
+    before, after = asyncio.run(scenario())
+
+    assert before == [] and len(after) == 2
@@ -0,0 +1,110 @@
+# backend/tests/test_priority_task_queue.py
+import asyncio
+
+import pytest
+
+from utils.priority_task_queue import PriorityTaskQueue
+
+
+def _classify(item):
+    return item["class"], item.get("score", 0), item.get("ws")
+
+
+def _drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_corrective_fast_lane_is_served_first():
+    queue = PriorityTaskQueue(priority_fn=_classify, aging_rate=0)
+    queue.put_nowait({"id": "bulk", "class": "normal", "ws": "a"})
+    queue.put_nowait({"id": "final", "class": "finalization", "ws": "a"})
+    queue.put_nowait({"id": "fix", "class": "corrective", "ws": "a"})
+
+    assert [item["id"] for item in _drain(queue)] == ["fix", "final", "bulk"]
+
+
+def test_workspaces_share_workers_round_robin():
+    queue = PriorityTaskQueue(priority_fn=_classify, aging_rate=0)
+    for i in range(3):
+        queue.put_nowait({"id": f"a{i}", "class": "high", "ws": "a"})
+    queue.put_nowait({"id": "b0", "class": "low", "ws": "b"})
+
+    assert [item["id"] for item in _drain(queue)] == ["a0", "b0", "a1", "a2"]
+
+
+def test_workspace_weight_grants_extra_turns():
+    queue = PriorityTaskQueue(priority_fn=_classify, aging_rate=0)
+    queue.set_workspace_weight("a", 2)
+    for i in range(3):
+        queue.put_nowait({"id": f"a{i}", "class": "normal", "ws": "a"})
+        queue.put_nowait({"id": f"b{i}", "class": "normal", "ws": "b"})
+
+    assert [item["id"] for item in _drain(queue)] == ["a0", "a1", "b0", "a2", "b1", "b2"]
+
+
+def test_aging_lets_old_low_priority_work_overtake(monkeypatch):
+    clock = {"now": 0.0}
+    monkeypatch.setattr("utils.priority_task_queue.time.monotonic", lambda: clock["now"])
+    queue = PriorityTaskQueue(priority_fn=_classify, aging_rate=10.0)
+
+    queue.put_nowait({"id": "old", "class": "low", "ws": "a"})
+    clock["now"] = 150.0  # 1500 aging points, more than the normal/low class gap
+    queue.put_nowait({"id": "new", "class": "normal", "ws": "a"})
+
+    assert [item["id"] for item in _drain(queue)] == ["old", "new"]
+
+
+def test_capacity_applies_except_for_corrective_and_sentinel():
+    queue = PriorityTaskQueue(maxsize=1, priority_fn=_classify)
+    queue.put_nowait({"id": "bulk", "class": "normal"})
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait({"id": "more", "class": "normal"})
+    queue.put_nowait({"id": "fix", "class": "corrective"})
+    queue.put_nowait(None)
+
+    assert queue.get_nowait() is None
+    assert queue.get_nowait()["id"] == "fix"
+
+
+def test_get_waits_for_put_and_reports_metrics():
+    async def scenario():
+        queue = PriorityTaskQueue(priority_fn=_classify)
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        await queue.put({"id": "t", "class": "high", "ws": "a"})
+        item = await asyncio.wait_for(getter, timeout=1)
+        queue.task_done()
+        await queue.join()
+        return item, queue.get_metrics()
+
+    item, metrics = asyncio.run(scenario())
+
+    assert item["id"] == "t"
+    assert metrics["per_priority_class"]["high"]["dequeued"] == 1
+    assert metrics["per_priority_class"]["high"]["depth"] == 0
+
+
+def test_each_put_classifies_once_and_precomputed_priority_skips_it():
+    classified = []
+
+    def counting_classify(item):
+        classified.append(item["id"])
+        return _classify(item)
+
+    async def scenario():
+        queue = PriorityTaskQueue(maxsize=1, priority_fn=counting_classify)
+        queue.put_nowait({"id": "bulk", "class": "normal"})
+        # At capacity: the capacity check and the enqueue share one classification
+        queue.put_nowait({"id": "fix", "class": "corrective"})
+        await queue.put({"id": "urgent", "class": "corrective"})
+        queue.put_nowait({"id": "scored", "class": "normal"}, priority=("corrective", 5.0, "a"))
+        return [item["id"] for item in _drain(queue)]
+
+    order = asyncio.run(scenario())
+
+    assert classified == ["bulk", "fix", "urgent"]
+    assert order == ["scored", "fix", "urgent", "bulk"]
@@ -0,0 +1,68 @@
+# backend/tests/test_task_dependency_graph.py
+from services.task_dependency_graph import (
+    MISSING_DEPENDENCY,
+    TaskDependencyGraph,
+    TaskDependencyGraphRegistry,
+)
+
+
+def _task(task_id, deps=None):
+    return {"id": task_id, "status": "pending", "depends_on_task_ids": deps or []}
+
+
+def test_tasks_without_dependencies_are_ready():
+    graph = TaskDependencyGraph("ws")
+    graph.sync_pending([_task("a"), _task("b", ["a"])])
+
+    assert graph.ready_task_ids() == {"a"}
+    assert graph.unresolved_dependencies() == {"a"}
+
+
+def test_completion_unblocks_dependents_incrementally():
+    graph = TaskDependencyGraph("ws")
+    graph.sync_pending([_task("b", ["a"]), _task("c", ["a", "b"])])
+    graph.set_status("a", "pending")
+
+    assert graph.set_status("a", "completed") == {"b"}
+    assert graph.set_status("b", "completed") == {"c"}
+    assert graph.ready_task_ids() == {"c"}
+
+
+def test_missing_dependency_does_not_block():
+    graph = TaskDependencyGraph("ws")
+    graph.sync_pending([_task("b", ["gone"])])
+
+    graph.set_status("gone", MISSING_DEPENDENCY)
+
+    assert graph.ready_task_ids() == {"b"}
+
+
+def test_reopened_dependency_blocks_again():
+    graph = TaskDependencyGraph("ws")
+    graph.sync_pending([_task("b", ["a"])])
+    graph.set_status("a", "completed")
+
+    graph.set_status("a", "needs_revision")
+
+    assert graph.ready_task_ids() == set()
+
+
+def test_sync_drops_tasks_that_left_pending():
+    graph = TaskDependencyGraph("ws")
+    graph.sync_pending([_task("a"), _task("b")])
+
+    graph.sync_pending([_task("b")])
+
+    assert graph.ready_task_ids() == {"b"}
+    assert graph.get_stats()["pending_tasks"] == 1
+
+
+def test_registry_routes_status_changes_to_referencing_graphs():
+    registry = TaskDependencyGraphRegistry()
+    graph = registry.get("ws")
+    graph.sync_pending([_task("b", ["a"])])
+    graph.set_status("a", "in_progress")
+
+    registry.on_status_change("a", "completed")
+
+    assert graph.ready_task_ids() == {"b"}
@@ -0,0 +1,75 @@
+# backend/tests/test_task_duplicate_index.py
+import random
+
+from services.task_duplicate_index import MinHasher, TaskDuplicateIndex, TaskDuplicateIndexRegistry, estimate_jaccard, task_shingles
+
+
+def _index(tasks):
+    registry = TaskDuplicateIndexRegistry()
+    index = registry.get("ws")
+    index.load(tasks)
+    return registry, index
+
+
+def _workspace(n, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [f"w{i}" for i in range(3000)]
+    return [
+        {"id": f"t{i}", "workspace_id": "ws", "status": "pending",
+         "name": " ".join(rng.sample(vocabulary, 6)),
+         "description": " ".join(rng.sample(vocabulary, 20))}
+        for i in range(n)
+    ]
+
+
+def test_near_duplicate_is_a_candidate_and_unrelated_task_is_not():
+    _, index = _index([
+        {"id": "a", "status": "pending", "name": "Write LinkedIn post about the product launch",
+         "description": "Draft a LinkedIn post announcing the product launch to our B2B audience"},
+        {"id": "b", "status": "pending", "name": "Analyse churn for Q3",
+         "description": "Compute monthly churn by cohort for the third quarter"},
+    ])
+
+    candidates = index.candidates({
+        "name": "Write a LinkedIn post about the product launch",
+        "description": "Draft a LinkedIn post announcing the product launch to our B2B audience",
+    })
+
+    assert [task["id"] for task, _ in candidates] == ["a"]
+
+
+def test_status_changes_filter_candidates():
+    registry, index = _index([{"id": "a", "workspace_id": "ws", "status": "pending", "name": "Build pricing page"}])
+
+    registry.on_status_change("a", "failed")
+    assert index.candidates({"name": "Build pricing page"}) == []
+
+    registry.on_status_change("a", "completed")
+    assert [task["id"] for task, _ in index.candidates({"name": "Build pricing page"})] == ["a"]
+
+
+def test_created_tasks_are_indexed_incrementally():
+    registry, index = _index([])
+    registry.on_task_created({"id": "new", "workspace_id": "ws", "status": "pending", "name": "Prepare webinar script"})
+
+    assert "new" in index
+    assert index.candidates({"name": "Prepare webinar script"})[0][1] == 1.0
+
+
+def test_candidate_set_stays_small_in_large_workspace():
+    tasks = _workspace(2000)
+    _, index = _index(tasks)
+    near_copy = {"name": tasks[4]["name"], "description": tasks[4]["description"] + " urgent"}
+
+    candidates = index.candidates(near_copy)
+
+    assert [task["id"] for task, _ in candidates] == ["t4"]
+
+
+def test_jaccard_estimate_tracks_true_overlap():
+    hasher = MinHasher(256)
+    s1 = task_shingles({"name": "alpha beta gamma delta epsilon zeta eta theta"})
+    s2 = task_shingles({"name": "alpha beta gamma delta epsilon zeta iota kappa"})
+    true_jaccard = len(s1 & s2) / len(s1 | s2)
+
+    assert abs(estimate_jaccard(hasher.signature(s1), hasher.signature(s2)) - true_jaccard) < 0.15
@@ -0,0 +1,151 @@
+# backend/tests/test_task_event_bus.py
+import asyncio
+import json
+import logging
+import threading
+
+from utils import task_event_bus as bus_module
+from utils.task_event_bus import TASK_CREATED, TASK_QUEUED, TaskEventBus
+
+
+class FakeConnection:
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def close(self):
+        self.closed = True
+
+    def notify(self, payload):
+        for callback in self.listeners.values():
+            callback(self, 1, bus_module.TASK_EVENTS_CHANNEL, json.dumps(payload))
+
+    def drop(self):
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+class FakeAsyncpg:
+    """connect() fails ``failures`` times, then hands out FakeConnections."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.attempts = 0
+        self.connections = []
+
+    async def connect(self, dsn):
+        self.attempts += 1
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection refused")
+        self.connections.append(FakeConnection())
+        return self.connections[-1]
+
+
+def test_subscriber_wakes_immediately_on_publish():
+    async def scenario():
+        bus = TaskEventBus()
+        subscription = bus.subscribe({TASK_CREATED})
+        waiter = asyncio.create_task(subscription.wait(timeout=5))
+        await asyncio.sleep(0)
+        bus.publish(TASK_QUEUED, workspace_id="ws")  # filtered out
+        bus.publish(TASK_CREATED, workspace_id="ws", task_id="t1")
+        return await asyncio.wait_for(waiter, timeout=1)
+
+    events = asyncio.run(scenario())
+
+    assert [(e.event_type, e.task_id) for e in events] == [(TASK_CREATED, "t1")]
+
+
+def test_wait_times_out_without_events():
+    async def scenario():
+        return await TaskEventBus().subscribe().wait(timeout=0.01)
+
+    assert asyncio.run(scenario()) == []
+
+
+def test_full_mailbox_drops_oldest_event():
+    async def scenario():
+        bus = TaskEventBus()
+        subscription = bus.subscribe(maxsize=2)
+        for i in range(3):
+            bus.publish(TASK_CREATED, task_id=f"t{i}")
+        return subscription.drain(), bus.get_stats()
+
+    events, stats = asyncio.run(scenario())
+
+    assert [e.task_id for e in events] == ["t1", "t2"]
+    assert stats["dropped"] == 1
+
+
+def test_publish_from_another_thread_is_delivered_on_the_loop():
+    async def scenario():
+        bus = TaskEventBus()
+        subscription = bus.subscribe()
+        thread = threading.Thread(target=bus.publish, args=(TASK_CREATED,), kwargs={"task_id": "t"})
+        thread.start()
+        thread.join()
+        return await subscription.wait(timeout=1)
+
+    events = asyncio.run(scenario())
+
+    assert events[0].task_id == "t"
+
+
+def test_missing_dsn_warns_that_cross_process_delivery_is_off(monkeypatch, caplog):
+    monkeypatch.setattr(bus_module, "TASK_EVENTS_PG_DSN", None)
+
+    with caplog.at_level(logging.WARNING, logger=bus_module.__name__):
+        started = asyncio.run(TaskEventBus().start_postgres_listener())
+
+    assert started is False
+    assert "cross-process delivery is off" in caplog.text
+
+
+def test_postgres_listener_retries_with_backoff_and_reconnects_after_a_drop(monkeypatch, caplog):
+    fake_asyncpg = FakeAsyncpg(failures=2)
+    monkeypatch.setattr(bus_module, "asyncpg", fake_asyncpg)
+    monkeypatch.setattr(bus_module, "ASYNCPG_AVAILABLE", True)
+    monkeypatch.setattr(bus_module, "TASK_EVENTS_RECONNECT_MIN_SECONDS", 0.01)
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay, *args, **kwargs):
+        sleeps.append(delay)
+        await real_sleep(0)
+
+    async def wait_for_connection(bus, count):
+        while len(fake_asyncpg.connections) < count or bus._listener_connection is None:
+            await real_sleep(0)
+
+    async def scenario():
+        bus = TaskEventBus()
+        subscription = bus.subscribe({TASK_CREATED})
+        monkeypatch.setattr(bus_module.asyncio, "sleep", recording_sleep)
+        started = await bus.start_postgres_listener("postgresql://events")
+        await asyncio.wait_for(wait_for_connection(bus, 1), timeout=1)
+        fake_asyncpg.connections[0].drop()
+        dropped_stats = bus.get_stats()
+        await asyncio.wait_for(wait_for_connection(bus, 2), timeout=1)
+        fake_asyncpg.connections[1].notify({"event_type": TASK_CREATED, "workspace_id": "ws", "task_id": "t"})
+        events = subscription.drain()
+        await bus.stop_postgres_listener()
+        return started, dropped_stats, events, bus
+
+    with caplog.at_level(logging.WARNING, logger=bus_module.__name__):
+        started, dropped_stats, events, bus = asyncio.run(scenario())
+
+    assert started is False and "cross-process delivery is off" in caplog.text
+    assert dropped_stats["postgres_listener"] is False and dropped_stats["postgres_listener_reconnecting"]
+    # Initial attempt and first retry fail (delays double), then a fresh backoff after the drop
+    assert sleeps == [0.01, 0.02, 0.01]
+    assert fake_asyncpg.attempts == 4 and bus.stats["listener_reconnects"] == 2
+    assert [(e.task_id, e.source) for e in events] == [("t", "postgres")]
+    assert fake_asyncpg.connections[1].closed and not bus.get_stats()["postgres_listener"]
@@ -0,0 +1,81 @@
+# backend/tests/test_task_similarity_clustering.py
+import random
+
+import pytest
+
+from services import task_similarity_clustering as clustering
+from services.task_similarity_clustering import (
+    TASK_DESCRIPTION_DUPLICATE_THRESHOLD,
+    cluster_texts,
+    clusters_from_pairs,
+    find_similar_pairs,
+)
+
+TEXTS = [
+    "Write a LinkedIn post announcing the product launch to B2B buyers",
+    "Compute monthly churn by cohort for the third quarter",
+    "Write LinkedIn post announcing the product launch to B2B buyers today",
+    "Prepare the webinar script for the onboarding series",
+    "Announce the product launch with a LinkedIn post for B2B buyers",
+]
+
+# Lower-cased executor descriptions: rewordings of one task (0-9) and different tasks that
+# share a template (10-15); the old 0.8 SequenceMatcher ratio also merged 12 and 13 into 2-3
+DESCRIPTIONS = [
+    "write a linkedin post announcing the product launch to b2b buyers in europe",
+    "write a linkedin post announcing the product launch to b2b buyers in europe.",
+    "compute monthly churn by cohort for the third quarter and summarise the drivers",
+    "compute the monthly churn by cohort for the third quarter and summarize the drivers",
+    "research the top 20 competitors in the crm market and list their pricing tiers",
+    "research the top 25 competitors in the crm market and list their pricing tiers",
+    "draft a 5-email nurture sequence for trial users who have not activated",
+    "draft a 5-email nurture sequence for trial users that have not yet activated",
+    "create the onboarding checklist for new enterprise customers with owners and dates",
+    "create an onboarding checklist for new enterprise customers, with owners and due dates",
+    "research the top 20 influencers in the fitness market and list their contact details",
+    "write a blog article explaining the pricing change to existing customers in europe",
+    "compute monthly revenue by region for the third quarter and summarise the outliers",
+    "compute monthly churn by segment for the second quarter and summarise the outliers",
+    "announce the product launch with a linkedin post aimed at b2b buyers in europe",
+    "prepare the webinar script for the onboarding series with speaker notes",
+]
+
+
+def _methods():
+    methods = ["inverted", "lsh"]
+    if clustering.HAS_NUMPY:
+        methods.append("dense")
+    if clustering.HAS_SCIPY:
+        methods.append("sparse")
+    return methods
+
+
+@pytest.mark.parametrize("method", _methods())
+def test_near_duplicates_cluster_together(method):
+    assert cluster_texts(TEXTS, threshold=0.6, method=method) == [[0, 2]]
+
+
+@pytest.mark.parametrize("method", _methods())
+def test_duplicate_threshold_groups_rewordings_but_not_template_siblings(method):
+    clusters = cluster_texts(DESCRIPTIONS, threshold=TASK_DESCRIPTION_DUPLICATE_THRESHOLD, method=method)
+
+    assert clusters == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+    # Left at the old 0.8, the cosine would miss three of the five rewordings
+    assert cluster_texts(DESCRIPTIONS, threshold=0.8, method=method) == [[0, 1], [8, 9]]
+
+
+def test_backends_agree_on_pairs():
+    rng = random.Random(3)
+    vocabulary = [f"w{i}" for i in range(400)]
+    base = [" ".join(rng.sample(vocabulary, 12)) for _ in range(60)]
+    texts = base + [text + " extra" for text in base[:15]]
+
+    expected = {(i, j) for i, j, _ in find_similar_pairs(texts, 0.7, method="inverted")}
+
+    assert {(i, j) for i in range(15) for j in [i + 60]} <= expected
+    for method in _methods():
+        assert {(i, j) for i, j, _ in find_similar_pairs(texts, 0.7, method=method)} == expected, method
+
+
+def test_union_find_is_transitive():
+    assert clusters_from_pairs(6, [(0, 1, 0.9), (1, 4, 0.9), (2, 3, 0.9)]) == [[0, 1, 4], [2, 3]]
@@ -0,0 +1,133 @@
+# backend/tests/test_telemetry_counters.py
+import asyncio
+import gzip
+import json
+from types import SimpleNamespace
+
+from services import system_telemetry_monitor as monitor_module
+from services.system_telemetry_monitor import SystemTelemetryMonitor, TelemetryMetrics
+from utils.telemetry_counters import MetricRing, TelemetryCounters
+
+
+class FakeAsyncDb:
+    """Answers telemetry RPCs (or raises when they are missing) and exact-count queries"""
+
+    def __init__(self, rpc_rows=None):
+        self.rpc_rows = rpc_rows
+        self.count_queries = 0
+        self.filters = []
+        self.response = None
+
+    def rpc(self, name, params):
+        if self.rpc_rows is None:
+            raise RuntimeError(f"function {name} does not exist")
+        self.response = SimpleNamespace(data=self.rpc_rows, count=None)
+        return self
+
+    def table(self, name):
+        self.count_queries += 1
+        self.response = SimpleNamespace(data=[], count=3)
+        return self
+
+    def select(self, *args, **kwargs):
+        return self
+
+    def eq(self, column, value):
+        return self
+
+    def gte(self, column, value):
+        return self
+
+    def or_(self, filters):
+        self.filters.append(filters)
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def execute(self):
+        return self.response
+
+
+def test_rings_are_bounded_and_rates_are_none_until_recorded():
+    ring = MetricRing(size=3)
+    for value in range(5):
+        ring.append(value, timestamp=value)
+
+    counters = TelemetryCounters(ring_size=4)
+    assert counters.success_rate("goal_update") is None and counters.average("ai_confidence", 0.7) == 0.7
+    for success in (False, True, True, True, True):
+        counters.record_outcome("goal_update", success)
+
+    assert ring.values() == [2.0, 3.0, 4.0] and ring.values(since=3) == [3.0, 4.0]
+    assert counters.success_rate("goal_update") == 1.0
+    assert counters.snapshot()["success_rates"]["goal_update"] == {"rate": 1.0, "attempts": 4}
+
+
+def test_action_metrics_report_counter_deltas(monkeypatch):
+    counters = TelemetryCounters()
+    monkeypatch.setattr(monitor_module, "telemetry_counters", counters)
+    monitor = SystemTelemetryMonitor()
+
+    counters.increment("recovery_actions", 2)
+    first = asyncio.run(monitor._collect_system_action_metrics())
+    counters.increment("recovery_actions")
+    second = asyncio.run(monitor._collect_system_action_metrics())
+    idle = asyncio.run(monitor._collect_system_action_metrics())
+
+    assert [first["recovery_actions"], second["recovery_actions"], idle["recovery_actions"]] == [2, 1, 0]
+
+
+def test_workspace_counts_fall_back_to_count_queries_when_rpc_is_missing():
+    monitor = SystemTelemetryMonitor()
+    with_rpc = FakeAsyncDb([{"status": "active", "workspace_count": 4}, {"status": "paused", "workspace_count": 1}])
+    without_rpc = FakeAsyncDb()
+
+    aggregated = asyncio.run(monitor._workspace_status_counts(with_rpc, ["active", "paused"]))
+    fallback = asyncio.run(monitor._workspace_status_counts(without_rpc, ["active", "paused"]))
+
+    assert aggregated == {"active": 4, "paused": 1, "__total__": 5} and with_rpc.count_queries == 0
+    assert fallback == {"active": 3, "paused": 3, "__total__": 3} and without_rpc.count_queries == 3
+    assert monitor._aggregate_rpcs_retry_at > 0
+
+
+def test_task_metrics_fallback_counts_exactly_and_leaves_wait_time_unknown():
+    monitor = SystemTelemetryMonitor()
+    db = FakeAsyncDb()
+
+    metrics = asyncio.run(monitor._collect_task_metrics_with_counts(db, "2026-10-16T09:00:00"))
+
+    assert metrics == {"pending": 3, "critical": 3, "completion_rate": 3.0, "avg_wait_time": None}
+    assert db.count_queries == 3 and db.filters == ["name.ilike.%urgent%,name.ilike.%critical%,name.ilike.%emergency%"]
+
+    # Snapshots without a wait time are left out of the wait trend instead of counted as 0
+    for index, wait in enumerate([None] * 5 + [12.0] * 5):
+        monitor.metrics_history.append(TelemetryMetrics(
+            timestamp=f"2026-10-16T10:0{index}:00", system_health_score=0.9, active_workspaces=1, paused_workspaces=0,
+            pending_tasks_total=3, critical_tasks_total=0, task_completion_rate=1.0, average_task_wait_time=wait,
+            anti_loop_triggers=0, achievement_extraction_success_rate=None, goal_update_success_rate=None,
+            ai_confidence_average=None, workspace_recovery_actions=0
+        ))
+    trends = asyncio.run(monitor._calculate_trends())
+    assert trends["task_wait_time"] == "unknown" and trends["wait_time_change"] is None
+
+
+def test_telemetry_file_rotates_into_gzip_backups(monkeypatch, tmp_path):
+    monkeypatch.setattr(monitor_module, "TELEMETRY_LOG_MAX_BYTES", 400)
+    monitor = SystemTelemetryMonitor()
+    monitor.telemetry_file = str(tmp_path / "telemetry.jsonl")
+
+    snapshot = TelemetryMetrics(
+        timestamp="2026-10-16T10:00:00", system_health_score=0.9, active_workspaces=2, paused_workspaces=0,
+        pending_tasks_total=5, critical_tasks_total=0, task_completion_rate=3.0, average_task_wait_time=4.5,
+        anti_loop_triggers=0, achievement_extraction_success_rate=None, goal_update_success_rate=None,
+        ai_confidence_average=None, workspace_recovery_actions=0
+    )
+    for _ in range(5):
+        asyncio.run(monitor._write_telemetry_to_file(snapshot))
+    monitor._get_file_logger().handlers[0].close()
+
+    backup = tmp_path / "telemetry.jsonl.1.gz"
+    assert backup.exists()
+    with gzip.open(backup, "rt", encoding="utf-8") as f:
+        assert all("system_health_score" in json.loads(line) for line in f)
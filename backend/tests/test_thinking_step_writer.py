@@ -0,0 +1,96 @@
+# backend/tests/test_thinking_step_writer.py
+import asyncio
+
+from services.thinking_step_writer import ThinkingEventDispatcher, ThinkingStepWriter
+
+
+class RecordingInserter:
+    def __init__(self, fail_on=None, delay=0.0):
+        self.batches = []
+        self.fail_on = fail_on
+        self.delay = delay
+
+    async def __call__(self, rows):
+        await asyncio.sleep(self.delay)
+        if self.fail_on and len(rows) > 1 and any(r["step_id"] == self.fail_on for r in rows):
+            raise RuntimeError("bulk insert rejected")
+        if self.fail_on and [r["step_id"] for r in rows] == [self.fail_on]:
+            raise RuntimeError("bad row")
+        self.batches.append([r["step_id"] for r in rows])
+
+
+def test_rows_are_coalesced_into_ordered_batches():
+    async def scenario():
+        inserter = RecordingInserter()
+        writer = ThinkingStepWriter(inserter, batch_size=3, flush_interval=60)
+        for i in range(7):
+            await writer.enqueue({"step_id": f"s{i}"})
+        await writer.close()
+        return inserter.batches, writer.get_stats()
+
+    batches, stats = asyncio.run(scenario())
+
+    assert [step for batch in batches for step in batch] == [f"s{i}" for i in range(7)]
+    assert all(len(batch) <= 3 for batch in batches)
+    assert stats["written"] == 7 and stats["buffered"] == 0
+
+
+def test_interval_flush_without_explicit_flush():
+    async def scenario():
+        inserter = RecordingInserter()
+        writer = ThinkingStepWriter(inserter, batch_size=100, flush_interval=0.01)
+        await writer.enqueue({"step_id": "s0"})
+        await asyncio.sleep(0.05)
+        written = list(inserter.batches)
+        await writer.close()
+        return written
+
+    assert asyncio.run(scenario()) == [["s0"]]
+
+
+def test_flush_waits_for_batch_already_in_flight():
+    async def scenario():
+        inserter = RecordingInserter(delay=0.02)
+        writer = ThinkingStepWriter(inserter, batch_size=1, flush_interval=60)
+        await writer.enqueue({"step_id": "s0"})
+        await asyncio.sleep(0)  # background flusher takes the row
+        await writer.flush()
+        written = list(inserter.batches)
+        await writer.close()
+        return written
+
+    assert asyncio.run(scenario()) == [["s0"]]
+
+
+def test_failed_bulk_insert_falls_back_to_single_rows():
+    async def scenario():
+        inserter = RecordingInserter(fail_on="s1")
+        writer = ThinkingStepWriter(inserter, batch_size=10, flush_interval=60)
+        for i in range(3):
+            await writer.enqueue({"step_id": f"s{i}"})
+        await writer.close()
+        return inserter.batches, writer.get_stats()
+
+    batches, stats = asyncio.run(scenario())
+
+    assert batches == [["s0"], ["s2"]]
+    assert stats["failed"] == 1 and stats["written"] == 2
+
+
+def test_dispatcher_delivers_in_order_and_drops_oldest_when_full():
+    async def scenario():
+        delivered = []
+
+        async def send(event_type, data):
+            delivered.append(data["n"])
+
+        dispatcher = ThinkingEventDispatcher(send, maxsize=2)
+        for n in range(4):
+            dispatcher.dispatch("step_added", {"n": n})
+        await dispatcher.close()
+        return delivered, dispatcher.get_stats()
+
+    delivered, stats = asyncio.run(scenario())
+
+    assert delivered == [2, 3]
+    assert stats["dropped"] == 2
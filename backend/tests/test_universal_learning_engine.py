@@ -0,0 +1,76 @@
+# backend/tests/test_universal_learning_engine.py
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from services import learning_watermarks as watermarks_module
+from services import universal_learning_engine as engine_module
+from services.learning_watermarks import LearningWatermarkStore
+from services.universal_learning_engine import UniversalLearningEngine
+from tests.test_learning_watermarks import FakeSupabase
+from utils.ai_result_store import AIResultStore
+
+REPORT_BODY = "Quarterly pipeline review: conversion rate 12% against a 9% baseline. " * 10
+
+
+def _deliverable(deliverable_id, updated_at):
+    return {"id": deliverable_id, "workspace_id": "ws", "title": "Pipeline review", "content": REPORT_BODY,
+            "created_at": datetime.now().isoformat(), "updated_at": updated_at}
+
+
+@pytest.fixture
+def harness(monkeypatch, tmp_path):
+    store = AIResultStore(path=str(tmp_path / "learning.sqlite3"))
+    monkeypatch.setattr(watermarks_module, "ai_result_store", store)
+    monkeypatch.setattr(engine_module, "learning_watermarks", LearningWatermarkStore(enabled=True))
+
+    state = {"supabase": FakeSupabase([]), "stored_hashes": set(), "inserts": [],
+             "failing_extractions": 0, "extraction_prompts": []}
+
+    async def call_ai(provider_type, agent, prompt, **kwargs):
+        if agent["name"] == "UniversalContextDetector":
+            return {"domain": "sales", "language": "en"}
+        if agent["name"] == "UniversalInsightExtractor":
+            state["extraction_prompts"].append(prompt)
+            if state["failing_extractions"]:
+                state["failing_extractions"] -= 1
+                raise RuntimeError("provider unavailable")
+            return {"insights": [{"title": "Conversion beats baseline", "insight_type": "learning",
+                                  "metric_name": "conversion_rate", "metric_value": 0.12,
+                                  "actionable_recommendation": "Keep the qualification step"}]}
+        return {"patterns": []}
+
+    async def existing_hashes(workspace_id, hashes):
+        return state["stored_hashes"] & set(hashes)
+
+    async def add_many(workspace_id, records):
+        state["inserts"].append(len(records))
+        state["stored_hashes"].update(record["content_hash"] for record in records)
+        return len(records)
+
+    monkeypatch.setattr(engine_module.ai_provider_manager, "call_ai", call_ai)
+    monkeypatch.setattr(engine_module, "get_supabase_client", lambda: state["supabase"])
+    monkeypatch.setattr(engine_module, "get_existing_insight_hashes", existing_hashes)
+    monkeypatch.setattr(engine_module, "add_memory_insights", add_many)
+    return state
+
+
+def test_failed_ai_call_keeps_the_watermark_so_the_next_run_retries(harness):
+    harness["supabase"].rows = [_deliverable("d1", "2026-10-01T10:00:00+00:00"),
+                                _deliverable("d2", "2026-10-01T11:00:00+00:00")]
+    harness["failing_extractions"] = 1
+    engine = UniversalLearningEngine()
+
+    failed = asyncio.run(engine.analyze_workspace_content("ws"))
+    inserts_after_failure = list(harness["inserts"])
+    retried = asyncio.run(engine.analyze_workspace_content("ws"))
+    idle = asyncio.run(engine.analyze_workspace_content("ws"))
+
+    assert failed["status"] == "error" and inserts_after_failure == []
+    assert retried["status"] == "completed" and retried["deliverables_analyzed"] == 2
+    assert retried["insights_generated"] == 1 and harness["inserts"] == [1]
+    # Both runs saw the same deliverables; once the watermark moves nothing is left to analyse
+    assert harness["extraction_prompts"][0] == harness["extraction_prompts"][1]
+    assert idle["status"] == "insufficient_data"
+    assert engine.get_learning_stats()["failed_runs"] == 1
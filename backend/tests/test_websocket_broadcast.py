@@ -0,0 +1,103 @@
+# backend/tests/test_websocket_broadcast.py
+import asyncio
+import json
+
+from utils.websocket_broadcast import DROP_NEWEST, WebSocketBroadcaster
+
+
+class FakeSocket:
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.release = None
+
+    async def send_text(self, text):
+        if self.release is not None:
+            await self.release.wait()
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("client went away")
+        self.received.append(json.loads(text))
+
+
+async def _drain(broadcaster, timeout=1.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while broadcaster.get_stats()["queued"] and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(0.01)
+
+
+def test_slow_client_does_not_delay_the_others():
+    async def scenario():
+        broadcaster = WebSocketBroadcaster()
+        fast, slow = FakeSocket(), FakeSocket(delay=0.5)
+        broadcaster.broadcast([fast, slow], {"type": "task_update", "n": 1})
+        await asyncio.sleep(0.05)
+        received = list(fast.received), list(slow.received)
+        broadcaster.discard(slow)
+        return received
+
+    fast_received, slow_received = asyncio.run(scenario())
+
+    assert fast_received == [{"type": "task_update", "n": 1}]
+    assert slow_received == []
+
+
+def test_full_queue_drops_oldest_and_coalesces_by_key():
+    async def scenario():
+        broadcaster = WebSocketBroadcaster(queue_size=3)
+        socket = FakeSocket()
+        socket.release = asyncio.Event()
+        broadcaster.broadcast([socket], {"n": 0})
+        await asyncio.sleep(0)  # n=0 is now in flight, blocked on the client
+        for n in range(1, 5):
+            broadcaster.broadcast([socket], {"n": n})
+        broadcaster.broadcast([socket], {"goal": "g1", "progress": 10}, coalesce_key="goal:g1")
+        broadcaster.broadcast([socket], {"goal": "g1", "progress": 20}, coalesce_key="goal:g1")
+        socket.release.set()
+        await _drain(broadcaster)
+        return socket.received, broadcaster.get_stats()
+
+    received, stats = asyncio.run(scenario())
+
+    # n=0 was already in flight; n=1 and n=2 were dropped to make room for newer frames
+    assert received == [{"n": 0}, {"n": 3}, {"n": 4}, {"goal": "g1", "progress": 20}]
+    assert stats["coalesced"] == 1
+    assert stats["dropped"] == 2
+
+
+def test_drop_newest_policy_rejects_frames_when_full():
+    async def scenario():
+        broadcaster = WebSocketBroadcaster(queue_size=1, policy=DROP_NEWEST)
+        socket = FakeSocket()
+        socket.release = asyncio.Event()
+        accepted = [broadcaster.send(socket, {"n": 0})]
+        await asyncio.sleep(0)  # n=0 is now in flight, blocked on the client
+        accepted += [broadcaster.send(socket, {"n": n}) for n in (1, 2)]
+        socket.release.set()
+        await _drain(broadcaster)
+        return accepted, socket.received
+
+    accepted, received = asyncio.run(scenario())
+
+    assert accepted == [True, True, False]
+    assert received == [{"n": 0}, {"n": 1}]
+
+
+def test_failed_send_notifies_owners_and_forgets_the_socket():
+    failures = []
+
+    async def scenario():
+        broadcaster = WebSocketBroadcaster()
+        socket = FakeSocket(fail=True)
+        broadcaster.sender_for(socket).add_callbacks("test", on_failure=failures.append)
+        broadcaster.broadcast([socket], {"n": 1})
+        await asyncio.sleep(0.02)
+        return broadcaster.get_stats()
+
+    stats = asyncio.run(scenario())
+
+    assert len(failures) == 1 and isinstance(failures[0], ConnectionError)
+    assert stats["connections"] == 0
+    assert stats["failed"] == 1
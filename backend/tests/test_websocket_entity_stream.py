@@ -0,0 +1,92 @@
+# backend/tests/test_websocket_entity_stream.py
+import asyncio
+import copy
+import json
+
+from utils.websocket_broadcast import WebSocketBroadcaster
+from utils.websocket_entity_stream import EntityStreamHub, apply_patch, json_diff
+
+
+class FakeSocket:
+    def __init__(self):
+        self.received = []
+
+    async def send_text(self, text):
+        self.received.append(json.loads(text))
+
+
+def _progress(progress, quality=0.5):
+    return {"type": "goal_progress_update", "goal_id": "g1", "progress": progress, "quality_score": quality}
+
+
+def test_json_diff_round_trips():
+    old = {"a": 1, "nested": {"x": [1, 2], "gone": True, "we/ird~": 1}, "same": "s"}
+    new = {"a": 2, "nested": {"x": [1, 2, 3], "we/ird~": 2, "new": None}, "same": "s"}
+
+    patch = json_diff(old, new)
+
+    assert apply_patch(copy.deepcopy(old), patch) == new
+    assert json_diff(new, new) == []
+
+
+def test_updates_within_frame_window_are_coalesced():
+    async def scenario():
+        hub = EntityStreamHub(broadcaster=WebSocketBroadcaster(), frame_window=0.02)
+        socket = FakeSocket()
+        for progress in (10, 20, 30):
+            hub.publish("goal:g1", _progress(progress), lambda: [socket])
+        await asyncio.sleep(0.06)
+        return socket.received, hub.get_stats()
+
+    received, stats = asyncio.run(scenario())
+
+    # Legacy clients keep getting the full message, only the latest state of the burst
+    assert received == [{**_progress(30), "stream": "goal:g1", "seq": 1}]
+    assert stats["coalesced"] == 2
+    assert stats["flushes"] == 1
+
+
+def test_delta_clients_get_patches_against_their_acked_state():
+    async def scenario():
+        hub = EntityStreamHub(broadcaster=WebSocketBroadcaster(), frame_window=0)
+        socket = FakeSocket()
+        hub.handle_client_message(socket, {"type": "stream_resume"})
+
+        hub.publish("goal:g1", _progress(10), lambda: [socket])
+        await asyncio.sleep(0.01)
+        hub.handle_client_message(socket, {"type": "stream_ack", "stream": "goal:g1", "seq": 1})
+
+        hub.publish("goal:g1", _progress(40), lambda: [socket])
+        await asyncio.sleep(0.01)
+        return socket.received
+
+    snapshot, patch = asyncio.run(scenario())
+
+    assert snapshot["type"] == "stream_snapshot" and snapshot["seq"] == 1
+    assert patch["type"] == "stream_patch" and (patch["base_seq"], patch["seq"]) == (1, 2)
+    assert patch["patch"] == [{"op": "replace", "path": "/progress", "value": 40}]
+    assert apply_patch(snapshot["snapshot"], patch["patch"]) == _progress(40)
+
+
+def test_resume_sends_patch_from_held_seq_or_snapshot_when_evicted():
+    async def scenario():
+        hub = EntityStreamHub(broadcaster=WebSocketBroadcaster(), frame_window=0, history_size=2)
+        for progress in (10, 20, 30):
+            hub.publish("goal:g1", _progress(progress), lambda: [])
+            await asyncio.sleep(0)
+
+        recent, stale, current = FakeSocket(), FakeSocket(), FakeSocket()
+        hub.resume(recent, {"goal:g1": 2})
+        hub.resume(stale, {"goal:g1": 1})
+        hub.resume(current, {"goal:g1": 3})
+        await asyncio.sleep(0.01)
+        return recent.received, stale.received, current.received
+
+    recent, stale, current = asyncio.run(scenario())
+
+    assert recent == [{
+        "type": "stream_patch", "stream": "goal:g1", "seq": 3, "base_seq": 2,
+        "patch": [{"op": "replace", "path": "/progress", "value": 30}],
+    }]
+    assert stale == [{"type": "stream_snapshot", "stream": "goal:g1", "seq": 3, "snapshot": _progress(30)}]
+    assert current == []
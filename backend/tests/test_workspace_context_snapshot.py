@@ -0,0 +1,166 @@
+# backend/tests/test_workspace_context_snapshot.py
+import asyncio
+import time
+
+from services.workspace_context_snapshot import ContextSection, WorkspaceContextSnapshotService
+from utils.task_event_bus import AGENT_CHANGED, GOAL_CHANGED, TASK_QUEUED, TaskEventBus
+
+
+def _sections(calls, delay=0.05):
+    async def slow(name, value):
+        calls.append(name)
+        await asyncio.sleep(delay)
+        return value
+
+    return [
+        ContextSection("workspace", lambda: slow("workspace", {"domain": "marketing"})),
+        ContextSection("agents", lambda: slow("agents", ["a1"]), list),
+        ContextSection("goals", lambda: slow("goals", ["g1"]), list),
+        ContextSection(
+            "learning_insights", lambda workspace: slow("learning_insights", [workspace["domain"]]), list,
+            depends_on="workspace",
+        ),
+    ]
+
+
+def test_sections_load_concurrently_and_dependencies_see_their_input():
+    service = WorkspaceContextSnapshotService(event_bus=None)
+    calls = []
+
+    started = time.perf_counter()
+    snapshot = asyncio.run(service.get_snapshot("ws", _sections(calls, delay=0.1)))
+    elapsed = time.perf_counter() - started
+
+    # Three independent sections in parallel, then the dependent one: ~2 delays, not 4
+    assert elapsed < 0.35
+    assert snapshot["agents"] == ["a1"]
+    assert snapshot["learning_insights"] == ["marketing"]
+    assert set(snapshot["_snapshot"]["section_seconds"]) == {"workspace", "agents", "goals", "learning_insights"}
+    assert service.get_stats()["sections"]["goals"]["count"] == 1
+
+
+def test_timed_out_section_yields_partial_snapshot_that_is_not_cached():
+    service = WorkspaceContextSnapshotService(section_timeout=0.05, event_bus=None)
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    sections = [
+        ContextSection("workspace", lambda: asyncio.sleep(0, result={"name": "ws"})),
+        ContextSection("deliverables", hang, list),
+    ]
+
+    async def scenario():
+        first = await service.get_snapshot("ws", sections)
+        second = await service.get_snapshot("ws", sections)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first["workspace"] == {"name": "ws"}
+    assert first["deliverables"] == []
+    assert first["_snapshot"]["partial_sections"] == ["deliverables"]
+    assert service.stats["snapshots_built"] == 2
+    assert service.get_stats()["sections"]["deliverables"]["timeout"] == 2
+
+
+def test_snapshot_is_cached_until_a_workspace_event_invalidates_it():
+    bus = TaskEventBus()
+    service = WorkspaceContextSnapshotService(event_bus=bus)
+    calls = []
+
+    async def scenario():
+        sections = _sections(calls, delay=0)
+        first = await service.get_snapshot("ws", sections)
+        first["deep_analysis"] = "caller-owned key"
+        await service.get_snapshot("ws", sections)
+        bus.publish(TASK_QUEUED, workspace_id="ws")  # not a content change
+        await service.get_snapshot("ws", sections)
+        bus.publish(GOAL_CHANGED, workspace_id="other")
+        await service.get_snapshot("ws", sections)
+        bus.publish(GOAL_CHANGED, workspace_id="ws")
+        return await service.get_snapshot("ws", sections)
+
+    latest = asyncio.run(scenario())
+
+    assert calls.count("workspace") == 2
+    assert "deep_analysis" not in latest
+    assert service.stats["invalidations"] == 2
+
+
+def test_variants_are_cached_separately_and_invalidated_together():
+    bus = TaskEventBus()
+    service = WorkspaceContextSnapshotService(event_bus=bus)
+    calls = []
+    light = [ContextSection("agents", lambda: asyncio.sleep(0, result=calls.append("light") or ["a1"]), list)]
+
+    async def scenario():
+        full = await service.get_snapshot("ws", _sections(calls, delay=0))
+        lightweight = await service.get_snapshot("ws", light, variant="lightweight")
+        await service.get_snapshot("ws", light, variant="lightweight")
+        bus.publish(AGENT_CHANGED, workspace_id="ws", agent_id="a1")
+        await service.get_snapshot("ws", light, variant="lightweight")
+        await service.get_snapshot("ws", _sections(calls, delay=0))
+        return full, lightweight
+
+    full, lightweight = asyncio.run(scenario())
+
+    assert "goals" in full and set(lightweight) == {"agents", "_snapshot"}
+    assert calls.count("light") == 2 and calls.count("workspace") == 2
+
+
+def test_partial_snapshot_only_drops_its_own_variant():
+    service = WorkspaceContextSnapshotService(section_timeout=0.05, event_bus=None)
+    calls = []
+
+    async def hang():
+        await asyncio.sleep(1)
+
+    degraded = [ContextSection("deliverables", hang, list)]
+
+    async def scenario():
+        await service.get_snapshot("ws", _sections(calls, delay=0))
+        partial = await service.get_snapshot("ws", degraded, variant="lightweight")
+        full = await service.get_snapshot("ws", _sections(calls, delay=0))
+        return partial, full
+
+    partial, full = asyncio.run(scenario())
+
+    assert partial["_snapshot"]["partial_sections"] == ["deliverables"]
+    assert not full["_snapshot"]["partial_sections"]
+    assert calls.count("workspace") == 1
+
+
+def test_generations_stay_bounded_and_stale_loads_are_never_served():
+    service = WorkspaceContextSnapshotService(event_bus=None)
+    service.max_generations = 3
+    versions = {}
+
+    def sections(workspace_id):
+        async def load():
+            version = versions.get(workspace_id, 0)
+            await asyncio.sleep(0.02)
+            return version
+
+        return [ContextSection("workspace", load, int)]
+
+    async def race(workspace_id):
+        # The workspace changes while its snapshot is loading
+        loading = asyncio.create_task(service.get_snapshot(workspace_id, sections(workspace_id)))
+        await asyncio.sleep(0.005)
+        versions[workspace_id] = 1
+        service.invalidate(workspace_id)
+        await loading
+
+    async def scenario():
+        for index in range(10):
+            await race(f"ws-{index}")
+        for index in range(10):
+            service.invalidate(f"idle-{index}")
+        return [(await service.get_snapshot(f"ws-{index}", sections(f"ws-{index}")))["workspace"]
+                for index in range(10)]
+
+    latest = asyncio.run(scenario())
+
+    assert latest == [1] * 10
+    assert service.get_stats()["tracked_generations"] <= 3
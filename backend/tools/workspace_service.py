@@ -7,6 +7,8 @@ import logging
 from typing import Dict, List, Any, Optional
 from abc import ABC, abstractmethod
 
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED, AGENT_CHANGED
+
 logger = logging.getLogger(__name__)
 
 class WorkspaceServiceInterface(ABC):
@@ -72,6 +74,8 @@ class SupabaseWorkspaceService(WorkspaceServiceInterface):
             
             result = self.db_client.table("agents").insert(new_agent).execute()
             agent_data = result.data[0] if result.data else None
+            if agent_data:
+                task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id, agent_id=agent_data.get("id"))
             return {
                 "success": True,
                 "message": f"Successfully added {new_agent['name']} ({seniority} {role}) to the team",
@@ -125,6 +129,7 @@ class SupabaseWorkspaceService(WorkspaceServiceInterface):
                 .update({"status": status})\
                 .eq("id", workspace_id)\
                 .execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             if status == "active":
                 # Update all agents to available
@@ -132,6 +137,7 @@ class SupabaseWorkspaceService(WorkspaceServiceInterface):
                     .update({"status": "available"})\
                     .eq("workspace_id", workspace_id)\
                     .execute()
+                task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id)
                 message = "Team started successfully. All agents are now available for tasks."
             else:
                 message = "Team activities paused. Current tasks will complete but no new tasks will start."
@@ -0,0 +1,283 @@
+# utils/ai_result_store.py
+"""
+🗃️ Persistent AI Result Store
+Content-addressed cache for deterministic-enough model outputs (semantic hashes /
+essence extractions, pairwise similarity scores) shared by every worker on the
+host and surviving restarts, so identical task text never pays for a second
+model call.
+
+- Keys are SHA-256 digests of the normalised input text plus a version string
+  naming the model and prompt revision: bumping the version makes old entries
+  unreachable, and LRU eviction reclaims them.
+- Storage is a local SQLite file (WAL, shared between processes) bounded to
+  ``AI_RESULT_STORE_MAX_ENTRIES`` rows, fronted by a small in-process LRU.
+  SQLite calls run in a worker thread to keep the event loop responsive.
+- Concurrent misses on the same key share one computation (single-flight).
+- Readers may pass ``max_age`` to treat older entries as misses (TTL).
+- Callers always receive their own copy of a result, so mutating it never
+  changes what later readers get.
+"""
+
+import asyncio
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+AI_RESULT_STORE_PATH = os.getenv(
+    "AI_RESULT_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache", "ai_results.sqlite3"),
+)
+AI_RESULT_STORE_MAX_ENTRIES = int(os.getenv("AI_RESULT_STORE_MAX_ENTRIES", "50000"))
+AI_RESULT_STORE_MEMORY_ENTRIES = int(os.getenv("AI_RESULT_STORE_MEMORY_ENTRIES", "2048"))
+# Fraction of the bound removed at once when the table overflows
+EVICTION_FRACTION = 0.1
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_MISSING = object()
+
+
+def normalize_text(text: Any) -> str:
+    """Canonical form used for keys: NFKC, lowercase, collapsed whitespace."""
+    if text is None:
+        return ""
+    if not isinstance(text, str):
+        text = json.dumps(text, sort_keys=True, default=str, ensure_ascii=False)
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text).lower()).strip()
+
+
+def content_key(version: str, *parts: Any) -> str:
+    """Digest of the normalised parts, scoped to a model/prompt version."""
+    payload = "\x1f".join([version] + [normalize_text(part) for part in parts])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AIResultStore:
+    """Bounded, persistent, content-addressed store of JSON-serialisable results."""
+
+    def __init__(
+        self,
+        path: str = AI_RESULT_STORE_PATH,
+        max_entries: int = AI_RESULT_STORE_MAX_ENTRIES,
+        memory_entries: int = AI_RESULT_STORE_MEMORY_ENTRIES,
+    ):
+        self.path = path or ":memory:"
+        self.max_entries = max(1, max_entries)
+        self.memory_entries = max(0, memory_entries)
+        # (namespace, key) -> (value, created_at)
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._inflight: Dict[Tuple[int, str, str], asyncio.Future] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0, "expired": 0, "writes": 0, "coalesced": 0}
+        )
+        self.evictions = 0
+
+    # ------------------------------------------------------------------ sqlite
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        try:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"⚠️ AI result store unavailable at {self.path} ({e}), keeping results in memory only")
+            self.path = ":memory:"
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ai_results ("
+            " namespace TEXT NOT NULL, key TEXT NOT NULL, version TEXT NOT NULL, value TEXT NOT NULL,"
+            " created_at REAL NOT NULL, last_access REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ai_results_last_access ON ai_results (last_access)")
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _read(self, namespace: str, key: str) -> Tuple[Any, float]:
+        with self._db_lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM ai_results WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                return _MISSING, 0.0
+            conn.execute(
+                "UPDATE ai_results SET last_access = ?, hits = hits + 1 WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key),
+            )
+            conn.commit()
+        return json.loads(row[0]), row[1]
+
+    def _write(self, namespace: str, key: str, version: str, value: Any):
+        encoded = json.dumps(value, default=str, ensure_ascii=False)
+        now = time.time()
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_results (namespace, key, version, value, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, version, encoded, now, now),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM ai_results").fetchone()
+            if count > self.max_entries:
+                # Least recently used rows go first (other processes share the bound)
+                excess = count - self.max_entries + max(1, int(self.max_entries * EVICTION_FRACTION))
+                conn.execute(
+                    "DELETE FROM ai_results WHERE rowid IN"
+                    " (SELECT rowid FROM ai_results ORDER BY last_access LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            conn.commit()
+
+    # ------------------------------------------------------------------ memory
+
+    def _remember(self, namespace: str, key: str, value: Any, created_at: Optional[float] = None):
+        if not self.memory_entries:
+            return
+        self._memory[(namespace, key)] = (copy.deepcopy(value), created_at if created_at is not None else time.time())
+        self._memory.move_to_end((namespace, key))
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------ public
+
+    async def get(self, namespace: str, key: str, max_age: Optional[float] = None) -> Any:
+        """Cached value or None; entries older than ``max_age`` seconds count as misses."""
+        oldest = time.time() - max_age if max_age is not None else None
+        entry = self._memory.get((namespace, key))
+        if entry is not None:
+            value, created_at = entry
+            if oldest is None or created_at >= oldest:
+                self._memory.move_to_end((namespace, key))
+                self._stats[namespace]["memory_hits"] += 1
+                return copy.deepcopy(value)
+        try:
+            value, created_at = await asyncio.to_thread(self._read, namespace, key)
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ AI result store read failed: {e}")
+            value, created_at = _MISSING, 0.0
+        if value is not _MISSING and oldest is not None and created_at < oldest:
+            self._stats[namespace]["expired"] += 1
+            value = _MISSING
+        if value is _MISSING:
+            self._stats[namespace]["misses"] += 1
+            return None
+        self._stats[namespace]["disk_hits"] += 1
+        self._remember(namespace, key, value, created_at)
+        return value
+
+    async def set(self, namespace: str, key: str, value: Any, version: str = ""):
+        self._remember(namespace, key, value)
+        try:
+            await asyncio.to_thread(self._write, namespace, key, version, value)
+            self._stats[namespace]["writes"] += 1
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ AI result store write failed: {e}")
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        version: str,
+        parts: Tuple[Any, ...],
+        compute: Callable[[], Union[Any, Awaitable[Any]]],
+        should_store: Callable[[Any], bool] = lambda value: value is not None,
+        max_age: Optional[float] = None,
+    ) -> Any:
+        """
+        Return the stored result for ``parts`` or compute, store and return it.
+
+        Results rejected by ``should_store`` (by default None, i.e. a failed call)
+        are returned but not persisted, so transient failures are retried.
+        Stored results older than ``max_age`` seconds are recomputed.
+        """
+        key = content_key(version, *parts)
+        value = await self.get(namespace, key, max_age)
+        if value is not None:
+            return value
+
+        inflight_key = (id(asyncio.get_running_loop()), namespace, key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            self._stats[namespace]["coalesced"] += 1
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            value = compute()
+            if inspect.isawaitable(value):
+                value = await value
+            if should_store(value):
+                await self.set(namespace, key, value, version)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    def clear(self):
+        self._memory.clear()
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM ai_results")
+            conn.commit()
+
+    def close(self):
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        namespaces = {}
+        for namespace, counters in self._stats.items():
+            hits = counters["memory_hits"] + counters["disk_hits"]
+            lookups = hits + counters["misses"]
+            namespaces[namespace] = {
+                **counters,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            }
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            "memory_entries": len(self._memory),
+            "evictions": self.evictions,
+            "namespaces": namespaces,
+        }
+
+
+# Global instance
+ai_result_store = AIResultStore()
+
+__all__ = [
+    "AIResultStore",
+    "ai_result_store",
+    "content_key",
+    "normalize_text",
+]
@@ -92,6 +92,7 @@ Return a JSON object:
             prompt=prompt,
             max_tokens=500,
             temperature=0.1,
+            cache="classify_agent_role",
             response_format={"type": "json_object"}
         )
         
@@ -220,12 +221,12 @@ Examples:
 - "Software Engineer" vs "Web Developer" = 0.5
 - "Accountant" vs "Graphic Designer" = 0.1
 
-Return only the numeric similarity score (0.0 to 1.0):"""
+Return JSON: {{"similarity": <score from 0.0 to 1.0>}}"""
 
         evaluator_agent = {
             "name": "RoleSimilarityAgent",
             "model": "gpt-4o-mini",
-            "instructions": "Compare professional role similarity. Return only numeric score."
+            "instructions": "Compare professional role similarity. Return JSON with a numeric similarity score."
         }
 
         response = await ai_provider_manager.call_ai(
@@ -233,15 +234,16 @@ Return only the numeric similarity score (0.0 to 1.0):"""
             agent=evaluator_agent,
             prompt=prompt,
             max_tokens=50,
-            temperature=0.1
+            temperature=0.1,
+            response_format={"type": "json_object"},
+            cache="role_similarity"
         )
         
         if response and isinstance(response, dict):
-            content = response.get('content', '').strip()
             try:
-                similarity = float(content)
+                similarity = float(response.get('similarity'))
                 return max(0.0, min(1.0, similarity))
-            except ValueError:
+            except (TypeError, ValueError):
                 pass
         
         return 0.3  # Default moderate similarity
@@ -309,6 +311,7 @@ Return JSON:
             prompt=prompt,
             max_tokens=400,
             temperature=0.1,
+            cache="skill_complexity",
             response_format={"type": "json_object"}
         )
         
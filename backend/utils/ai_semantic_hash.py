@@ -2,6 +2,9 @@
 """
 AI-Driven Semantic Hashing for Task Deduplication
 Replaces simple string concatenation with semantic understanding
+
+Essence extractions and pairwise scores are kept in the persistent AI result
+store, keyed by the normalised task text, so identical tasks are analysed once.
 """
 
 import hashlib
@@ -9,8 +12,14 @@ import logging
 from typing import Optional, Dict, Any, List
 from uuid import UUID
 
+from utils.ai_result_store import ai_result_store
+
 logger = logging.getLogger(__name__)
 
+# Model + prompt revisions: bump when either prompt or model changes
+SEMANTIC_ESSENCE_VERSION = "gpt-4o-mini/essence-v1"
+SEMANTIC_SIMILARITY_VERSION = "gpt-4o-mini/pair-similarity-v1"
+
 async def generate_ai_semantic_hash(
     name: str,
     description: Optional[str] = None,
@@ -41,6 +50,20 @@ async def generate_ai_semantic_hash(
 
 
 async def _extract_semantic_essence(name: str, description: Optional[str], context: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Extract the semantic essence of a task, reusing the stored result for identical text."""
+    try:
+        return await ai_result_store.get_or_compute(
+            "semantic_essence",
+            SEMANTIC_ESSENCE_VERSION,
+            (name, description, context),
+            lambda: _ai_semantic_essence(name, description, context),
+        )
+    except Exception as e:
+        logger.error(f"❌ Error extracting semantic essence: {e}")
+        return None
+
+
+async def _ai_semantic_essence(name: str, description: Optional[str], context: Optional[Dict[str, Any]]) -> Optional[str]:
     """Extract the semantic essence of a task using AI."""
     try:
         from services.ai_provider_abstraction import ai_provider_manager
@@ -184,7 +207,24 @@ def _extract_key_terms(text: str, max_terms: int = 5) -> List[str]:
 
 # Enhanced semantic similarity for related tasks
 async def calculate_ai_semantic_similarity(task1_name: str, task1_desc: str, task2_name: str, task2_desc: str) -> float:
-    """Calculate semantic similarity between two tasks using AI understanding."""
+    """Calculate semantic similarity between two tasks, reusing the stored score for identical pairs."""
+    # Order-insensitive key: (A, B) and (B, A) share one stored score
+    first, second = sorted([(task1_name or "", task1_desc or ""), (task2_name or "", task2_desc or "")])
+    try:
+        similarity = await ai_result_store.get_or_compute(
+            "semantic_similarity",
+            SEMANTIC_SIMILARITY_VERSION,
+            (*first, *second),
+            lambda: _ai_semantic_similarity(task1_name, task1_desc, task2_name, task2_desc),
+        )
+    except Exception as e:
+        logger.error(f"❌ Error calculating AI semantic similarity: {e}")
+        similarity = None
+    return 0.5 if similarity is None else similarity  # Default moderate similarity on failure
+
+
+async def _ai_semantic_similarity(task1_name: str, task1_desc: str, task2_name: str, task2_desc: str) -> Optional[float]:
+    """Calculate semantic similarity between two tasks using AI understanding (None on failure)."""
     try:
         from services.ai_provider_abstraction import ai_provider_manager
         
@@ -235,8 +275,8 @@ Return only a number between 0.0 and 1.0:"""
             except ValueError:
                 pass
         
-        return 0.5  # Default moderate similarity if parsing fails
+        return None  # Parsing failed: not stored, retried next time
         
     except Exception as e:
         logger.error(f"❌ Error calculating AI semantic similarity: {e}")
-        return 0.5  # Safe default
\ No newline at end of file
+        return None
\ No newline at end of file
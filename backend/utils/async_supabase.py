@@ -0,0 +1,236 @@
+"""
+Non-blocking Supabase Data Access Layer
+Keeps PostgREST round-trips off the asyncio event loop while preserving the
+familiar ``table(...).select(...).eq(...).execute()`` query-builder surface.
+
+Two backends are available:
+- ``threadpool`` (default): the synchronous supabase-py builders are executed in a
+  dedicated, bounded thread pool. Works with any client (including test mocks).
+- ``native``: a pooled ``postgrest.AsyncPostgrestClient`` (httpx.AsyncClient) per
+  event loop, so queries are truly asynchronous end-to-end.
+
+Usage:
+    db = AsyncSupabaseClient(get_supabase_client)
+    result = await db.table("tasks").select("id, status").eq("workspace_id", ws).execute()
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+ASYNC_DB_BACKEND = os.getenv("SUPABASE_ASYNC_BACKEND", "threadpool").lower()
+ASYNC_DB_POOL_SIZE = int(os.getenv("SUPABASE_ASYNC_POOL_SIZE", "16"))
+ASYNC_DB_TIMEOUT_SECONDS = float(os.getenv("SUPABASE_ASYNC_TIMEOUT_SECONDS", "30"))
+
+try:
+    from postgrest import AsyncPostgrestClient
+    NATIVE_ASYNC_AVAILABLE = True
+except ImportError:
+    AsyncPostgrestClient = None
+    NATIVE_ASYNC_AVAILABLE = False
+
+# Shared executor: every AsyncSupabaseClient in the process competes for the same
+# bounded set of worker threads, so a burst of queries cannot spawn unbounded threads.
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=ASYNC_DB_POOL_SIZE,
+            thread_name_prefix="supabase-io"
+        )
+    return _executor
+
+
+class AsyncQueryBuilder:
+    """
+    Proxy around a synchronous supabase-py request builder.
+
+    Every chained call (select, eq, in_, order, limit, ...) is forwarded to the
+    wrapped builder; only ``execute()`` is turned into a coroutine that runs the
+    HTTP round-trip in the shared thread pool. Builder-valued properties such as
+    ``not_`` are wrapped as well, so ``.not_.is_(...)`` chains stay async.
+    """
+
+    def __init__(self, owner: "AsyncSupabaseClient", builder: Any, label: str):
+        self._owner = owner
+        self._builder = builder
+        self._label = label
+
+    def _wrap(self, builder: Any) -> "AsyncQueryBuilder":
+        return type(self)(self._owner, builder, self._label)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._builder, name)
+        if not callable(attr):
+            # Properties returning a builder (postgrest's ``not_``) continue the chain;
+            # plain values (params, headers, ...) are returned as they are
+            return self._wrap(attr) if hasattr(attr, "execute") else attr
+
+        def _chain(*args, **kwargs):
+            # Builders return new builder objects; wrap them so the chain stays async
+            return self._wrap(attr(*args, **kwargs))
+
+        return _chain
+
+    async def execute(self) -> Any:
+        return await self._owner._run(self._builder.execute, self._label)
+
+
+class AsyncSupabaseClient:
+    """
+    Async facade for a Supabase client.
+
+    ``client_provider`` may be a client instance or a zero-argument callable
+    returning one; the callable form resolves the client lazily on every query so
+    modules that swap their client (tests, service-role fallbacks) stay in sync.
+    """
+
+    def __init__(
+        self,
+        client_provider: Union[Any, Callable[[], Any]],
+        backend: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        rest_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+    ):
+        if callable(client_provider) and not hasattr(client_provider, "table"):
+            self._client_provider = client_provider
+        else:
+            self._client_provider = lambda: client_provider
+
+        self.backend = (backend or ASYNC_DB_BACKEND).lower()
+        if self.backend == "native" and not (NATIVE_ASYNC_AVAILABLE and rest_url and api_key):
+            logger.warning("⚠️ Native async PostgREST backend unavailable, using threadpool backend")
+            self.backend = "threadpool"
+
+        self.max_concurrency = max_concurrency or ASYNC_DB_POOL_SIZE
+        self.timeout_seconds = timeout_seconds or ASYNC_DB_TIMEOUT_SECONDS
+        self._rest_url = rest_url
+        self._api_key = api_key
+
+        # Semaphores and native clients are bound to the loop that created them
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._native_clients: Dict[int, Any] = {}
+
+        self.stats = {
+            "queries": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "total_wait_ms": 0.0,
+            "total_exec_ms": 0.0,
+        }
+
+    @property
+    def sync_client(self) -> Any:
+        """The underlying synchronous client (for code paths not yet migrated)."""
+        return self._client_provider()
+
+    def _loop_key(self) -> int:
+        return id(asyncio.get_running_loop())
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        key = self._loop_key()
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[key] = semaphore
+        return semaphore
+
+    def _get_native_client(self) -> Any:
+        key = self._loop_key()
+        client = self._native_clients.get(key)
+        if client is None:
+            client = AsyncPostgrestClient(
+                base_url=self._rest_url,
+                headers={
+                    "apikey": self._api_key,
+                    "Authorization": f"Bearer {self._api_key}",
+                },
+            )
+            self._native_clients[key] = client
+        return client
+
+    def table(self, table_name: str) -> Any:
+        if self.backend == "native":
+            return _NativeQueryBuilder(self, self._get_native_client().from_(table_name), table_name)
+        return AsyncQueryBuilder(self, self.sync_client.table(table_name), table_name)
+
+    # supabase-py exposes ``from_`` as an alias of ``table``
+    from_ = table
+
+    def rpc(self, fn_name: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        params = params or {}
+        if self.backend == "native":
+            return _NativeQueryBuilder(self, self._get_native_client().rpc(fn_name, params), f"rpc:{fn_name}")
+        return AsyncQueryBuilder(self, self.sync_client.rpc(fn_name, params), f"rpc:{fn_name}")
+
+    async def _run(self, execute_fn: Callable[[], Any], label: str) -> Any:
+        """Run a blocking ``execute`` in the thread pool under the concurrency bound."""
+        loop = asyncio.get_running_loop()
+
+        async def _call():
+            result = await loop.run_in_executor(_get_executor(), execute_fn)
+            # Async-capable clients (and AsyncMock in tests) hand back an awaitable
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return await self._instrumented(_call, label)
+
+    async def _instrumented(self, call: Callable[[], Any], label: str) -> Any:
+        wait_start = time.perf_counter()
+        async with self._get_semaphore():
+            exec_start = time.perf_counter()
+            self.stats["total_wait_ms"] += (exec_start - wait_start) * 1000
+            self.stats["queries"] += 1
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+            try:
+                return await asyncio.wait_for(call(), timeout=self.timeout_seconds)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                self.stats["errors"] += 1
+                logger.error(f"⏱️ Supabase query on {label} timed out after {self.timeout_seconds}s")
+                raise
+            except Exception:
+                self.stats["errors"] += 1
+                raise
+            finally:
+                self.stats["in_flight"] -= 1
+                self.stats["total_exec_ms"] += (time.perf_counter() - exec_start) * 1000
+
+    def get_stats(self) -> Dict[str, Any]:
+        queries = self.stats["queries"]
+        return {
+            **self.stats,
+            "backend": self.backend,
+            "max_concurrency": self.max_concurrency,
+            "avg_wait_ms": round(self.stats["total_wait_ms"] / queries, 2) if queries else 0.0,
+            "avg_exec_ms": round(self.stats["total_exec_ms"] / queries, 2) if queries else 0.0,
+        }
+
+
+class _NativeQueryBuilder(AsyncQueryBuilder):
+    """Proxy for postgrest async builders: ``execute`` is already a coroutine."""
+
+    async def execute(self) -> Any:
+        return await self._owner._instrumented(self._builder.execute, self._label)
+
+
+__all__ = [
+    "AsyncSupabaseClient",
+    "AsyncQueryBuilder",
+    "NATIVE_ASYNC_AVAILABLE",
+]
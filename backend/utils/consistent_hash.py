@@ -0,0 +1,74 @@
+# utils/consistent_hash.py
+"""
+🧭 Consistent-hash ring
+Maps keys (e.g. workspace ids) onto a set of nodes (e.g. backend replicas) so that
+each key has exactly one owner, and adding or removing a node only moves the keys
+of the affected arc (~1/N of them) instead of reshuffling everything.
+
+Every node is placed on the ring at ``virtual_nodes`` points to keep the slices
+even; hashing is stable across processes (no Python ``hash()`` randomisation), so
+all replicas agree on the owner without coordinating.
+"""
+
+import bisect
+import hashlib
+import os
+from typing import Iterable, List, Optional, Tuple
+
+DEFAULT_VIRTUAL_NODES = 64
+
+
+def _ring_position(value: str) -> int:
+    return int.from_bytes(hashlib.md5(value.encode("utf-8")).digest()[:8], "big")
+
+
+class ConsistentHashRing:
+    """Immutable ring of nodes with virtual points."""
+
+    def __init__(self, nodes: Iterable[str], virtual_nodes: int = DEFAULT_VIRTUAL_NODES):
+        self.nodes: Tuple[str, ...] = tuple(sorted({str(node) for node in nodes if str(node).strip()}))
+        if not self.nodes:
+            raise ValueError("ConsistentHashRing needs at least one node")
+        self.virtual_nodes = max(1, virtual_nodes)
+
+        points: List[Tuple[int, str]] = sorted(
+            (_ring_position(f"{node}#{replica}"), node)
+            for node in self.nodes
+            for replica in range(self.virtual_nodes)
+        )
+        self._positions = [position for position, _ in points]
+        self._owners = [node for _, node in points]
+
+    def owner(self, key: str) -> str:
+        """Node owning ``key``: the first ring point clockwise from its hash."""
+        index = bisect.bisect(self._positions, _ring_position(str(key))) % len(self._positions)
+        return self._owners[index]
+
+    def owns(self, node: str, key: str) -> bool:
+        return self.owner(key) == node
+
+    def slice_for(self, node: str, keys: Iterable[str]) -> List[str]:
+        """The subset of ``keys`` owned by ``node``, in input order."""
+        return [key for key in keys if self.owner(key) == node]
+
+
+def ring_from_env(
+    nodes_var: str,
+    node_id_var: str,
+    virtual_nodes: int = DEFAULT_VIRTUAL_NODES,
+) -> Tuple[Optional[ConsistentHashRing], Optional[str]]:
+    """
+    Build ``(ring, this_node)`` from a comma-separated node list and this
+    process' node id (falling back to HOSTNAME). Returns ``(None, None)`` when
+    sharding is not configured, i.e. this process owns every key.
+    """
+    nodes = [node.strip() for node in os.getenv(nodes_var, "").split(",") if node.strip()]
+    if len(nodes) < 2:
+        return None, None
+    node_id = os.getenv(node_id_var) or os.getenv("HOSTNAME")
+    if node_id not in nodes:
+        raise ValueError(f"{node_id_var}={node_id!r} is not one of {nodes_var}={nodes}")
+    return ConsistentHashRing(nodes, virtual_nodes), node_id
+
+
+__all__ = ["ConsistentHashRing", "ring_from_env", "DEFAULT_VIRTUAL_NODES"]
@@ -11,6 +11,8 @@ from uuid import uuid4
 
 from database import get_supabase_client
 from models import Workspace
+from services.workspace_context_snapshot import ContextSection, workspace_context_snapshots
+from utils.async_supabase import AsyncSupabaseClient
 
 # Use the enhanced factory for quota tracking
 from utils.openai_client_factory_enhanced import get_enhanced_openai_client
@@ -27,6 +29,8 @@ class ConversationContextManager:
         self.workspace_id = workspace_id
         self.max_context_tokens = max_context_tokens
         self.supabase = get_supabase_client()
+        # Context loaders run concurrently: keep their queries off the event loop
+        self.async_supabase = AsyncSupabaseClient(lambda: self.supabase)
         # Use enhanced factory for quota tracking
         self.openai_client = get_enhanced_openai_client(workspace_id=workspace_id)
         
@@ -34,53 +38,47 @@ class ConversationContextManager:
         self.active_window_size = 20  # Keep last 20 messages active
         self.summary_chunk_size = 10  # Summarize in chunks of 10 messages
         
-    async def get_workspace_context(self) -> Dict[str, Any]:
+    async def get_workspace_context(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get comprehensive workspace context for AI processing.
         Universal and domain-agnostic.
+
+        Sections load concurrently through the workspace context snapshot service
+        (per-section timeouts, cached until a task/goal/deliverable/agent or the workspace changes).
         """
         try:
-            context = {}
-            
-            # 1. Workspace Information
-            workspace_data = await self._get_workspace_data()
-            context["workspace"] = workspace_data
-            
-            # 2. Team Information
-            team_data = await self._get_team_data()
-            context["agents"] = team_data
-            
-            # 3. Recent Tasks and Activity
-            tasks_data = await self._get_recent_tasks()
-            context["recent_tasks"] = tasks_data
-            
-            # 4. Project Deliverables
-            deliverables_data = await self._get_deliverables()
-            context["deliverables"] = deliverables_data
-            
-            # 5. Budget and Resource Information
-            budget_data = await self._get_budget_info(workspace_data)
-            context["budget"] = budget_data
-            
-            # 6. Goals and Objectives
-            goals_data = await self._get_goals()
-            context["goals"] = goals_data
-            
-            # 7. Memory Insights
-            memory_data = await self._get_memory_insights()
-            context["memory_insights"] = memory_data
-            
-            # 8. Cross-workspace Learning (anonymized)
-            learning_data = await self._get_learning_insights(workspace_data.get("domain"))
-            context["learning_insights"] = learning_data
-            
-            logger.info(f"Loaded comprehensive context for workspace {self.workspace_id}")
+            context = await workspace_context_snapshots.get_snapshot(
+                self.workspace_id, self._context_sections(), force_refresh=force_refresh
+            )
+            logger.info(
+                f"Loaded comprehensive context for workspace {self.workspace_id} "
+                f"in {context['_snapshot']['total_seconds']:.3f}s"
+            )
             return context
             
         except Exception as e:
             logger.error(f"Failed to load workspace context: {e}")
             return self._get_minimal_context()
     
+    def _context_sections(self) -> List[ContextSection]:
+        """Independent context sections (budget and learning need the workspace row)"""
+        return [
+            ContextSection("workspace", self._get_workspace_data, self._get_default_workspace_data),
+            ContextSection("agents", self._get_team_data, list),
+            ContextSection("recent_tasks", self._get_recent_tasks, list),
+            ContextSection("deliverables", self._get_deliverables, list),
+            ContextSection(
+                "budget", self._get_budget_info, lambda: {"max_budget": 10000, "used": 0, "currency": "EUR"},
+                depends_on="workspace",
+            ),
+            ContextSection("goals", self._get_goals, list),
+            ContextSection("memory_insights", self._get_memory_insights, list),
+            ContextSection(
+                "learning_insights", lambda workspace_data: self._get_learning_insights(workspace_data.get("domain")),
+                list, depends_on="workspace",
+            ),
+        ]
+    
     async def manage_conversation_context(self, conversation_id: str) -> Dict[str, Any]:
         """
         Manage conversation context with progressive summarization.
@@ -318,7 +316,7 @@ class ConversationContextManager:
     async def _get_workspace_data(self) -> Dict[str, Any]:
         """Get workspace information"""
         try:
-            result = self.supabase.table("workspaces")\
+            result = await self.async_supabase.table("workspaces")\
                 .select("*")\
                 .eq("id", self.workspace_id)\
                 .execute()
@@ -335,7 +333,7 @@ class ConversationContextManager:
     async def _get_team_data(self) -> List[Dict[str, Any]]:
         """Get team/agents information"""
         try:
-            result = self.supabase.table("agents")\
+            result = await self.async_supabase.table("agents")\
                 .select("*")\
                 .eq("workspace_id", self.workspace_id)\
                 .execute()
@@ -352,7 +350,7 @@ class ConversationContextManager:
             # Get tasks from last 30 days
             thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
             
-            result = self.supabase.table("tasks")\
+            result = await self.async_supabase.table("tasks")\
                 .select("*")\
                 .eq("workspace_id", self.workspace_id)\
                 .gte("created_at", thirty_days_ago.isoformat())\
@@ -369,7 +367,7 @@ class ConversationContextManager:
     async def _get_deliverables(self) -> List[Dict[str, Any]]:
         """Get project deliverables"""
         try:
-            result = self.supabase.table("deliverables")\
+            result = await self.async_supabase.table("deliverables")\
                 .select("*")\
                 .eq("workspace_id", self.workspace_id)\
                 .order("created_at", desc=True)\
@@ -420,7 +418,7 @@ class ConversationContextManager:
             # For now, return structured insights
             
             # Get completed tasks for insight generation
-            completed_tasks = self.supabase.table("tasks")\
+            completed_tasks = await self.async_supabase.table("tasks")\
                 .select("*")\
                 .eq("workspace_id", self.workspace_id)\
                 .eq("status", "completed")\
@@ -462,7 +460,7 @@ class ConversationContextManager:
             if not domain:
                 return []
             
-            result = self.supabase.table("cross_workspace_insights")\
+            result = await self.async_supabase.table("cross_workspace_insights")\
                 .select("*")\
                 .eq("domain", domain)\
                 .gte("confidence_score", 70)\
@@ -0,0 +1,58 @@
+# utils/latency_histogram.py
+"""
+⏱️ Fixed-bucket latency histograms
+Cheap O(1) recording of durations into cumulative-style buckets (Prometheus-like),
+plus count/sum/max, for exposing per-key timing through stats endpoints.
+"""
+
+import bisect
+from typing import Dict, Iterable, Optional, Tuple
+
+DEFAULT_BUCKETS_SECONDS: Tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """Histogram of durations in seconds with fixed upper-bound buckets."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS_SECONDS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        # One extra slot for observations above the last bucket (+Inf)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: Optional[float] = None
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def percentile(self, q: float) -> float:
+        """Approximate percentile (upper bound of the bucket holding the q-th observation)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        labels = [f"le_{bound:g}s" for bound in self.buckets] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg_seconds": round(self.total / self.count, 4) if self.count else 0.0,
+            "max_seconds": round(self.max, 4),
+            "last_seconds": round(self.last, 4) if self.last is not None else None,
+            "p50_seconds": self.percentile(0.5),
+            "p95_seconds": self.percentile(0.95),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+__all__ = ["LatencyHistogram", "DEFAULT_BUCKETS_SECONDS"]
@@ -0,0 +1,150 @@
+"""
+Deferred router mounting for rarely used API groups.
+
+Route modules pull in their services at import time, so mounting every router in
+``main.py`` makes each process pay for subsystems it may never serve. A deferred
+group is declared by its URL prefixes and the ``"module:attribute"`` of its
+routers; :class:`DeferredRouterMiddleware` imports and mounts the group the first
+time a request hits one of those prefixes (or when the OpenAPI schema is built),
+after which the request is routed normally.
+
+Set ``LAZY_ROUTERS_ENABLED=false`` to mount every group eagerly at startup.
+"""
+
+import importlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+LAZY_ROUTERS_ENABLED = os.getenv("LAZY_ROUTERS_ENABLED", "true").lower() == "true"
+
+
+@dataclass
+class DeferredRouterGroup:
+    """A set of routers mounted together on the first request to any of their prefixes"""
+    name: str
+    prefixes: Tuple[str, ...]
+    routers: List[Tuple[str, Dict[str, Any]]]
+    loaded: bool = False
+    load_seconds: Optional[float] = None
+    error: Optional[str] = None
+    triggered_by: Optional[str] = None
+
+    def matches(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix.rstrip("/") + "/") for prefix in self.prefixes)
+
+
+class DeferredRouterMounter:
+    """Holds the deferred groups of an app and mounts them on demand"""
+
+    def __init__(self, app, enabled: bool = LAZY_ROUTERS_ENABLED):
+        self.app = app
+        self.enabled = enabled
+        self.groups: Dict[str, DeferredRouterGroup] = {}
+        self._lock = threading.Lock()
+
+    def defer(self, name: str, prefixes, *routers) -> DeferredRouterGroup:
+        """
+        Declare a router group.
+
+        ``routers`` are ``"module.path:attribute"`` strings, or ``(target, kwargs)``
+        pairs whose kwargs are passed to ``app.include_router`` (e.g. ``prefix``).
+        """
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        group = DeferredRouterGroup(
+            name=name,
+            prefixes=tuple(prefixes),
+            routers=[router if isinstance(router, tuple) else (router, {}) for router in routers],
+        )
+        self.groups[name] = group
+        if not self.enabled:
+            self.load(group, trigger="startup")
+        return group
+
+    def pending(self) -> List[DeferredRouterGroup]:
+        return [group for group in self.groups.values() if not group.loaded and group.error is None]
+
+    def ensure_loaded(self, path: str) -> None:
+        """Mount every pending group serving ``path``; the OpenAPI schema needs them all"""
+        pending = self.pending()
+        if not pending:
+            return
+        if path == getattr(self.app, "openapi_url", None):
+            for group in pending:
+                self.load(group, trigger=path)
+            return
+        for group in pending:
+            if group.matches(path):
+                self.load(group, trigger=path)
+
+    def load_all(self) -> None:
+        for group in self.pending():
+            self.load(group, trigger="load_all")
+
+    def load(self, group: DeferredRouterGroup, trigger: Optional[str] = None) -> bool:
+        with self._lock:
+            if group.loaded or group.error is not None:
+                return group.loaded
+            started = time.perf_counter()
+            try:
+                for target, include_kwargs in group.routers:
+                    module_path, _, attribute = target.partition(":")
+                    module = importlib.import_module(module_path)
+                    self.app.include_router(getattr(module, attribute or "router"), **include_kwargs)
+            except Exception as e:
+                # Leave the group unmounted (its paths 404) rather than failing every request
+                group.error = str(e)
+                logger.error(f"❌ Deferred router group {group.name} failed to load: {e}")
+                return False
+            group.loaded = True
+            group.load_seconds = round(time.perf_counter() - started, 4)
+            group.triggered_by = trigger
+            # Routes changed: rebuild the OpenAPI schema on next request
+            self.app.openapi_schema = None
+        if trigger != "startup":
+            logger.info(f"📦 Mounted deferred router group {group.name} in {group.load_seconds * 1000:.0f}ms "
+                        f"(triggered by {trigger})")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "groups": {
+                name: {
+                    "prefixes": list(group.prefixes),
+                    "loaded": group.loaded,
+                    "load_seconds": group.load_seconds,
+                    "triggered_by": group.triggered_by,
+                    "error": group.error,
+                }
+                for name, group in self.groups.items()
+            },
+            "pending": [group.name for group in self.pending()],
+        }
+
+
+class DeferredRouterMiddleware:
+    """ASGI middleware that mounts a deferred group before its first request is routed"""
+
+    def __init__(self, app, mounter: DeferredRouterMounter):
+        self.app = app
+        self.mounter = mounter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            self.mounter.ensure_loaded(scope.get("path", ""))
+        await self.app(scope, receive, send)
+
+
+__all__ = [
+    "LAZY_ROUTERS_ENABLED",
+    "DeferredRouterGroup",
+    "DeferredRouterMounter",
+    "DeferredRouterMiddleware",
+]
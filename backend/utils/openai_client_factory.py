@@ -17,6 +17,8 @@ from functools import wraps
 from services.openai_quota_tracker import quota_tracker
 # Import cost optimizer for model selection
 from utils.ai_model_optimizer import get_cost_optimized_model, ai_model_optimizer
+# Shared request/token budgets and priority classes for every LLM call
+from services.llm_rate_limiter import estimate_tokens, llm_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,14 @@ _sync_client: Optional[OpenAI] = None
 _async_client: Optional[AsyncOpenAI] = None
 
 
+def _estimated_call_tokens(kwargs: dict) -> int:
+    """Prompt + completion token estimate of a chat completion request"""
+    return estimate_tokens(
+        kwargs.get("messages"),
+        completion_tokens=kwargs.get("max_tokens") or kwargs.get("max_completion_tokens"),
+    )
+
+
 class QuotaTrackedOpenAI(OpenAI):
     """
     Wrapper for OpenAI client that automatically tracks quota usage.
@@ -48,6 +58,8 @@ class QuotaTrackedOpenAI(OpenAI):
                 tokens_used = 0
                 if hasattr(result, 'usage') and result.usage:
                     tokens_used = result.usage.total_tokens
+                    # Sync calls cannot wait for a permit; charge the shared budget instead
+                    llm_rate_limiter.record_usage(kwargs.get("model"), result.usage)
                 quota_tracker.record_request(success=True, tokens_used=tokens_used)
                 logger.debug(f"✅ QUOTA TRACKED: Sync chat completion - {tokens_used} tokens")
                 return result
@@ -65,6 +77,7 @@ class QuotaTrackedOpenAI(OpenAI):
                 tokens_used = 0
                 if hasattr(result, 'usage') and result.usage:
                     tokens_used = result.usage.total_tokens
+                    llm_rate_limiter.record_usage(kwargs.get("model"), result.usage)
                 quota_tracker.record_request(success=True, tokens_used=tokens_used)
                 logger.debug(f"✅ QUOTA TRACKED: Sync beta parse - {tokens_used} tokens")
                 return result
@@ -81,7 +94,8 @@ class QuotaTrackedOpenAI(OpenAI):
 class QuotaTrackedAsyncOpenAI(AsyncOpenAI):
     """
     Wrapper for AsyncOpenAI client that automatically tracks quota usage.
-    Intercepts all async API calls to record quota metrics.
+    Intercepts all async API calls to record quota metrics, and admits each call
+    through the shared LLM rate limiter (services.llm_rate_limiter).
     """
     
     def __init__(self, *args, **kwargs):
@@ -97,7 +111,9 @@ class QuotaTrackedAsyncOpenAI(AsyncOpenAI):
         @wraps(self._original_chat_completions_create)
         async def tracked_async_chat_create(*args, **kwargs):
             try:
-                result = await self._original_chat_completions_create(*args, **kwargs)
+                async with llm_rate_limiter.limit(kwargs.get("model"), _estimated_call_tokens(kwargs)) as permit:
+                    result = await self._original_chat_completions_create(*args, **kwargs)
+                    permit.record_usage(getattr(result, 'usage', None))
                 # Record successful request with token usage
                 tokens_used = 0
                 if hasattr(result, 'usage') and result.usage:
@@ -115,7 +131,9 @@ class QuotaTrackedAsyncOpenAI(AsyncOpenAI):
         @wraps(self._original_beta_chat_completions_parse)
         async def tracked_async_beta_parse(*args, **kwargs):
             try:
-                result = await self._original_beta_chat_completions_parse(*args, **kwargs)
+                async with llm_rate_limiter.limit(kwargs.get("model"), _estimated_call_tokens(kwargs)) as permit:
+                    result = await self._original_beta_chat_completions_parse(*args, **kwargs)
+                    permit.record_usage(getattr(result, 'usage', None))
                 # Record successful request with token usage
                 tokens_used = 0
                 if hasattr(result, 'usage') and result.usage:
@@ -4,37 +4,76 @@ Reduces API costs by caching expensive operations with intelligent TTL
 """
 
 import asyncio
+import copy
+import heapq
+import inspect
+import json
+import sys
 import time
-from typing import Any, Dict, Optional, Callable, Union
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Callable, Set, Tuple
 from functools import wraps
 import logging
 import hashlib
-import json
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Argument names that automatically become invalidation tags for @cached functions
+DEFAULT_TAG_ARGS: Tuple[str, ...] = ("workspace_id", "goal_id", "task_id", "agent_id")
+
+_MISSING = object()
+
+
+def make_tag(name: str, value: Any) -> str:
+    """Canonical tag string, e.g. make_tag("workspace_id", ws) -> "workspace_id:<ws>"."""
+    return f"{name}:{value}"
+
+
 class PerformanceCache:
     """
     High-performance caching system for expensive operations.
     Features:
-    - TTL (Time To Live) support
-    - Intelligent cache invalidation 
-    - Memory-efficient storage
+    - TTL (Time To Live) support, expired entries reclaimed through a timing wheel
+    - O(1) LRU eviction (OrderedDict) with an optional size budget in bytes
+    - Tag-based invalidation (workspace_id, goal_id, task_id, ...)
+    - Single-flight loading: concurrent misses for a key share one computation
     - Hit rate tracking for optimization
     """
-    
-    def __init__(self, max_size: int = 1000, default_ttl: int = 300):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 300,
+        max_bytes: Optional[int] = None,
+        wheel_resolution: float = 1.0,
+    ):
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.max_size = max_size
         self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+
+        # tag -> keys (each entry keeps its own tags), for invalidation without scanning the cache
+        self._tag_index: Dict[str, Set[str]] = {}
+
+        # Timing wheel: expiry slot -> keys, plus a heap of occupied slots
+        self.wheel_resolution = wheel_resolution
+        self._wheel: Dict[int, Set[str]] = {}
+        self._wheel_slots: List[int] = []
+
+        # key -> future of the in-flight load (per event loop)
+        self._inflight: Dict[Tuple[int, str], asyncio.Future] = {}
+
         self.stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'coalesced_loads': 0,
             'total_requests': 0
         }
-        
+
     def _generate_key(self, func_name: str, args: tuple, kwargs: dict) -> str:
         """Generate unique cache key from function signature"""
         try:
@@ -45,145 +84,298 @@ class PerformanceCache:
                 'kwargs': {k: v for k, v in sorted(kwargs.items())}
             }
             key_json = json.dumps(key_data, sort_keys=True, default=str)
-            return hashlib.md5(key_json.encode()).hexdigest()
+            return f"{func_name}:{hashlib.md5(key_json.encode()).hexdigest()}"
         except Exception as e:
             # Fallback to simple string concatenation
             logger.warning(f"Cache key generation failed, using fallback: {e}")
             return f"{func_name}:{str(args)}:{str(sorted(kwargs.items()))}"
-    
-    def _is_expired(self, cache_entry: dict) -> bool:
+
+    def _is_expired(self, cache_entry: dict, now: Optional[float] = None) -> bool:
         """Check if cache entry has expired"""
-        return time.time() > cache_entry['expires_at']
-    
-    def _evict_oldest(self):
-        """Remove oldest cache entries when max_size is reached"""
-        if len(self.cache) >= self.max_size:
-            # Remove 10% of oldest entries
-            entries_to_remove = max(1, len(self.cache) // 10)
-            oldest_keys = sorted(
-                self.cache.keys(), 
-                key=lambda k: self.cache[k]['created_at']
-            )[:entries_to_remove]
-            
-            for key in oldest_keys:
-                del self.cache[key]
-                self.stats['evictions'] += 1
-    
+        return (now or time.time()) > cache_entry['expires_at']
+
+    @staticmethod
+    def _estimate_size(data: Any) -> int:
+        try:
+            return len(json.dumps(data, default=str))
+        except Exception:
+            return sys.getsizeof(data)
+
+    # === Internal bookkeeping ===
+
+    def _remove(self, key: str, reason: Optional[str] = None) -> bool:
+        entry = self.cache.pop(key, None)
+        if entry is None:
+            return False
+        self.current_bytes -= entry['size']
+        for tag in entry['tags']:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+        slot_keys = self._wheel.get(entry['slot'])
+        if slot_keys is not None:
+            slot_keys.discard(key)
+        if reason:
+            self.stats[reason] += 1
+        return True
+
+    def _advance_wheel(self, now: float):
+        """Drop every entry whose expiry slot has fully elapsed (amortized O(expired))."""
+        current_slot = int(now // self.wheel_resolution)
+        while self._wheel_slots and self._wheel_slots[0] < current_slot:
+            slot = heapq.heappop(self._wheel_slots)
+            for key in list(self._wheel.pop(slot, ())):
+                entry = self.cache.get(key)
+                if entry is not None and entry['slot'] == slot:
+                    self._remove(key, 'expirations')
+
+    def _evict_oldest(self, incoming_bytes: int = 0):
+        """Evict least recently used entries until a new entry fits the count and byte budgets"""
+        while self.cache and (
+            len(self.cache) >= self.max_size or
+            (self.max_bytes is not None and self.current_bytes + incoming_bytes > self.max_bytes)
+        ):
+            oldest_key = next(iter(self.cache))
+            self._remove(oldest_key, 'evictions')
+
+    # === Public API ===
+
     def get(self, key: str) -> Optional[Any]:
         """Get item from cache if exists and not expired"""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key: str) -> Any:
         self.stats['total_requests'] += 1
-        
-        if key not in self.cache:
+        now = time.time()
+        self._advance_wheel(now)
+
+        entry = self.cache.get(key)
+        if entry is None:
             self.stats['misses'] += 1
-            return None
-            
-        entry = self.cache[key]
-        
-        if self._is_expired(entry):
-            del self.cache[key]
+            return _MISSING
+
+        if self._is_expired(entry, now):
+            self._remove(key, 'expirations')
             self.stats['misses'] += 1
-            return None
-            
-        # Update access time for LRU behavior
-        entry['last_accessed'] = time.time()
+            return _MISSING
+
+        # Move to the MRU end for LRU behavior
+        self.cache.move_to_end(key)
+        entry['last_accessed'] = now
         self.stats['hits'] += 1
-        logger.debug(f"Cache HIT for key: {key[:10]}...")
+        logger.debug(f"Cache HIT for key: {key[:40]}...")
         return entry['data']
-    
-    def set(self, key: str, data: Any, ttl: Optional[int] = None) -> None:
-        """Store item in cache with TTL"""
-        self._evict_oldest()
-        
+
+    def set(self, key: str, data: Any, ttl: Optional[int] = None, tags: Optional[Iterable[str]] = None) -> None:
+        """Store item in cache with TTL and optional invalidation tags"""
         ttl = ttl or self.default_ttl
         now = time.time()
-        
+        self._advance_wheel(now)
+        self._remove(key)
+
+        size = self._estimate_size(data) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            logger.debug(f"Cache SKIP for key: {key[:40]}... ({size} bytes exceeds budget)")
+            return
+
+        self._evict_oldest(size)
+
+        expires_at = now + ttl
+        slot = int(expires_at // self.wheel_resolution)
+        entry_tags = frozenset(tags or ())
+
         self.cache[key] = {
             'data': data,
             'created_at': now,
             'last_accessed': now,
-            'expires_at': now + ttl
+            'expires_at': expires_at,
+            'slot': slot,
+            'tags': entry_tags,
+            'size': size,
         }
-        logger.debug(f"Cache SET for key: {key[:10]}... (TTL: {ttl}s)")
-    
+        self.current_bytes += size
+        for tag in entry_tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        if slot not in self._wheel:
+            self._wheel[slot] = set()
+            heapq.heappush(self._wheel_slots, slot)
+        self._wheel[slot].add(key)
+        logger.debug(f"Cache SET for key: {key[:40]}... (TTL: {ttl}s)")
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """
+        Return the cached value or compute it with ``loader``.
+
+        Concurrent callers missing on the same key await a single in-flight load
+        instead of each hitting the backend (single-flight / stampede protection).
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        inflight_key = (id(asyncio.get_running_loop()), key)
+        inflight = self._inflight.get(inflight_key)
+        if inflight is not None:
+            self.stats['coalesced_loads'] += 1
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            result = loader()
+            if inspect.isawaitable(result):
+                result = await result
+            self.set(key, result, ttl, tags)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else was waiting
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(inflight_key, None)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Invalidate every entry carrying any of the given tags"""
+        keys = set()
+        for tag in tags:
+            keys.update(self._tag_index.get(tag, ()))
+        for key in keys:
+            self._remove(key, 'invalidations')
+        if keys:
+            logger.debug(f"Cache invalidated: {len(keys)} entries removed (tags: {tags})")
+        return len(keys)
+
     def invalidate(self, pattern: str = None) -> int:
-        """Invalidate cache entries matching pattern"""
+        """Invalidate cache entries matching pattern (a tag, or a substring of the key)"""
         if pattern is None:
             # Clear all
             count = len(self.cache)
-            self.cache.clear()
+            for key in list(self.cache.keys()):
+                self._remove(key)
             logger.info(f"Cache cleared: {count} entries removed")
             return count
-            
-        # Pattern-based invalidation
+
+        if pattern in self._tag_index:
+            return self.invalidate_tags(pattern)
+
+        # Pattern-based invalidation (keys are prefixed with the function name)
         keys_to_remove = [k for k in self.cache.keys() if pattern in k]
         for key in keys_to_remove:
-            del self.cache[key]
-        
+            self._remove(key, 'invalidations')
+
         logger.info(f"Cache invalidated: {len(keys_to_remove)} entries removed (pattern: {pattern})")
         return len(keys_to_remove)
-    
+
+    def clear(self) -> int:
+        """Drop every entry (statistics are kept)"""
+        return self.invalidate()
+
     def get_stats(self) -> dict:
         """Get cache statistics"""
         total = self.stats['total_requests']
         hit_rate = (self.stats['hits'] / total * 100) if total > 0 else 0
-        
+
         return {
             **self.stats,
             'hit_rate_percent': round(hit_rate, 2),
             'cache_size': len(self.cache),
-            'memory_usage': f"{len(self.cache)}/{self.max_size}"
+            'memory_usage': f"{len(self.cache)}/{self.max_size}",
+            'bytes_used': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'tags_indexed': len(self._tag_index),
+            'inflight_loads': len(self._inflight)
         }
 
 # Global cache instance
 _cache_instance = PerformanceCache(max_size=500, default_ttl=300)  # 5 minute default TTL
 
-def cached(ttl: int = 300, cache_key: Optional[str] = None):
+def cached(ttl: int = 300, cache_key: Optional[str] = None, tag_args: Iterable[str] = DEFAULT_TAG_ARGS):
     """
     Decorator for caching expensive function results.
-    
+
     Args:
         ttl: Time to live in seconds (default: 5 minutes)
         cache_key: Custom cache key (optional)
+        tag_args: Argument names whose values become invalidation tags, so e.g.
+            invalidate_workspace_cache(ws) drops every result computed for ws
+
+    Every caller receives its own deep copy, so mutating a returned dict never
+    changes the cached value seen by other callers.
     """
     def decorator(func: Callable):
+        signature = inspect.signature(func)
+        tagged_params = [name for name in tag_args if name in signature.parameters]
+
+        def _tags_for_call(args: tuple, kwargs: dict) -> List[str]:
+            if not tagged_params:
+                return []
+            try:
+                bound = signature.bind_partial(*args, **kwargs)
+            except TypeError:
+                return []
+            return [
+                make_tag(name, bound.arguments[name])
+                for name in tagged_params
+                if bound.arguments.get(name) is not None
+            ]
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Generate cache key
             if cache_key:
                 key = cache_key
             else:
-                key = _cache_instance._generate_key(func.__name__, args, kwargs)
-            
-            # Try to get from cache
-            cached_result = _cache_instance.get(key)
-            if cached_result is not None:
-                return cached_result
-            
-            # Execute function and cache result
-            try:
+                key = _cache_instance._generate_key(func.__qualname__, args, kwargs)
+
+            async def _load():
                 if asyncio.iscoroutinefunction(func):
-                    result = await func(*args, **kwargs)
-                else:
-                    result = func(*args, **kwargs)
-                
-                _cache_instance.set(key, result, ttl)
-                return result
-                
+                    return await func(*args, **kwargs)
+                return func(*args, **kwargs)
+
+            try:
+                result = await _cache_instance.get_or_load(key, _load, ttl, _tags_for_call(args, kwargs))
+                return copy.deepcopy(result)
             except Exception as e:
                 logger.error(f"Error executing cached function {func.__name__}: {e}")
                 raise
-        
+
         # Add cache management methods to function
-        wrapper.cache_invalidate = lambda pattern=None: _cache_instance.invalidate(pattern or func.__name__)
+        wrapper.cache_invalidate = lambda pattern=None: _cache_instance.invalidate(pattern or func.__qualname__)
         wrapper.cache_stats = lambda: _cache_instance.get_stats()
-        
+
         return wrapper
     return decorator
 
 # Workspace-specific caching helpers
 def invalidate_workspace_cache(workspace_id: str) -> int:
     """Invalidate all cache entries for a workspace"""
-    return _cache_instance.invalidate(workspace_id)
+    return _cache_instance.invalidate_tags(make_tag("workspace_id", workspace_id))
+
+def invalidate_goal_cache(goal_id: str) -> int:
+    """Invalidate all cache entries computed for a goal"""
+    return _cache_instance.invalidate_tags(make_tag("goal_id", goal_id))
+
+def invalidate_task_cache(task_id: str) -> int:
+    """Invalidate all cache entries computed for a task"""
+    return _cache_instance.invalidate_tags(make_tag("task_id", task_id))
+
+def invalidate_agent_cache(agent_id: str) -> int:
+    """Invalidate all cache entries computed for an agent"""
+    return _cache_instance.invalidate_tags(make_tag("agent_id", agent_id))
 
 def get_cache_stats() -> dict:
     """Get global cache statistics"""
@@ -193,7 +385,7 @@ def get_cache_stats() -> dict:
 def rate_limited(max_requests: int = 10, window_seconds: int = 60):
     """
     Rate limiting decorator using cache backend.
-    
+
     Args:
         max_requests: Maximum requests allowed in time window
         window_seconds: Time window in seconds
@@ -204,34 +396,38 @@ def rate_limited(max_requests: int = 10, window_seconds: int = 60):
             # Get client identifier (you might want to use IP, user ID, etc.)
             # For now, use function name + first argument as identifier
             client_id = f"rate_limit_{func.__name__}_{str(args[0]) if args else 'global'}"
-            
+
             # Check current request count
             current_count = _cache_instance.get(client_id) or 0
-            
+
             if current_count >= max_requests:
                 from fastapi import HTTPException
                 raise HTTPException(
-                    status_code=429, 
+                    status_code=429,
                     detail=f"Rate limit exceeded. Max {max_requests} requests per {window_seconds} seconds"
                 )
-            
+
             # Increment counter
             _cache_instance.set(client_id, current_count + 1, window_seconds)
-            
+
             # Execute function
             if asyncio.iscoroutinefunction(func):
                 return await func(*args, **kwargs)
             else:
                 return func(*args, **kwargs)
-        
+
         return wrapper
     return decorator
 
 # Export functions
 __all__ = [
-    'PerformanceCache', 
-    'cached', 
+    'PerformanceCache',
+    'cached',
     'rate_limited',
-    'invalidate_workspace_cache', 
+    'make_tag',
+    'invalidate_workspace_cache',
+    'invalidate_goal_cache',
+    'invalidate_task_cache',
+    'invalidate_agent_cache',
     'get_cache_stats'
-]
\ No newline at end of file
+]
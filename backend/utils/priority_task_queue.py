@@ -0,0 +1,295 @@
+# utils/priority_task_queue.py
+"""
+🎯 Priority Task Queue for the TaskExecutor
+Drop-in replacement for ``asyncio.Queue`` (put/get/put_nowait/get_nowait/task_done/
+qsize/full/empty/join) that orders work instead of serving it FIFO:
+
+- Corrective fast lane: corrective/urgent items are always dequeued first and are
+  admitted even when the queue is full. Running tasks are never preempted.
+- Per-workspace fair share: non-corrective work is served by deficit round robin
+  across workspaces (optionally weighted), so one tenant's bulk backlog cannot
+  monopolise the workers.
+- Priority with aging: inside a workspace items are ordered by score, and every
+  waiting item gains ``aging_rate`` points per second so low priority work cannot
+  starve. Because all items age at the same rate the aged ordering is encoded in a
+  static heap key, keeping enqueue/dequeue O(log n).
+- Metrics: queue depth and wait times per priority class.
+
+Each item is classified once per put; callers that have already scored the item
+can pass ``priority=`` to skip ``priority_fn`` entirely.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_CLASSES = ("corrective", "finalization", "high", "normal", "low")
+CORRECTIVE_CLASS = "corrective"
+DEFAULT_CLASS = "normal"
+
+# Points added to an item's score for its priority class, so class dominates the
+# raw score unless an item has been waiting for a long time
+CLASS_BASE_SCORES = {
+    "corrective": 100000.0,
+    "finalization": 10000.0,
+    "high": 3000.0,
+    "normal": 1000.0,
+    "low": 0.0,
+}
+
+# (priority_class, score, workspace_id) for a queue item
+PriorityInfo = Tuple[str, float, Optional[str]]
+
+
+class PriorityTaskQueue:
+    """Heap-based, fair-share priority queue with an asyncio.Queue-compatible API."""
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        priority_fn: Optional[Callable[[Any], PriorityInfo]] = None,
+        aging_rate: float = 10.0,
+        workspace_weights: Optional[Dict[str, int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.aging_rate = aging_rate
+        self._priority_fn = priority_fn or (lambda item: (DEFAULT_CLASS, 0.0, None))
+        self.workspace_weights: Dict[str, int] = dict(workspace_weights or {})
+
+        self._counter = itertools.count()
+        # Control items (e.g. the None shutdown sentinel) bypass ordering
+        self._control: Deque[Any] = deque()
+        self._fast_lane: List[Tuple[float, int, float, str, Any]] = []
+        self._workspace_heaps: Dict[str, List[Tuple[float, int, float, str, Any]]] = {}
+        # Deficit round robin state
+        self._active_workspaces: Deque[str] = deque()
+        self._deficits: Dict[str, float] = {}
+        self._size = 0
+
+        self._getters: Deque[asyncio.Future] = deque()
+        self._putters: Deque[asyncio.Future] = deque()
+        self._unfinished_tasks = 0
+        self._finished: Optional[asyncio.Event] = None
+
+        self._metrics: Dict[str, Dict[str, float]] = {
+            priority_class: {
+                "depth": 0,
+                "enqueued": 0,
+                "dequeued": 0,
+                "total_wait_s": 0.0,
+                "max_wait_s": 0.0,
+            }
+            for priority_class in PRIORITY_CLASSES
+        }
+
+    # === asyncio.Queue compatible API ===
+
+    def qsize(self) -> int:
+        return self._size + len(self._control)
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self.qsize()
+
+    async def put(self, item: Any, priority: Optional[PriorityInfo] = None):
+        info = self._info_for(item, priority)
+        while self.full() and not self._bypasses_capacity(item, info):
+            putter = asyncio.get_running_loop().create_future()
+            self._putters.append(putter)
+            try:
+                await putter
+            except BaseException:
+                putter.cancel()
+                try:
+                    self._putters.remove(putter)
+                except ValueError:
+                    pass
+                if not self.full() and not putter.cancelled():
+                    self._wakeup_next(self._putters)
+                raise
+        self.put_nowait(item, info)
+
+    def put_nowait(self, item: Any, priority: Optional[PriorityInfo] = None):
+        info = self._info_for(item, priority)
+        if self.full() and not self._bypasses_capacity(item, info):
+            raise asyncio.QueueFull
+        self._put(item, info)
+        self._unfinished_tasks += 1
+        if self._finished is not None:
+            self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    async def get(self) -> Any:
+        while self.empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                if not self.empty() and not getter.cancelled():
+                    self._wakeup_next(self._getters)
+                raise
+        return self.get_nowait()
+
+    def get_nowait(self) -> Any:
+        if self.empty():
+            raise asyncio.QueueEmpty
+        item = self._get()
+        self._wakeup_next(self._putters)
+        return item
+
+    def task_done(self):
+        if self._unfinished_tasks <= 0:
+            raise ValueError("task_done() called too many times")
+        self._unfinished_tasks -= 1
+        if self._unfinished_tasks == 0 and self._finished is not None:
+            self._finished.set()
+
+    async def join(self):
+        if self._unfinished_tasks > 0:
+            if self._finished is None:
+                self._finished = asyncio.Event()
+            self._finished.clear()
+            await self._finished.wait()
+
+    # === Scheduling ===
+
+    def set_workspace_weight(self, workspace_id: str, weight: int):
+        """Give a workspace ``weight`` dequeues per round-robin turn (default 1)."""
+        self.workspace_weights[workspace_id] = max(1, int(weight))
+
+    def _classify(self, item: Any, priority: Optional[PriorityInfo] = None) -> PriorityInfo:
+        try:
+            priority_class, score, workspace_id = priority if priority is not None else self._priority_fn(item)
+        except Exception as e:
+            logger.warning(f"Priority classification failed, using '{DEFAULT_CLASS}': {e}")
+            priority_class, score, workspace_id = DEFAULT_CLASS, 0.0, None
+        if priority_class not in CLASS_BASE_SCORES:
+            priority_class = DEFAULT_CLASS
+        return priority_class, float(score or 0.0), workspace_id
+
+    def _info_for(self, item: Any, priority: Optional[PriorityInfo]) -> Optional[PriorityInfo]:
+        """Classification of ``item`` (None for control items), computed once per put."""
+        return None if item is None else self._classify(item, priority)
+
+    @staticmethod
+    def _bypasses_capacity(item: Any, info: Optional[PriorityInfo]) -> bool:
+        return item is None or info[0] == CORRECTIVE_CLASS
+
+    def _put(self, item: Any, info: Optional[PriorityInfo]):
+        if item is None:
+            self._control.append(item)
+            return
+
+        priority_class, score, workspace_id = info
+        enqueued_at = time.monotonic()
+        # Aged priority = base + score + aging_rate * (now - enqueued_at); "now" is common to
+        # every item, so ordering by (base + score - aging_rate * enqueued_at) is equivalent
+        key = -(CLASS_BASE_SCORES[priority_class] + score - self.aging_rate * enqueued_at)
+        entry = (key, next(self._counter), enqueued_at, priority_class, item)
+
+        if priority_class == CORRECTIVE_CLASS:
+            heapq.heappush(self._fast_lane, entry)
+        else:
+            workspace_key = workspace_id or ""
+            heap = self._workspace_heaps.get(workspace_key)
+            if heap is None:
+                heap = []
+                self._workspace_heaps[workspace_key] = heap
+                self._active_workspaces.append(workspace_key)
+                self._deficits[workspace_key] = 0.0
+            heapq.heappush(heap, entry)
+
+        self._size += 1
+        metrics = self._metrics[priority_class]
+        metrics["depth"] += 1
+        metrics["enqueued"] += 1
+
+    def _get(self) -> Any:
+        if self._control:
+            return self._control.popleft()
+
+        if self._fast_lane:
+            entry = heapq.heappop(self._fast_lane)
+        else:
+            entry = self._pop_fair_share()
+
+        _, _, enqueued_at, priority_class, item = entry
+        self._size -= 1
+        wait_s = time.monotonic() - enqueued_at
+        metrics = self._metrics[priority_class]
+        metrics["depth"] -= 1
+        metrics["dequeued"] += 1
+        metrics["total_wait_s"] += wait_s
+        metrics["max_wait_s"] = max(metrics["max_wait_s"], wait_s)
+        return item
+
+    def _pop_fair_share(self) -> Tuple[float, int, float, str, Any]:
+        """Deficit round robin over workspaces with pending work (unit cost per task)."""
+        workspace_key = self._active_workspaces[0]
+        if self._deficits[workspace_key] < 1:
+            self._deficits[workspace_key] += self.workspace_weights.get(workspace_key, 1)
+        heap = self._workspace_heaps[workspace_key]
+        entry = heapq.heappop(heap)
+        self._deficits[workspace_key] -= 1
+
+        if not heap:
+            self._active_workspaces.popleft()
+            del self._workspace_heaps[workspace_key]
+            del self._deficits[workspace_key]
+        elif self._deficits[workspace_key] < 1:
+            self._active_workspaces.rotate(-1)
+        return entry
+
+    @staticmethod
+    def _wakeup_next(waiters: Deque[asyncio.Future]):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    # === Metrics ===
+
+    def get_metrics(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        oldest_wait: Dict[str, float] = {}
+        for heap in [self._fast_lane, *self._workspace_heaps.values()]:
+            for _, _, enqueued_at, priority_class, _ in heap:
+                oldest_wait[priority_class] = max(oldest_wait.get(priority_class, 0.0), now - enqueued_at)
+
+        per_class = {}
+        for priority_class, metrics in self._metrics.items():
+            dequeued = metrics["dequeued"]
+            per_class[priority_class] = {
+                "depth": int(metrics["depth"]),
+                "enqueued": int(metrics["enqueued"]),
+                "dequeued": int(dequeued),
+                "avg_wait_seconds": round(metrics["total_wait_s"] / dequeued, 3) if dequeued else 0.0,
+                "max_wait_seconds": round(metrics["max_wait_s"], 3),
+                "oldest_waiting_seconds": round(oldest_wait.get(priority_class, 0.0), 3),
+            }
+
+        return {
+            "size": self.qsize(),
+            "maxsize": self.maxsize,
+            "aging_rate": self.aging_rate,
+            "active_workspaces": len(self._active_workspaces),
+            "per_priority_class": per_class,
+        }
+
+
+__all__ = ["PriorityTaskQueue", "PRIORITY_CLASSES", "CLASS_BASE_SCORES"]
@@ -0,0 +1,309 @@
+# utils/task_event_bus.py
+"""
+📣 In-process Task Event Bus
+Lightweight publish/subscribe channel for task lifecycle events (created, status
+changed, queued) so the executor can wake up as soon as work appears instead of
+waiting for its next polling interval. Goal, deliverable, workspace and agent
+writes are published too, for consumers that cache workspace state.
+
+Publishing is synchronous and never blocks: each subscriber owns a bounded queue
+and, when it falls behind, the oldest event is dropped (consumers treat events as
+"something changed in workspace X" hints, and polling remains the safety net).
+
+Synchronous listeners (``add_listener``) run inline on publish and are meant for
+cheap bookkeeping such as cache invalidation.
+
+Optionally, events produced by other processes/replicas can be received through
+Postgres LISTEN/NOTIFY (``TASK_EVENTS_PG_DSN`` + asyncpg + the trigger in
+migrations/025_add_task_event_notifications.sql). A dropped or failed LISTEN
+connection is retried with exponential backoff; while it is down, cross-process
+events are only picked up by polling.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+TASK_EVENTS_CHANNEL = os.getenv("TASK_EVENTS_CHANNEL", "task_events")
+TASK_EVENTS_PG_DSN = os.getenv("TASK_EVENTS_PG_DSN") or os.getenv("DATABASE_URL")
+TASK_EVENTS_RECONNECT_MIN_SECONDS = float(os.getenv("TASK_EVENTS_RECONNECT_MIN_SECONDS", "1"))
+TASK_EVENTS_RECONNECT_MAX_SECONDS = float(os.getenv("TASK_EVENTS_RECONNECT_MAX_SECONDS", "60"))
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    asyncpg = None
+    ASYNCPG_AVAILABLE = False
+
+# Event types
+TASK_CREATED = "task_created"
+TASK_STATUS_CHANGED = "task_status_changed"
+TASK_QUEUED = "task_queued"
+GOAL_CHANGED = "goal_changed"
+DELIVERABLE_CHANGED = "deliverable_changed"
+WORKSPACE_CHANGED = "workspace_changed"
+AGENT_CHANGED = "agent_changed"
+
+
+@dataclass
+class TaskEvent:
+    event_type: str
+    workspace_id: Optional[str] = None
+    task_id: Optional[str] = None
+    status: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    source: str = "local"
+    published_at: float = field(default_factory=time.time)
+
+
+class TaskEventSubscription:
+    """Bounded per-subscriber mailbox bound to the event loop that created it."""
+
+    def __init__(self, bus: "TaskEventBus", event_types: Optional[Set[str]], maxsize: int):
+        self._bus = bus
+        self.event_types = event_types
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.loop = asyncio.get_running_loop()
+        self.dropped = 0
+
+    def wants(self, event: TaskEvent) -> bool:
+        return self.event_types is None or event.event_type in self.event_types
+
+    def _deliver(self, event: TaskEvent):
+        if self.queue.full():
+            # Drop the oldest hint: the newest one carries the same or more information
+            try:
+                self.queue.get_nowait()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+        self.queue.put_nowait(event)
+
+    async def wait(self, timeout: float) -> List[TaskEvent]:
+        """Wait up to ``timeout`` seconds for at least one event, then drain what is pending."""
+        try:
+            first = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+        return [first] + self.drain()
+
+    def drain(self) -> List[TaskEvent]:
+        """Return every event already pending, without waiting."""
+        events = []
+        while not self.queue.empty():
+            events.append(self.queue.get_nowait())
+        return events
+
+    def close(self):
+        self._bus.unsubscribe(self)
+
+
+class TaskEventBus:
+    """Process-wide fan-out of task events to in-process subscribers."""
+
+    def __init__(self):
+        self._subscriptions: List[TaskEventSubscription] = []
+        self._listeners: List[Callable[[TaskEvent], None]] = []
+        self._listener_connection = None
+        self._listener_dsn: Optional[str] = None
+        self._listener_stopped = True
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "published": 0, "delivered": 0, "remote_received": 0,
+            "listener_reconnect_attempts": 0, "listener_reconnects": 0,
+        }
+
+    def subscribe(self, event_types: Optional[Set[str]] = None, maxsize: int = 1000) -> TaskEventSubscription:
+        subscription = TaskEventSubscription(self, event_types, maxsize)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: TaskEventSubscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    def add_listener(self, listener: Callable[[TaskEvent], None]):
+        """Call ``listener(event)`` synchronously on every publish (must be cheap)."""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[TaskEvent], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def publish(
+        self,
+        event_type: str,
+        workspace_id: Optional[str] = None,
+        task_id: Optional[str] = None,
+        status: Optional[str] = None,
+        source: str = "local",
+        **data: Any,
+    ):
+        """Publish an event; safe to call from any thread and never raises."""
+        event = TaskEvent(
+            event_type=event_type,
+            workspace_id=str(workspace_id) if workspace_id else None,
+            task_id=str(task_id) if task_id else None,
+            status=status,
+            data=data,
+            source=source,
+        )
+        self.stats["published"] += 1
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for listener in list(self._listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                logger.debug(f"Task event listener failed: {e}")
+
+        for subscription in list(self._subscriptions):
+            if not subscription.wants(event):
+                continue
+            try:
+                if subscription.loop is running_loop:
+                    subscription._deliver(event)
+                elif not subscription.loop.is_closed():
+                    subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+                else:
+                    continue
+                self.stats["delivered"] += 1
+            except Exception as e:
+                logger.debug(f"Task event delivery failed: {e}")
+
+    # === Optional cross-process notifications ===
+
+    async def start_postgres_listener(self, dsn: Optional[str] = None) -> bool:
+        """
+        Relay Postgres NOTIFY payloads on TASK_EVENTS_CHANNEL into this bus.
+
+        Returns whether the listener is connected; when the first attempt fails it
+        keeps retrying in the background.
+        """
+        dsn = dsn or TASK_EVENTS_PG_DSN
+        if not (ASYNCPG_AVAILABLE and dsn):
+            reason = "asyncpg is not installed" if not ASYNCPG_AVAILABLE else "TASK_EVENTS_PG_DSN/DATABASE_URL is not set"
+            logger.warning(f"⚠️ Task event bus: cross-process delivery is off ({reason}), "
+                           f"events from other processes are only picked up by polling")
+            return False
+        if self._listener_connection is not None:
+            return True
+
+        self._listener_dsn = dsn
+        self._listener_stopped = False
+        if await self._connect_listener():
+            return True
+        logger.warning("⚠️ Task event bus: cross-process delivery is off until the Postgres listener reconnects")
+        self._schedule_reconnect()
+        return False
+
+    async def _connect_listener(self) -> bool:
+        connection = None
+        try:
+            connection = await asyncpg.connect(self._listener_dsn)
+            await connection.add_listener(TASK_EVENTS_CHANNEL, self._on_notification)
+            connection.add_termination_listener(self._on_listener_terminated)
+        except Exception as e:
+            logger.warning(f"⚠️ Task event bus: failed to LISTEN on Postgres: {e}")
+            if connection is not None:
+                try:
+                    await connection.close()
+                except Exception:
+                    pass
+            return False
+        self._listener_connection = connection
+        logger.info(f"📣 Task event bus listening on Postgres channel '{TASK_EVENTS_CHANNEL}'")
+        return True
+
+    def _on_listener_terminated(self, connection):
+        if connection is not self._listener_connection:
+            return
+        self._listener_connection = None
+        if self._listener_stopped:
+            return
+        logger.warning("⚠️ Task event bus: Postgres LISTEN connection lost, "
+                       "cross-process delivery is off until it reconnects")
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        if self._reconnect_task is not None and not self._reconnect_task.done():
+            return
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_listener())
+
+    async def _reconnect_listener(self):
+        delay = TASK_EVENTS_RECONNECT_MIN_SECONDS
+        while not self._listener_stopped and self._listener_connection is None:
+            await asyncio.sleep(delay)
+            if self._listener_stopped:
+                return
+            self.stats["listener_reconnect_attempts"] += 1
+            if await self._connect_listener():
+                self.stats["listener_reconnects"] += 1
+                logger.info("📣 Task event bus: Postgres listener reconnected, cross-process delivery restored")
+                return
+            delay = min(delay * 2, TASK_EVENTS_RECONNECT_MAX_SECONDS)
+
+    async def stop_postgres_listener(self):
+        self._listener_stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+        if self._listener_connection is not None:
+            try:
+                await self._listener_connection.close()
+            finally:
+                self._listener_connection = None
+
+    def _on_notification(self, connection, pid, channel, payload):
+        try:
+            message = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        self.stats["remote_received"] += 1
+        self.publish(
+            message.get("event_type", TASK_STATUS_CHANGED),
+            workspace_id=message.get("workspace_id"),
+            task_id=message.get("task_id"),
+            status=message.get("status"),
+            source="postgres",
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "subscribers": len(self._subscriptions),
+            "listeners": len(self._listeners),
+            "dropped": sum(s.dropped for s in self._subscriptions),
+            "postgres_listener": self._listener_connection is not None,
+            "postgres_listener_reconnecting": self._reconnect_task is not None and not self._reconnect_task.done(),
+        }
+
+
+# Global instance
+task_event_bus = TaskEventBus()
+
+__all__ = [
+    "TaskEventBus",
+    "TaskEvent",
+    "TaskEventSubscription",
+    "task_event_bus",
+    "TASK_CREATED",
+    "TASK_STATUS_CHANGED",
+    "TASK_QUEUED",
+    "GOAL_CHANGED",
+    "DELIVERABLE_CHANGED",
+    "WORKSPACE_CHANGED",
+    "AGENT_CHANGED",
+]
@@ -0,0 +1,117 @@
+# utils/telemetry_counters.py
+"""
+📈 In-process telemetry counters
+O(1), fixed-memory recording of the events SystemTelemetryMonitor reports, fed
+directly by the services that cause them instead of being re-derived from
+database scans:
+
+- counters: monotonically increasing totals (anti-loop triggers, recovery
+  actions); readers take the delta between two collections
+- outcomes: success/failure of the most recent attempts in a fixed-size ring,
+  so a success rate reflects the last ``TELEMETRY_RING_SIZE`` attempts
+- observations: the most recent values (e.g. confidence scores) in a ring
+
+``MetricRing`` is also the rolling time-series buffer used for metric history.
+"""
+
+import os
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+TELEMETRY_RING_SIZE = int(os.getenv("TELEMETRY_RING_SIZE", "500"))
+
+
+class MetricRing:
+    """Fixed-size ring of (timestamp, value) samples; the oldest sample is dropped when full."""
+
+    def __init__(self, size: int = TELEMETRY_RING_SIZE):
+        self.samples: Deque[Tuple[float, float]] = deque(maxlen=max(1, size))
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def append(self, value: float, timestamp: Optional[float] = None):
+        self.samples.append((timestamp if timestamp is not None else time.time(), float(value)))
+
+    def values(self, since: Optional[float] = None) -> List[float]:
+        return [value for ts, value in self.samples if since is None or ts >= since]
+
+    def latest(self) -> Optional[float]:
+        return self.samples[-1][1] if self.samples else None
+
+    def mean(self, since: Optional[float] = None) -> Optional[float]:
+        values = self.values(since)
+        return sum(values) / len(values) if values else None
+
+    def summary(self) -> Dict[str, Any]:
+        values = self.values()
+        if not values:
+            return {"count": 0, "last": None, "min": None, "max": None, "avg": None}
+        return {
+            "count": len(values),
+            "last": values[-1],
+            "min": min(values),
+            "max": max(values),
+            "avg": round(sum(values) / len(values), 4),
+        }
+
+
+class TelemetryCounters:
+    """Named counters, outcome rings and observation rings shared by the whole process."""
+
+    def __init__(self, ring_size: int = TELEMETRY_RING_SIZE):
+        self.ring_size = ring_size
+        self.counters: Dict[str, int] = {}
+        self.outcomes: Dict[str, MetricRing] = {}
+        self.observations: Dict[str, MetricRing] = {}
+
+    def increment(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_outcome(self, name: str, success: bool):
+        self._ring(self.outcomes, name).append(1.0 if success else 0.0)
+
+    def observe(self, name: str, value: Optional[float]):
+        if value is not None:
+            self._ring(self.observations, name).append(value)
+
+    def counter(self, name: str) -> int:
+        return self.counters.get(name, 0)
+
+    def success_rate(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        ring = self.outcomes.get(name)
+        rate = ring.mean() if ring is not None else None
+        return rate if rate is not None else default
+
+    def average(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        ring = self.observations.get(name)
+        average = ring.mean() if ring is not None else None
+        return average if average is not None else default
+
+    def _ring(self, rings: Dict[str, MetricRing], name: str) -> MetricRing:
+        ring = rings.get(name)
+        if ring is None:
+            ring = rings[name] = MetricRing(self.ring_size)
+        return ring
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self.counters),
+            "success_rates": {
+                name: {"rate": round(ring.mean(), 4), "attempts": len(ring)}
+                for name, ring in self.outcomes.items() if len(ring)
+            },
+            "observations": {name: ring.summary() for name, ring in self.observations.items()},
+        }
+
+    def reset(self):
+        self.counters.clear()
+        self.outcomes.clear()
+        self.observations.clear()
+
+
+# Global instance
+telemetry_counters = TelemetryCounters()
+
+__all__ = ["MetricRing", "TelemetryCounters", "telemetry_counters", "TELEMETRY_RING_SIZE"]
@@ -0,0 +1,265 @@
+# utils/websocket_broadcast.py
+"""
+📡 WebSocket Broadcast Engine
+Fan-out of one message to many sockets without letting a slow browser stall the
+others:
+
+- A broadcast serializes the message once; every recipient gets the same text.
+- Each socket owns a bounded send queue drained by its own background task, so
+  sends to different clients run concurrently and a broadcast never awaits a
+  client.
+- When a client falls behind, frames sharing a ``coalesce_key`` replace the queued
+  one in place (latest state wins), and a full queue drops its oldest frame
+  (``drop_oldest``, default) or rejects the new one (``drop_newest``).
+- A send that fails or exceeds ``send_timeout`` closes the socket's queue and
+  notifies its owners (health manager / legacy connection manager) so they can
+  unregister it.
+- Enqueue-to-delivery latency is recorded in a histogram (see benchmark_websocket_broadcast.py).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Optional
+
+from utils.latency_histogram import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", "256"))
+WS_SEND_TIMEOUT_SECONDS = float(os.getenv("WS_SEND_TIMEOUT_SECONDS", "10"))
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest").lower()
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+# Local delivery is expected in the low milliseconds
+DELIVERY_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+
+def serialize_message(message: Any) -> str:
+    """JSON text sent on the wire (datetimes and UUIDs become strings)."""
+    return json.dumps(message, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class OutboundFrame:
+    text: str
+    coalesce_key: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class ConnectionSender:
+    """Bounded send queue of one socket, drained by a dedicated task."""
+
+    def __init__(self, websocket: Any, broadcaster: "WebSocketBroadcaster"):
+        self.websocket = websocket
+        self._broadcaster = broadcaster
+        self._queue: Deque[OutboundFrame] = deque()
+        self._keyed: Dict[str, OutboundFrame] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._on_failure: Dict[str, Callable[[Exception], Any]] = {}
+        self._on_sent: Dict[str, Callable[[], Any]] = {}
+        self.closed = False
+        self.stats = {"enqueued": 0, "sent": 0, "dropped": 0, "coalesced": 0, "failed": 0}
+
+    def add_callbacks(
+        self,
+        owner: str,
+        on_failure: Optional[Callable[[Exception], Any]] = None,
+        on_sent: Optional[Callable[[], Any]] = None,
+    ):
+        """Register (or replace) the callbacks of one owner of this socket."""
+        if on_failure is not None:
+            self._on_failure[owner] = on_failure
+        if on_sent is not None:
+            self._on_sent[owner] = on_sent
+
+    @property
+    def queued(self) -> int:
+        return len(self._queue)
+
+    def offer(self, frame: OutboundFrame) -> bool:
+        """Queue a frame without waiting; False when it was rejected."""
+        if self.closed:
+            return False
+
+        if frame.coalesce_key is not None:
+            pending = self._keyed.get(frame.coalesce_key)
+            if pending is not None:
+                # Keep the queue position (and age) of the pending frame, send the newest state
+                pending.text = frame.text
+                self.stats["coalesced"] += 1
+                return True
+
+        if len(self._queue) >= self._broadcaster.queue_size:
+            if self._broadcaster.policy == DROP_NEWEST:
+                self.stats["dropped"] += 1
+                return False
+            oldest = self._queue.popleft()
+            if oldest.coalesce_key is not None:
+                self._keyed.pop(oldest.coalesce_key, None)
+            self.stats["dropped"] += 1
+
+        self._queue.append(frame)
+        if frame.coalesce_key is not None:
+            self._keyed[frame.coalesce_key] = frame
+        self.stats["enqueued"] += 1
+        self._ensure_started()
+        self._wakeup.set()
+        return True
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self):
+        while not self.closed:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            frame = self._queue.popleft()
+            if frame.coalesce_key is not None and self._keyed.get(frame.coalesce_key) is frame:
+                del self._keyed[frame.coalesce_key]
+
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(frame.text), timeout=self._broadcaster.send_timeout
+                )
+            except Exception as e:
+                self._fail(e)
+                return
+
+            self.stats["sent"] += 1
+            self._broadcaster.delivery_latency.observe(time.perf_counter() - frame.enqueued_at)
+            for callback in list(self._on_sent.values()):
+                try:
+                    callback()
+                except Exception as e:
+                    logger.debug(f"WebSocket on_sent callback failed: {e}")
+
+    def _fail(self, error: Exception):
+        self.stats["failed"] += 1
+        self.close()
+        self._broadcaster._forget(self)
+        logger.debug(f"🔌 WebSocket send failed, dropping its queue: {error!r}")
+        for callback in list(self._on_failure.values()):
+            try:
+                callback(error)
+            except Exception as e:
+                logger.debug(f"WebSocket on_failure callback failed: {e}")
+
+    def close(self):
+        """Stop sending; pending frames are discarded."""
+        self.closed = True
+        self._queue.clear()
+        self._keyed.clear()
+        task, self._task = self._task, None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+
+class WebSocketBroadcaster:
+    """Registry of per-socket senders plus the serialize-once broadcast entry point."""
+
+    def __init__(
+        self,
+        queue_size: int = WS_SEND_QUEUE_SIZE,
+        send_timeout: float = WS_SEND_TIMEOUT_SECONDS,
+        policy: str = WS_SLOW_CONSUMER_POLICY,
+    ):
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            logger.warning(f"⚠️ Unknown WS_SLOW_CONSUMER_POLICY '{policy}', using {DROP_OLDEST}")
+            policy = DROP_OLDEST
+        self.queue_size = max(1, queue_size)
+        self.send_timeout = send_timeout
+        self.policy = policy
+        self._senders: Dict[int, ConnectionSender] = {}
+        self.delivery_latency = LatencyHistogram(DELIVERY_BUCKETS_SECONDS)
+        # Counters of senders that are gone, so totals survive disconnects
+        self._retired = {"enqueued": 0, "sent": 0, "dropped": 0, "coalesced": 0, "failed": 0}
+        self.stats = {"broadcasts": 0, "recipients": 0}
+
+    def sender_for(self, websocket: Any) -> ConnectionSender:
+        sender = self._senders.get(id(websocket))
+        if sender is None or sender.websocket is not websocket:
+            sender = ConnectionSender(websocket, self)
+            self._senders[id(websocket)] = sender
+        return sender
+
+    def broadcast(
+        self,
+        websockets: Iterable[Any],
+        message: Any,
+        coalesce_key: Optional[str] = None,
+    ) -> int:
+        """
+        Serialize ``message`` once and queue it for every socket; never waits on
+        the clients. Returns the number of sockets that accepted the frame.
+        """
+        text = message if isinstance(message, str) else serialize_message(message)
+        enqueued_at = time.perf_counter()
+        accepted = 0
+        for websocket in websockets:
+            # Frames are per socket: coalescing mutates the queued frame in place
+            if self.sender_for(websocket).offer(OutboundFrame(text, coalesce_key, enqueued_at)):
+                accepted += 1
+        self.stats["broadcasts"] += 1
+        self.stats["recipients"] += accepted
+        return accepted
+
+    def send(self, websocket: Any, message: Any, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a message for a single socket."""
+        return self.broadcast([websocket], message, coalesce_key) == 1
+
+    def discard(self, websocket: Any):
+        """Stop and forget the sender of a socket that disconnected."""
+        sender = self._senders.get(id(websocket))
+        if sender is not None and sender.websocket is websocket:
+            sender.close()
+            self._forget(sender)
+
+    def _forget(self, sender: ConnectionSender):
+        if self._senders.get(id(sender.websocket)) is sender:
+            del self._senders[id(sender.websocket)]
+            for name in self._retired:
+                self._retired[name] += sender.stats[name]
+
+    def get_stats(self) -> Dict[str, Any]:
+        totals = dict(self._retired)
+        for sender in self._senders.values():
+            for name in totals:
+                totals[name] += sender.stats[name]
+        return {
+            **self.stats,
+            **totals,
+            "connections": len(self._senders),
+            "queued": sum(sender.queued for sender in self._senders.values()),
+            "queue_size": self.queue_size,
+            "policy": self.policy,
+            "delivery_latency": self.delivery_latency.to_dict(),
+        }
+
+
+# Global instance shared by the health manager and the legacy connection manager,
+# so both paths feed the same per-socket queue and keep message order
+websocket_broadcaster = WebSocketBroadcaster()
+
+__all__ = [
+    "ConnectionSender",
+    "OutboundFrame",
+    "WebSocketBroadcaster",
+    "serialize_message",
+    "websocket_broadcaster",
+    "DROP_OLDEST",
+    "DROP_NEWEST",
+]
@@ -0,0 +1,356 @@
+# utils/websocket_entity_stream.py
+"""
+🎞️ WebSocket Entity Streams
+Per-entity state streams (goal progress, artifact quality, task updates) layered on
+the broadcast engine:
+
+- Updates of the same entity published within ``WS_STREAM_FRAME_WINDOW_MS`` are
+  coalesced: one frame with the latest state goes out per window.
+- Every flush bumps the entity's ``seq``; the last ``WS_STREAM_HISTORY_SIZE`` states
+  are kept so deltas can be computed against older versions.
+- Clients that never opted in keep receiving the full message (plus ``stream`` and
+  ``seq`` fields), so existing consumers are unaffected.
+- Clients opt into deltas by sending ``stream_resume`` (optionally with the last
+  ``seq`` they hold per stream, e.g. after a reconnect) and acknowledge applied
+  frames with ``stream_ack``. They then receive ``stream_patch`` frames, a JSON
+  patch (RFC 6902 add/remove/replace) from the last state they acknowledged, or a
+  ``stream_snapshot`` when that state is no longer in the history.
+
+Because a patch is always relative to the acknowledged ``base_seq`` (not to the
+previous frame), a queued patch can be replaced by a newer one for the same stream
+(``coalesce_key``) without breaking the client. Clients keep the states they
+received since their last ack; one that no longer holds ``base_seq`` sends
+``stream_resume`` with the ``seq`` it does hold.
+"""
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from utils.websocket_broadcast import WebSocketBroadcaster, serialize_message, websocket_broadcaster
+
+logger = logging.getLogger(__name__)
+
+WS_STREAM_FRAME_WINDOW_MS = float(os.getenv("WS_STREAM_FRAME_WINDOW_MS", "100"))
+WS_STREAM_HISTORY_SIZE = int(os.getenv("WS_STREAM_HISTORY_SIZE", "32"))
+WS_STREAM_MAX_ENTITIES = int(os.getenv("WS_STREAM_MAX_ENTITIES", "5000"))
+
+# Client -> server message types
+STREAM_RESUME = "stream_resume"
+STREAM_ACK = "stream_ack"
+STREAM_CLIENT_MESSAGES = (STREAM_RESUME, STREAM_ACK)
+
+# Server -> client frame types for clients in delta mode
+STREAM_PATCH = "stream_patch"
+STREAM_SNAPSHOT = "stream_snapshot"
+
+_MISSING = object()
+
+
+def _escape_pointer(key: Any) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    JSON patch turning ``old`` into ``new``. Objects are diffed key by key; lists
+    and scalars that differ are replaced whole (progress payloads are small and
+    list reordering would otherwise produce long patches).
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key, old_value in old.items():
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape_pointer(key)}"})
+        for key, new_value in new.items():
+            child = f"{path}/{_escape_pointer(key)}"
+            old_value = old.get(key, _MISSING)
+            if old_value is _MISSING:
+                ops.append({"op": "add", "path": child, "value": new_value})
+            else:
+                ops.extend(json_diff(old_value, new_value, child))
+        return ops
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """Apply a patch produced by ``json_diff`` (reference for clients and tests)."""
+    for op in patch:
+        tokens = [_unescape_pointer(token) for token in op["path"].split("/")[1:]]
+        if not tokens:
+            document = op.get("value")
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            last = int(last)
+        if op["op"] == "remove":
+            del parent[last]
+        else:
+            parent[last] = op["value"]
+    return document
+
+
+@dataclass
+class EntityStream:
+    """Versioned state of one entity plus its pending (not yet flushed) update."""
+    key: str
+    seq: int = 0
+    history: "OrderedDict[int, Dict[str, Any]]" = field(default_factory=OrderedDict)
+    pending: Optional[Dict[str, Any]] = None
+    targets: Optional[Callable[[], Iterable[Any]]] = None
+    flush_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def state(self) -> Optional[Dict[str, Any]]:
+        return self.history[self.seq] if self.seq in self.history else None
+
+
+@dataclass
+class ClientStreams:
+    """Delta-mode bookkeeping of one socket: last acknowledged seq per stream."""
+    websocket: Any
+    acked: Dict[str, int] = field(default_factory=dict)
+
+
+class EntityStreamHub:
+    """Coalesces per-entity updates and fans them out as full messages or deltas."""
+
+    def __init__(
+        self,
+        broadcaster: WebSocketBroadcaster = websocket_broadcaster,
+        frame_window: float = WS_STREAM_FRAME_WINDOW_MS / 1000,
+        history_size: int = WS_STREAM_HISTORY_SIZE,
+        max_entities: int = WS_STREAM_MAX_ENTITIES,
+    ):
+        self.broadcaster = broadcaster
+        self.frame_window = max(0.0, frame_window)
+        self.history_size = max(1, history_size)
+        self.max_entities = max(1, max_entities)
+        self._streams: "OrderedDict[str, EntityStream]" = OrderedDict()
+        self._clients: Dict[int, ClientStreams] = {}
+        self.stats = {
+            "published": 0,
+            "coalesced": 0,
+            "flushes": 0,
+            "full_frames": 0,
+            "patch_frames": 0,
+            "snapshot_frames": 0,
+            "resumes": 0,
+            "acks": 0,
+            # Bytes actually queued vs. what full messages to every recipient would cost
+            "bytes_sent": 0,
+            "bytes_full": 0,
+            "evicted_streams": 0,
+        }
+
+    # === PUBLISHING ===
+
+    def publish(self, stream_key: str, state: Dict[str, Any], targets: Callable[[], Iterable[Any]]):
+        """
+        Record the latest state of an entity and schedule its flush. ``targets`` is
+        resolved at flush time, so sockets that connect during the window are included.
+        """
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            stream = EntityStream(stream_key)
+            self._streams[stream_key] = stream
+            self._evict_streams()
+        self._streams.move_to_end(stream_key)
+
+        self.stats["published"] += 1
+        if stream.pending is not None:
+            self.stats["coalesced"] += 1
+        stream.pending = state
+        stream.targets = targets
+
+        if stream.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self.frame_window:
+                stream.flush_handle = loop.call_later(self.frame_window, self._flush, stream_key)
+            else:
+                stream.flush_handle = loop.call_soon(self._flush, stream_key)
+
+    def flush_all(self):
+        """Send every pending update now (shutdown, tests)."""
+        for stream_key in [key for key, stream in self._streams.items() if stream.pending is not None]:
+            self._flush(stream_key)
+
+    def _evict_streams(self):
+        while len(self._streams) > self.max_entities:
+            # Oldest idle stream first; streams with a pending flush are kept
+            victim = next((key for key, stream in self._streams.items() if stream.pending is None), None)
+            if victim is None:
+                return
+            del self._streams[victim]
+            self.stats["evicted_streams"] += 1
+
+    def _flush(self, stream_key: str):
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            return
+        if stream.flush_handle is not None:
+            stream.flush_handle.cancel()
+            stream.flush_handle = None
+        state, stream.pending = stream.pending, None
+        if state is None:
+            return
+
+        stream.seq += 1
+        stream.history[stream.seq] = state
+        while len(stream.history) > self.history_size:
+            stream.history.popitem(last=False)
+        self.stats["flushes"] += 1
+
+        try:
+            websockets = self._unique(stream.targets() if stream.targets else [])
+        except Exception as e:
+            logger.error(f"Failed to resolve recipients of stream {stream_key}: {e}")
+            return
+
+        full_sockets = []
+        delta_groups: Dict[Optional[int], List[Any]] = {}
+        for websocket in websockets:
+            client = self._client(websocket)
+            if client is None:
+                full_sockets.append(websocket)
+            else:
+                delta_groups.setdefault(client.acked.get(stream_key), []).append(websocket)
+
+        if full_sockets:
+            self._send(full_sockets, {**state, "stream": stream_key, "seq": stream.seq}, stream_key, "full_frames", state)
+        for base_seq, group in delta_groups.items():
+            self._send_delta(group, stream, base_seq)
+
+    def _send_delta(self, websockets: List[Any], stream: EntityStream, base_seq: Optional[int]):
+        if base_seq == stream.seq:
+            return  # Already up to date (e.g. just resumed)
+        state = stream.state
+        if base_seq is not None and base_seq in stream.history:
+            frame = {
+                "type": STREAM_PATCH,
+                "stream": stream.key,
+                "seq": stream.seq,
+                "base_seq": base_seq,
+                "patch": json_diff(stream.history[base_seq], state),
+            }
+            self._send(websockets, frame, stream.key, "patch_frames", state)
+        else:
+            frame = {"type": STREAM_SNAPSHOT, "stream": stream.key, "seq": stream.seq, "snapshot": state}
+            self._send(websockets, frame, stream.key, "snapshot_frames", state)
+
+    def _send(self, websockets: List[Any], frame: Dict[str, Any], stream_key: str, counter: str, state: Dict[str, Any]):
+        text = serialize_message(frame)
+        accepted = self.broadcaster.broadcast(websockets, text, coalesce_key=f"stream:{stream_key}")
+        self.stats[counter] += 1
+        self.stats["bytes_sent"] += len(text) * accepted
+        self.stats["bytes_full"] += len(serialize_message(state)) * accepted
+
+    @staticmethod
+    def _unique(websockets: Iterable[Any]) -> List[Any]:
+        seen = set()
+        unique = []
+        for websocket in websockets:
+            if id(websocket) not in seen:
+                seen.add(id(websocket))
+                unique.append(websocket)
+        return unique
+
+    # === CLIENT PROTOCOL ===
+
+    def _client(self, websocket: Any) -> Optional[ClientStreams]:
+        client = self._clients.get(id(websocket))
+        if client is not None and client.websocket is websocket:
+            return client
+        return None
+
+    def handle_client_message(self, websocket: Any, message: Dict[str, Any]) -> bool:
+        """
+        Handle ``stream_resume`` / ``stream_ack`` sent by a client. Returns False
+        for any other message so endpoints can keep dispatching it.
+        """
+        message_type = message.get("type")
+        if message_type == STREAM_RESUME:
+            self.resume(websocket, message.get("streams") or {})
+            return True
+        if message_type == STREAM_ACK:
+            self.ack(websocket, message.get("stream"), message.get("seq"))
+            return True
+        return False
+
+    def resume(self, websocket: Any, positions: Dict[str, Any]):
+        """
+        Switch a socket to delta mode and catch it up: for each stream it names,
+        send a patch from the ``seq`` it holds (or a snapshot when that version is
+        gone or unknown).
+        """
+        client = self._client(websocket)
+        if client is None:
+            client = ClientStreams(websocket)
+            self._clients[id(websocket)] = client
+        self.stats["resumes"] += 1
+
+        for stream_key, seq in positions.items():
+            stream = self._streams.get(stream_key)
+            if stream is None or stream.state is None:
+                continue
+            base_seq = seq if isinstance(seq, int) and seq in stream.history else None
+            if base_seq is not None:
+                client.acked[stream_key] = base_seq
+            else:
+                client.acked.pop(stream_key, None)
+            self._send_delta([websocket], stream, base_seq)
+
+    def ack(self, websocket: Any, stream_key: Optional[str], seq: Any):
+        """Record that a delta-mode client applied ``seq``; unknown versions are ignored."""
+        client = self._client(websocket)
+        stream = self._streams.get(stream_key) if stream_key else None
+        if client is None or stream is None or not isinstance(seq, int) or seq not in stream.history:
+            return
+        if seq > client.acked.get(stream_key, 0):
+            client.acked[stream_key] = seq
+            self.stats["acks"] += 1
+
+    def forget(self, websocket: Any):
+        """Drop the delta bookkeeping of a disconnected socket."""
+        client = self._clients.get(id(websocket))
+        if client is not None and client.websocket is websocket:
+            del self._clients[id(websocket)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        bytes_full = self.stats["bytes_full"]
+        return {
+            **self.stats,
+            "streams": len(self._streams),
+            "pending": sum(1 for stream in self._streams.values() if stream.pending is not None),
+            "delta_clients": len(self._clients),
+            "bandwidth_ratio": round(self.stats["bytes_sent"] / bytes_full, 3) if bytes_full else None,
+            "frame_window_ms": self.frame_window * 1000,
+        }
+
+
+# Global instance used by the task/goal/artifact broadcast helpers
+entity_stream_hub = EntityStreamHub()
+
+__all__ = [
+    "EntityStreamHub",
+    "entity_stream_hub",
+    "json_diff",
+    "apply_patch",
+    "STREAM_CLIENT_MESSAGES",
+    "STREAM_RESUME",
+    "STREAM_ACK",
+    "STREAM_PATCH",
+    "STREAM_SNAPSHOT",
+]
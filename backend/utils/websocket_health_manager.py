@@ -9,13 +9,16 @@ to prevent ConnectionClosedError and maintain real-time update reliability.
 import asyncio
 import time
 import logging
-from typing import Dict, Set, Optional, Any, Callable
+from typing import Dict, List, Set, Optional, Any, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from fastapi import WebSocket, WebSocketDisconnect
 from enum import Enum
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
+from utils.websocket_broadcast import websocket_broadcaster
+from utils.websocket_entity_stream import entity_stream_hub
+
 logger = logging.getLogger(__name__)
 
 class ConnectionState(Enum):
@@ -205,8 +208,10 @@ class WebSocketHealthManager:
                 if not self.workspace_connections[workspace_id]:
                     del self.workspace_connections[workspace_id]
             
-            # Remove connection
+            # Remove connection, its pending broadcast frames and stream positions
             del self.connections[client_id]
+            websocket_broadcaster.discard(connection_info.websocket)
+            entity_stream_hub.forget(connection_info.websocket)
             
             # Update statistics
             self.stats["active_connections"] = len(self.connections)
@@ -226,55 +231,68 @@ class WebSocketHealthManager:
         self, 
         workspace_id: str, 
         message: Dict[str, Any],
-        exclude_client: Optional[str] = None
+        exclude_client: Optional[str] = None,
+        coalesce_key: Optional[str] = None
     ) -> int:
         """
         Broadcast message to all healthy connections in a workspace
         
-        Returns number of successful broadcasts
+        The message is serialized once and queued on each connection's bounded
+        send queue (utils.websocket_broadcast); delivery happens concurrently in
+        the background, so a slow client never delays the others or the caller.
+        Connections whose send fails are unregistered when the failure happens.
+        
+        Returns number of connections the message was queued for
         """
-        if workspace_id not in self.workspace_connections:
+        targets = self.healthy_websockets(workspace_id, exclude_client)
+        if not targets:
             return 0
-        
-        client_ids = self.workspace_connections[workspace_id].copy()
-        successful_broadcasts = 0
-        failed_connections = []
-        
-        for client_id in client_ids:
+        return websocket_broadcaster.broadcast(targets, message, coalesce_key=coalesce_key)
+    
+    def healthy_websockets(self, workspace_id: str, exclude_client: Optional[str] = None) -> List[WebSocket]:
+        """
+        Healthy sockets of a workspace, with this manager's send callbacks attached
+        (failure -> unregister, success -> activity) for use with websocket_broadcaster
+        """
+        targets = []
+        for client_id in self.workspace_connections.get(workspace_id, set()).copy():
             if exclude_client and client_id == exclude_client:
                 continue
             
-            if client_id not in self.connections:
+            connection_info = self.connections.get(client_id)
+            if connection_info is None:
                 continue
-                
-            connection_info = self.connections[client_id]
             
             # Skip unhealthy connections
             if not connection_info.is_healthy:
                 continue
             
-            try:
-                await connection_info.websocket.send_json(message)
-                await self.update_activity(client_id)
-                successful_broadcasts += 1
-                
-            except (WebSocketDisconnect, ConnectionClosedError, ConnectionClosedOK):
-                logger.debug(f"🔌 Client {client_id} disconnected during broadcast")
-                failed_connections.append(client_id)
-                
-            except Exception as e:
-                logger.error(f"❌ Broadcast failed to {client_id}: {e}")
-                connection_info.error_count += 1
-                failed_connections.append(client_id)
-        
-        # Clean up failed connections
-        for client_id in failed_connections:
-            await self.unregister_connection(client_id, "broadcast_failure")
-        
-        if failed_connections:
-            logger.warning(f"🧹 Cleaned up {len(failed_connections)} failed connections")
+            websocket_broadcaster.sender_for(connection_info.websocket).add_callbacks(
+                "health_manager",
+                on_failure=lambda error, client_id=client_id: self._on_send_failure(client_id, error),
+                on_sent=lambda client_id=client_id: self._record_activity(client_id),
+            )
+            targets.append(connection_info.websocket)
         
-        return successful_broadcasts
+        return targets
+    
+    def _record_activity(self, client_id: str):
+        connection_info = self.connections.get(client_id)
+        if connection_info is not None:
+            connection_info.last_activity = time.time()
+            connection_info.message_count += 1
+    
+    def _on_send_failure(self, client_id: str, error: Exception):
+        """Background send failed: unregister the connection"""
+        connection_info = self.connections.get(client_id)
+        if connection_info is None:
+            return
+        if isinstance(error, (WebSocketDisconnect, ConnectionClosedError, ConnectionClosedOK)):
+            logger.debug(f"🔌 Client {client_id} disconnected during broadcast")
+        else:
+            logger.error(f"❌ Broadcast failed to {client_id}: {error!r}")
+            connection_info.error_count += 1
+        asyncio.get_running_loop().create_task(self.unregister_connection(client_id, "broadcast_failure"))
     
     async def _heartbeat_loop(self):
         """Proactive heartbeat loop to maintain connection health"""
@@ -444,6 +462,8 @@ class WebSocketHealthManager:
         
         return {
             **self.stats,
+            "broadcast": websocket_broadcaster.get_stats(),
+            "streams": entity_stream_hub.get_stats(),
             "healthy_connections": healthy_connections,
             "workspaces_with_connections": len(self.workspace_connections),
             "average_connection_age": sum(conn.age_seconds for conn in self.connections.values()) / len(self.connections) if self.connections else 0,
@@ -470,9 +490,14 @@ async def unregister_websocket_connection(client_id: str, reason: str = "normal"
     """Unregister a WebSocket connection"""
     await websocket_health_manager.unregister_connection(client_id, reason)
 
-async def broadcast_to_workspace_healthy(workspace_id: str, message: Dict[str, Any], exclude_client: Optional[str] = None) -> int:
+async def broadcast_to_workspace_healthy(
+    workspace_id: str,
+    message: Dict[str, Any],
+    exclude_client: Optional[str] = None,
+    coalesce_key: Optional[str] = None
+) -> int:
     """Broadcast message to healthy connections in workspace"""
-    return await websocket_health_manager.broadcast_to_workspace(workspace_id, message, exclude_client)
+    return await websocket_health_manager.broadcast_to_workspace(workspace_id, message, exclude_client, coalesce_key)
 
 async def update_websocket_activity(client_id: str):
     """Update activity for a WebSocket connection"""
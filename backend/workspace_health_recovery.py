@@ -11,6 +11,7 @@ from uuid import UUID
 from datetime import datetime, timedelta
 
 from database import supabase
+from utils.task_event_bus import task_event_bus, WORKSPACE_CHANGED
 from models import WorkspaceStatus
 
 # Configure logging
@@ -245,6 +246,7 @@ class WorkspaceHealthRecovery:
                 'status': WorkspaceStatus.COMPLETED.value,
                 'updated_at': datetime.now().isoformat()
             }).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             return True
             
@@ -260,6 +262,7 @@ class WorkspaceHealthRecovery:
                 'status': WorkspaceStatus.ACTIVE.value,
                 'updated_at': datetime.now().isoformat()
             }).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             return True
             
@@ -274,6 +277,7 @@ class WorkspaceHealthRecovery:
                 'status': WorkspaceStatus.ACTIVE.value,
                 'updated_at': datetime.now().isoformat()
             }).eq('id', workspace_id).execute()
+            task_event_bus.publish(WORKSPACE_CHANGED, workspace_id=workspace_id)
             
             return True
             
@@ -15,6 +15,7 @@ from uuid import UUID
 
 from models import WorkspaceStatus, TaskStatus, AgentStatus
 from database import supabase, update_workspace_status
+from utils.task_event_bus import task_event_bus, AGENT_CHANGED
 
 logger = logging.getLogger(__name__)
 
@@ -226,6 +227,7 @@ class WorkspaceRecoverySystem:
             ).in_(
                 "status", [AgentStatus.ERROR.value, AgentStatus.OFFLINE.value]
             ).execute()
+            task_event_bus.publish(AGENT_CHANGED, workspace_id=workspace_id)
             
             reactivated_count = len(update_result.data) if update_result.data else 0
             